@@ -12,6 +12,7 @@ text input file specification.  The distributions currently available are:
 - vonMises
 - uniform
 - normal
+- lognormal
 - bivariate normal
 
 In addition, we allow for "enumeration" of sets of variables, and their cartesian product.
@@ -47,6 +48,17 @@ Or::
     
 which causes the code to generate the cartesian product {(5,1),(5,5),(15,1),(15,5),(25,1),(25,5)}.
 
+Instead of sampling the variables point by point, DistnParser.space_filling_sample draws a Latin hypercube
+or scrambled Sobol' design over all the sampled variables at once and maps it through the inverse CDFs,
+with the parameters of conditional distributions evaluated on the arrays of the variables they depend on.
+For instance the IEC 61400-1 ed. 4 normal turbulence model, the standard deviation of the wind speed
+given the hub height wind speed::
+
+    Vhub = W(2.0, 9.5)
+    sigma1 = LN(0.14*(0.75*Vhub + 3.8), 0.14*1.4)
+
+sample_case_inputs returns such a design as case_inputs for CaseGen_General.
+
 """
 
 ### This is some more of the thinking that was part of development, so not included in the docstring:
@@ -117,13 +129,13 @@ import math
 from numpy import matrix
 from math import pi, isnan, exp
 from numpy import mean
-from scipy.stats import vonmises, gamma
+from scipy.stats import vonmises, gamma, norm
+
+from wisdem.aeroelasticse.CaseGen_General import CaseGen_General, save_case_matrix, case_naming
 
 global gIgnoreJointDistn
 gIgnoreJointDistn = True
 
-# from CaseGen_General import save_case_matric, case_naming
-
 def draw_uniform(x0,x1):
     val = npr.uniform(x0,x1)
     return val
@@ -150,6 +162,11 @@ def draw_vonmises(kappa, loc, nsamples=1):
     x = vonmises.rvs(kappa, loc=loc, size=nsamples)
     return x
 
+def draw_lognormal(mean, std, nsamples=1):
+    mu, sigma = lognormal_params(mean, std)
+    x = npr.lognormal(mu, sigma, nsamples)
+    return x
+
 def draw_multivariate_normal(mean, cov):
     val = npr.multivariate_normal(mean, cov)
 #    val = multivariate_normal.rvs(mean, cov)
@@ -169,7 +186,9 @@ def prob_weibull(x, shape, scale):
     return p
 
 def prob_gamma(x, shape, scale):
-    shape = max(1e-1,shape)
+    # same bounds on the parameters as draw_gamma, so that this is the density of the samples
+    shape = max(1e-3,shape)
+    scale = max(1e-3,scale)
     p = gamma.pdf(x,shape, loc=0, scale=scale)
     return p
 
@@ -181,6 +200,11 @@ def prob_vonmises(x, kappa, loc):
     p = max(p)
     return p
 
+def prob_lognormal(x, mean, std):
+    mu, sigma = lognormal_params(mean, std)
+    p = 1/(x * sigma * np.sqrt(2 * np.pi)) * np.exp( - (np.log(x) - mu)**2 / (2 * sigma**2))
+    return p
+
 def prob_multivariate_normal(x, mu, sigma):
 ## not in scipy < 0.14:
 #    p = multivariate_normal.pdf(x,mean,cov)
@@ -202,6 +226,131 @@ def prob_multivariate_normal(x, mu, sigma):
     else:
         raise NameError("The dimensions of the input don't match")
 
+def lognormal_params(mean, std):
+    """ mean and standard deviation of the underlying normal distribution of a lognormal variable
+    with the given mean and standard deviation """
+    sigma = np.sqrt(np.log(1 + (np.asarray(std, dtype=float)/mean)**2))
+    mu = np.log(mean) - 0.5*sigma**2
+    return mu, sigma
+
+############
+# Vectorized inverse CDFs, CDFs and densities.  All arguments broadcast, so the parameters of a
+# conditional distribution can be arrays with one value per sample.
+
+def ppf_uniform(u, x0, x1):
+    return x0 + u*(np.asarray(x1) - x0)
+
+def ppf_normal(u, mu, sigma):
+    return mu + sigma*norm.ppf(u)
+
+def ppf_weibull(u, shape, scale):
+    return scale*(-np.log1p(-u))**(1./np.asarray(shape))
+
+def ppf_gamma(u, shape, scale):
+    return gamma.ppf(u, np.maximum(1e-3,shape), loc=0, scale=np.maximum(1e-3,scale))
+
+def ppf_vonmises(u, kappa, loc):
+    # scipy's vonmises.ppf root finds point by point, so bisect the vectorized CDF on [-pi, pi] instead
+    u, kappa, loc = np.broadcast_arrays(u, kappa, loc)
+    x0 = np.full(u.shape, -pi)
+    x1 = np.full(u.shape, pi)
+    for i in range(52):
+        x = 0.5*(x0 + x1)
+        below = vonmises.cdf(x, kappa) < u
+        x0 = np.where(below, x, x0)
+        x1 = np.where(below, x1, x)
+    return loc + 0.5*(x0 + x1)
+
+def ppf_lognormal(u, mean, std):
+    mu, sigma = lognormal_params(mean, std)
+    return np.exp(mu + sigma*norm.ppf(u))
+
+def ppf_bivariate_normal(u, mu1, mu2, var1, var2, cov):
+    """ maps u, shape (n,2), to samples of the 2D normal distribution through the Cholesky factor of the covariance """
+    z = norm.ppf(u)
+    s1 = np.sqrt(var1)
+    x1 = mu1 + s1*z[:,0]
+    x2 = mu2 + cov/s1*z[:,0] + np.sqrt(var2 - cov**2/var1)*z[:,1]
+    return np.c_[x1, x2]
+
+def cdf_uniform(x, x0, x1):
+    return np.clip((x - x0)/(np.asarray(x1) - x0), 0.0, 1.0)
+
+def cdf_normal(x, mu, sigma):
+    return norm.cdf(x, loc=mu, scale=sigma)
+
+def cdf_weibull(x, shape, scale):
+    return -np.expm1(-(np.maximum(x, 0.0)/scale)**shape)
+
+def cdf_gamma(x, shape, scale):
+    return gamma.cdf(x, np.maximum(1e-3,shape), loc=0, scale=np.maximum(1e-3,scale))
+
+def cdf_vonmises(x, kappa, loc):
+    return vonmises.cdf(x, kappa, loc=loc)
+
+def cdf_lognormal(x, mean, std):
+    mu, sigma = lognormal_params(mean, std)
+    return norm.cdf(np.log(np.maximum(x, 1e-300)), loc=mu, scale=sigma)
+
+def pdf_uniform(x, x0, x1):
+    return np.ones(np.shape(x))/(np.asarray(x1) - x0)
+
+def pdf_weibull(x, shape, scale):
+    return (shape/scale)*(x/scale)**(shape-1)*np.exp(-(x/scale)**shape)
+
+def pdf_gamma(x, shape, scale):
+    return gamma.pdf(x, np.maximum(1e-3,shape), loc=0, scale=np.maximum(1e-3,scale))
+
+def pdf_vonmises(x, kappa, loc):
+    return np.max([vonmises.pdf(x + m, kappa, loc=loc) for m in [-2*pi, 0, 2*pi]], axis=0)
+
+def pdf_bivariate_normal(x, mu1, mu2, var1, var2, cov):
+    det = var1*var2 - cov**2
+    d1 = x[:,0] - mu1
+    d2 = x[:,1] - mu2
+    q = (var2*d1**2 - 2*cov*d1*d2 + var1*d2**2)/det
+    return np.exp(-0.5*q)/(2*pi*np.sqrt(det))
+
+# distribution name: (number of parameters, inverse CDF, CDF, density)
+vectorized_distns = {'N'  : (2, ppf_normal, cdf_normal, prob_normal),
+                     'U'  : (2, ppf_uniform, cdf_uniform, pdf_uniform),
+                     'G'  : (2, ppf_gamma, cdf_gamma, pdf_gamma),
+                     'VM' : (2, ppf_vonmises, cdf_vonmises, pdf_vonmises),
+                     'W'  : (2, ppf_weibull, cdf_weibull, pdf_weibull),
+                     'LN' : (2, ppf_lognormal, cdf_lognormal, prob_lognormal),
+                     'N2' : (5, ppf_bivariate_normal, None, pdf_bivariate_normal)}
+
+# math functions available to the expressions of vectorized distribution parameters
+vectorized_math = {'exp':np.exp, 'log':np.log, 'log10':np.log10, 'sqrt':np.sqrt, 'pow':np.power,
+                   'sin':np.sin, 'cos':np.cos, 'tan':np.tan, 'asin':np.arcsin, 'acos':np.arccos,
+                   'atan':np.arctan, 'atan2':np.arctan2, 'fabs':np.abs, 'abs':np.abs,
+                   'floor':np.floor, 'ceil':np.ceil, 'min':np.minimum, 'max':np.maximum,
+                   'pi':pi, 'e':np.e}
+
+def sample_unit_hypercube(nsamples, ndim, method='lhs', seed=None):
+    """
+    Design of nsamples points in the unit hypercube of dimension ndim.
+
+    method is 'lhs' (Latin hypercube: one point in each of the nsamples equal strata of every
+    dimension), 'sobol' (scrambled Sobol' sequence, best balanced for powers of 2 samples) or
+    'random'.  The same seed gives the same design.
+    """
+    if method == 'lhs':
+        rng = npr.RandomState(seed)
+        u = (np.arange(nsamples)[:,np.newaxis] + rng.uniform(size=(nsamples, ndim))) / nsamples
+        for j in range(ndim):
+            u[:,j] = u[rng.permutation(nsamples),j]
+    elif method == 'sobol':
+        from scipy.stats import qmc # scipy >= 1.7
+        if ndim == 0:
+            return np.zeros((nsamples, 0))
+        u = qmc.Sobol(ndim, scramble=True, seed=seed).random(nsamples)
+    elif method == 'random':
+        u = npr.RandomState(seed).uniform(size=(nsamples, ndim))
+    else:
+        raise ValueError("Sorry, unknown sampling method: %s" % method)
+    return u
+
 
 ###############################
 ###############################
@@ -344,6 +493,8 @@ class FnDistn(Distribution):
         elif (self.fn == "W"):
             val = draw_weibull(argvals[0], argvals[1])
 #            print(" sampled Wiebull with args = ", argvals, "got ", val)
+        elif (self.fn == "LN"):
+            val = draw_lognormal(argvals[0], argvals[1])
         else:
             raise ValueError("Sorry, unknown distribution: %s" % self.fn)
         return val
@@ -377,6 +528,8 @@ class FnDistn(Distribution):
         elif (self.fn == "W"):
             val = prob_weibull(x,argvals[0], argvals[1])
 #            print("prob W", x, argvals[0], argvals[1], val)
+        elif (self.fn == "LN"):
+            val = prob_lognormal(x,argvals[0], argvals[1])
         else:
             raise ValueError("unknown distribution %s" % self.fn)
         
@@ -384,6 +537,36 @@ class FnDistn(Distribution):
             print("NAN", val, x, self.fn, argvals)
         return val/C
 
+    def get_dim(self):
+        """ number of dimensions of the unit hypercube used by ppf """
+        return 2 if self.fn == "N2" else 1
+
+    def ppf(self, u, argvals):
+        """ vectorized sampling: maps u, shape (n, get_dim()), through the inverse CDF.  argvals are
+        arrays of length n or scalars.  Truncated distributions are sampled between their truncation
+        points by rescaling u, rather than by rejection. """
+        if self.fn not in vectorized_distns:
+            raise ValueError("Sorry, unknown distribution: %s" % self.fn)
+        nargs, ppf, cdf, pdf = vectorized_distns[self.fn]
+        if self.fn == "N2":
+            return ppf(u, *argvals[:nargs])
+        u = u[:,0]
+        if self.is_truncated:
+            F0 = cdf(argvals[-2], *argvals[:nargs])
+            F1 = cdf(argvals[-1], *argvals[:nargs])
+            u = F0 + u*(F1 - F0)
+        return ppf(u, *argvals[:nargs])
+
+    def pdf(self, x, argvals):
+        """ vectorized calc_prob, for samples x and arrays of argvals as in ppf """
+        nargs, ppf, cdf, pdf = vectorized_distns[self.fn]
+        val = pdf(x, *argvals[:nargs])
+        if self.is_truncated:
+            inside = (x >= argvals[-2]) & (x <= argvals[-1])
+            C = cdf(argvals[-1], *argvals[:nargs]) - cdf(argvals[-2], *argvals[:nargs])
+            val = np.where(inside, val/C, 0.0)
+        return val
+
 
 class DistnParser(object):
     def __init__(self):
@@ -392,7 +575,7 @@ class DistnParser(object):
         self.dlist_map = {}
         
     def parse_file(self,fname):
-        mystr = file(fname).readlines()
+        mystr = open(fname).readlines()
         return self.parse(mystr)
 
     def parse(self, mystr):
@@ -618,6 +801,52 @@ class DistnParser(object):
 #            op = a[-2]
 #            return math_op(op, v1, v2)
 
+    def resolve_array(self, a):
+        """ vectorized resolve_value: evaluates the tokens of a with the variables bound to
+        their arrays of samples """
+        names = dict(vectorized_math)
+        names.update(self.values)
+        return eval("".join(a), {"__builtins__": {}}, names)
+
+    def space_filling_sample(self, numsamples, method='lhs', seed=None):
+        """
+        Samples all the distributions at once: one design of numsamples points from
+        sample_unit_hypercube over the dimensions of all the sampled variables, mapped through
+        their inverse CDFs in the order the variables are defined, so parameters can depend on
+        the variables defined before them.  As in multi_sample(expand_enums=True), each
+        combination of the set variables gets numsamples samples, here all from the same design.
+
+        Returns a dict of arrays, one value per case, for each variable and for 'p', the
+        probability density of the case.
+        """
+        global gIgnoreJointDistn
+        fns = [d for d in self.dlist if hasattr(d,"fn")]
+        u = sample_unit_hypercube(numsamples, sum(d.get_dim() for d in fns), method, seed)
+
+        columns = {}
+        for e in self.expand_enums():
+            self.clear_values()
+            p = np.ones(numsamples)
+            k = 0
+            for d in self.dlist:
+                if (hasattr(d,"fn")):
+                    argvals = [self.resolve_array(a) for a in d.args]
+                    x = d.ppf(u[:,k:k+d.get_dim()], argvals)
+                    p *= d.pdf(x, argvals)
+                    k += d.get_dim()
+                else:
+                    x = np.full(numsamples, self.resolve_array(e[d.vstr]))
+                self.values[d.vstr] = x
+                subv = d.vstr.split(".")
+                if (not gIgnoreJointDistn and len(subv) > 1):
+                    for i in range(len(subv)):
+                        self.values[subv[i]] = x[:,i]
+            self.values['p'] = p
+            for key in self.values:
+                columns.setdefault(key, []).append(self.values[key])
+
+        return {key:np.concatenate(columns[key]) for key in columns}
+
     def get_num_samples(self):
         self.sample()  # kludge: sample once to get NumSamples set, if it exists
         if "NumSamples" in self.values:
@@ -682,7 +911,7 @@ class DistnParser(object):
 #     return options, args
 
 def read_samples(fname):
-    lines = file(fname).readlines()
+    lines = open(fname).readlines()
     hdr = lines[0].split()
     dat = []
     for ln in lines[1:]:
@@ -715,7 +944,7 @@ def gen_cases(options=None, args=None):
                 s[pidx] = p
             new_samples.append(s)
 
-        fout = file(options['main_output'], "w")
+        fout = open(options['main_output'], "w")
         for key in new_hdr:
             fout.write("%s " % key)
         fout.write("\n")
@@ -746,7 +975,41 @@ def gen_cases(options=None, args=None):
         return case_list_dist
 
 
+# FAST input changed by each distribution variable
+dist_var_map = {'AnalTime': ('Fst','TMax'),
+                'Hs'      : ('HydroDyn','WaveHs'),
+                'Tp'      : ('HydroDyn','WaveTp'),
+                'WaveDir' : ('HydroDyn','WaveDir'),
+                'Vhub'    : ('InflowWind','HWindSpeed'),
+                'p'       : ('P','')}
+
+def sample_case_inputs(dist, nsamples, method='lhs', seed=0, var_map=dist_var_map, group=0):
+    """
+    Space filling design over the distributions of the file dist (see
+    DistnParser.space_filling_sample), as case_inputs for CaseGen_General: each variable of
+    var_map gets its array of samples, all linked in the same group.
+
+    Returns case_inputs and the dict of the arrays of samples of all the variables, including
+    those without a FAST input in var_map (e.g. a turbulence intensity for the wind files).
+    """
+    dparser = DistnParser()
+    dparser.parse_file(dist)
+    samples = dparser.space_filling_sample(nsamples, method=method, seed=seed)
+
+    case_inputs = {}
+    for var in samples:
+        if var in var_map:
+            case_inputs[var_map[var]] = {'vals':samples[var].tolist(), 'group':group}
+
+    return case_inputs, samples
+
 def CaseGen_Dists(case_inputs):
+    """
+    Cases sampled from the distribution file case_inputs['dist'].  case_inputs['sampling'] is
+    'random' (default, one independent draw per case) or a method of sample_unit_hypercube.
+    The simulation time ('Fst','TMax') is the AnalTime of the distribution file, or
+    case_inputs['tmax'] if the file does not define AnalTime.
+    """
 
     # Default options
     if 'dist' not in case_inputs.keys():
@@ -765,6 +1028,19 @@ def CaseGen_Dists(case_inputs):
         case_inputs['dir_matrix'] = ''
     if 'namebase' not in case_inputs.keys():
         case_inputs['namebase'] = ''
+    if 'sampling' not in case_inputs.keys():
+        case_inputs['sampling'] = 'random'
+    if 'seed' not in case_inputs.keys():
+        case_inputs['seed'] = 0
+
+    if case_inputs['sampling'] != 'random' and case_inputs['old_samples'] == None:
+        # Latin hypercube or Sobol' design, through the general case generator
+        case_inputs_gen, _ = sample_case_inputs(case_inputs['dist'], case_inputs['nsamples'],
+                                                method=case_inputs['sampling'], seed=case_inputs['seed'])
+        if ('Fst','TMax') not in case_inputs_gen:
+            case_inputs_gen[('Fst','TMax')] = {'vals':[case_inputs['tmax']], 'group':1}
+        return CaseGen_General(case_inputs_gen, dir_matrix=case_inputs['dir_matrix'], namebase=case_inputs['namebase'],
+                               save_matrix=bool(case_inputs['dir_matrix']))
 
     # Read distribution input file, generate cases
     case_list_dist = gen_cases(case_inputs, [])
@@ -775,6 +1051,8 @@ def CaseGen_Dists(case_inputs):
         case_list_i = {}
         if 'AnalTime' in case.keys():
             case_list_i[('Fst','TMax')] = [case['AnalTime']]
+        else:
+            case_list_i[('Fst','TMax')] = [case_inputs['tmax']]
         if 'Hs' in case.keys():
             case_list_i[('HydroDyn','WaveHs')] = case['Hs']
         if 'Tp' in case.keys():
@@ -792,7 +1070,7 @@ def CaseGen_Dists(case_inputs):
     change_vars = sorted(case_list[0].keys())
     matrix_out = np.asarray([[str(case[var][0]) for var in change_vars] for case in case_list])
     if case_inputs['dir_matrix']:
-        save_case_matric(matrix_out, change_vars, case_inputs['dir_matrix'])
+        save_case_matrix(matrix_out, change_vars, case_inputs['dir_matrix'])
 
     # Case naming
     case_name = case_naming(len(case_list), namebase=case_inputs['namebase'])
@@ -809,6 +1087,8 @@ if __name__=="__main__":
     case_inputs['main_output'] = 'run_cases.txt'
     case_inputs['dir_matrix']  = 'temp/openFAST'
     case_inputs['namebase']    = 'testing_dists'
+    case_inputs['sampling']    = 'lhs'
+    case_inputs['seed']        = 0
 
     case_list, case_name = CaseGen_Dists(case_inputs)
 
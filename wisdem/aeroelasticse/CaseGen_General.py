@@ -1,4 +1,4 @@
-import os, itertools
+import os, json, numbers
 import numpy as np
 
 def save_case_matrix_direct(case_list, dir_matrix):
@@ -33,30 +33,30 @@ def save_case_matrix(matrix_out, change_vars, dir_matrix):
         n_header_lines = 1
 
     n_cases = np.shape(matrix_out)[0]
-    matrix_out = np.hstack((np.asarray([[i] for i in range(n_cases)]), matrix_out))
+    matrix_out = np.hstack((np.arange(n_cases)[:,np.newaxis], matrix_out))
+    if matrix_out.dtype == object:
+        # str of each value, astype would unpack list values
+        matrix_str = np.frompyfunc(str, 1, 1)(matrix_out).astype(str)
+    else:
+        matrix_str = matrix_out.astype(str)
 
     change_vars = [('Case_ID',)+('',)*(n_header_lines-1)] + change_vars
-    # col_len = [max([len(val) for val in matrix_out[:,j]] + [len(change_vars[j][0]), len(change_vars[j][1])]) for j in range(len(change_vars))]
-    col_len = [max([len(str(val)) for val in matrix_out[:,j]] + [len(change_vars[j][header_i]) for header_i in range(n_header_lines)]) for j in range(len(change_vars))]
+    col_len = [max([np.char.str_len(matrix_str[:,j]).max(initial=0)] + [len(change_vars[j][header_i]) for header_i in range(n_header_lines)]) for j in range(len(change_vars))]
 
     text_out = []
     for header_i in range(n_header_lines):
         text_out.append(''.join([val.center(col+2) for val, col in zip([var[header_i] for var in change_vars], col_len)])+'\n')
 
-    for row in matrix_out:
-        row_str = ''
-        for val, col in zip(row, col_len):
-            if val is not str:
-                val = str(val)
-            row_str += val.center(col+2)
-        row_str += '\n'
-        text_out.append(row_str)
+    # center each column at once, then join the columns of each row
+    rows = np.full(n_cases, '', dtype=object)
+    for j, col in enumerate(col_len):
+        rows = rows + np.char.center(matrix_str[:,j], col+2).astype(object)
+    text_out.extend(rows + '\n')
 
     if not os.path.exists(dir_matrix):
             os.makedirs(dir_matrix)
     ofh = open(os.path.join(dir_matrix,'case_matrix.txt'),'w')
-    for row in text_out:
-        ofh.write(row)
+    ofh.write(''.join(text_out))
     ofh.close()
 
 def case_naming(n_cases, namebase=None):
@@ -95,53 +95,157 @@ def convert_str(val):
     else:
         return val
 
-def CaseGen_General(case_inputs, dir_matrix='', namebase='', save_matrix=True):
-    """ Cartesian product to enumerate over all combinations of set of variables that are changed together"""
-
-    # put case dict into lists
-    change_vars = sorted(case_inputs.keys())
-    change_vals = [case_inputs[var]['vals'] for var in change_vars]
-    change_group = [case_inputs[var]['group'] for var in change_vars]
-
-    # find number of groups and length of groups
-    group_set = list(set(change_group))
-    group_len = [len(change_vals[change_group.index(i)]) for i in group_set]
-
-    # case matrix, as indices
-    group_idx = [range(n) for n in group_len]
-    matrix_idx = list(itertools.product(*group_idx))
-
-    # index of each group
-    matrix_group_idx = [np.where([group_i == group_j for group_j in change_group])[0].tolist() for group_i in group_set]
-
-    # build final matrix of variable values
-    matrix_out = []
-    for i, row in enumerate(matrix_idx):
-        row_out = [None]*len(change_vars)
-        for j, val in enumerate(row):
-            for g in matrix_group_idx[j]:
-                row_out[g] = change_vals[g][val]
-        matrix_out.append(row_out)
-    matrix_out = np.asarray(matrix_out)
-    n_cases = np.shape(matrix_out)[0]
+def value_kind(val):
+    # 'b', 'i', 'f' or 'U' for scalar booleans, integers, floats and strings, 'O' for anything else
+    if isinstance(val, (bool, np.bool_)):
+        return 'b'
+    elif isinstance(val, numbers.Integral):
+        return 'i'
+    elif isinstance(val, numbers.Real):
+        return 'f'
+    elif isinstance(val, str):
+        return 'U'
+    return 'O'
+
+def object_column(vals):
+    # 1D object array of the values, without numpy unpacking list values
+    column = np.empty(len(vals), dtype=object)
+    for i, val in enumerate(vals):
+        column[i] = val
+    return column
+
+def column_values(vals):
+    """ values of a variable as a 1D array, and the type they take once stacked in a matrix with other
+    variables.  Values of mixed types (e.g. ints and floats) or that are lists are kept as they are in
+    an object array, as np.asarray would convert them """
+    kinds = set(value_kind(val) for val in vals)
+    if len(kinds) == 1 and 'O' not in kinds:
+        column = np.asarray(vals)
+        return column, column.dtype
+
+    column = object_column(vals)
+    if 'O' in kinds:
+        return column, np.dtype(object)
+    return column, np.asarray(list(vals)).dtype
+
+class CaseMatrix(object):
+    """
+    Columnar case matrix: one array of values per changed variable instead of one dict per case.
+
+    Cases are materialized as dicts only when indexed or iterated, with the same values
+    CaseGen_General has always returned, so a CaseMatrix can be given to runFAST_pywrapper_batch
+    as case_list.  Indexing with a slice or an array of indices gives a CaseMatrix of those cases.
+
+    Parameters
+    ----------
+    change_vars : list
+        keys of the changed variables, e.g. ('InflowWind','HWindSpeed')
+    columns : list of ndarray
+        values of each variable, one per case
+    """
+
+    def __init__(self, change_vars, columns, dtype=None):
+        self.change_vars = list(change_vars)
+        self.columns     = list(columns)
+        if dtype is None:
+            try:
+                dtype = np.result_type(*self.columns)
+            except TypeError:
+                dtype = object
+        # type of the values if they were stacked in a single matrix, as in the case matrix file
+        self.dtype       = np.dtype(dtype)
+
+    @classmethod
+    def from_case_inputs(cls, case_inputs):
+        """ Cartesian product over the groups of case_inputs, variables of the same group changed together """
+        change_vars  = sorted(case_inputs.keys())
+        change_group = [case_inputs[var]['group'] for var in change_vars]
+
+        # find number of groups and length of groups
+        group_set = list(set(change_group))
+        group_len = [len(case_inputs[change_vars[change_group.index(i)]]['vals']) for i in group_set]
+
+        # case matrix, as indices of each group, in the order of itertools.product
+        matrix_idx = np.indices(group_len).reshape(len(group_len), -1)
+
+        values = [column_values(case_inputs[var]['vals']) for var in change_vars]
+        dtype  = np.result_type(*[dtype_i for _, dtype_i in values])
+
+        columns = []
+        for var, group, (vals, dtype_i) in zip(change_vars, change_group, values):
+            if dtype == object and vals.dtype != object:
+                # the values of an object matrix are the inputs themselves, e.g. str rather than np.str_
+                vals = object_column(case_inputs[var]['vals'])
+            columns.append(vals[matrix_idx[group_set.index(group)]])
+
+        return cls(change_vars, columns, dtype)
+
+    def __len__(self):
+        return len(self.columns[0]) if self.columns else 0
+
+    def __getitem__(self, i):
+        if isinstance(i, (slice, list, np.ndarray)):
+            idx = np.arange(len(self))[i]
+            return CaseMatrix(self.change_vars, [col[idx] for col in self.columns], self.dtype)
+        if self.dtype == object:
+            return {var:convert_str(col[i]) for var, col in zip(self.change_vars, self.columns)}
+        return {var:convert_str(np.asarray(col[i]).astype(self.dtype)[()]) for var, col in zip(self.change_vars, self.columns)}
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def column(self, var):
+        """ values of variable var for all the cases """
+        return self.columns[self.change_vars.index(var)]
+
+    def to_list(self):
+        """ list of case dicts """
+        return list(self)
+
+    def matrix(self):
+        """ 2D array of all the values, cases along the rows """
+        return np.column_stack([col.astype(self.dtype) for col in self.columns])
+
+    def save_txt(self, dir_matrix):
+        """ writes case_matrix.txt in dir_matrix """
+        save_case_matrix(self.matrix(), self.change_vars, dir_matrix)
+
+    def save(self, fname):
+        """ writes the columns to a .npz file, much faster to load back than the text matrix """
+        data = {'col%d'%j:col for j, col in enumerate(self.columns)}
+        np.savez(fname, change_vars=np.asarray([json.dumps(var) for var in self.change_vars]), dtype=self.dtype.str, **data)
+
+    @classmethod
+    def load(cls, fname):
+        """ reads a file written by save.  Columns of list-valued inputs are pickled, so only load trusted files """
+        with np.load(fname, allow_pickle=True) as data:
+            change_vars = [json.loads(var) for var in data['change_vars']]
+            change_vars = [tuple(var) if isinstance(var, list) else var for var in change_vars]
+            columns = [data['col%d'%j] for j in range(len(change_vars))]
+            dtype   = str(data['dtype'])
+        return cls(change_vars, columns, dtype)
+
+
+def CaseGen_General(case_inputs, dir_matrix='', namebase='', save_matrix=True, columnar=False):
+    """ Cartesian product to enumerate over all combinations of set of variables that are changed together.
+    Returns the list of case dicts, or with columnar=True the CaseMatrix, and the case names """
+
+    case_matrix = CaseMatrix.from_case_inputs(case_inputs)
+    n_cases = len(case_matrix)
 
     # Save case matrix
     if save_matrix:
         if not dir_matrix:
             dir_matrix = os.getcwd()
-        save_case_matrix(matrix_out, change_vars, dir_matrix)
-
-    case_list = []
-    for i in range(n_cases):
-        case_list_i = {}
-        for j, var in enumerate(change_vars):
-            case_list_i[var] = convert_str(matrix_out[i,j])
-        case_list.append(case_list_i)
+        case_matrix.save_txt(dir_matrix)
 
     # case naming
     case_name = case_naming(n_cases, namebase=namebase)
 
-    return case_list, case_name
+    if columnar:
+        return case_matrix, case_name
+    return case_matrix.to_list(), case_name
 
 
 if __name__ == "__main__":
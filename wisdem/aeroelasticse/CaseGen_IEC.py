@@ -224,6 +224,14 @@ class CaseGen_IEC():
                         WindFile_out.extend(data_out[1])
                         WindFile_type_out.extend(data_out[2])
 
+            elif isinstance(iecwind, pyIECWind_extreme):
+                # Serial, transient events for all wind speeds are generated at once
+                U_vals = [var_vals[change_vars.index('U')] for var_vals in matrix_out]
+                iecwind.execute_batch(IEC_WindType, U_vals)
+                WindFile_out = iecwind.fname_out
+                WindFile_type_out = iecwind.fname_type
+                U_out = [U for U in U_vals for _ in range(len(WindFile_out)//max(len(U_vals), 1))]
+
             else:
                 # Serial
                 U_out = []
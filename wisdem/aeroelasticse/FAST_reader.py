@@ -1,7 +1,7 @@
 import os, re, sys, copy
 import yaml
 import numpy as np
-from functools import reduce
+from functools import reduce, lru_cache
 import operator
 
 from wisdem.aeroelasticse.FAST_vars import FstModel
@@ -52,6 +52,65 @@ def int_read(text):
         except:
             return str(text)
 
+def read_table(lines, ncol):
+    # bulk convert the first ncol columns of whitespace delimited numeric rows to a (len(lines), ncol) float array
+    rows = [line.split()[:ncol] for line in lines]
+    try:
+        return np.array(rows, dtype=float).reshape(len(rows), ncol)
+    except ValueError:
+        # non-numeric entries (e.g. "default") are kept as strings, cell by cell with float_read
+        return np.array([[float_read(val) for val in row] for row in rows], dtype=object).reshape(len(rows), ncol)
+
+
+class FASTInputFile(object):
+    """ Input file read once and tokenized: "value  KEY  ! comment" lines are indexed by KEY, and numeric tables are bulk loaded."""
+
+    def __init__(self, filename):
+
+        with open(filename) as f:
+            self.lines = f.read().splitlines()
+
+        # Non-blank lines that are not comments, in file order
+        self.data_lines = [line.strip() for line in self.lines if line.strip() and line.strip()[0] != '!']
+
+        # Line number of the first "value KEY" line for each KEY
+        self.keys = {}
+        for i, line in enumerate(self.lines):
+            tokens = line.split()
+            if len(tokens) > 1 and tokens[1] not in self.keys:
+                self.keys[tokens[1]] = i
+
+        self._tables = {}
+
+    def value(self, key):
+        # first token of the line defining key
+        return self.lines[self.keys[key]].split()[0]
+
+    def table(self, start, nrow, ncol, data_lines=False):
+        # nrow x ncol float array starting at line start of self.lines (or self.data_lines), memoized
+        tbl_key = (start, nrow, ncol, data_lines)
+        if tbl_key not in self._tables:
+            lines = self.data_lines if data_lines else self.lines
+            self._tables[tbl_key] = read_table(lines[start:start+nrow], ncol)
+        return self._tables[tbl_key]
+
+# Number of tokenized input files kept in memory, least recently used first out
+FILE_CACHE_SIZE = 128
+
+@lru_cache(maxsize=FILE_CACHE_SIZE)
+def _tokenized_file(path, stamp):
+    # keyed by the file modification time and size, so that a modified file is read again
+    return FASTInputFile(path)
+
+def tokenize_file(filename):
+    # return the FASTInputFile of filename, only re-reading the file if it has been modified since the last call
+    path = os.path.realpath(filename)
+    st = os.stat(path)
+    return _tokenized_file(path, (st.st_mtime_ns, st.st_size))
+
+def clear_file_cache():
+    _tokenized_file.cache_clear()
+
 
 class InputReader_Common(object):
     """ Methods for reading input files that are (relatively) unchanged across FAST versions."""
@@ -138,44 +197,26 @@ class InputReader_Common(object):
         f.readline()
         f.readline()
         f.readline()
-        self.fst_vt['ElastoDynBlade']['BlFract'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-        self.fst_vt['ElastoDynBlade']['PitchAxis'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-        self.fst_vt['ElastoDynBlade']['StrcTwst'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-        self.fst_vt['ElastoDynBlade']['BMassDen'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-        self.fst_vt['ElastoDynBlade']['FlpStff'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-        self.fst_vt['ElastoDynBlade']['EdgStff'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
+        ncol = 17 if self.FAST_ver.lower() == 'fast7' else 6
+        data = read_table([f.readline() for i in range(self.fst_vt['ElastoDynBlade']['NBlInpSt'])], ncol)
+        self.fst_vt['ElastoDynBlade']['BlFract'] = data[:,0].tolist()
+        self.fst_vt['ElastoDynBlade']['PitchAxis'] = data[:,1].tolist()
+        self.fst_vt['ElastoDynBlade']['StrcTwst'] = data[:,2].tolist()
+        self.fst_vt['ElastoDynBlade']['BMassDen'] = data[:,3].tolist()
+        self.fst_vt['ElastoDynBlade']['FlpStff'] = data[:,4].tolist()
+        self.fst_vt['ElastoDynBlade']['EdgStff'] = data[:,5].tolist()
         if self.FAST_ver.lower() == 'fast7':
-            self.fst_vt['ElastoDynBlade']['GJStff'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-            self.fst_vt['ElastoDynBlade']['EAStff'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-            self.fst_vt['ElastoDynBlade']['Alpha'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-            self.fst_vt['ElastoDynBlade']['FlpIner'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-            self.fst_vt['ElastoDynBlade']['EdgIner'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-            self.fst_vt['ElastoDynBlade']['PrecrvRef'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-            self.fst_vt['ElastoDynBlade']['PreswpRef'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-            self.fst_vt['ElastoDynBlade']['FlpcgOf'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-            self.fst_vt['ElastoDynBlade']['Edgcgof'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-            self.fst_vt['ElastoDynBlade']['FlpEAOf'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-            self.fst_vt['ElastoDynBlade']['EdgEAOf'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-        for i in range(self.fst_vt['ElastoDynBlade']['NBlInpSt']):
-            data = f.readline().split()          
-            self.fst_vt['ElastoDynBlade']['BlFract'][i]  = float_read(data[0])
-            self.fst_vt['ElastoDynBlade']['PitchAxis'][i]  = float_read(data[1])
-            self.fst_vt['ElastoDynBlade']['StrcTwst'][i]  = float_read(data[2])
-            self.fst_vt['ElastoDynBlade']['BMassDen'][i]  = float_read(data[3])
-            self.fst_vt['ElastoDynBlade']['FlpStff'][i]  = float_read(data[4])
-            self.fst_vt['ElastoDynBlade']['EdgStff'][i]  = float_read(data[5])
-            if self.FAST_ver.lower() == 'fast7':
-                self.fst_vt['ElastoDynBlade']['GJStff'][i]  = float_read(data[6])
-                self.fst_vt['ElastoDynBlade']['EAStff'][i]  = float_read(data[7])
-                self.fst_vt['ElastoDynBlade']['Alpha'][i]  = float_read(data[8])
-                self.fst_vt['ElastoDynBlade']['FlpIner'][i]  = float_read(data[9])
-                self.fst_vt['ElastoDynBlade']['EdgIner'][i]  = float_read(data[10])
-                self.fst_vt['ElastoDynBlade']['PrecrvRef'][i]  = float_read(data[11])
-                self.fst_vt['ElastoDynBlade']['PreswpRef'][i]  = float_read(data[12])
-                self.fst_vt['ElastoDynBlade']['FlpcgOf'][i]  = float_read(data[13])
-                self.fst_vt['ElastoDynBlade']['Edgcgof'][i]  = float_read(data[14])
-                self.fst_vt['ElastoDynBlade']['FlpEAOf'][i]  = float_read(data[15])
-                self.fst_vt['ElastoDynBlade']['EdgEAOf'][i]  = float_read(data[16])
+            self.fst_vt['ElastoDynBlade']['GJStff'] = data[:,6].tolist()
+            self.fst_vt['ElastoDynBlade']['EAStff'] = data[:,7].tolist()
+            self.fst_vt['ElastoDynBlade']['Alpha'] = data[:,8].tolist()
+            self.fst_vt['ElastoDynBlade']['FlpIner'] = data[:,9].tolist()
+            self.fst_vt['ElastoDynBlade']['EdgIner'] = data[:,10].tolist()
+            self.fst_vt['ElastoDynBlade']['PrecrvRef'] = data[:,11].tolist()
+            self.fst_vt['ElastoDynBlade']['PreswpRef'] = data[:,12].tolist()
+            self.fst_vt['ElastoDynBlade']['FlpcgOf'] = data[:,13].tolist()
+            self.fst_vt['ElastoDynBlade']['Edgcgof'] = data[:,14].tolist()
+            self.fst_vt['ElastoDynBlade']['FlpEAOf'] = data[:,15].tolist()
+            self.fst_vt['ElastoDynBlade']['EdgEAOf'] = data[:,16].tolist()
 
         f.readline()
         self.fst_vt['ElastoDynBlade']['BldFl1Sh'] = [None] * 5
@@ -230,31 +271,19 @@ class InputReader_Common(object):
         f.readline()
         f.readline()
         f.readline()
-        self.fst_vt['ElastoDynTower']['HtFract'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
-        self.fst_vt['ElastoDynTower']['TMassDen'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
-        self.fst_vt['ElastoDynTower']['TwFAStif'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
-        self.fst_vt['ElastoDynTower']['TwSSStif'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
+        ncol = 10 if self.FAST_ver.lower() == 'fast7' else 4
+        data = read_table([f.readline() for i in range(self.fst_vt['ElastoDynTower']['NTwInpSt'])], ncol)
+        self.fst_vt['ElastoDynTower']['HtFract'] = data[:,0].tolist()
+        self.fst_vt['ElastoDynTower']['TMassDen'] = data[:,1].tolist()
+        self.fst_vt['ElastoDynTower']['TwFAStif'] = data[:,2].tolist()
+        self.fst_vt['ElastoDynTower']['TwSSStif'] = data[:,3].tolist()
         if self.FAST_ver.lower() == 'fast7':
-            self.fst_vt['ElastoDynTower']['TwGJStif'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
-            self.fst_vt['ElastoDynTower']['TwEAStif'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
-            self.fst_vt['ElastoDynTower']['TwFAIner'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
-            self.fst_vt['ElastoDynTower']['TwSSIner'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
-            self.fst_vt['ElastoDynTower']['TwFAcgOf'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
-            self.fst_vt['ElastoDynTower']['TwSScgOf'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
-
-        for i in range(self.fst_vt['ElastoDynTower']['NTwInpSt']):
-            data = f.readline().split()
-            self.fst_vt['ElastoDynTower']['HtFract'][i]  = float_read(data[0])
-            self.fst_vt['ElastoDynTower']['TMassDen'][i]  = float_read(data[1])
-            self.fst_vt['ElastoDynTower']['TwFAStif'][i]  = float_read(data[2])
-            self.fst_vt['ElastoDynTower']['TwSSStif'][i]  = float_read(data[3])
-            if self.FAST_ver.lower() == 'fast7':
-                self.fst_vt['ElastoDynTower']['TwGJStif'][i]  = float_read(data[4])
-                self.fst_vt['ElastoDynTower']['TwEAStif'][i]  = float_read(data[5])
-                self.fst_vt['ElastoDynTower']['TwFAIner'][i]  = float_read(data[6])
-                self.fst_vt['ElastoDynTower']['TwSSIner'][i]  = float_read(data[7])
-                self.fst_vt['ElastoDynTower']['TwFAcgOf'][i]  = float_read(data[8])
-                self.fst_vt['ElastoDynTower']['TwSScgOf'][i]  = float_read(data[9])           
+            self.fst_vt['ElastoDynTower']['TwGJStif'] = data[:,4].tolist()
+            self.fst_vt['ElastoDynTower']['TwEAStif'] = data[:,5].tolist()
+            self.fst_vt['ElastoDynTower']['TwFAIner'] = data[:,6].tolist()
+            self.fst_vt['ElastoDynTower']['TwSSIner'] = data[:,7].tolist()
+            self.fst_vt['ElastoDynTower']['TwFAcgOf'] = data[:,8].tolist()
+            self.fst_vt['ElastoDynTower']['TwSScgOf'] = data[:,9].tolist()
         
         # Tower Mode Shapes
         f.readline()
@@ -1096,121 +1125,62 @@ class InputReader_OpenFAST(InputReader_Common):
         # AeroDyn v5.00 Blade Definition File
 
         ad_blade_file = os.path.join(self.FAST_directory, self.fst_vt['AeroDyn15']['ADBlFile1'])
-        f = open(ad_blade_file)
+        f = tokenize_file(ad_blade_file)
 
-        f.readline()
-        f.readline()
-        f.readline()
         # Blade Properties
-        self.fst_vt['AeroDynBlade']['NumBlNds']       = int(f.readline().split()[0])
-        f.readline()
-        f.readline()
-        self.fst_vt['AeroDynBlade']['BlSpn']          = [None]*self.fst_vt['AeroDynBlade']['NumBlNds']
-        self.fst_vt['AeroDynBlade']['BlCrvAC']        = [None]*self.fst_vt['AeroDynBlade']['NumBlNds']
-        self.fst_vt['AeroDynBlade']['BlSwpAC']        = [None]*self.fst_vt['AeroDynBlade']['NumBlNds']
-        self.fst_vt['AeroDynBlade']['BlCrvAng']       = [None]*self.fst_vt['AeroDynBlade']['NumBlNds']
-        self.fst_vt['AeroDynBlade']['BlTwist']        = [None]*self.fst_vt['AeroDynBlade']['NumBlNds']
-        self.fst_vt['AeroDynBlade']['BlChord']        = [None]*self.fst_vt['AeroDynBlade']['NumBlNds']
-        self.fst_vt['AeroDynBlade']['BlAFID']         = [None]*self.fst_vt['AeroDynBlade']['NumBlNds']
-        for i in range(self.fst_vt['AeroDynBlade']['NumBlNds']):
-            data = [float(val) for val in f.readline().split()]
-            self.fst_vt['AeroDynBlade']['BlSpn'][i]   = data[0] 
-            self.fst_vt['AeroDynBlade']['BlCrvAC'][i] = data[1] 
-            self.fst_vt['AeroDynBlade']['BlSwpAC'][i] = data[2]
-            self.fst_vt['AeroDynBlade']['BlCrvAng'][i]= data[3]
-            self.fst_vt['AeroDynBlade']['BlTwist'][i] = data[4]
-            self.fst_vt['AeroDynBlade']['BlChord'][i] = data[5]
-            self.fst_vt['AeroDynBlade']['BlAFID'][i]  = data[6]
-        
-        f.close()
+        self.fst_vt['AeroDynBlade']['NumBlNds']       = int(f.value('NumBlNds'))
+        # table follows the column name and unit lines
+        data = f.table(f.keys['NumBlNds']+3, self.fst_vt['AeroDynBlade']['NumBlNds'], 7)
+        self.fst_vt['AeroDynBlade']['BlSpn']          = data[:,0].tolist()
+        self.fst_vt['AeroDynBlade']['BlCrvAC']        = data[:,1].tolist()
+        self.fst_vt['AeroDynBlade']['BlSwpAC']        = data[:,2].tolist()
+        self.fst_vt['AeroDynBlade']['BlCrvAng']       = data[:,3].tolist()
+        self.fst_vt['AeroDynBlade']['BlTwist']        = data[:,4].tolist()
+        self.fst_vt['AeroDynBlade']['BlChord']        = data[:,5].tolist()
+        self.fst_vt['AeroDynBlade']['BlAFID']         = data[:,6].tolist()
 
     def read_AeroDyn15Polar(self):
         # AirfoilInfo v1.01
 
-        def readline_filterComments(f):
-            read = True
-            while read:
-                line = f.readline().strip()
-                if len(line)>0:
-                    if line[0] != '!':
-                        read = False
-            return line
-
+        # Header values preceding the polar table, in file order
+        header = [('InterpOrd', int_read), ('NonDimArea', int_read), ('NumCoords', str), ('NumTabs', int_read),
+                  ('Re', float_read), ('Ctrl', int_read), ('InclUAdata', bool_read)]
+        # Unsteady Aero Data
+        header_UA = ['alpha0', 'alpha1', 'alpha2', 'eta_e', 'C_nalpha', 'T_f0', 'T_V0', 'T_p', 'T_VL', 'b1', 'b2', 'b5',
+                     'A1', 'A2', 'A5', 'S1', 'S2', 'S3', 'S4', 'Cn1', 'Cn2', 'St_sh', 'Cd0', 'Cm0', 'k0', 'k1', 'k2', 'k3',
+                     'k1_hat', 'x_cp_bar', 'UACutout', 'filtCutOff']
+        # Polar table columns
+        columns = [('Alpha', 'InCol_Alfa'), ('Cl', 'InCol_Cl'), ('Cd', 'InCol_Cd'), ('Cm', 'InCol_Cm'), ('Cpmin', 'InCol_Cpmin')]
+        ncol = max([self.fst_vt['AeroDyn15'][incol] for _, incol in columns])
 
         self.fst_vt['AeroDyn15']['af_data'] = [None]*self.fst_vt['AeroDyn15']['NumAFfiles']
 
         for afi, af_filename in enumerate(self.fst_vt['AeroDyn15']['AFNames']):
-            f = open(af_filename)
-            # print af_filename
+            # Files are tokenized once and cached by modification time, comment lines are skipped
+            af = tokenize_file(af_filename)
+            values = [line.split()[0] for line in af.data_lines]
 
             polar = {}
 
-            polar['InterpOrd']      = int_read(readline_filterComments(f).split()[0])
-            polar['NonDimArea']     = int_read(readline_filterComments(f).split()[0])
-            polar['NumCoords']      = readline_filterComments(f).split()[0]
-            polar['NumTabs']        = int_read(readline_filterComments(f).split()[0])
-            polar['Re']             = float_read(readline_filterComments(f).split()[0])
-            polar['Ctrl']           = int_read(readline_filterComments(f).split()[0])
-            polar['InclUAdata']     = bool_read(readline_filterComments(f).split()[0])
+            for i, (key, read) in enumerate(header):
+                polar[key] = read(values[i])
+            i = len(header)
 
-            # Unsteady Aero Data
             if polar['InclUAdata']:
-                polar['alpha0']     = float_read(readline_filterComments(f).split()[0])
-                polar['alpha1']     = float_read(readline_filterComments(f).split()[0])
-                polar['alpha2']     = float_read(readline_filterComments(f).split()[0])
-                polar['eta_e']      = float_read(readline_filterComments(f).split()[0])
-                polar['C_nalpha']   = float_read(readline_filterComments(f).split()[0])
-                polar['T_f0']       = float_read(readline_filterComments(f).split()[0])
-                polar['T_V0']       = float_read(readline_filterComments(f).split()[0])
-                polar['T_p']        = float_read(readline_filterComments(f).split()[0])
-                polar['T_VL']       = float_read(readline_filterComments(f).split()[0])
-                polar['b1']         = float_read(readline_filterComments(f).split()[0])
-                polar['b2']         = float_read(readline_filterComments(f).split()[0])
-                polar['b5']         = float_read(readline_filterComments(f).split()[0])
-                polar['A1']         = float_read(readline_filterComments(f).split()[0])
-                polar['A2']         = float_read(readline_filterComments(f).split()[0])
-                polar['A5']         = float_read(readline_filterComments(f).split()[0])
-                polar['S1']         = float_read(readline_filterComments(f).split()[0])
-                polar['S2']         = float_read(readline_filterComments(f).split()[0])
-                polar['S3']         = float_read(readline_filterComments(f).split()[0])
-                polar['S4']         = float_read(readline_filterComments(f).split()[0])
-                polar['Cn1']        = float_read(readline_filterComments(f).split()[0])
-                polar['Cn2']        = float_read(readline_filterComments(f).split()[0])
-                polar['St_sh']      = float_read(readline_filterComments(f).split()[0])
-                polar['Cd0']        = float_read(readline_filterComments(f).split()[0])
-                polar['Cm0']        = float_read(readline_filterComments(f).split()[0])
-                polar['k0']         = float_read(readline_filterComments(f).split()[0])
-                polar['k1']         = float_read(readline_filterComments(f).split()[0])
-                polar['k2']         = float_read(readline_filterComments(f).split()[0])
-                polar['k3']         = float_read(readline_filterComments(f).split()[0])
-                polar['k1_hat']     = float_read(readline_filterComments(f).split()[0])
-                polar['x_cp_bar']   = float_read(readline_filterComments(f).split()[0])
-                polar['UACutout']   = float_read(readline_filterComments(f).split()[0])
-                polar['filtCutOff'] = float_read(readline_filterComments(f).split()[0])
+                for key in header_UA:
+                    polar[key] = float_read(values[i])
+                    i += 1
 
             # Polar Data
-            polar['NumAlf']         = int_read(readline_filterComments(f).split()[0])
-            polar['Alpha']          = [None]*polar['NumAlf']
-            polar['Cl']             = [None]*polar['NumAlf']
-            polar['Cd']             = [None]*polar['NumAlf']
-            polar['Cm']             = [None]*polar['NumAlf']
-            polar['Cpmin']          = [None]*polar['NumAlf']
-            for i in range(polar['NumAlf']):
-                data = [float(val) for val in readline_filterComments(f).split()]
-                if self.fst_vt['AeroDyn15']['InCol_Alfa'] > 0:
-                    polar['Alpha'][i] = data[self.fst_vt['AeroDyn15']['InCol_Alfa']-1]
-                if self.fst_vt['AeroDyn15']['InCol_Cl'] > 0:
-                    polar['Cl'][i]    = data[self.fst_vt['AeroDyn15']['InCol_Cl']-1]
-                if self.fst_vt['AeroDyn15']['InCol_Cd'] > 0:
-                    polar['Cd'][i]    = data[self.fst_vt['AeroDyn15']['InCol_Cd']-1]
-                if self.fst_vt['AeroDyn15']['InCol_Cm'] > 0:
-                    polar['Cm'][i]    = data[self.fst_vt['AeroDyn15']['InCol_Cm']-1]
-                if self.fst_vt['AeroDyn15']['InCol_Cpmin'] > 0:
-                    polar['Cpmin'][i] = data[self.fst_vt['AeroDyn15']['InCol_Cpmin']-1]
+            polar['NumAlf']         = int_read(values[i])
+            data = af.table(i+1, polar['NumAlf'], ncol, data_lines=True)
+            for key, incol in columns:
+                if self.fst_vt['AeroDyn15'][incol] > 0:
+                    polar[key] = data[:, self.fst_vt['AeroDyn15'][incol]-1].tolist()
+                else:
+                    polar[key] = [None]*polar['NumAlf']
 
             self.fst_vt['AeroDyn15']['af_data'][afi] = polar
-            
-            f.close()
 
     def read_ServoDyn(self):
         # ServoDyn v1.05 Input File
@@ -1499,52 +1469,39 @@ class InputReader_OpenFAST(InputReader_Common):
         #AXIAL COEFFICIENTS
         f.readline()
         self.fst_vt['HydroDyn']['NAxCoef']       = int_read(f.readline().split()[0])
-        self.fst_vt['HydroDyn']['AxCoefID']      = [None]*self.fst_vt['HydroDyn']['NAxCoef']
-        self.fst_vt['HydroDyn']['AxCd']          = [None]*self.fst_vt['HydroDyn']['NAxCoef']
-        self.fst_vt['HydroDyn']['AxCa']          = [None]*self.fst_vt['HydroDyn']['NAxCoef']
-        self.fst_vt['HydroDyn']['AxCp']          = [None]*self.fst_vt['HydroDyn']['NAxCoef']
         ln = f.readline().split()
         ln = f.readline().split()
-        for i in range(self.fst_vt['HydroDyn']['NAxCoef']):
-            ln = f.readline().split()
-            self.fst_vt['HydroDyn']['AxCoefID'][i] = int(ln[0])
-            self.fst_vt['HydroDyn']['AxCd'][i]     = float(ln[1])
-            self.fst_vt['HydroDyn']['AxCa'][i]     = float(ln[2])
-            self.fst_vt['HydroDyn']['AxCp'][i]     = float(ln[3])
+        rows = [f.readline() for i in range(self.fst_vt['HydroDyn']['NAxCoef'])]
+        data = read_table(rows, 4)
+        self.fst_vt['HydroDyn']['AxCoefID'] = data[:,0].astype(int).tolist()
+        self.fst_vt['HydroDyn']['AxCd']     = data[:,1].tolist()
+        self.fst_vt['HydroDyn']['AxCa']     = data[:,2].tolist()
+        self.fst_vt['HydroDyn']['AxCp']     = data[:,3].tolist()
 
         #MEMBER JOINTS
         f.readline()
         self.fst_vt['HydroDyn']['NJoints']    = int_read(f.readline().split()[0])
-        self.fst_vt['HydroDyn']['JointID']    = [None]*self.fst_vt['HydroDyn']['NJoints']
-        self.fst_vt['HydroDyn']['Jointxi']    = [None]*self.fst_vt['HydroDyn']['NJoints']
-        self.fst_vt['HydroDyn']['Jointyi']    = [None]*self.fst_vt['HydroDyn']['NJoints']
-        self.fst_vt['HydroDyn']['Jointzi']    = [None]*self.fst_vt['HydroDyn']['NJoints']
-        self.fst_vt['HydroDyn']['JointAxID']  = [None]*self.fst_vt['HydroDyn']['NJoints']
-        self.fst_vt['HydroDyn']['JointOvrlp'] = [None]*self.fst_vt['HydroDyn']['NJoints']
         ln = f.readline().split()
         ln = f.readline().split()
-        for i in range(self.fst_vt['HydroDyn']['NJoints']):
-            ln = f.readline().split()
-            self.fst_vt['HydroDyn']['JointID'][i]    = int(ln[0])
-            self.fst_vt['HydroDyn']['Jointxi'][i]    = float(ln[1])
-            self.fst_vt['HydroDyn']['Jointyi'][i]    = float(ln[2])
-            self.fst_vt['HydroDyn']['Jointzi'][i]    = float(ln[3])
-            self.fst_vt['HydroDyn']['JointAxID'][i]  = int(ln[4])
-            self.fst_vt['HydroDyn']['JointOvrlp'][i] = int(ln[5])
+        rows = [f.readline() for i in range(self.fst_vt['HydroDyn']['NJoints'])]
+        data = read_table(rows, 6)
+        self.fst_vt['HydroDyn']['JointID']    = data[:,0].astype(int).tolist()
+        self.fst_vt['HydroDyn']['Jointxi']    = data[:,1].tolist()
+        self.fst_vt['HydroDyn']['Jointyi']    = data[:,2].tolist()
+        self.fst_vt['HydroDyn']['Jointzi']    = data[:,3].tolist()
+        self.fst_vt['HydroDyn']['JointAxID']  = data[:,4].astype(int).tolist()
+        self.fst_vt['HydroDyn']['JointOvrlp'] = data[:,5].astype(int).tolist()
 
         #MEMBER CROSS-SECTION PROPERTIES
         f.readline()
         self.fst_vt['HydroDyn']['NPropSets'] = int_read(f.readline().split()[0])
-        self.fst_vt['HydroDyn']['PropSetID'] = [None]*self.fst_vt['HydroDyn']['NPropSets']
-        self.fst_vt['HydroDyn']['PropD']     = [None]*self.fst_vt['HydroDyn']['NPropSets']
-        self.fst_vt['HydroDyn']['PropThck']  = [None]*self.fst_vt['HydroDyn']['NPropSets']
         ln = f.readline().split()
         ln = f.readline().split()
-        for i in range(self.fst_vt['HydroDyn']['NPropSets']):
-            ln = f.readline().split()
-            self.fst_vt['HydroDyn']['PropSetID'][i] = int(ln[0])
-            self.fst_vt['HydroDyn']['PropD'][i]     = float(ln[1])
-            self.fst_vt['HydroDyn']['PropThck'][i]  = float(ln[2])
+        rows = [f.readline() for i in range(self.fst_vt['HydroDyn']['NPropSets'])]
+        data = read_table(rows, 3)
+        self.fst_vt['HydroDyn']['PropSetID'] = data[:,0].astype(int).tolist()
+        self.fst_vt['HydroDyn']['PropD']     = data[:,1].tolist()
+        self.fst_vt['HydroDyn']['PropThck']  = data[:,2].tolist()
 
         #SIMPLE HYDRODYNAMIC COEFFICIENTS
         f.readline()
@@ -1565,107 +1522,66 @@ class InputReader_OpenFAST(InputReader_Common):
         #DEPTH-BASED HYDRODYNAMIC COEFFICIENTS
         f.readline()
         self.fst_vt['HydroDyn']['NCoefDpth']  = int_read(f.readline().split()[0])
-        self.fst_vt['HydroDyn']['Dpth']       = [None]*self.fst_vt['HydroDyn']['NCoefDpth']
-        self.fst_vt['HydroDyn']['DpthCd']     = [None]*self.fst_vt['HydroDyn']['NCoefDpth']
-        self.fst_vt['HydroDyn']['DpthCdMG']   = [None]*self.fst_vt['HydroDyn']['NCoefDpth']
-        self.fst_vt['HydroDyn']['DpthCa']     = [None]*self.fst_vt['HydroDyn']['NCoefDpth']
-        self.fst_vt['HydroDyn']['DpthCaMG']   = [None]*self.fst_vt['HydroDyn']['NCoefDpth']
-        self.fst_vt['HydroDyn']['DpthCp']     = [None]*self.fst_vt['HydroDyn']['NCoefDpth']
-        self.fst_vt['HydroDyn']['DpthCpMG']   = [None]*self.fst_vt['HydroDyn']['NCoefDpth']
-        self.fst_vt['HydroDyn']['DpthAxCa']   = [None]*self.fst_vt['HydroDyn']['NCoefDpth']
-        self.fst_vt['HydroDyn']['DpthAxCaMG'] = [None]*self.fst_vt['HydroDyn']['NCoefDpth']
-        self.fst_vt['HydroDyn']['DpthAxCp']   = [None]*self.fst_vt['HydroDyn']['NCoefDpth']
-        self.fst_vt['HydroDyn']['DpthAxCpMG'] = [None]*self.fst_vt['HydroDyn']['NCoefDpth']
         ln = f.readline().split()
         ln = f.readline().split()
-        for i in range(self.fst_vt['HydroDyn']['NCoefDpth']):
-            ln = f.readline().split()
-            self.fst_vt['HydroDyn']['Dpth'][i]       = float(ln[0])
-            self.fst_vt['HydroDyn']['DpthCd'][i]     = float(ln[1])
-            self.fst_vt['HydroDyn']['DpthCdMG'][i]   = float(ln[2])
-            self.fst_vt['HydroDyn']['DpthCa'][i]     = float(ln[3])
-            self.fst_vt['HydroDyn']['DpthCaMG'][i]   = float(ln[4])
-            self.fst_vt['HydroDyn']['DpthCp'][i]     = float(ln[5])
-            self.fst_vt['HydroDyn']['DpthCpMG'][i]   = float(ln[6])
-            self.fst_vt['HydroDyn']['DpthAxCa'][i]   = float(ln[7])
-            self.fst_vt['HydroDyn']['DpthAxCaMG'][i] = float(ln[8])
-            self.fst_vt['HydroDyn']['DpthAxCp'][i]   = float(ln[9])
-            self.fst_vt['HydroDyn']['DpthAxCpMG'][i] = float(ln[10])
+        rows = [f.readline() for i in range(self.fst_vt['HydroDyn']['NCoefDpth'])]
+        data = read_table(rows, 11)
+        self.fst_vt['HydroDyn']['Dpth']       = data[:,0].tolist()
+        self.fst_vt['HydroDyn']['DpthCd']     = data[:,1].tolist()
+        self.fst_vt['HydroDyn']['DpthCdMG']   = data[:,2].tolist()
+        self.fst_vt['HydroDyn']['DpthCa']     = data[:,3].tolist()
+        self.fst_vt['HydroDyn']['DpthCaMG']   = data[:,4].tolist()
+        self.fst_vt['HydroDyn']['DpthCp']     = data[:,5].tolist()
+        self.fst_vt['HydroDyn']['DpthCpMG']   = data[:,6].tolist()
+        self.fst_vt['HydroDyn']['DpthAxCa']   = data[:,7].tolist()
+        self.fst_vt['HydroDyn']['DpthAxCaMG'] = data[:,8].tolist()
+        self.fst_vt['HydroDyn']['DpthAxCp']   = data[:,9].tolist()
+        self.fst_vt['HydroDyn']['DpthAxCpMG'] = data[:,10].tolist()
 
         #MEMBER-BASED HYDRODYNAMIC COEFFICIENTS
         f.readline()
         self.fst_vt['HydroDyn']['NCoefMembers']  = int_read(f.readline().split()[0])
-        self.fst_vt['HydroDyn']['MemberID_HydC']      = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
-        self.fst_vt['HydroDyn']['MemberCd1']     = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
-        self.fst_vt['HydroDyn']['MemberCd2']     = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
-        self.fst_vt['HydroDyn']['MemberCdMG1']   = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
-        self.fst_vt['HydroDyn']['MemberCdMG2']   = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
-        self.fst_vt['HydroDyn']['MemberCa1']     = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
-        self.fst_vt['HydroDyn']['MemberCa2']     = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
-        self.fst_vt['HydroDyn']['MemberCaMG1']   = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
-        self.fst_vt['HydroDyn']['MemberCaMG2']   = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
-        self.fst_vt['HydroDyn']['MemberCp1']     = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
-        self.fst_vt['HydroDyn']['MemberCp2']     = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
-        self.fst_vt['HydroDyn']['MemberCpMG1']   = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
-        self.fst_vt['HydroDyn']['MemberCpMG2']   = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
-        self.fst_vt['HydroDyn']['MemberAxCa1']   = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
-        self.fst_vt['HydroDyn']['MemberAxCa2']   = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
-        self.fst_vt['HydroDyn']['MemberAxCaMG1'] = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
-        self.fst_vt['HydroDyn']['MemberAxCaMG2'] = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
-        self.fst_vt['HydroDyn']['MemberAxCp1']   = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
-        self.fst_vt['HydroDyn']['MemberAxCp2']   = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
-        self.fst_vt['HydroDyn']['MemberAxCpMG1'] = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
-        self.fst_vt['HydroDyn']['MemberAxCpMG2'] = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
-
-        f.readline()
-        f.readline()
-        for i in range(self.fst_vt['HydroDyn']['NCoefMembers']):
-            ln = f.readline().split()
-            self.fst_vt['HydroDyn']['MemberID_HydC'][i]      = int(ln[0])
-            self.fst_vt['HydroDyn']['MemberCd1'][i]     = float(ln[1])
-            self.fst_vt['HydroDyn']['MemberCd2'][i]     = float(ln[2])
-            self.fst_vt['HydroDyn']['MemberCdMG1'][i]   = float(ln[3])
-            self.fst_vt['HydroDyn']['MemberCdMG2'][i]   = float(ln[4])
-            self.fst_vt['HydroDyn']['MemberCa1'][i]     = float(ln[5])
-            self.fst_vt['HydroDyn']['MemberCa2'][i]     = float(ln[6])
-            self.fst_vt['HydroDyn']['MemberCaMG1'][i]   = float(ln[7])
-            self.fst_vt['HydroDyn']['MemberCaMG2'][i]   = float(ln[8])
-            self.fst_vt['HydroDyn']['MemberCp1'][i]     = float(ln[9])
-            self.fst_vt['HydroDyn']['MemberCp2'][i]     = float(ln[10])
-            self.fst_vt['HydroDyn']['MemberCpMG1'][i]   = float(ln[11])
-            self.fst_vt['HydroDyn']['MemberCpMG2'][i]   = float(ln[12])
-            self.fst_vt['HydroDyn']['MemberAxCa1'][i]   = float(ln[13])
-            self.fst_vt['HydroDyn']['MemberAxCa2'][i]   = float(ln[14])
-            self.fst_vt['HydroDyn']['MemberAxCaMG1'][i] = float(ln[15])
-            self.fst_vt['HydroDyn']['MemberAxCaMG2'][i] = float(ln[16])
-            self.fst_vt['HydroDyn']['MemberAxCp1'][i]   = float(ln[17])
-            self.fst_vt['HydroDyn']['MemberAxCp2'][i]   = float(ln[18])
-            self.fst_vt['HydroDyn']['MemberAxCpMG1'][i] = float(ln[19])
-            self.fst_vt['HydroDyn']['MemberAxCpMG2'][i] = float(ln[20])
+        f.readline()
+        f.readline()
+        rows = [f.readline() for i in range(self.fst_vt['HydroDyn']['NCoefMembers'])]
+        data = read_table(rows, 21)
+        self.fst_vt['HydroDyn']['MemberID_HydC'] = data[:,0].astype(int).tolist()
+        self.fst_vt['HydroDyn']['MemberCd1']     = data[:,1].tolist()
+        self.fst_vt['HydroDyn']['MemberCd2']     = data[:,2].tolist()
+        self.fst_vt['HydroDyn']['MemberCdMG1']   = data[:,3].tolist()
+        self.fst_vt['HydroDyn']['MemberCdMG2']   = data[:,4].tolist()
+        self.fst_vt['HydroDyn']['MemberCa1']     = data[:,5].tolist()
+        self.fst_vt['HydroDyn']['MemberCa2']     = data[:,6].tolist()
+        self.fst_vt['HydroDyn']['MemberCaMG1']   = data[:,7].tolist()
+        self.fst_vt['HydroDyn']['MemberCaMG2']   = data[:,8].tolist()
+        self.fst_vt['HydroDyn']['MemberCp1']     = data[:,9].tolist()
+        self.fst_vt['HydroDyn']['MemberCp2']     = data[:,10].tolist()
+        self.fst_vt['HydroDyn']['MemberCpMG1']   = data[:,11].tolist()
+        self.fst_vt['HydroDyn']['MemberCpMG2']   = data[:,12].tolist()
+        self.fst_vt['HydroDyn']['MemberAxCa1']   = data[:,13].tolist()
+        self.fst_vt['HydroDyn']['MemberAxCa2']   = data[:,14].tolist()
+        self.fst_vt['HydroDyn']['MemberAxCaMG1'] = data[:,15].tolist()
+        self.fst_vt['HydroDyn']['MemberAxCaMG2'] = data[:,16].tolist()
+        self.fst_vt['HydroDyn']['MemberAxCp1']   = data[:,17].tolist()
+        self.fst_vt['HydroDyn']['MemberAxCp2']   = data[:,18].tolist()
+        self.fst_vt['HydroDyn']['MemberAxCpMG1'] = data[:,19].tolist()
+        self.fst_vt['HydroDyn']['MemberAxCpMG2'] = data[:,20].tolist()
 
         #MEMBERS
         f.readline()
         self.fst_vt['HydroDyn']['NMembers']    = int_read(f.readline().split()[0])
-        self.fst_vt['HydroDyn']['MemberID']    = [None]*self.fst_vt['HydroDyn']['NMembers']
-        self.fst_vt['HydroDyn']['MJointID1']   = [None]*self.fst_vt['HydroDyn']['NMembers']
-        self.fst_vt['HydroDyn']['MJointID2']   = [None]*self.fst_vt['HydroDyn']['NMembers']
-        self.fst_vt['HydroDyn']['MPropSetID1'] = [None]*self.fst_vt['HydroDyn']['NMembers']
-        self.fst_vt['HydroDyn']['MPropSetID2'] = [None]*self.fst_vt['HydroDyn']['NMembers']
-        self.fst_vt['HydroDyn']['MDivSize']    = [None]*self.fst_vt['HydroDyn']['NMembers']
-        self.fst_vt['HydroDyn']['MCoefMod']    = [None]*self.fst_vt['HydroDyn']['NMembers']
-        self.fst_vt['HydroDyn']['PropPot']     = [None]*self.fst_vt['HydroDyn']['NMembers']
         ln = f.readline().split()
         ln = f.readline().split()
-        for i in range(self.fst_vt['HydroDyn']['NMembers']):
-            ln = f.readline().split()
-            self.fst_vt['HydroDyn']['MemberID'][i]    = int(ln[0])
-            self.fst_vt['HydroDyn']['MJointID1'][i]   = int(ln[1])
-            self.fst_vt['HydroDyn']['MJointID2'][i]   = int(ln[2])
-            self.fst_vt['HydroDyn']['MPropSetID1'][i] = int(ln[3])
-            self.fst_vt['HydroDyn']['MPropSetID2'][i] = int(ln[4])
-            self.fst_vt['HydroDyn']['MDivSize'][i]    = float(ln[5])
-            self.fst_vt['HydroDyn']['MCoefMod'][i]    = int(ln[6])
-            self.fst_vt['HydroDyn']['PropPot'][i]     = bool_read(ln[7])
+        rows = [f.readline() for i in range(self.fst_vt['HydroDyn']['NMembers'])]
+        data = read_table(rows, 7)
+        self.fst_vt['HydroDyn']['MemberID']    = data[:,0].astype(int).tolist()
+        self.fst_vt['HydroDyn']['MJointID1']   = data[:,1].astype(int).tolist()
+        self.fst_vt['HydroDyn']['MJointID2']   = data[:,2].astype(int).tolist()
+        self.fst_vt['HydroDyn']['MPropSetID1'] = data[:,3].astype(int).tolist()
+        self.fst_vt['HydroDyn']['MPropSetID2'] = data[:,4].astype(int).tolist()
+        self.fst_vt['HydroDyn']['MDivSize']    = data[:,5].tolist()
+        self.fst_vt['HydroDyn']['MCoefMod']    = data[:,6].astype(int).tolist()
+        self.fst_vt['HydroDyn']['PropPot']     = [bool_read(row.split()[7]) for row in rows]
 
         #FILLED MEMBERS
         f.readline()
@@ -1686,30 +1602,24 @@ class InputReader_OpenFAST(InputReader_Common):
         #MARINE GROWTH
         f.readline()
         self.fst_vt['HydroDyn']['NMGDepths'] = int_read(f.readline().split()[0])
-        self.fst_vt['HydroDyn']['MGDpth']    = [None]*self.fst_vt['HydroDyn']['NMGDepths']
-        self.fst_vt['HydroDyn']['MGThck']    = [None]*self.fst_vt['HydroDyn']['NMGDepths']
-        self.fst_vt['HydroDyn']['MGDens']    = [None]*self.fst_vt['HydroDyn']['NMGDepths']
         ln = f.readline().split()
         ln = f.readline().split()
-        for i in range(self.fst_vt['HydroDyn']['NMGDepths']):
-            ln = f.readline().split()
-            self.fst_vt['HydroDyn']['MGDpth'][i] = float(ln[0])
-            self.fst_vt['HydroDyn']['MGThck'][i] = float(ln[1])
-            self.fst_vt['HydroDyn']['MGDens'][i] = float(ln[2])
+        rows = [f.readline() for i in range(self.fst_vt['HydroDyn']['NMGDepths'])]
+        data = read_table(rows, 3)
+        self.fst_vt['HydroDyn']['MGDpth'] = data[:,0].tolist()
+        self.fst_vt['HydroDyn']['MGThck'] = data[:,1].tolist()
+        self.fst_vt['HydroDyn']['MGDens'] = data[:,2].tolist()
 
         #MEMBER OUTPUT LIST
         f.readline()
         self.fst_vt['HydroDyn']['NMOutputs'] = int_read(f.readline().split()[0])
-        self.fst_vt['HydroDyn']['MemberID_out']  = [None]*self.fst_vt['HydroDyn']['NMOutputs']
-        self.fst_vt['HydroDyn']['NOutLoc']   = [None]*self.fst_vt['HydroDyn']['NMOutputs']
-        self.fst_vt['HydroDyn']['NodeLocs']  = [None]*self.fst_vt['HydroDyn']['NMOutputs']
         ln = f.readline().split()
         ln = f.readline().split()
-        for i in range(self.fst_vt['HydroDyn']['NMOutputs']):
-            ln = f.readline().split()
-            self.fst_vt['HydroDyn']['MemberID_out'][i] = int(ln[0])
-            self.fst_vt['HydroDyn']['NOutLoc'][i]  = int(ln[1])
-            self.fst_vt['HydroDyn']['NodeLocs'][i] = float(ln[2])
+        rows = [f.readline() for i in range(self.fst_vt['HydroDyn']['NMOutputs'])]
+        data = read_table(rows, 3)
+        self.fst_vt['HydroDyn']['MemberID_out'] = data[:,0].astype(int).tolist()
+        self.fst_vt['HydroDyn']['NOutLoc']      = data[:,1].astype(int).tolist()
+        self.fst_vt['HydroDyn']['NodeLocs']     = data[:,2].tolist()
 
         #JOINT OUTPUT LIST
         f.readline()
@@ -1,4 +1,6 @@
 import os
+import asyncio
+import concurrent.futures
 import subprocess
 import platform
 
@@ -11,6 +13,8 @@ class FastWrapper(object):
         self.FAST_InputFile = None   # FAST input file (ext=.fst)
         self.FAST_directory = None   # Path to fst directory files
         self.debug_level = 0 #(0:quiet, 1:output task description, 2:full FAST stdout)
+        self.timeout = None    # Wall-clock limit in seconds, only used by execute_async
+        self.log_file = None   # File capturing stdout/stderr, only used by execute_async
 
         # Optional population class attributes from key word arguments
         for k, w in kwargs.items():
@@ -21,7 +25,7 @@ class FastWrapper(object):
 
         super(FastWrapper, self).__init__()
 
-    def execute(self):
+    def get_exec_str(self):
 
         self.input_file = os.path.join(self.FAST_directory, self.FAST_InputFile)
 
@@ -35,9 +39,6 @@ class FastWrapper(object):
         exec_str.append(self.FAST_exe)
         exec_str.append(self.FAST_InputFile)
 
-        olddir = os.getcwd()
-        os.chdir(self.FAST_directory)
-
         if self.debug_level > 0:
             print ("EXECUTING", self.FAST_ver)
             print ("Executable: \t", self.FAST_exe)
@@ -45,13 +46,109 @@ class FastWrapper(object):
             print ("Input file: \t", self.FAST_InputFile)
             print ("Exec string: \t", exec_str)
 
+        return exec_str
+
+    def execute(self):
+
+        exec_str = self.get_exec_str()
+
+        # Run in FAST_directory through cwd rather than os.chdir, so that
+        # executions from multiple threads don't change each other's paths
         if self.debug_level > 1:
-            subprocess.call(exec_str)
+            subprocess.call(exec_str, cwd=self.FAST_directory)
         else:
             FNULL = open(os.devnull, 'w')
-            subprocess.call(exec_str, stdout=FNULL, stderr=subprocess.STDOUT)
+            subprocess.call(exec_str, stdout=FNULL, stderr=subprocess.STDOUT, cwd=self.FAST_directory)
+
+    async def execute_async(self, semaphore=None):
+        # Coroutine version of execute. Output is written to log_file (or
+        # discarded), the run is killed after timeout seconds, and if a
+        # semaphore is given it bounds the number of concurrent runs.
+        # Returns the process return code, or None if the run timed out.
+
+        exec_str = self.get_exec_str()
+        return await run_subprocess_async(exec_str, self.FAST_directory, log_file=self.log_file,
+                                          timeout=self.timeout, semaphore=semaphore,
+                                          debug_level=self.debug_level)
 
-        os.chdir(olddir)
+
+async def run_subprocess_async(exec_str, cwd, log_file=None, timeout=None, semaphore=None, debug_level=0):
+    # Run exec_str in directory cwd without blocking the event loop
+
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(1)
+
+    async with semaphore:
+        if log_file:
+            out = open(log_file, 'w')
+        elif debug_level > 1:
+            out = None
+        else:
+            out = subprocess.DEVNULL
+
+        try:
+            proc = await asyncio.create_subprocess_exec(*exec_str, cwd=cwd, stdout=out, stderr=subprocess.STDOUT)
+            try:
+                returncode = await asyncio.wait_for(proc.wait(), timeout)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                returncode = None
+                if debug_level > 0:
+                    print('TIMEOUT after %s s: %s (in %s)'%(timeout, ' '.join(exec_str), cwd))
+        finally:
+            if log_file:
+                out.close()
+
+    if debug_level > 0 and returncode is not None:
+        print('COMPLETE: %s (in %s), return code %d'%(' '.join(exec_str), cwd, returncode))
+
+    return returncode
+
+
+def print_progress(n_done, n_total, wrapper, returncode):
+    # Default progress report of run_async, one line per completed run
+    print('%d/%d runs complete: %s, return code %s'%(n_done, n_total, getattr(wrapper, 'FAST_InputFile', wrapper), returncode))
+
+
+async def gather_async(wrappers, n_concurrent=None, progress=None):
+    # Coroutine running a list of FastWrapper (or other objects with an
+    # execute_async coroutine) concurrently, with at most n_concurrent
+    # executables running at once. progress, if given, is called as
+    # progress(n_done, n_total, wrapper, returncode) after each run completes
+    # (True prints a line per run). Returns the return codes, in the order of
+    # wrappers. Use this with await from code already running an event loop.
+
+    if not n_concurrent:
+        n_concurrent = os.cpu_count()
+    if progress is True:
+        progress = print_progress
+
+    semaphore = asyncio.Semaphore(n_concurrent)
+    n_done = [0]
+
+    async def _run_one(wrapper):
+        returncode = await wrapper.execute_async(semaphore=semaphore)
+        n_done[0] += 1
+        if progress:
+            progress(n_done[0], len(wrappers), wrapper, returncode)
+        return returncode
+
+    return await asyncio.gather(*[_run_one(w) for w in wrappers])
+
+
+def run_async(wrappers, n_concurrent=None, progress=None):
+    # Blocking version of gather_async. If this thread already runs an event
+    # loop (Jupyter, asynchronous drivers), where asyncio.run is not allowed,
+    # the runs get their own event loop in a worker thread.
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(gather_async(wrappers, n_concurrent=n_concurrent, progress=progress))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, gather_async(wrappers, n_concurrent=n_concurrent, progress=progress)).result()
 
 if __name__=="__main__":
 
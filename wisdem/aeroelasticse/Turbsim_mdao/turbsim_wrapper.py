@@ -1,5 +1,7 @@
 import os
 import subprocess
+from wisdem.aeroelasticse.FAST_wrapper import run_subprocess_async
+
 class Turbsim_wrapper(object):
     def __init__(self):
         self.turbsim_exe = 'turbsim'
@@ -7,11 +9,11 @@ class Turbsim_wrapper(object):
         self.turbsim_input = "/Users/pgraf/work/wese/turbsim_studies/pghacking/TurbSim.inp"
         self.run_dir = '.'
         self.debug_level = 2
+        self.timeout = None    # Wall-clock limit in seconds, only used by execute_async
+        self.log_file = None   # File capturing stdout/stderr, only used by execute_async
 
     def execute(self):
         exec_string = [self.turbsim_exe, self.turbsim_input]
-        olddir = os.getcwd()
-        os.chdir(self.run_dir)
 
         if self.debug_level > 0:
             print ("EXECUTING TurbSim")
@@ -21,15 +23,20 @@ class Turbsim_wrapper(object):
             print ("Exec string: \t", exec_string)
 
         if self.debug_level > 1:
-            subprocess.call(exec_string)
+            subprocess.call(exec_string, cwd=self.run_dir)
         else:
             FNULL = open(os.devnull, 'w')
-            subprocess.call(exec_string, stdout=FNULL, stderr=subprocess.STDOUT)
+            subprocess.call(exec_string, stdout=FNULL, stderr=subprocess.STDOUT, cwd=self.run_dir)
 
         if self.debug_level > 0:
             print ("COMPLETE TurbSim")
 
-        os.chdir(olddir)
+    async def execute_async(self, semaphore=None):
+        # Coroutine version of execute, see FastWrapper.execute_async
+        exec_string = [self.turbsim_exe, self.turbsim_input]
+        return await run_subprocess_async(exec_string, self.run_dir, log_file=self.log_file,
+                                          timeout=self.timeout, semaphore=semaphore,
+                                          debug_level=self.debug_level)
 if __name__=='__main__':
     wrapper = Turbsim_wrapper()
     wrapper.turbsim_exe = '/Users/jquick/TurbSim/bin/TurbSim_glin64'
@@ -80,282 +80,180 @@ class pyIECWind_extreme():
 
         return sigma_1, V_e50, V_e1, V_50, V_1
 
-    def EOG(self, V_hub_in):
+    def transient_time(self, T):
+        # Time vector of a transient event of length T
+        return np.linspace(0., T, num=int(round(T/self.dt))+1)
+
+    def flow_angle(self, V_hub_in):
+        # Flow angle adjustments
+        V_hub = V_hub_in*np.cos(self.Vert_Slope*np.pi/180)
+        V_vert_mag = V_hub_in*np.sin(self.Vert_Slope*np.pi/180)
+        return V_hub, V_vert_mag
+
+    def wnd_columns(self, t, n_cases, V=0., V_dir=0., V_vert=0., shear_horz=0., shear_vert=0., shear_vert_lin=0., V_gust=0.):
+        # Stack the .wnd file columns into an (n_cases, n_time, 8) array, inputs are broadcast against (n_cases, n_time)
+        data = np.zeros((n_cases, t.size, 8))
+        data[:,:,0] = t
+        for j, val in enumerate([V, V_dir, V_vert, shear_horz, shear_vert, shear_vert_lin, V_gust]):
+            data[:,:,j+1] = val
+        return data
+
+    def EOG_events(self, V_hub_in):
         # Extreme operating guest: 6.3.2.2
+        # Returns a list of (name, title, data, sigma_1) for the array of hub height wind speeds V_hub_in, where data has shape (n_cases, n_time, 8)
 
         self.setup()
+        V_hub_in = np.atleast_1d(np.asarray(V_hub_in, dtype=float))
 
         T = 10.5
-        t = np.linspace(0., T, num=(T/self.dt+1))
+        t = self.transient_time(T)
 
         # constants from standard
         alpha = 0.2
 
-        # Flow angle adjustments
-        V_hub = V_hub_in*np.cos(self.Vert_Slope*np.pi/180)
-        V_vert_mag = V_hub_in*np.sin(self.Vert_Slope*np.pi/180)
+        V_hub, V_vert_mag = self.flow_angle(V_hub_in)
 
         sigma_1 = self.NTM(V_hub)
         __, __, V_e1, __, __ = self.EWM(V_hub)
 
-        # Contant variables
-        V = np.zeros_like(t)+V_hub
-        V_dir = np.zeros_like(t)
-        V_vert = np.zeros_like(t)+V_vert_mag
-        shear_horz = np.zeros_like(t)
-        shear_vert = np.zeros_like(t)+alpha
-        shear_vert_lin = np.zeros_like(t)
-        V_gust = np.zeros_like(t)
-
-        V_gust = min([ 1.35*(V_e1 - V_hub), 3.3*(sigma_1/(1+0.1*(self.D/self.Sigma_1))) ])
-
-        V_gust_t = np.zeros_like(t)
-        for i, ti in enumerate(t):
-            if ti<T:
-                V_gust_t[i] = 0. - 0.37*V_gust*np.sin(3*np.pi*ti/T)*(1-np.cos(2*np.pi*ti/T))
-            else:
-                V_gust_t[i] = 0.
-
-        # Write Files
-        self.fname_out = []
-        self.fname_type = []
-        fname = self.case_name + '_EOG_U%2.1f.wnd'%V_hub_in
-        data = np.column_stack((t, V, V_dir, V_vert, shear_horz, shear_vert, shear_vert_lin, V_gust_t))
-        hd = []
-        hd.append('! Extreme operating guest\n')
-        hd = self.heading_common(hd)
-        hd = self.heading_variable(hd, V_hub_in=V_hub_in, sigma_1=sigma_1)
-        self.write_wnd(fname, data, hd)
-        self.fname_out.append(os.path.realpath(os.path.normpath(os.path.join(self.outdir, fname))))
-        self.fname_type.append(2)
+        V_gust = np.minimum(1.35*(V_e1 - V_hub), 3.3*(sigma_1/(1+0.1*(self.D/self.Sigma_1))))
+        V_gust_t = np.where(t<T, 0. - 0.37*V_gust[:,None]*np.sin(3*np.pi*t/T)*(1-np.cos(2*np.pi*t/T)), 0.)
 
+        data = self.wnd_columns(t, V_hub_in.size, V=V_hub[:,None], V_vert=V_vert_mag[:,None], shear_vert=alpha, V_gust=V_gust_t)
 
+        return [('EOG', '! Extreme operating guest\n', data, sigma_1)]
 
-    def EDC(self, V_hub_in):
+    def EDC_events(self, V_hub_in):
         # Extreme direction change: 6.3.2.4
 
         self.setup()
-        
+        V_hub_in = np.atleast_1d(np.asarray(V_hub_in, dtype=float))
+
         T = 6.
-        t = np.linspace(0., T, num=(T/self.dt+1))
+        t = self.transient_time(T)
 
         # constants from standard
         alpha = 0.2
 
-        # Flow angle adjustments
-        V_hub = V_hub_in*np.cos(self.Vert_Slope*np.pi/180)
-        V_vert_mag = V_hub_in*np.sin(self.Vert_Slope*np.pi/180)
+        V_hub, V_vert_mag = self.flow_angle(V_hub_in)
 
         sigma_1 = self.NTM(V_hub)
 
-        # Contant variables
-        V = np.zeros_like(t)+V_hub
-        V_vert = np.zeros_like(t)+V_vert_mag
-        shear_horz = np.zeros_like(t)
-        shear_vert = np.zeros_like(t)+alpha
-        shear_vert_lin = np.zeros_like(t)
-        V_gust = np.zeros_like(t)
-
         # Transcient
         Theta_e = 4.*np.arctan(sigma_1/(V_hub*(1.+0.01*(self.D/self.Sigma_1))))*180./np.pi
-        if Theta_e > 180.:
-            Theta_e = 180.
-
-        Theta_p = np.zeros_like(t)
-        Theta_n = np.zeros_like(t)
-        for i, ti in enumerate(t):
-            if ti<T:
-                Theta_p[i] = 0.5*Theta_e*(1-np.cos(np.pi*ti/T))
-                Theta_n[i] = -1*0.5*Theta_e*(1-np.cos(np.pi*ti/T))
-            else:
-                Theta_p[i] = Theta_e
-                Theta_n[i] = -1*Theta_e
-
-        # Write Files
-        self.fname_out = []
-        self.fname_type = []
-        if self.dir_change.lower() == 'both' or self.dir_change.lower() == '+':
-            ## Vert
-            fname = self.case_name + '_EDC_P_U%2.1f.wnd'%V_hub_in
-            data = np.column_stack((t, V, Theta_p, V_vert, shear_horz, shear_vert, shear_vert_lin, V_gust))
-            hd = []
-            hd.append('! Exteme Vertical Wind Shear, positive\n')
-            hd = self.heading_common(hd)
-            hd = self.heading_variable(hd, V_hub_in=V_hub_in, sigma_1=sigma_1)
-            self.write_wnd(fname, data, hd)
-            self.fname_out.append(os.path.realpath(os.path.normpath(os.path.join(self.outdir, fname))))
-            self.fname_type.append(2)
-
-
-        if self.dir_change.lower() == 'both' or self.dir_change.lower() == '-':
-            ## Vert
-            fname = self.case_name + '_EDC_N_U%2.1f.wnd'%V_hub_in
-            data = np.column_stack((t, V, Theta_n, V_vert, shear_horz, shear_vert, shear_vert_lin, V_gust))
-            hd = []
-            hd.append('! Exteme Vertical Wind Shear, negative\n')
-            hd = self.heading_common(hd)
-            hd = self.heading_variable(hd, V_hub_in=V_hub_in, sigma_1=sigma_1)
-            self.write_wnd(fname, data, hd)
-            self.fname_out.append(os.path.realpath(os.path.normpath(os.path.join(self.outdir, fname))))
-            self.fname_type.append(2)
-
-         
-    def ECD(self, V_hub_in):
+        Theta_e = np.minimum(Theta_e, 180.)[:,None]
+        Theta_p = np.where(t<T, 0.5*Theta_e*(1-np.cos(np.pi*t/T)), Theta_e)
+
+        events = []
+        for sign, name, title in [('+', 'EDC_P', '! Exteme Vertical Wind Shear, positive\n'), ('-', 'EDC_N', '! Exteme Vertical Wind Shear, negative\n')]:
+            if self.dir_change.lower() == 'both' or self.dir_change.lower() == sign:
+                data = self.wnd_columns(t, V_hub_in.size, V=V_hub[:,None], V_dir=Theta_p if sign == '+' else -1*Theta_p,
+                                        V_vert=V_vert_mag[:,None], shear_vert=alpha)
+                events.append((name, title, data, sigma_1))
+
+        return events
+
+    def ECD_events(self, V_hub_in):
         # Extreme coherent gust with direction change: 6.3.2.5
 
         self.setup()
-        
+        V_hub_in = np.atleast_1d(np.asarray(V_hub_in, dtype=float))
+
         T = 10.
-        t = np.linspace(0., T, num=(T/self.dt+1))
+        t = self.transient_time(T)
 
         # constants from standard
         alpha = 0.2
         V_cg = 15 #m/s
 
-        # Flow angle adjustments
-        V_hub = V_hub_in*np.cos(self.Vert_Slope*np.pi/180)
-        V_vert_mag = V_hub_in*np.sin(self.Vert_Slope*np.pi/180)
-
-        sigma_1 = self.NTM(V_hub)
+        V_hub, V_vert_mag = self.flow_angle(V_hub_in)
 
-        # Contant variables
-        V_vert = np.zeros_like(t)+V_vert_mag
-        shear_horz = np.zeros_like(t)
-        shear_vert = np.zeros_like(t)+alpha
-        shear_vert_lin = np.zeros_like(t)
-        V_gust = np.zeros_like(t)
+        # Transcient, Theta_cg is 180 deg below 4 m/s
+        Theta_cg = (720/np.maximum(V_hub, 4))[:,None]
+        V = np.where(t<T, V_hub[:,None] + 0.5*V_cg*(1-np.cos(np.pi*t/T)), V_hub[:,None]+V_cg)
+        Theta_p = np.where(t<T, 0.5*Theta_cg*(1-np.cos(np.pi*t/T)), Theta_cg)
 
-        # Transcient
-        if V_hub < 4:
-            Theta_cg = 180
-        else:
-            Theta_cg = 720/V_hub
-
-        Theta_p = np.zeros_like(t)
-        Theta_n = np.zeros_like(t)
-        V = np.zeros_like(t)
-        for i, ti in enumerate(t):
-            if ti<T:
-                V[i] = V_hub + 0.5*V_cg*(1-np.cos(np.pi*ti/T))
-                Theta_p[i] = 0.5*Theta_cg*(1-np.cos(np.pi*ti/T))
-                Theta_n[i] = -1*0.5*Theta_cg*(1-np.cos(np.pi*ti/T))
-            else:
-                V[i] = V_hub+V_cg
-                Theta_p[i] = Theta_cg
-                Theta_n[i] = -1*Theta_cg
-
-        # Write Files
-        self.fname_out = []
-        self.fname_type = []
-        if self.dir_change.lower() == 'both' or self.dir_change.lower() == '+':
-            ## Vert
-            fname = self.case_name + '_ECD_P_U%2.1f.wnd'%V_hub_in
-            data = np.column_stack((t, V, Theta_p, V_vert, shear_horz, shear_vert, shear_vert_lin, V_gust))
-            hd = []
-            hd.append('! Exteme coherent gust with direction change, positive\n')
-            hd = self.heading_common(hd)
-            hd = self.heading_variable(hd, V_hub_in=V_hub_in)
-            self.write_wnd(fname, data, hd)
-            self.fname_out.append(os.path.realpath(os.path.normpath(os.path.join(self.outdir, fname))))
-            self.fname_type.append(2)
-
-
-        if self.dir_change.lower() == 'both' or self.dir_change.lower() == '-':
-            ## Vert
-            fname = self.case_name + '_ECD_N_U%2.1f.wnd'%V_hub_in
-            data = np.column_stack((t, V, Theta_n, V_vert, shear_horz, shear_vert, shear_vert_lin, V_gust))
-            hd = []
-            hd.append('! Exteme coherent gust with direction change, negative\n')
-            hd = self.heading_common(hd)
-            hd = self.heading_variable(hd, V_hub_in=V_hub_in)
-            self.write_wnd(fname, data, hd)
-            self.fname_out.append(os.path.realpath(os.path.normpath(os.path.join(self.outdir, fname))))
-            self.fname_type.append(2)
+        events = []
+        for sign, name, title in [('+', 'ECD_P', '! Exteme coherent gust with direction change, positive\n'), ('-', 'ECD_N', '! Exteme coherent gust with direction change, negative\n')]:
+            if self.dir_change.lower() == 'both' or self.dir_change.lower() == sign:
+                data = self.wnd_columns(t, V_hub_in.size, V=V, V_dir=Theta_p if sign == '+' else -1*Theta_p,
+                                        V_vert=V_vert_mag[:,None], shear_vert=alpha)
+                events.append((name, title, data, None))
 
+        return events
 
-    def EWS(self, V_hub_in):
+    def EWS_events(self, V_hub_in):
         # Extreme wind shear: 6.3.2.6
+
         self.setup()
+        V_hub_in = np.atleast_1d(np.asarray(V_hub_in, dtype=float))
 
         T = 12
-        t = np.linspace(0, T, num=(T/self.dt+1))
+        t = self.transient_time(T)
 
         # constants from standard
         alpha = 0.2
         Beta = 6.4
 
-        # Flow angle adjustments
-        V_hub = V_hub_in*np.cos(self.Vert_Slope*np.pi/180)
-        V_vert_mag = V_hub_in*np.sin(self.Vert_Slope*np.pi/180)
+        V_hub, V_vert_mag = self.flow_angle(V_hub_in)
 
         sigma_1 = self.NTM(V_hub)
 
-        # Contant variables
-        V = np.zeros_like(t)+V_hub
-        V_dir = np.zeros_like(t)
-        V_vert = np.zeros_like(t)+V_vert_mag
-        # shear_horz = np.zeros_like(t)
-        shear_vert = np.zeros_like(t)+alpha
-        V_gust = np.zeros_like(t)
-
         # Transcient
-        shear_lin_p = np.zeros_like(t)
-        shear_lin_n = np.zeros_like(t)
-
-        for i, ti in enumerate(t):
-            shear_lin_p[i] = (2.5+0.2*Beta*sigma_1*(self.D/self.Sigma_1)**(1/4))*(1-np.cos(2*np.pi*ti/T))/V_hub
-            shear_lin_n[i] = -1*(2.5+0.2*Beta*sigma_1*(self.D/self.Sigma_1)**(1/4))*(1-np.cos(2*np.pi*ti/T))/V_hub
+        shear_lin_p = (2.5+0.2*Beta*sigma_1[:,None]*(self.D/self.Sigma_1)**(1/4))*(1-np.cos(2*np.pi*t/T))/V_hub[:,None]
+
+        events = []
+        for sign, sign_name, sign_title in [('+', 'P', 'positive'), ('-', 'N', 'negative')]:
+            if self.dir_change.lower() == 'both' or self.dir_change.lower() == sign:
+                shear_lin = shear_lin_p if sign == '+' else -1*shear_lin_p
+                if self.shear_orient.lower() == 'both' or self.shear_orient.lower() == 'v':
+                    ## Vert
+                    data = self.wnd_columns(t, V_hub_in.size, V=V_hub[:,None], V_vert=V_vert_mag[:,None], shear_vert=alpha, shear_vert_lin=shear_lin)
+                    events.append(('EWS_V_'+sign_name, '! Exteme Vertical Wind Shear, %s\n'%sign_title, data, None))
+                if self.shear_orient.lower() == 'both' or self.shear_orient.lower() == 'h':
+                    # Horz
+                    data = self.wnd_columns(t, V_hub_in.size, V=V_hub[:,None], V_vert=V_vert_mag[:,None], shear_horz=shear_lin, shear_vert=alpha)
+                    events.append(('EWS_H_'+sign_name, '! Exteme Horizontal Wind Shear, %s\n'%sign_title, data, None))
+
+        return events
 
-        # Write Files
+    def EOG(self, V_hub_in):
         self.fname_out = []
         self.fname_type = []
-        if self.dir_change.lower() == 'both' or self.dir_change.lower() == '+':
-            if self.shear_orient.lower() == 'both' or self.shear_orient.lower() == 'v':
-                ## Vert
-                fname = self.case_name + '_EWS_V_P_U%2.1f.wnd'%V_hub_in
-                data = np.column_stack((t, V, V_dir, V_vert, np.zeros_like(t), shear_vert, shear_lin_p, V_gust))
-                hd = []
-                hd.append('! Exteme Vertical Wind Shear, positive\n')
-                hd = self.heading_common(hd)
-                hd = self.heading_variable(hd, V_hub_in=V_hub_in)
-                self.write_wnd(fname, data, hd)
-                self.fname_out.append(os.path.realpath(os.path.normpath(os.path.join(self.outdir, fname))))
-                self.fname_type.append(2)
+        self.write_events(self.EOG_events(V_hub_in), V_hub_in)
 
-            if self.shear_orient.lower() == 'both' or self.shear_orient.lower() == 'h':
-                # Horz
-                fname = self.case_name + '_EWS_H_P_U%2.1f.wnd'%V_hub_in
-                data = np.column_stack((t, V, V_dir, V_vert, shear_lin_p, shear_vert, np.zeros_like(t), V_gust))
-                hd = []
-                hd.append('! Exteme Horizontal Wind Shear, positive\n')
-                hd = self.heading_common(hd)
-                hd = self.heading_variable(hd, V_hub_in=V_hub_in)
-                self.write_wnd(fname, data, hd)
-                self.fname_out.append(os.path.realpath(os.path.normpath(os.path.join(self.outdir, fname))))
-                self.fname_type.append(2)
+    def EDC(self, V_hub_in):
+        self.fname_out = []
+        self.fname_type = []
+        self.write_events(self.EDC_events(V_hub_in), V_hub_in)
 
-        if self.dir_change.lower() == 'both' or self.dir_change.lower() == '-':
-            if self.shear_orient.lower() == 'both' or self.shear_orient.lower() == 'v':
-                ## Vert
-                fname = self.case_name + '_EWS_V_N_U%2.1f.wnd'%V_hub_in
-                data = np.column_stack((t, V, V_dir, V_vert, np.zeros_like(t), shear_vert, shear_lin_n, V_gust))
-                hd = []
-                hd.append('! Exteme Vertical Wind Shear, negative\n')
-                hd = self.heading_common(hd)
-                hd = self.heading_variable(hd, V_hub_in=V_hub_in)
-                self.write_wnd(fname, data, hd)
-                self.fname_out.append(os.path.realpath(os.path.normpath(os.path.join(self.outdir, fname))))
-                self.fname_type.append(2)
+    def ECD(self, V_hub_in):
+        self.fname_out = []
+        self.fname_type = []
+        self.write_events(self.ECD_events(V_hub_in), V_hub_in)
 
-            if self.shear_orient.lower() == 'both' or self.shear_orient.lower() == 'h':
-                # Horz
-                fname = self.case_name + '_EWS_H_N_U%2.1f.wnd'%V_hub_in
-                data = np.column_stack((t, V, V_dir, V_vert, shear_lin_n, shear_vert, np.zeros_like(t), V_gust))
+    def EWS(self, V_hub_in):
+        self.fname_out = []
+        self.fname_type = []
+        self.write_events(self.EWS_events(V_hub_in), V_hub_in)
+
+    def write_events(self, events, V_hub_in, padded=False):
+        # Write one .wnd file per event and hub height wind speed, appending the file names to self.fname_out
+        V_hub_in = np.atleast_1d(V_hub_in)
+        for i, V in enumerate(V_hub_in):
+            for name, title, data, sigma_1 in events:
+                fname = self.case_name + '_%s_U%2.1f.wnd'%(name, V)
                 hd = []
-                hd.append('! Exteme Horizontal Wind Shear, negative\n')
+                hd.append(title)
                 hd = self.heading_common(hd)
-                hd = self.heading_variable(hd, V_hub_in=V_hub_in)
-                self.write_wnd(fname, data, hd)
+                if sigma_1 is not None:
+                    hd = self.heading_variable(hd, V_hub_in=V, sigma_1=sigma_1[i])
+                else:
+                    hd = self.heading_variable(hd, V_hub_in=V)
+                if padded:
+                    self.write_wnd_file(fname, data[i], hd)
+                else:
+                    self.write_wnd(fname, data[i], hd)
                 self.fname_out.append(os.path.realpath(os.path.normpath(os.path.join(self.outdir, fname))))
                 self.fname_type.append(2)
 
@@ -374,18 +272,24 @@ class pyIECWind_extreme():
 
         return hd
 
+    def pad_time(self, data):
+        # Move transcient event to user definted time, holding the initial and final values from T0 to TF
+        # data has shape (n_time, 8) or (n_cases, n_time, 8)
+        data = np.concatenate((data[...,:1,:], data, data[...,-1:,:]), axis=-2)
+        data[...,1:-1,0] += self.TStart
+        data[...,0,0] = self.T0
+        data[...,-1,0] = self.TF
+        return data
+
     def write_wnd(self, fname, data, hd):
+        self.write_wnd_file(fname, self.pad_time(data), hd)
+
+    def write_wnd_file(self, fname, data, hd):
 
         # Make sure directory exist
         if not os.path.isdir(self.outdir):
             os.makedirs(self.outdir)
 
-        # Move transcient event to user definted time
-        data[:,0] += self.TStart
-        data = np.vstack((data[0,:], data, data[-1,:]))
-        data[0,0] = self.T0
-        data[-1,0] = self.TF
-
         # Headers
         hd1 = ['Time', 'Wind', 'Wind', 'Vertical', 'Horiz.', 'Pwr. Law', 'Lin. Vert.', 'Gust']
         hd2 = ['', 'Speed', 'Dir', 'Speed', 'Shear', 'Vert. Shr', 'Shear', 'Speed']
@@ -401,8 +305,8 @@ class pyIECWind_extreme():
         fid.write('! '+''.join([('%s' % val).center(12) for val in hd1]) + '\n')
         fid.write('! '+''.join([('%s' % val).center(12) for val in hd2]) + '\n')
         fid.write('! '+''.join([('%s' % val).center(12) for val in hd3]) + '\n')
-        for row in data:
-            fid.write('  '+''.join([('%.6f' % val).center(12) for val in row]) + '\n')
+        # Values right aligned in the 12 character header columns
+        np.savetxt(fid, data, fmt='  '+' %11.6f'*data.shape[1])
 
         fid.close()
 
@@ -418,6 +322,33 @@ class pyIECWind_extreme():
             self.EWS(V_hub)
 
         return self.fname_out, self.fname_type
+
+    def execute_batch(self, Vtype, V_hub, write_files=True):
+        # Generate the transient events in Vtype for an array of hub height wind speeds at once
+        # Returns a dictionary of event name ('EOG', 'EDC_P', 'EWS_V_N', ...) to (n_cases, n_time, 8) arrays of the
+        # .wnd file columns. If write_files, the .wnd files are also written and listed in self.fname_out and
+        # self.fname_type, ordered by wind speed and then event as with repeated calls to execute.
+
+        V_hub = np.atleast_1d(np.asarray(V_hub, dtype=float))
+
+        events = []
+        if 'EOG' in Vtype:
+            events.extend(self.EOG_events(V_hub))
+        if 'EDC' in Vtype:
+            events.extend(self.EDC_events(V_hub))
+        if 'ECD' in Vtype:
+            events.extend(self.ECD_events(V_hub))
+        if 'EWS' in Vtype:
+            events.extend(self.EWS_events(V_hub))
+
+        events = [(name, title, self.pad_time(data), sigma_1) for name, title, data, sigma_1 in events]
+
+        self.fname_out = []
+        self.fname_type = []
+        if write_files:
+            self.write_events(events, V_hub, padded=True)
+
+        return dict([(name, data) for name, title, data, sigma_1 in events])
         
 
 class pyIECWind_turb():
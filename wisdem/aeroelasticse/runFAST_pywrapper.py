@@ -11,7 +11,7 @@ import multiprocessing as mp
 
 from wisdem.aeroelasticse.FAST_reader import InputReader_Common, InputReader_OpenFAST, InputReader_FAST7
 from wisdem.aeroelasticse.FAST_writer import InputWriter_Common, InputWriter_OpenFAST, InputWriter_FAST7
-from wisdem.aeroelasticse.FAST_wrapper import FastWrapper
+from wisdem.aeroelasticse.FAST_wrapper import FastWrapper, run_async
 from wisdem.aeroelasticse.FAST_post import return_timeseries
 
 import numpy as np
@@ -44,6 +44,16 @@ class runFAST_pywrapper(object):
         super(runFAST_pywrapper, self).__init__()
 
     def execute(self):
+        wrapper = self.write_inputs()
+
+        # Run FAST
+        wrapper.execute()
+
+        FAST_Output = os.path.join(wrapper.FAST_directory, wrapper.FAST_InputFile[:-3]+'outb')
+        return FAST_Output
+
+    def write_inputs(self):
+        # Write the FAST input files for this case and return the FastWrapper that runs them
         # FAST version specific initialization
         if self.FAST_ver.lower() == 'fast7':
             reader = InputReader_FAST7(FAST_ver=self.FAST_ver)
@@ -83,14 +93,11 @@ class runFAST_pywrapper(object):
             writer.FAST_yamlfile = self.FAST_yamlfile_out
             writer.write_yaml()
 
-        # Run FAST
         wrapper.FAST_exe = self.FAST_exe
         wrapper.FAST_InputFile = os.path.split(writer.FAST_InputFileOut)[1]
         wrapper.FAST_directory = os.path.split(writer.FAST_InputFileOut)[0]
-        wrapper.execute()
 
-        FAST_Output = os.path.join(wrapper.FAST_directory, wrapper.FAST_InputFile[:-3]+'outb')
-        return FAST_Output
+        return wrapper
 
 class runFAST_pywrapper_batch(object):
 
@@ -110,7 +117,7 @@ class runFAST_pywrapper_batch(object):
         self.write_yaml         = False
         self.FAST_yamlfile_out  = ''
 
-        self.case_list          = []
+        self.case_list          = []    # case dicts, or a columnar CaseGen_General.CaseMatrix
         self.case_name_list     = []
         self.channels           = {}
 
@@ -125,6 +132,26 @@ class runFAST_pywrapper_batch(object):
 
         super(runFAST_pywrapper_batch, self).__init__()
 
+    def case_data(self, i):
+        # argument list of eval_multi for case i
+        case_data = []
+        case_data.append(self.case_list[i])
+        case_data.append(self.case_name_list[i])
+        case_data.append(self.FAST_ver)
+        case_data.append(self.FAST_exe)
+        case_data.append(self.FAST_runDirectory)
+        case_data.append(self.FAST_InputFile)
+        case_data.append(self.FAST_directory)
+        case_data.append(self.read_yaml)
+        case_data.append(self.FAST_yamlfile_in)
+        case_data.append(self.fst_vt)
+        case_data.append(self.write_yaml)
+        case_data.append(self.FAST_yamlfile_out)
+        case_data.append(self.channels)
+        case_data.append(self.debug_level)
+        case_data.append(self.dev_branch)
+        case_data.append(self.post)
+        return case_data
         
     def run_serial(self):
         # Run batch serially
@@ -148,34 +175,51 @@ class runFAST_pywrapper_batch(object):
             cores = mp.cpu_count()
         pool = mp.Pool(cores)
 
-        case_data_all = []
-        for i in range(len(self.case_list)):
-            case_data = []
-            case_data.append(self.case_list[i])
-            case_data.append(self.case_name_list[i])
-            case_data.append(self.FAST_ver)
-            case_data.append(self.FAST_exe)
-            case_data.append(self.FAST_runDirectory)
-            case_data.append(self.FAST_InputFile)
-            case_data.append(self.FAST_directory)
-            case_data.append(self.read_yaml)
-            case_data.append(self.FAST_yamlfile_in)
-            case_data.append(self.fst_vt)
-            case_data.append(self.write_yaml)
-            case_data.append(self.FAST_yamlfile_out)
-            case_data.append(self.channels)
-            case_data.append(self.debug_level)
-            case_data.append(self.dev_branch)
-            case_data.append(self.post)
-
-            case_data_all.append(case_data)
-
-        output = pool.map(eval_multi, case_data_all)
+        # cases are materialized as they are sent to the pool, so a columnar CaseMatrix case_list
+        # is never expanded to all of its case dicts at once
+        case_data_all = (self.case_data(i) for i in range(len(self.case_list)))
+        output = list(pool.imap(eval_multi, case_data_all))
         pool.close()
         pool.join()
 
         return output
 
+    def run_async(self, cores=None, timeout=None, progress=None):
+        # Run cases in parallel as concurrent subprocesses of this process,
+        # with at most 'cores' FAST runs at once.  Input files are written
+        # up front, each run's stdout/stderr is captured in
+        # <FAST_runDirectory>/<case_name>.log and runs exceeding 'timeout'
+        # seconds are killed.  The output of runs that time out or exit with
+        # a non-zero return code is None.  progress is passed to
+        # FAST_wrapper.run_async (True prints each completed run).
+
+        if not os.path.exists(self.FAST_runDirectory):
+            os.makedirs(self.FAST_runDirectory)
+
+        wrappers = []
+        for i, case_name in enumerate(self.case_name_list):
+            # case_data ends with the post processing function, which is applied below
+            fast = case_pywrapper(*self.case_data(i)[:-1])
+            wrapper = fast.write_inputs()
+            wrapper.timeout  = timeout
+            wrapper.log_file = os.path.join(self.FAST_runDirectory, case_name + '.log')
+            wrappers.append(wrapper)
+
+        returncodes = run_async(wrappers, n_concurrent=cores, progress=progress)
+
+        output = []
+        for wrapper, returncode in zip(wrappers, returncodes):
+            FAST_Output = os.path.join(wrapper.FAST_directory, wrapper.FAST_InputFile[:-3]+'outb')
+            if returncode != 0:
+                # timed out (None) or failed run
+                output.append(None)
+            elif self.post:
+                output.append(self.post(FAST_Output))
+            else:
+                output.append([])
+
+        return output
+
     def run_mpi(self, mpi_comm_map_down):
         # Run in parallel with mpi
         from mpi4py import MPI
@@ -193,40 +237,18 @@ class runFAST_pywrapper_batch(object):
         if not os.path.exists(self.FAST_runDirectory) and rank == 0:
             os.makedirs(self.FAST_runDirectory)
 
-        case_data_all = []
-        for i in range(N_cases):
-            case_data = []
-            case_data.append(self.case_list[i])
-            case_data.append(self.case_name_list[i])
-            case_data.append(self.FAST_ver)
-            case_data.append(self.FAST_exe)
-            case_data.append(self.FAST_runDirectory)
-            case_data.append(self.FAST_InputFile)
-            case_data.append(self.FAST_directory)
-            case_data.append(self.read_yaml)
-            case_data.append(self.FAST_yamlfile_in)
-            case_data.append(self.fst_vt)
-            case_data.append(self.write_yaml)
-            case_data.append(self.FAST_yamlfile_out)
-            case_data.append(self.channels)
-            case_data.append(self.debug_level)
-            case_data.append(self.dev_branch)
-            case_data.append(self.post)
-
-            case_data_all.append(case_data)
-
         output = []
         for i in range(N_loops):
             idx_s    = i*size
             idx_e    = min((i+1)*size, N_cases)
 
-            for j, case_data in enumerate(case_data_all[idx_s:idx_e]):
-                data   = [eval_multi, case_data]
+            for j, k in enumerate(range(idx_s, idx_e)):
+                data   = [eval_multi, self.case_data(k)]
                 rank_j = sub_ranks[j]
                 comm.send(data, dest=rank_j, tag=0)
 
             # for rank_j in sub_ranks:
-            for j, case_data in enumerate(case_data_all[idx_s:idx_e]):
+            for j in range(idx_e - idx_s):
                 rank_j = sub_ranks[j]
                 data_out = comm.recv(source=rank_j, tag=1)
                 output.append(data_out)
@@ -319,8 +341,8 @@ class runFAST_pywrapper_batch(object):
 
 
 
-def eval(case, case_name, FAST_ver, FAST_exe, FAST_runDirectory, FAST_InputFile, FAST_directory, read_yaml, FAST_yamlfile_in, fst_vt, write_yaml, FAST_yamlfile_out, channels, debug_level, dev_branch, post):
-    # Batch FAST pyWrapper call, as a function outside the runFAST_pywrapper_batch class for pickle-ablility
+def case_pywrapper(case, case_name, FAST_ver, FAST_exe, FAST_runDirectory, FAST_InputFile, FAST_directory, read_yaml, FAST_yamlfile_in, fst_vt, write_yaml, FAST_yamlfile_out, channels, debug_level, dev_branch):
+    # runFAST_pywrapper set up for one case of a batch
 
     fast = runFAST_pywrapper(FAST_ver=FAST_ver)
     fast.FAST_exe           = FAST_exe
@@ -340,6 +362,12 @@ def eval(case, case_name, FAST_ver, FAST_exe, FAST_runDirectory, FAST_InputFile,
     fast.channels           = channels
     fast.debug_level        = debug_level
 
+    return fast
+
+def eval(case, case_name, FAST_ver, FAST_exe, FAST_runDirectory, FAST_InputFile, FAST_directory, read_yaml, FAST_yamlfile_in, fst_vt, write_yaml, FAST_yamlfile_out, channels, debug_level, dev_branch, post):
+    # Batch FAST pyWrapper call, as a function outside the runFAST_pywrapper_batch class for pickle-ablility
+
+    fast = case_pywrapper(case, case_name, FAST_ver, FAST_exe, FAST_runDirectory, FAST_InputFile, FAST_directory, read_yaml, FAST_yamlfile_in, fst_vt, write_yaml, FAST_yamlfile_out, channels, debug_level, dev_branch)
     FAST_Output = fast.execute()
 
     # Post process
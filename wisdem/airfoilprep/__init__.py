@@ -1 +1 @@
-from .airfoilprep import Airfoil, Polar
+from .airfoilprep import Airfoil, Polar, PolarSet
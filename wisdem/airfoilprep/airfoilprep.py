@@ -755,18 +755,13 @@ class Airfoil(object):
 
         if alpha is None:
             # union of angle of attacks
-            alpha = []
-            for p in self.polars:
-                alpha = np.union1d(alpha, p.alpha)
+            alpha = np.unique(np.concatenate([p.alpha for p in self.polars]))
 
-        # interpolate each polar to new alpha
-        n = len(self.polars)
-        polars = [0]*n
-        for idx, p in enumerate(self.polars):
-            cl = np.interp(alpha, p.alpha, p.cl)
-            cd = np.interp(alpha, p.alpha, p.cd)
-            cm = np.interp(alpha, p.alpha, p.cm)
-            polars[idx] = self.polar_type(p.Re, alpha, cl, cd, cm)
+        # interpolate all polars to new alpha at once
+        cl = _interp_rows(alpha, [p.alpha for p in self.polars], [p.cl for p in self.polars])
+        cd = _interp_rows(alpha, [p.alpha for p in self.polars], [p.cd for p in self.polars])
+        cm = _interp_rows(alpha, [p.alpha for p in self.polars], [p.cm for p in self.polars])
+        polars = [self.polar_type(p.Re, alpha, cl[idx], cd[idx], cm[idx]) for idx, p in enumerate(self.polars)]
 
         return Airfoil(polars)
 
@@ -838,14 +833,9 @@ class Airfoil(object):
         Re = [p.Re for p in polarList]
 
         # fill in cl, cd grid
-        cl = np.zeros((len(alpha), len(Re)))
-        cd = np.zeros((len(alpha), len(Re)))
-        cm = np.zeros((len(alpha), len(Re)))
-
-        for (idx, p) in enumerate(polarList):
-            cl[:, idx] = p.cl
-            cd[:, idx] = p.cd
-            cm[:, idx] = p.cm
+        cl = np.column_stack([p.cl for p in polarList])
+        cd = np.column_stack([p.cd for p in polarList])
+        cm = np.column_stack([p.cm for p in polarList])
 
 
         return alpha, Re, cl, cd, cm
@@ -989,6 +979,428 @@ class Airfoil(object):
     #     return cl, cd
 
 
+def _interp_last_axis(x, xp, fp):
+    """np.interp(x, xp, f) for every row f of fp, an array of shape (..., len(xp))"""
+
+    x = np.asarray(x, dtype=float)
+    xp = np.asarray(xp, dtype=float)
+    j = np.clip(np.searchsorted(xp, x, side='right') - 1, 0, len(xp)-2)
+    dx = xp[j+1] - xp[j]
+    slope = (fp[..., j+1] - fp[..., j]) / np.where(dx == 0.0, 1.0, dx)
+    y = slope*(x - xp[j]) + fp[..., j]
+    y = np.where(x < xp[0], fp[..., :1], y)
+    y = np.where(x >= xp[-1], fp[..., -1:], y)
+    return y
+
+
+def _interp_rows(x, xps, fps):
+    """np.interp(x, xp, fp) for each pair of xps and fps, which may have different lengths,
+    in a single search.  Returns an array of shape (len(xps), len(x))"""
+
+    x = np.asarray(x, dtype=float)
+    n = len(xps)
+    lengths = np.array([len(xp) for xp in xps])
+    start = np.r_[0, np.cumsum(lengths)[:-1]]
+    xp_all = np.concatenate(xps).astype(float)
+    fp_all = np.concatenate(fps).astype(float)
+
+    # Shift every row to its own range so one sorted search finds all the intervals
+    lo = min(xp_all.min(), x.min())
+    span = max(xp_all.max(), x.max()) - lo + 1.0
+    shift = span*np.arange(n)
+    first = xp_all[start]
+    last = xp_all[start + lengths - 1]
+    xc = np.clip(x[np.newaxis, :], first[:, np.newaxis], last[:, np.newaxis])
+    j = np.searchsorted(xp_all - lo + np.repeat(shift, lengths), (xc - lo + shift[:, np.newaxis]).ravel(), side='right') - 1
+    j = np.minimum(j.reshape(xc.shape), (start + lengths - 2)[:, np.newaxis])
+    j = np.maximum(j, start[:, np.newaxis])
+
+    dx = xp_all[j+1] - xp_all[j]
+    slope = (fp_all[j+1] - fp_all[j]) / np.where(dx == 0.0, 1.0, dx)
+    y = slope*(xc - xp_all[j]) + fp_all[j]
+    y = np.where(xc >= last[:, np.newaxis], fp_all[start + lengths - 1][:, np.newaxis], y)
+    return y
+
+
+class PolarSet(object):
+    """
+    Polars of many sections and Reynolds numbers on a common set of angles of
+    attack, stored as arrays of shape (..., Re.size, alpha.size), e.g.
+    (n_stations, n_Re, n_alpha) for all the airfoils of a blade.  The methods are
+    the array versions of those of Polar and Airfoil and apply to all polars at once.
+
+    """
+
+    def __init__(self, Re, alpha, cl, cd, cm):
+        """Constructor
+
+        Parameters
+        ----------
+        Re : ndarray
+            Reynolds numbers
+        alpha : ndarray (deg)
+            angles of attack
+        cl : ndarray
+            lift coefficients of shape (..., Re.size, alpha.size)
+        cd : ndarray
+            drag coefficients of the same shape
+        cm : ndarray
+            moment coefficients of the same shape
+        """
+
+        self.Re = np.array(Re, dtype=float, ndmin=1)
+        self.alpha = np.array(alpha, dtype=float)
+        self.cl = np.array(cl, dtype=float)
+        self.cd = np.array(cd, dtype=float)
+        self.cm = np.array(cm, dtype=float)
+
+
+    @classmethod
+    def fromAirfoils(cls, airfoils, alpha=None, Re=None):
+        """Construct a PolarSet of shape (len(airfoils), Re.size, alpha.size) from Airfoil objects
+
+        Parameters
+        ----------
+        airfoils : list(Airfoil)
+            airfoils, e.g. one per blade station
+        alpha : ndarray, optional (deg)
+            common set of angles of attack.  If None a union of all angles of attack in the polars is used.
+        Re : ndarray, optional
+            common set of Reynolds numbers.  If None a union of all Reynolds numbers is used.
+            Each airfoil is linearly interpolated in Reynolds number, and outside of its
+            range uses the polar with the closest Reynolds number, as Airfoil.getPolar.
+
+        """
+
+        polars = [p for af in airfoils for p in af.polars]
+        if alpha is None:
+            alpha = np.unique(np.concatenate([p.alpha for p in polars]))
+        if Re is None:
+            Re = np.unique([p.Re for p in polars])
+        alpha = np.array(alpha, dtype=float)
+        Re = np.array(Re, dtype=float, ndmin=1)
+
+        # all polars to common alpha in one search
+        coeff = [_interp_rows(alpha, [p.alpha for p in polars], [getattr(p, c) for p in polars]) for c in ['cl', 'cd', 'cm']]
+
+        # each airfoil to common Re
+        grids = [np.zeros((len(airfoils), Re.size, alpha.size)) for c in coeff]
+        k = 0
+        for i, af in enumerate(airfoils):
+            n = len(af.polars)
+            Re_i = np.array([p.Re for p in af.polars])
+            for grid, c in zip(grids, coeff):
+                grid[i] = _interp_last_axis(Re, Re_i, c[k:k+n].T).T if n > 1 else c[k]
+            k += n
+
+        return cls(Re, alpha, *grids)
+
+
+    def toAirfoils(self, polarType=Polar):
+        """Airfoil objects of the leading dimensions of the set, in a nested list of the same shape"""
+
+        def build(cl, cd, cm):
+            if cl.ndim == 2:
+                return Airfoil([polarType(self.Re[j], self.alpha, cl[j], cd[j], cm[j]) for j in range(self.Re.size)])
+            return [build(cl[i], cd[i], cm[i]) for i in range(cl.shape[0])]
+
+        return build(self.cl, self.cd, self.cm)
+
+
+    def interpToCommonAlpha(self, alpha):
+        """Interpolates all polars to the angles of attack alpha (deg)"""
+
+        return type(self)(self.Re, alpha, _interp_last_axis(alpha, self.alpha, self.cl),
+                          _interp_last_axis(alpha, self.alpha, self.cd), _interp_last_axis(alpha, self.alpha, self.cm))
+
+
+    def createDataGrid(self):
+        """alpha, Re, cl, cd, cm as Airfoil.createDataGrid, with cl, cd, and cm of shape
+        (..., alpha.size, Re.size)"""
+
+        return self.alpha, self.Re, np.swapaxes(self.cl, -1, -2), np.swapaxes(self.cd, -1, -2), np.swapaxes(self.cm, -1, -2)
+
+
+    def getPolars(self, Re):
+        """Polars at the Reynolds numbers Re, linearly interpolated between the stored ones and the
+        closest one outside of their range, as Airfoil.getPolar.  Returns a PolarSet."""
+
+        Re = np.array(Re, dtype=float, ndmin=1)
+        if self.Re.size == 1:
+            reps = lambda x : np.repeat(x, Re.size, axis=-2)
+            return type(self)(Re, self.alpha, reps(self.cl), reps(self.cd), reps(self.cm))
+
+        interp = lambda x : np.swapaxes(_interp_last_axis(Re, self.Re, np.swapaxes(x, -1, -2)), -1, -2)
+        return type(self)(Re, self.alpha, interp(self.cl), interp(self.cd), interp(self.cm))
+
+
+    def blend(self, other, weight):
+        """Blend this PolarSet with another one, as Airfoil.blend: both are evaluated at the
+        union of their Reynolds numbers and at the union of their angles of attack within
+        the range common to both, then blended linearly.  Unlike Polar.blend, the Reynolds
+        numbers of the result are those at which the polars were evaluated, not blended ones.
+
+        Parameters
+        ----------
+        other : PolarSet
+            other set, of a shape that broadcasts with this one
+        weight : float or ndarray
+            blending parameter between 0 and 1, of a shape that broadcasts with the leading
+            dimensions.  0 returns self, whereas 1 returns other.
+
+        Returns
+        -------
+        obj : PolarSet
+            the blended set
+
+        """
+
+        Re = np.union1d(self.Re, other.Re)
+        alpha = np.union1d(self.alpha, other.alpha)
+        min_alpha = max(self.alpha.min(), other.alpha.min())
+        max_alpha = min(self.alpha.max(), other.alpha.max())
+        alpha = alpha[np.logical_and(alpha >= min_alpha, alpha <= max_alpha)]
+
+        p1 = self.getPolars(Re).interpToCommonAlpha(alpha)
+        p2 = other.getPolars(Re).interpToCommonAlpha(alpha)
+        w = np.asarray(weight, dtype=float)[..., np.newaxis, np.newaxis]
+
+        return type(self)(Re, alpha, p1.cl + w*(p2.cl-p1.cl), p1.cd + w*(p2.cd-p1.cd), p1.cm + w*(p2.cm-p1.cm))
+
+
+    def correction3D(self, r_over_R, chord_over_r, tsr, alpha_max_corr=30,
+                     alpha_linear_min=-5, alpha_linear_max=5):
+        """Applies 3-D corrections for rotating sections to all polars, as Polar.correction3D.
+
+        Parameters
+        ----------
+        r_over_R : float or ndarray
+            local radial position / rotor radius, of a shape that broadcasts with the leading dimensions
+        chord_over_r : float or ndarray
+            local chord length / local radial location, same
+        tsr : float or ndarray
+            tip-speed ratio, same
+        alpha_max_corr : float, optional (deg)
+            maximum angle of attack to apply full correction
+        alpha_linear_min : float, optional (deg)
+            angle of attack where linear portion of lift curve slope begins
+        alpha_linear_max : float, optional (deg)
+            angle of attack where linear portion of lift curve slope ends
+
+        Returns
+        -------
+        obj : PolarSet
+            A new PolarSet corrected for 3-D effects
+
+        """
+
+        # rename and convert units for convenience
+        alpha = np.radians(self.alpha)
+        cl_2d = self.cl
+        cd_2d = self.cd
+        alpha_max_corr = radians(alpha_max_corr)
+        alpha_linear_min = radians(alpha_linear_min)
+        alpha_linear_max = radians(alpha_linear_max)
+        column = lambda x : np.asarray(x, dtype=float)[..., np.newaxis, np.newaxis]
+        r_over_R = column(r_over_R)
+        chord_over_r = column(chord_over_r)
+        tsr = column(tsr)
+
+        # parameters in Du-Selig model
+        a = 1
+        b = 1
+        d = 1
+        lam = tsr/(1+tsr**2)**0.5  # modified tip speed ratio
+        expon   = d/lam/r_over_R
+        expon_d = d/lam/r_over_R/2.
+
+        # least squares line through the linear region of every polar
+        idx = np.logical_and(alpha >= alpha_linear_min,
+                             alpha <= alpha_linear_max)
+        x = alpha[idx] - alpha[idx].mean()
+        y = cl_2d[..., idx]
+        ymean = y.mean(axis=-1, keepdims=True)
+        m = np.sum(x*(y - ymean), axis=-1, keepdims=True) / np.sum(x*x)
+        alpha0 = alpha[idx].mean() - ymean/m
+
+        # correction factor
+        fcl = 1.0/m*(1.6*chord_over_r/0.1267*(a-chord_over_r**expon)/(b+chord_over_r**expon)-1)
+        fcd = 1.0/m*(1.6*chord_over_r/0.1267*(a-chord_over_r**expon_d)/(b+chord_over_r**expon_d)-1)
+
+        # not sure where this adjustment comes from (besides AirfoilPrep spreadsheet of course)
+        adj = ((pi/2-alpha)/(pi/2-alpha_max_corr))**2
+        adj[alpha <= alpha_max_corr] = 1.0
+
+        # Du-Selig correction for lift
+        cl_linear = m*(alpha-alpha0)
+        cl_3d = cl_2d + fcl*(cl_linear-cl_2d)*adj
+
+        # Du-Selig correction for drag
+        cd0 = _interp_last_axis(np.zeros(1), alpha, cd_2d)
+        dcd = cd_2d - cd0
+        cd_3d = cd_2d + fcd*dcd
+
+        shape = np.broadcast(cl_3d, cd_3d).shape
+        return type(self)(self.Re, self.alpha, cl_3d, cd_3d, np.broadcast_to(self.cm, shape))
+
+
+    def extrapolate(self, cdmax, AR=None, cdmin=0.001, nalpha=15):
+        """Extrapolates all polars up to +/- 180 degrees using Viterna's method, as
+        Polar.extrapolate.
+
+        Parameters
+        ----------
+        cdmax : float
+            maximum drag coefficient
+        AR : float, optional
+            aspect ratio = (rotor radius / chord_75% radius)
+            if provided, cdmax is computed from AR
+        cdmin: float, optional
+            minimum drag coefficient
+        nalpha: int, optional
+            number of points to add in each segment of Viterna method
+
+        Returns
+        -------
+        obj : PolarSet
+            a new PolarSet
+
+        """
+
+        if cdmin < 0:
+            raise Exception('cdmin cannot be < 0')
+
+        # lift coefficient adjustment to account for assymetry
+        cl_adj = 0.7
+
+        # estimate CD max
+        if AR is not None:
+            cdmax = 1.11 + 0.018*AR
+        cdmax = np.maximum(self.cd.max(axis=-1, keepdims=True), cdmax)
+
+        # extract matching info from ends
+        alpha_high = radians(self.alpha[-1])
+        cl_high = self.cl[..., -1:]
+        cd_high = self.cd[..., -1:]
+        cm_high = self.cm[..., -1:]
+
+        alpha_low = radians(self.alpha[0])
+        cl_low = self.cl[..., :1]
+        cd_low = self.cd[..., :1]
+
+        if alpha_high > pi/2:
+            raise Exception('alpha[-1] > pi/2')
+        if alpha_low < -pi/2:
+            raise Exception('alpha[0] < -pi/2')
+
+        # parameters used in model
+        sa = sin(alpha_high)
+        ca = cos(alpha_high)
+        A = (cl_high - cdmax*sa*ca)*sa/ca**2
+        B = (cd_high - cdmax*sa*sa)/ca
+
+        def viterna(alpha, cl_adj):
+            alpha = np.maximum(alpha, 0.0001)  # prevent divide by zero
+            cl = cdmax/2*np.sin(2*alpha) + A*np.cos(alpha)**2/np.sin(alpha)
+            cd = cdmax*np.sin(alpha)**2 + B*np.cos(alpha)
+            return cl*cl_adj, cd
+
+        # alpha_high <-> 90
+        alpha1 = np.linspace(alpha_high, pi/2, nalpha)[1:]
+        cl1, cd1 = viterna(alpha1, 1.0)
+
+        # 90 <-> 180-alpha_high
+        alpha2 = np.linspace(pi/2, pi-alpha_high, nalpha)[1:]
+        cl2, cd2 = viterna(pi-alpha2, -cl_adj)
+
+        # 180-alpha_high <-> 180
+        alpha3 = np.linspace(pi-alpha_high, pi, nalpha)[1:]
+        _, cd3 = viterna(pi-alpha3, 1.0)
+        cl3 = (alpha3-pi)/alpha_high*cl_high*cl_adj  # linear variation
+
+        if alpha_low <= -alpha_high:
+            alpha4 = np.zeros(0)
+            cl4 = cd4 = np.zeros(self.cl.shape[:-1] + (0,))
+            alpha5max = alpha_low
+        else:
+            # -alpha_high <-> alpha_low
+            alpha4 = np.linspace(-alpha_high, alpha_low, nalpha)[1:-2]
+            cl4 = -cl_high*cl_adj + (alpha4+alpha_high)/(alpha_low+alpha_high)*(cl_low+cl_high*cl_adj)
+            cd4 = cd_low + (alpha4-alpha_low)/(-alpha_high-alpha_low)*(cd_high-cd_low)
+            alpha5max = -alpha_high
+
+        # -90 <-> -alpha_high
+        alpha5 = np.linspace(-pi/2, alpha5max, nalpha)[1:]
+        cl5, cd5 = viterna(-alpha5, -cl_adj)
+
+        # -180+alpha_high <-> -90
+        alpha6 = np.linspace(-pi+alpha_high, -pi/2, nalpha)[1:]
+        cl6, cd6 = viterna(alpha6+pi, cl_adj)
+
+        # -180 <-> -180 + alpha_high
+        alpha7 = np.linspace(-pi, -pi+alpha_high, nalpha)
+        _, cd7 = viterna(alpha7+pi, 1.0)
+        cl7 = (alpha7+pi)/alpha_high*cl_high*cl_adj  # linear variation
+
+        shape = self.cl.shape[:-1]
+        full = lambda x : np.broadcast_to(x, shape + x.shape[-1:])
+        alpha = np.concatenate((alpha7, alpha6, alpha5, alpha4, np.radians(self.alpha), alpha1, alpha2, alpha3))
+        cl = np.concatenate([full(c) for c in (cl7, cl6, cl5, cl4, self.cl, cl1, cl2, cl3)], axis=-1)
+        cd = np.concatenate([full(c) for c in (cd7, cd6, cd5, cd4, self.cd, cd1, cd2, cd3)], axis=-1)
+
+        cd = np.maximum(cd, cdmin)  # don't allow negative drag coefficients
+
+        # Setup alpha and cm to be used in extrapolation
+        cm1_alpha = floor(self.alpha[0] / 10.0) * 10.0
+        cm2_alpha = ceil(self.alpha[-1] / 10.0) * 10.0
+        alpha_num = abs(int((-180.0-cm1_alpha)/10.0 - 1))
+        alpha_cm1 = np.linspace(-180.0, cm1_alpha, alpha_num)
+        alpha_cm2 = np.linspace(cm2_alpha, 180.0, int((180.0-cm2_alpha)/10.0 + 1))
+        alpha_cm = np.concatenate((alpha_cm1, self.alpha, alpha_cm2))
+        n1 = len(alpha_cm1)
+        n2 = len(alpha_cm2)
+        cm_ext = np.concatenate((np.zeros(shape + (n1,)), self.cm, np.zeros(shape + (n2,))), axis=-1)
+
+        # cm at zero lift, from the first crossing within +/- 20 deg, else extrapolated from the first two points
+        cross = (np.abs(self.alpha[:-1]) < 20.0) & (self.cl[..., :-1] <= 0) & (self.cl[..., 1:] >= 0)
+        i0 = np.where(cross.any(axis=-1), np.argmax(cross, axis=-1), 0)[..., np.newaxis]
+        cl_i0 = np.take_along_axis(self.cl, i0, -1)
+        cl_i1 = np.take_along_axis(self.cl, i0+1, -1)
+        cm_i0 = np.take_along_axis(self.cm, i0, -1)
+        cm_i1 = np.take_along_axis(self.cm, i0+1, -1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            p = -cl_i0 / (cl_i1 - cl_i0)
+            cm0 = cm_i0 + p * (cm_i1 - cm_i0)
+            XM = (-cm_high + cm0) / (cl_high * cos(alpha_high) + cd_high * sin(alpha_high))
+            cmCoef = (XM - 0.25) / tan((alpha_high - pi/2))
+
+        cl_cm = _interp_last_axis(alpha_cm, np.degrees(alpha), cl)
+        cd_cm = _interp_last_axis(alpha_cm, np.degrees(alpha), cd)
+        rad = np.radians(np.abs(alpha_cm))
+        sign = np.where(alpha_cm > 0, 1.0, -1.0)
+        x = cmCoef * np.tan(rad - pi/2) + 0.25
+        cm_new = sign*(cm0 - x * (sign*cl_cm * np.cos(rad) + cd_cm * np.sin(rad)))
+        cm_new = np.where(np.abs(alpha_cm) < 0.01, cm0, cm_new)
+
+        # table values near +/- 180 deg
+        table = {165: -0.4, 170: -0.5, 175: -0.25, 180: 0.0, -165: 0.35, -170: 0.4, -175: 0.2, -180: 0.0}
+        tail = np.abs(alpha_cm) >= 165
+        has_cm = np.any(self.cm != 0, axis=-1, keepdims=True)
+        for i in np.nonzero(tail)[0]:
+            if alpha_cm[i] not in table and np.any(has_cm):
+                print("Angle encountered for which there is no CM table value "
+                      "(near +/-180 deg). Program will stop.")
+        cm_table = np.array([table.get(a, 0.0) for a in alpha_cm])
+        cm_new = np.where(tail, cm_table, cm_new)
+
+        # keep the given cm in the range of the polar, and where cm is not given at all
+        outside = np.logical_or(alpha_cm < self.alpha[0], alpha_cm > self.alpha[-1])
+        cm_ext = np.where(np.logical_and(outside, has_cm), cm_new, cm_ext)
+
+        cm = _interp_last_axis(np.degrees(alpha), alpha_cm, cm_ext)
+        return type(self)(self.Re, np.degrees(alpha), cl, cd, cm)
+
+
 
 
 
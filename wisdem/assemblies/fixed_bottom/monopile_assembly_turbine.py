@@ -18,6 +18,8 @@ from wisdem.plant_financese.plant_finance import PlantFinance
 from wisdem.drivetrainse.drivese_omdao import DriveSE
 
 from wisdem.commonse.mpi_tools import MPI
+from wisdem.commonse import profiling
+from wisdem.commonse.evaluation_cache import cache_group, make_cache
 
 # np.seterr(all ='raise')
         
@@ -29,9 +31,20 @@ class MonopileTurbine(Group):
         self.options.declare('FASTpref', default={})
         self.options.declare('Nsection_Tow', default = 6)
         self.options.declare('VerbosityCosts', default = True)
+        self.options.declare('profile', default=False) # True or an output file prefix to time all components, see commonse/profiling.py
+        self.options.declare('cache', default=None) # EvaluationCache, True (in memory) or an SQLite file name to reuse repeated evaluations, see commonse/evaluation_cache.py
         self.options.declare('user_update_routine',     default=None)
         
         
+
+    def configure(self):
+        # Time every component and native call of this turbine, reported at exit
+        if self.options['profile']:
+            profiling.profile_system(self, None if self.options['profile'] is True else self.options['profile'])
+        # Serve repeated design points from the evaluation cache
+        if self.options['cache'] is not None:
+            cache_group(self, make_cache(self.options['cache']))
+
     def setup(self):
         
         RefBlade            = self.options['RefBlade']
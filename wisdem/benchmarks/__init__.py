@@ -0,0 +1,23 @@
+"""
+Benchmark suite of the WISDEM numerical kernels and assemblies, with JSON
+baselines and regression flagging.  Run it with
+
+    python -m wisdem.benchmarks --save baseline.json
+    python -m wisdem.benchmarks --compare baseline.json --threshold 0.15
+
+see runner.py for the options and the results format.
+
+No baseline is committed: timings only compare on the same machine and
+Python/numpy build.  Make one from the revision to compare against, e.g.
+
+    git stash                      # or: git checkout master
+    python -m wisdem.benchmarks --save baseline.json
+    git stash pop                  # or: git checkout <branch>
+    python -m wisdem.benchmarks --compare baseline.json
+
+Benchmarks slower by more than the threshold are flagged as 'regression' and
+give a non-zero exit status, as do output changes ('changed').  Benchmarks
+with too much spread between repeats to tell are reported as 'noisy'.
+"""
+
+from wisdem.benchmarks.runner import benchmark, run_benchmarks, compare, load_results, save_results
@@ -0,0 +1,4 @@
+import sys
+from wisdem.benchmarks.runner import main
+
+sys.exit(main())
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+assemblies.py
+
+End-to-end benchmarks: full OpenMDAO evaluations of the NREL 5MW tower, the
+ORBIT balance of system model on the bundled library data, and the land-based
+NREL 5MW turbine.  Setup (problem.setup and the inputs) is not timed, only
+run_model.
+
+Copyright (c) NREL. All rights reserved.
+"""
+
+from __future__ import print_function
+import numpy as np
+
+from wisdem.benchmarks.runner import benchmark
+from wisdem.benchmarks.kernels import nrel5mw_blade
+
+
+@benchmark(group='assembly', number=1, repeat=5, name='towerse.TowerSE')
+def towerse_nrel5mw():
+    # NREL 5MW tower with the max thrust and max wind speed load cases
+    from openmdao.api import Problem
+    from wisdem.towerse.tower import TowerSE
+    from wisdem.commonse import gravity
+
+    m    = 285598.8
+    prob = Problem()
+    prob.model = TowerSE(nLC=2, nPoints=3, nFull=7, wind='PowerWind', topLevelFlag=True, monopile=False)
+    prob.setup()
+
+    prob['shearExp'] = 0.2
+    prob['hub_height'] = 87.6
+    prob['foundation_height'] = 0.0
+    prob['transition_piece_height'] = 0.0
+    prob['transition_piece_mass'] = 0.0
+    prob['gravity_foundation_mass'] = 0.0
+    prob['tower_section_height'] = np.array([43.8, 43.8])
+    prob['tower_outer_diameter'] = np.array([6.0, 4.935, 3.87])
+    prob['tower_wall_thickness'] = 1.3*np.array([0.025, 0.021])
+    prob['tower_buckling_length'] = 30.0
+    prob['tower_outfitting_factor'] = 1.07
+    prob['yaw'] = 0.0
+    prob['suctionpile_depth'] = 0.0
+    prob['soil_G'] = 140e6
+    prob['soil_nu'] = 0.4
+    prob['E'] = 210e9
+    prob['G'] = 80.8e9
+    prob['material_density'] = 8500.0
+    prob['sigma_y'] = 450.0e6
+    prob['rna_mass'] = m
+    prob['rna_I'] = np.array([1.14930678e+08, 2.20354030e+07, 1.87597425e+07, 0.0, 5.03710467e+05, 0.0])
+    prob['rna_cg'] = np.array([-1.13197635, 0.0, 0.50875268])
+    prob['wind_reference_height'] = 90.0
+    prob['wind_z0'] = 0.0
+    prob['cd_usr'] = -1.
+    prob['air_density'] = 1.225
+    prob['air_viscosity'] = 1.7934e-5
+    prob['water_density'] = 1025.0
+    prob['water_viscosity'] = 1.3351e-3
+    prob['wind_beta'] = prob['wave_beta'] = 0.0
+    prob['significant_wave_height'] = 0.0
+    prob['significant_wave_period'] = 1.0
+    prob['gamma_f'] = 1.35
+    prob['gamma_m'] = 1.3
+    prob['gamma_n'] = 1.0
+    prob['gamma_b'] = 1.1
+    prob['gamma_fatigue'] = 1.35*1.3*1.0
+    prob['DC'] = 80.0
+    prob['shear'] = True
+    prob['geom'] = True
+    prob['tower_force_discretization'] = 5.0
+    prob['nM'] = 2
+    prob['Mmethod'] = 1
+    prob['lump'] = 0
+    prob['tol'] = 1e-9
+    prob['shift'] = 0.0
+    prob['life'] = 20.0
+    prob['m_SN'] = 4
+    prob['min_d_to_t'] = 120.0
+    prob['max_taper'] = 0.2
+    prob['wind1.Uref'] = 11.73732
+    prob['pre1.rna_F'] = np.array([1284744.19620519, 0.0, -2914124.84400512 + m*gravity])
+    prob['pre1.rna_M'] = np.array([3963732.76208099, -2275104.79420872, -346781.68192839])
+    prob['wind2.Uref'] = 70.0
+    prob['pre2.rna_F'] = np.array([930198.60063279, 0.0, -2883106.12368949 + m*gravity])
+    prob['pre2.rna_M'] = np.array([-1683669.22411597, -2522475.34625363, 147301.97023764])
+
+    def run():
+        prob.run_model()
+        return [prob['tower_mass'], prob['tower1.f1'], prob['post1.stress'], prob['post2.stress']]
+    return run
+
+
+@benchmark(group='assembly', number=1, repeat=3, name='orbit.ProjectManager.run_project')
+def orbit_run_project():
+    # Fixed bottom project of the ORBIT-WISDEM api defaults, on the bundled library
+    from openmdao.api import Problem
+    from wisdem.orbit import ProjectManager
+    from wisdem.orbit.api.wisdem.fixed import OrbitWisdemFixed
+
+    prob = Problem()
+    prob.model = OrbitWisdemFixed()
+    prob.setup()
+    prob.run_model()
+    config = prob.model._orbit_config
+
+    def run():
+        project = ProjectManager(config)
+        project.run_project()
+        return [project.bos_capex, project.installation_time]
+    return run
+
+
+@benchmark(
+    group="assembly",
+    number=1,
+    repeat=3,
+    name="orbit.ProjectManager.columnar_logs",
+)
+def orbit_columnar_logs():
+    # As orbit.ProjectManager.run_project, with the phase logs collected
+    # into DataFrames
+    from openmdao.api import Problem
+    from wisdem.orbit import ProjectManager
+    from wisdem.orbit.api.wisdem.fixed import OrbitWisdemFixed
+
+    prob = Problem()
+    prob.model = OrbitWisdemFixed()
+    prob.setup()
+    prob.run_model()
+    config = prob.model._orbit_config
+
+    def run():
+        project = ProjectManager(config, columnar_logs=True)
+        project.run_project()
+        actions = project.project_actions
+        return [
+            project.bos_capex,
+            project.installation_time,
+            len(project.project_logs),
+            actions["cost"].sum(),
+        ]
+
+    return run
+
+
+@benchmark(group='assembly', number=1, repeat=3, name='assemblies.LandBasedTurbine')
+def land_based_turbine():
+    # NREL 5MW land-based turbine: rotor, drivetrain, tower, costs and LCOE
+    from openmdao.api import Problem
+    from wisdem.assemblies.land_based.land_based_noGenerator_noBOS_lcoe import LandBasedTurbine, Init_LandBasedAssembly
+
+    blade = nrel5mw_blade()
+    prob  = Problem()
+    prob.model = LandBasedTurbine(RefBlade=blade, Nsection_Tow=6, VerbosityCosts=False)
+    prob.setup()
+    prob = Init_LandBasedAssembly(prob, blade, 6)
+
+    def run():
+        prob.run_model()
+        return [prob['lcoe'], prob['AEP']]
+    return run
@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+kernels.py
+
+Micro-benchmarks of the numerical kernels, on fixed reference inputs built from
+the NREL 5MW data bundled with WISDEM.
+
+Copyright (c) NREL. All rights reserved.
+"""
+
+from __future__ import print_function
+import os
+import struct
+
+import numpy as np
+
+from wisdem.benchmarks.runner import benchmark
+
+# NREL 5MW power curve operating points
+UINF  = np.arange(3.0, 26.0)
+OMEGA = np.array([6.972, 7.183, 7.506, 7.942, 8.469, 9.156, 10.296, 11.431,
+                  11.890, 12.100, 12.100, 12.100, 12.100, 12.100, 12.100,
+                  12.100, 12.100, 12.100, 12.100, 12.100, 12.100, 12.100, 12.100])
+PITCH = np.array([0.000, 0.000, 0.000, 0.000, 0.000, 0.000, 0.000, 0.000, 0.000,
+                  3.823, 6.602, 8.668, 10.450, 12.055, 13.536, 14.920, 16.226,
+                  17.473, 18.699, 19.941, 21.177, 22.347, 23.469])
+
+
+def nrel5mw_rotor():
+    """CCBlade model of the NREL 5MW rotor with the AeroDyn airfoil tables of the test suite"""
+    from wisdem.ccblade import CCAirfoil, CCBlade
+    import wisdem.test.test_ccblade as test_ccblade
+
+    r = np.array([2.8667, 5.6000, 8.3333, 11.7500, 15.8500, 19.9500, 24.0500,
+                  28.1500, 32.2500, 36.3500, 40.4500, 44.5500, 48.6500, 52.7500,
+                  56.1667, 58.9000, 61.6333])
+    chord = np.array([3.542, 3.854, 4.167, 4.557, 4.652, 4.458, 4.249, 4.007, 3.748,
+                      3.502, 3.256, 3.010, 2.764, 2.518, 2.313, 2.086, 1.419])
+    theta = np.array([13.308, 13.308, 13.308, 13.308, 11.480, 10.162, 9.011, 7.795,
+                      6.544, 5.361, 4.188, 3.125, 2.319, 1.526, 0.863, 0.370, 0.106])
+
+    basepath = os.path.join(os.path.dirname(test_ccblade.__file__), '5MW_AFFiles')
+    names    = ['Cylinder1', 'Cylinder2', 'DU40_A17', 'DU35_A17', 'DU30_A17', 'DU25_A17', 'DU21_A17', 'NACA64_A17']
+    airfoils = [CCAirfoil.initFromAerodynFile(os.path.join(basepath, n + '.dat')) for n in names]
+    af_idx   = [0, 0, 1, 2, 3, 3, 4, 5, 5, 6, 6, 7, 7, 7, 7, 7, 7]
+    af       = [airfoils[i] for i in af_idx]
+
+    return CCBlade(r, chord, theta, af, 1.5, 63.0, 3, 1.225, 1.81206e-5, 2.5, -5.0, 0.0,
+                   shearExp=0.2, hubHt=90.0)
+
+
+def nrel5mw_blade():
+    """NREL 5MW blade from the bundled ontology yaml, as returned by ReferenceBlade.initialize"""
+    from wisdem.rotorse.rotor_geometry_yaml import ReferenceBlade
+    import wisdem.rotorse as rotorse
+
+    path = os.path.join(os.path.dirname(rotorse.__file__), 'turbine_inputs')
+    refBlade = ReferenceBlade()
+    refBlade.verbose      = False
+    refBlade.NINPUT       = 8
+    refBlade.NPTS         = 50
+    refBlade.spar_var     = ['Spar_Cap_SS', 'Spar_Cap_PS']
+    refBlade.te_var       = 'TE_reinforcement'
+    refBlade.validate     = False
+    refBlade.fname_schema = os.path.join(path, 'IEAontology_schema.yaml')
+    return refBlade.initialize(os.path.join(path, 'nrel5mw_mod_update.yaml'))
+
+
+def write_fast_binary(filename, nchan=50, nt=6000, dt=0.1, seed=0):
+    """Writes a deterministic OpenFAST binary output file (FileID 2, no time channel) of
+    nchan random channels and nt time steps"""
+    rng      = np.random.RandomState(seed)
+    channels = rng.randn(nt, nchan) * np.linspace(1.0, 1e3, nchan)
+    vmin     = channels.min(axis=0)
+    vmax     = channels.max(axis=0)
+    scl      = (65535.0 / (vmax - vmin)).astype(np.float32)
+    off      = (-32768.0 - vmin*scl).astype(np.float32)
+    packed   = np.round(channels*scl + off).clip(-32768, 32767).astype(np.int16)
+
+    desc  = b'Benchmark output file'
+    names = ['Time'] + ['Chan%d' % k for k in range(nchan)]
+    units = ['(s)'] + ['(-)']*nchan
+    with open(filename, 'wb') as f:
+        f.write(struct.pack('h', 2))
+        f.write(struct.pack('i', nchan))
+        f.write(struct.pack('i', nt))
+        f.write(struct.pack('d', 0.0))
+        f.write(struct.pack('d', dt))
+        f.write(scl.tobytes())
+        f.write(off.tobytes())
+        f.write(struct.pack('i', len(desc)))
+        f.write(desc)
+        for s in names + units:
+            f.write(s.ljust(10).encode())
+        f.write(packed.tobytes())
+
+
+@benchmark(group='kernel', number=1, repeat=10, name='ccblade.CCBlade.evaluate')
+def ccblade_evaluate():
+    # Power curve of the NREL 5MW rotor, 23 wind speeds
+    rotor = nrel5mw_rotor()
+    return lambda : rotor.evaluate(UINF, OMEGA, PITCH)
+
+
+@benchmark(group='kernel', number=2, repeat=10, name='ccblade.CCBlade.evaluate_derivatives')
+def ccblade_evaluate_derivatives():
+    rotor = nrel5mw_rotor()
+    rotor.derivatives = True
+    return lambda : rotor.evaluate(UINF[8:12], OMEGA[8:12], PITCH[8:12])
+
+
+@benchmark(group='kernel', number=10, repeat=10, name='rotorse.PreComp.sectionProperties')
+def precomp_section_properties():
+    # Structural properties of the 50 sections of the NREL 5MW blade
+    from wisdem.rotorse.precomp import PreComp
+
+    blade = nrel5mw_blade()
+    pf    = blade['pf']
+    pc    = blade['precomp']
+    Rhub  = 0.5*blade['config']['hubD']
+    r     = Rhub + (blade['ctrl_pts']['bladeLength'])*np.array(pf['s'])
+    beam  = PreComp(r, pf['chord'], pf['theta'], pf['p_le'], pf['precurve'], pf['presweep'],
+                    pc['profile'], pc['materials'], pc['upperCS'], pc['lowerCS'], pc['websCS'],
+                    pc['sector_idx_strain_spar_ps'], pc['sector_idx_strain_spar_ss'],
+                    pc['sector_idx_strain_te_ps'], pc['sector_idx_strain_te_ss'])
+    return beam.sectionProperties
+
+
+@benchmark(group='kernel', number=5, repeat=10, name='pyframe3dd.Frame.run')
+def frame3dd_run():
+    # NREL 5MW tower as a 30 element cantilever with the RNA lumped at the top,
+    # one gravity plus rotor thrust load case and 6 modes
+    from wisdem.pyframe3dd import Frame, NodeData, ReactionData, ElementData, Options, StaticLoadCase
+    from wisdem.commonse.vertical_cylinder import RIGID
+
+    n    = 31
+    z    = np.linspace(10.0, 87.6, n)
+    d    = np.interp(z, [z[0], z[-1]], [6.0, 3.87])
+    t    = np.interp(z, [z[0], z[-1]], [0.027, 0.019])
+    dm   = 0.5*(d[1:] + d[:-1])
+    tm   = 0.5*(t[1:] + t[:-1])
+    Ro   = 0.5*dm
+    Ri   = Ro - tm
+    A    = np.pi*(Ro**2 - Ri**2)
+    Ixx  = 0.25*np.pi*(Ro**4 - Ri**4)
+    E, G, rho = 210e9, 80.8e9, 8500.0
+
+    node  = np.arange(1, n+1)
+    nodes = NodeData(node, np.zeros(n), np.zeros(n), z, np.zeros(n))
+    fixed = RIGID*np.ones(1)
+    reactions = ReactionData(np.ones(1), fixed, fixed, fixed, fixed, fixed, fixed, RIGID)
+    elem  = np.arange(1, n)
+    elements = ElementData(elem, elem, elem+1, A, 0.5*A, 0.5*A, 2*Ixx, Ixx, Ixx,
+                           E*np.ones(n-1), G*np.ones(n-1), np.zeros(n-1), rho*np.ones(n-1))
+    frame = Frame(nodes, reactions, elements, Options(True, True, 5.0))
+    frame.changeExtraNodeMass(np.array([n]), np.array([350e3]), np.array([4.37e7]), np.array([2.35e7]),
+                              np.array([2.54e7]), np.zeros(1), np.zeros(1), np.zeros(1),
+                              np.array([-1.13]), np.zeros(1), np.array([0.51]), True)
+    frame.enableDynamics(6, 1, 0, 1e-9, 0.0)
+
+    load = StaticLoadCase(0.0, 0.0, -9.81)
+    load.changePointLoads(np.array([n]), np.array([1.28e6]), np.zeros(1), np.zeros(1),
+                          np.zeros(1), np.array([4.0e6]), np.zeros(1))
+    frame.addLoadCase(load)
+    return frame.run
+
+
+@benchmark(group='kernel', number=1, repeat=5, name='aeroelasticse.ReadFASTbinary')
+def read_fast_binary():
+    # 50 channels, 10 minutes at 10 Hz, written to the scratch directory
+    from wisdem.aeroelasticse.Util.ReadFASTout import ReadFASTbinary
+
+    filename = os.path.abspath('benchmark.outb')
+    write_fast_binary(filename)
+    return lambda : ReadFASTbinary(filename)[0]
+
+
+@benchmark(group='kernel', number=20, repeat=10, name='floatingse.MapMooring.runMAP')
+def map_mooring_run():
+    # OC3-Hywind catenary mooring: three chain lines in 320 m of water
+    from wisdem.floatingse.map_mooring import MapMooring
+
+    inputs = {'water_density'                 : 1025.0,
+              'water_depth'                   : 320.0,
+              'fairlead'                      : 70.0,
+              'fairlead_radius'               : 5.2,
+              'anchor_radius'                 : 853.87,
+              'number_of_mooring_connections' : 3,
+              'mooring_lines_per_connection'  : 1,
+              'mooring_line_length'           : 902.2,
+              'mooring_diameter'              : 0.09,
+              'max_offset'                    : 20.0,
+              'max_survival_heel'             : 10.0,
+              'operational_heel'              : 10.0,
+              'gamma_f'                       : 1.35,
+              'mooring_cost_factor'           : 1.1,
+              'drag_embedment_extra_length'   : 300.0}
+    discrete_inputs = {'mooring_type': 'chain', 'anchor_type': 'suctionpile'}
+
+    def run():
+        outputs = {}
+        mymoor  = MapMooring()
+        mymoor.set_properties(inputs, discrete_inputs)
+        mymoor.set_geometry(inputs, outputs)
+        mymoor.runMAP(inputs, discrete_inputs, outputs)
+        return [outputs['mooring_stiffness'], outputs['max_offset_restoring_force'], outputs['axial_unity']]
+    return run
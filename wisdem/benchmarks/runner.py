@@ -0,0 +1,316 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+runner.py
+
+Registry, timing and baseline comparison for the WISDEM benchmark suite.
+
+A benchmark is a function decorated with @benchmark that does all of its setup
+(reading the reference data, building the problem) and returns a callable with
+no arguments.  Only that callable is timed: it is called once to warm up, then
+'repeat' times 'number' calls.  Whatever it returns is reduced to a signature
+so that a change in the numbers computed is flagged next to a change in speed.
+
+Results are stored as JSON:
+
+    {"metadata"   : {"date": ..., "python": ..., "numpy": ..., "commit": ...},
+     "benchmarks" : {name: {"group": ..., "min": ..., "median": ..., "mean": ...,
+                            "std": ..., "number": ..., "repeat": ..., "signature": ...}}}
+
+with times in seconds per call.  Benchmarks whose setup fails on a missing
+compiled extension or optional dependency are stored as {"skipped": reason}.
+
+Timings on a shared machine are noisy, so the comparison against a baseline
+uses the fastest repeat by default, widens the threshold to the spread of the
+repeats of noisy benchmarks (up to MAX_NOISE_TOLERANCE, past which an unflagged
+benchmark is reported as 'noisy' rather than 'ok'), and the benchmarks flagged
+as regressions are run again, keeping the faster of the two runs, before they
+are reported.
+
+Copyright (c) NREL. All rights reserved.
+"""
+
+from __future__ import print_function
+import os
+import sys
+import gc
+import re
+import json
+import time
+import platform
+import tempfile
+import datetime
+import subprocess
+from collections import OrderedDict
+
+import numpy as np
+
+GROUPS = ('kernel', 'assembly')
+
+# Relative change of the statistic past which a benchmark is flagged
+DEFAULT_THRESHOLD = 0.15
+
+# The threshold is at least this multiple of the relative spread of the repeats, (median - min) / min
+NOISE_FACTOR = 2.0
+
+# ... but the widening is capped at this relative change, so that a very noisy benchmark still flags
+# large regressions; within the cap it is reported as 'noisy' (inconclusive) instead of 'ok'
+MAX_NOISE_TOLERANCE = 0.5
+
+# Relative tolerance on the output signature
+SIGNATURE_RTOL = 1e-6
+
+# name -> (group, setup function, number, repeat)
+BENCHMARKS = OrderedDict()
+
+
+def benchmark(group='kernel', number=1, repeat=5, name=None):
+    """Registers a benchmark setup function under name (defaults to the function name)"""
+    if group not in GROUPS:
+        raise ValueError('Unknown benchmark group: ' + group)
+    def register(setup):
+        BENCHMARKS[name or setup.__name__] = (group, setup, number, repeat)
+        return setup
+    return register
+
+
+def signature(result):
+    """Reduces a benchmark result (number, array, or nested lists/tuples/dicts of them) to a float"""
+    if isinstance(result, dict):
+        result = [result[k] for k in sorted(result)]
+    if isinstance(result, (list, tuple)):
+        return float(sum(signature(r) for r in result))
+    try:
+        values = np.asarray(result, dtype=float)
+    except (TypeError, ValueError):
+        return 0.0
+    values = values[np.isfinite(values)]
+    return float(np.abs(values).sum())
+
+
+def time_benchmark(func, number=1, repeat=5):
+    """Times func() and returns the per call statistics and the signature of its result"""
+    result = func()
+    times  = np.zeros(repeat)
+    gcold  = gc.isenabled()
+    gc.disable()
+    try:
+        for k in range(repeat):
+            t = time.perf_counter()
+            for _ in range(number):
+                func()
+            times[k] = (time.perf_counter() - t) / number
+    finally:
+        if gcold:
+            gc.enable()
+    return {'min'       : float(times.min()),
+            'median'    : float(np.median(times)),
+            'mean'      : float(times.mean()),
+            'std'       : float(times.std()),
+            'number'    : number,
+            'repeat'    : repeat,
+            'signature' : signature(result)}
+
+
+def select(pattern=None, group=None):
+    """Names of the registered benchmarks matching the regular expression pattern and group"""
+    load_suite()
+    return [k for k, v in BENCHMARKS.items()
+            if (group is None or v[0] == group) and (pattern is None or re.search(pattern, k))]
+
+
+def load_suite():
+    # Importing the modules registers their benchmarks
+    import wisdem.benchmarks.kernels
+    import wisdem.benchmarks.assemblies
+
+
+def metadata():
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL,
+                                         cwd=os.path.dirname(os.path.abspath(__file__))).decode().strip()
+    except Exception:
+        commit = ''
+    return {'date'     : datetime.datetime.now().isoformat(timespec='seconds'),
+            'python'   : platform.python_version(),
+            'numpy'    : np.__version__,
+            'platform' : platform.platform(),
+            'machine'  : platform.node(),
+            'commit'   : commit}
+
+
+def run_benchmarks(names, repeat=None, verbose=True):
+    """Runs the named benchmarks, in a scratch working directory, and returns the results dictionary
+
+    INPUTS:
+    ----------
+    names   : list of registered benchmark names
+    repeat  : overrides the number of repeats of every benchmark
+    verbose : print each result as it completes
+
+    OUTPUTS : dictionary with 'metadata' and 'benchmarks'
+    """
+    load_suite()
+    results = OrderedDict()
+    cwd     = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch:
+        # Some kernels (MAP++, Frame3DD) write summary files in the working directory
+        os.chdir(scratch)
+        try:
+            for name in names:
+                group, setup, number, nrep = BENCHMARKS[name]
+                try:
+                    func = setup()
+                except ImportError as err:
+                    results[name] = {'group': group, 'skipped': str(err)}
+                else:
+                    results[name] = OrderedDict([('group', group)])
+                    results[name].update(time_benchmark(func, number, nrep if repeat is None else repeat))
+                if verbose:
+                    print(format_result(name, results[name]))
+                    sys.stdout.flush()
+        finally:
+            os.chdir(cwd)
+    return {'metadata': metadata(), 'benchmarks': results}
+
+
+def format_result(name, res, width=40):
+    if 'skipped' in res:
+        return ('%-'+str(width)+'s  skipped (%s)') % (name, res['skipped'])
+    return ('%-'+str(width)+'s %12.6f %12.6f %12.6f  (%d x %d)') % (name, res['min'], res['median'], res['std'],
+                                                                  res['repeat'], res['number'])
+
+
+def save_results(filename, results):
+    with open(filename, 'w') as f:
+        json.dump(results, f, indent=1)
+
+
+def load_results(filename):
+    with open(filename, 'r') as f:
+        return json.load(f)
+
+
+def spread(res):
+    """Relative spread of the repeats of a result, (median - min) / min"""
+    return (res['median'] - res['min']) / res['min'] if res['min'] > 0.0 else 0.0
+
+
+def faster(res, other):
+    """The result of the two runs of a benchmark with the fastest repeat"""
+    if 'skipped' in res or ('skipped' not in other and other['min'] < res['min']):
+        return other
+    return res
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD, stat='min', selected=None):
+    """Compares two sets of results benchmark by benchmark
+
+    INPUTS:
+    ----------
+    current   : results dictionary of run_benchmarks
+    baseline  : results dictionary to compare against
+    threshold : relative change of stat past which a benchmark is flagged, widened to
+                NOISE_FACTOR times the spread of the repeats for noisy benchmarks, up to
+                MAX_NOISE_TOLERANCE
+    stat      : 'min', 'median' or 'mean'
+    selected  : names of the benchmarks that were run (after --filter / --group), the baseline
+                benchmarks that are still registered but were not selected are 'skipped'
+
+    OUTPUTS   : list of (name, status, ratio of current to baseline stat) where status is one of
+                'regression', 'improvement', 'ok', 'noisy' (within the capped tolerance, but too
+                noisy to tell), 'changed' (signature differs), 'new', 'missing' or 'skipped'.
+                ratio is None where there is nothing to compare.
+    """
+    cur  = current['benchmarks']
+    base = baseline['benchmarks']
+    out  = []
+    for name, res in cur.items():
+        ref = base.get(name, None)
+        if ref is None:
+            out.append((name, 'new', None))
+            continue
+        if 'skipped' in res or 'skipped' in ref:
+            out.append((name, 'skipped', None))
+            continue
+        ratio = res[stat] / ref[stat] if ref[stat] > 0.0 else np.inf
+        noise = NOISE_FACTOR*max(spread(res), spread(ref))
+        tol   = max(threshold, min(noise, MAX_NOISE_TOLERANCE))
+        if not np.isclose(res['signature'], ref['signature'], rtol=SIGNATURE_RTOL, atol=0.0):
+            status = 'changed'
+        elif ratio > 1.0 + tol:
+            status = 'regression'
+        elif ratio < 1.0 - tol:
+            status = 'improvement'
+        elif noise > MAX_NOISE_TOLERANCE:
+            status = 'noisy'
+        else:
+            status = 'ok'
+        out.append((name, status, ratio))
+    for name in base:
+        if name not in cur:
+            excluded = selected is not None and name not in selected and name in BENCHMARKS
+            out.append((name, 'skipped' if excluded else 'missing', None))
+    return out
+
+
+def format_comparison(comparison, width=40):
+    lines = [('%-'+str(width)+'s %12s  %s') % ('Benchmark', 'ratio', 'status')]
+    for name, status, ratio in comparison:
+        lines.append(('%-'+str(width)+'s %12s  %s') % (name, '' if ratio is None else '%.3f' % ratio, status))
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(prog='python -m wisdem.benchmarks',
+                                     description='Times WISDEM kernels and assemblies on fixed reference inputs.')
+    parser.add_argument('-k', '--filter', default=None, help='regular expression on benchmark names')
+    parser.add_argument('-g', '--group', default=None, choices=GROUPS, help='only run this group')
+    parser.add_argument('-r', '--repeat', default=None, type=int, help='override the number of repeats')
+    parser.add_argument('-l', '--list', action='store_true', help='list the benchmarks and exit')
+    parser.add_argument('-s', '--save', default=None, help='write the results to this JSON file')
+    parser.add_argument('-c', '--compare', default=None, help='compare against this JSON baseline')
+    parser.add_argument('-t', '--threshold', default=DEFAULT_THRESHOLD, type=float,
+                        help='relative slowdown flagged as a regression (default %(default)s)')
+    parser.add_argument('--stat', default='min', choices=('min', 'median', 'mean'),
+                        help='statistic compared against the baseline (default %(default)s)')
+    parser.add_argument('--confirm', default=1, type=int,
+                        help='times the regressions are run again before being reported (default %(default)s)')
+    args = parser.parse_args(argv)
+
+    names = select(args.filter, args.group)
+    if args.list:
+        for name in names:
+            print('%-40s %s' % (name, BENCHMARKS[name][0]))
+        return 0
+
+    # Paths are relative to where the runner was started, not the scratch directory
+    save     = None if args.save is None else os.path.abspath(args.save)
+    baseline = None if args.compare is None else load_results(os.path.abspath(args.compare))
+
+    print(('%-40s %12s %12s %12s') % ('Benchmark', 'min [s]', 'median [s]', 'std [s]'))
+    results = run_benchmarks(names, repeat=args.repeat)
+
+    if baseline is not None:
+        comparison = compare(results, baseline, threshold=args.threshold, stat=args.stat, selected=names)
+        for _ in range(args.confirm):
+            # Run the regressions again, keeping the faster run, so that a slow spell of the machine is not reported
+            regressed = [name for name, status, _ in comparison if status == 'regression']
+            if not regressed:
+                break
+            print('\nRunning again: ' + ', '.join(regressed))
+            rerun = run_benchmarks(regressed, repeat=args.repeat)
+            for name in regressed:
+                results['benchmarks'][name] = faster(results['benchmarks'][name], rerun['benchmarks'][name])
+            comparison = compare(results, baseline, threshold=args.threshold, stat=args.stat, selected=names)
+
+    if save is not None:
+        save_results(save, results)
+
+    if baseline is None:
+        return 0
+    print('')
+    print(format_comparison(comparison))
+    flagged = [c for c in comparison if c[1] in ('regression', 'changed')]
+    return 1 if flagged else 0
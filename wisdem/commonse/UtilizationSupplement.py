@@ -83,13 +83,14 @@ class GeometricConstraints(ExplicitComponent):
     #     dm = np.hstack([dm_dd, np.zeros(len(self.t))])
 
 
-def fatigue(M_DEL, N_DEL, d, t, m=4, DC=80.0, eta=1.265, stress_factor=1.0, weld_factor=True):
+def fatigue(M_DEL, N_DEL, d, t, m=4, DC=80.0, eta=1.265, stress_factor=1.0, weld_factor=True, derivatives=False):
     """estimate fatigue damage for tower station
 
     Parmeters
     ---------
     M_DEL : array_like(float) (N*m)
-        damage equivalent moment at tower section
+        damage equivalent moment at tower section, optionally with leading
+        load case dimensions (..., nsection)
     N_DEL : array_like(int)
         corresponding number of cycles in lifetime
     d : array_like(float) (m)
@@ -106,66 +107,66 @@ def fatigue(M_DEL, N_DEL, d, t, m=4, DC=80.0, eta=1.265, stress_factor=1.0, weld
         load_factor * stress_concentration_factor
     weld_factor : bool
         if True include an empirical weld factor
+    derivatives : bool
+        if True also return the partial derivatives
 
     Returns
     -------
-    damage : float
-        damage from Miner's rule for this tower section
+    damage : array_like(float)
+        damage from Miner's rule for each tower section (and load case)
+    dD : dict
+        element-wise partial derivatives of damage with respect to M_DEL, N_DEL, d and t
+        (only if derivatives is True)
     """
 
 
     # convert to mm
-    dvec = np.array(d)*1e3
-    tvec = np.array(t)*1e3
+    dvec = np.asarray(d, dtype=float)*1e3
+    tvec = np.asarray(t, dtype=float)*1e3
 
-    t = sectional2nodal(t)
-    nvec = len(d)
-    damage = np.zeros(nvec)
-
-    # initialize weld factor (added cubic spline around corner)
+    # weld factor (added cubic spline around corner)
+    weld  = np.ones(tvec.shape)
+    dweld = np.zeros(tvec.shape)
     if weld_factor:
         x1 = 24.0
         x2 = 26.0
         spline = CubicSplineSegment(x1, x2, 1.0, (25.0/x2)**0.25, 0.0, 25.0**0.25*-0.25*x2**-1.25)
 
+        iout  = tvec >= x2
+        ispl  = np.logical_and(tvec > x1, np.logical_not(iout))
+        weld  = np.where(iout, (25.0/tvec)**0.25, np.where(ispl, spline.eval(tvec), 1.0))
+        dweld = np.where(iout, -0.25*weld/tvec, np.where(ispl, spline.eval_deriv(tvec), 0.0))
 
-    for i in range(nvec):
-
-        d = dvec[i]
-        t = tvec[i]
-
-        # weld factor
-        if not weld_factor or t <= x1:
-            weld = 1.0
-        elif t >= x2:
-            weld = (25.0/t)**0.25
-        else:
-            weld = spline.eval(t)
-
+    # stress
+    r = dvec/2.0
+    I = np.pi*r**3*tvec
+    c = r
+    sigma_per_M = c/I * stress_factor * 1e3  # convert to N/mm^2
+    sigma = M_DEL*sigma_per_M
 
-        # stress
-        r = d/2.0
-        I = np.pi*r**3*t
-        c = r
-        sigma = M_DEL[i]*c/I * stress_factor * 1e3  # convert to N/mm^2
+    # maximum allowed stress
+    Smax = DC * weld / eta
 
-        # maximum allowed stress
-        Smax = DC * weld / eta
+    # number of cycles for this load
+    N1 = 2e6  # TODO: where does this come from?
+    N = N_DEL/N1
 
-        # number of cycles to failure
-        Nf = (Smax/sigma)**m
+    # damage: N/Nf, with Nf = (Smax/sigma)**m the number of cycles to failure
+    damage = N*(sigma/Smax)**m
 
-        # number of cycles for this load
-        N1 = 2e6  # TODO: where does this come from?
-        N = N_DEL[i]/N1
+    if not derivatives:
+        return damage
 
-        # damage
-        damage[i] = N/Nf
+    dD_dsigma = m*N*(sigma/Smax)**(m-1)/Smax
+    dD = {}
+    dD['M_DEL'] = dD_dsigma*sigma_per_M
+    dD['N_DEL'] = (sigma/Smax)**m/N1
+    dD['d']     = -2e3*dD_dsigma*sigma/dvec
+    dD['t']     = -1e3*dD_dsigma*sigma/tvec - 1e3*m*damage*dweld/weld
+    return damage, dD
 
-    return damage
 
-
-def vonMisesStressUtilization(axial_stress, hoop_stress, shear_stress, gamma, sigma_y):
+def vonMisesStressUtilization(axial_stress, hoop_stress, shear_stress, gamma, sigma_y, derivatives=False):
     """combine stress for von Mises"""
 
     # von mises stress
@@ -177,7 +178,17 @@ def vonMisesStressUtilization(axial_stress, hoop_stress, shear_stress, gamma, si
     # stress margin
     stress_utilization = gamma * von_mises / sigma_y
 
-    return stress_utilization  # This must be <1 to pass
+    if not derivatives:
+        return stress_utilization  # This must be <1 to pass
+
+    dvm = 0.5*gamma/sigma_y/np.where(von_mises > 0.0, von_mises, 1.0)
+    dU = {}
+    dU['axial_stress'] = dvm*(0.5*(axial_stress + hoop_stress) + 1.5*(axial_stress - hoop_stress))
+    dU['hoop_stress']  = dvm*(0.5*(axial_stress + hoop_stress) - 1.5*(axial_stress - hoop_stress))
+    dU['shear_stress'] = dvm*6.0*shear_stress
+    dU['gamma']        = von_mises / sigma_y
+    dU['sigma_y']      = -stress_utilization / sigma_y
+    return stress_utilization, dU
 
 def hoopStress(d, t, q_dyn):
     r = d/2.0-t/2.0  # radius of cylinder middle surface
@@ -201,13 +212,13 @@ def hoopStressEurocode(z, d, t, L_reinforced, q_dyn):
     return hoopStress(d, t, Peq)
 
 
-def bucklingGL(d, t, Fz, Myy, tower_height, E, sigma_y, gamma_f=1.2, gamma_b=1.1, gamma_g=1.1):
+def bucklingGL(d, t, Fz, Myy, tower_height, E, sigma_y, gamma_f=1.2, gamma_b=1.1, gamma_g=1.1, derivatives=False):
 
     # other factors
     alpha = 0.21  # buckling imperfection factor
     beta = 1.0  # bending coefficient
     sk_factor = 2.0  # fixed-free
-    tower_height = tower_height * sk_factor
+    buckling_length = tower_height * sk_factor
 
     # geometry
     A = np.pi * d * t
@@ -223,27 +234,53 @@ def bucklingGL(d, t, Fz, Myy, tower_height, E, sigma_y, gamma_f=1.2, gamma_b=1.1
     Mp = Wp * sigma_y / gamma_b
 
     # factors
-    Ne = np.pi**2 * (E * I) / (1.1 * tower_height**2)
+    Ne = np.pi**2 * (E * I) / (1.1 * buckling_length**2)
     lambda_bar = np.sqrt(Np * gamma_b / Ne)
     phi = 0.5 * (1 + alpha*(lambda_bar - 0.2) + lambda_bar**2)
-    kappa = np.ones_like(d)
     idx = lambda_bar > 0.2
-    kappa[idx] = 1.0 / (phi[idx] + np.sqrt(phi[idx]**2 - lambda_bar[idx]**2))
+    root = np.sqrt(np.where(idx, phi**2 - lambda_bar**2, 1.0))
+    kappa = np.where(idx, 1.0 / (phi + root), 1.0)
     delta_n = 0.25*kappa*lambda_bar**2
     delta_n = np.minimum(delta_n, 0.1)
 
     GL_utilization = Nd/(kappa*Np) + beta*Md/Mp + delta_n  #this is utilization must be <1
 
-    return GL_utilization
+    if not derivatives:
+        return GL_utilization
+
+    # lambda_bar only depends on d, the buckling length and the material
+    dphi     = 0.5*alpha + lambda_bar
+    dkappa   = np.where(idx, -kappa**2*(dphi + (phi*dphi - lambda_bar)/root), 0.0)
+    ddelta_n = np.where(0.25*kappa*lambda_bar**2 < 0.1, 0.25*(dkappa*lambda_bar**2 + 2.0*kappa*lambda_bar), 0.0)
+    T1 = Nd/(kappa*Np)
+    T2 = beta*Md/Mp
+    dU_dlambda = -T1/kappa*dkappa + ddelta_n
 
+    dU = {}
+    dU['d']            = -dU_dlambda*lambda_bar/d - T1/d - 2.0*T2/d
+    dU['t']            = -(T1 + T2)/t
+    dU['Fz']           = -gamma_g/(kappa*Np)
+    dU['Myy']          = beta*gamma_f/Mp
+    dU['tower_height'] = dU_dlambda*lambda_bar/tower_height
+    dU['E']            = -0.5*dU_dlambda*lambda_bar/E
+    dU['sigma_y']      = 0.5*dU_dlambda*lambda_bar/sigma_y - (T1 + T2)/sigma_y
+    dU['gamma_f']      = beta*Myy/Mp
+    dU['gamma_b']      = (T1 + T2)/gamma_b
+    dU['gamma_g']      = -Fz/(kappa*Np)
+    return GL_utilization, dU
 
 
 
 
-def shellBucklingEurocode(d, t, sigma_z, sigma_t, tau_zt, L_reinforced, E, sigma_y, gamma_f=1.2, gamma_b=1.1):
+
+def shellBucklingEurocode(d, t, sigma_z, sigma_t, tau_zt, L_reinforced, E, sigma_y, gamma_f=1.2, gamma_b=1.1, derivatives=False):
     """
     Estimate shell buckling utilization along tower.
 
+    All arguments are broadcast against each other, so the stresses can carry
+    leading load case dimensions, e.g. (nLC, nsection), against the
+    (nsection,) geometry and material vectors.
+
     Arguments:
     npt - number of locations at each node at which stress is evaluated.
     sigma_z - axial stress at npt*node locations.  must be in order
@@ -255,53 +292,77 @@ def shellBucklingEurocode(d, t, sigma_z, sigma_t, tau_zt, L_reinforced, E, sigma
     L_reinforced - reinforcement length - structure is re-discretized with this spacing
     gamma_f - safety factor for stresses
     gamma_b - safety factor for buckling
+    derivatives - if True, also return the partial derivatives
 
     Returns:
     z
     EU_utilization: - array of shell buckling utilizations evaluted at (z[0] at npt locations, \n
                       z[0]+L_reinforced at npt locations, ...). \n
                       Each utilization must be < 1 to avoid failure.
+    dEU: - dictionary of the element-wise partial derivatives of EU_utilization with respect to
+           each argument (only if derivatives is True)
     """
 
-    n = len(d)
-    EU_utilization = np.zeros(n)
-    sigma_z_sh = np.zeros(n)
-    sigma_t_sh = np.zeros(n)
-    tau_zt_sh = np.zeros(n)
-
-    for i in range(n):
-        h = L_reinforced[i]
-
-        r1 = d[i]/2.0 - t[i]/2.0
-        r2 = d[i]/2.0 - t[i]/2.0
-
-        sigma_z_shell = sigma_z[i]
-        sigma_t_shell = sigma_t[i]
-        tau_zt_shell = tau_zt[i]
-
-        # TODO: the following is non-smooth, although in general its probably OK
-        # change to magnitudes and add safety factor
-        sigma_z_shell = gamma_f*abs(sigma_z_shell)
-        sigma_t_shell = gamma_f*abs(sigma_t_shell)
-        tau_zt_shell = gamma_f*abs(tau_zt_shell)
-
-        EU_utilization[i] = _shellBucklingOneSection(h, r1, r2, t[i], gamma_b, sigma_z_shell, sigma_t_shell, tau_zt_shell, E[i], sigma_y[i])
-
-        #make them into vectors
-        sigma_z_sh[i]=sigma_z_shell
-        sigma_t_sh[i]=sigma_t_shell
-        tau_zt_sh[i]=tau_zt_shell
-
-    return EU_utilization  # this is utilization must be <1
-
+    d = np.asarray(d, dtype=float)
+    t = np.asarray(t, dtype=float)
+    r = d/2.0 - t/2.0
+
+    # TODO: the following is non-smooth, although in general its probably OK
+    # change to magnitudes and add safety factor
+    sigma_z_shell = gamma_f*np.abs(sigma_z)
+    sigma_t_shell = gamma_f*np.abs(sigma_t)
+    tau_zt_shell = gamma_f*np.abs(tau_zt)
+
+    out = _shellBucklingOneSection(L_reinforced, r, r, t, gamma_b, sigma_z_shell, sigma_t_shell, tau_zt_shell, E, sigma_y,
+                                   derivatives=derivatives)
+    if not derivatives:
+        return out  # this is utilization must be <1
+
+    EU_utilization, dEU_section = out
+    dEU_dr = dEU_section['r1'] + dEU_section['r2']
+    dEU = {}
+    dEU['d']            = 0.5*dEU_dr
+    dEU['t']            = dEU_section['t'] - 0.5*dEU_dr
+    dEU['sigma_z']      = gamma_f*np.sign(sigma_z)*dEU_section['sigma_z']
+    dEU['sigma_t']      = gamma_f*np.sign(sigma_t)*dEU_section['sigma_t']
+    dEU['tau_zt']       = gamma_f*np.sign(tau_zt)*dEU_section['tau_zt']
+    dEU['L_reinforced'] = dEU_section['h']
+    dEU['E']            = dEU_section['E']
+    dEU['sigma_y']      = dEU_section['sigma_y']
+    dEU['gamma_f']      = (np.abs(sigma_z)*dEU_section['sigma_z'] + np.abs(sigma_t)*dEU_section['sigma_t'] +
+                           np.abs(tau_zt)*dEU_section['tau_zt'])
+    dEU['gamma_b']      = dEU_section['gamma_b']
+    return EU_utilization, dEU
+
+
+
+
+def _cubic_hermite(x1, x2, f1, f2, g1, g2, x):
+    """
+    Vectorized cubic_spline_eval: the cubic through (x1, f1) and (x2, f2) with slopes g1 and g2, evaluated at x.
+    Also returns the derivative with respect to x and the derivatives with respect to (x1, x2, f1, f2, g1, g2).
+    """
+    h   = x2 - x1
+    s   = (x - x1)/h
+    h00 = (1.0 + 2.0*s)*(1.0 - s)**2
+    h10 = s*(1.0 - s)**2
+    h01 = s**2*(3.0 - 2.0*s)
+    h11 = s**2*(s - 1.0)
+    f   = h00*f1 + h01*f2 + h*(h10*g1 + h11*g2)
 
+    df_ds = 6.0*s*(s - 1.0)*(f1 - f2) + h*((1.0 - s)*(1.0 - 3.0*s)*g1 + s*(3.0*s - 2.0)*g2)
+    df_dh = h10*g1 + h11*g2
+    return f, df_ds/h, (df_ds*(s - 1.0)/h - df_dh, df_dh - df_ds*s/h, h00, h01, h*h10, h*h11)
 
 
-def _cxsmooth(omega, rovert):
+def _cxsmooth(omega, rovert, derivatives=False):
 
     Cxb = 6.0  # clamped-clamped
     constant = 1 + 1.83/1.7 - 2.07/1.7**2
 
+    omega, rovert = np.broadcast_arrays(np.asarray(omega, dtype=float), np.asarray(rovert, dtype=float))
+    zero = np.zeros(omega.shape)
+
     ptL1 = 1.7-0.25
     ptR1 = 1.7+0.25
 
@@ -311,82 +372,106 @@ def _cxsmooth(omega, rovert):
     ptL3 = (0.5+Cxb)*rovert - 1.0
     ptR3 = (0.5+Cxb)*rovert + 1.0
 
-
-    if omega < ptL1:
-        Cx = constant - 1.83/omega + 2.07/omega**2
-
-    elif omega >= ptL1 and omega <= ptR1:
+    # Evaluate every piece everywhere, with its derivatives wrt omega (w) and rovert (r), and pick one per point
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        Cx1 = constant - 1.83/omega + 2.07/omega**2
+        w1  = 1.83/omega**2 - 4.14/omega**3
 
         fL = constant - 1.83/ptL1 + 2.07/ptL1**2
         fR = 1.0
         gL = 1.83/ptL1**2 - 4.14/ptL1**3
         gR = 0.0
-        Cx = cubic_spline_eval(ptL1, ptR1, fL, fR, gL, gR, omega)
-
-    elif omega > ptR1 and omega < ptL2:
-        Cx = 1.0
-
-    elif omega >= ptL2 and omega <= ptR2:
+        Cx2, w2, _ = _cubic_hermite(ptL1, ptR1, fL, fR, gL, gR, omega)
 
         fL = 1.0
         fR = 1 + 0.2/Cxb*(1-2.0*ptR2/rovert)
         gL = 0.0
         gR = -0.4/Cxb/rovert
-        Cx = cubic_spline_eval(ptL2, ptR2, fL, fR, gL, gR, omega)
-
-    elif omega > ptR2 and omega < ptL3:
-        Cx = 1 + 0.2/Cxb*(1-2.0*omega/rovert)
+        Cx4, w4, dp = _cubic_hermite(ptL2, ptR2, fL, fR, gL, gR, omega)
+        r4 = 0.5*(dp[0] + dp[1]) + (dp[3] + dp[5])*0.4/Cxb/rovert**2
 
-    elif omega >= ptL3 and omega <= ptR3:
+        Cx5 = 1 + 0.2/Cxb*(1-2.0*omega/rovert)
+        w5  = -0.4/Cxb/rovert + zero
+        r5  = 0.4/Cxb*omega/rovert**2
 
         fL = 1 + 0.2/Cxb*(1-2.0*ptL3/rovert)
         fR = 0.6
         gL = -0.4/Cxb/rovert
         gR = 0.0
-        Cx = cubic_spline_eval(ptL3, ptR3, fL, fR, gL, gR, omega)
+        Cx6, w6, dp = _cubic_hermite(ptL3, ptR3, fL, fR, gL, gR, omega)
+        r6 = (0.5+Cxb)*(dp[0] + dp[1]) - (dp[2] - dp[4])*0.4/Cxb/rovert**2
+
+    pieces = [omega < ptL1, omega <= ptR1, omega < ptL2, omega <= ptR2, omega < ptL3, omega <= ptR3]
+    Cx = np.select(pieces, [Cx1, Cx2, 1.0+zero, Cx4, Cx5, Cx6], 0.6)
 
-    else:
-        Cx = 0.6
+    if not derivatives:
+        return Cx
 
-    return Cx
+    dCx_domega  = np.select(pieces, [w1, w2, zero, w4, w5, w6], 0.0)
+    dCx_drovert = np.select(pieces, [zero, zero, zero, r4, r5, r6], 0.0)
+    return Cx, dCx_domega, dCx_drovert
 
 
-def _sigmasmooth(omega, E, rovert):
+def _sigmasmooth(omega, E, rovert, derivatives=False):
 
     Ctheta = 1.5  # clamped-clamped
 
+    omega, E, rovert = np.broadcast_arrays(np.asarray(omega, dtype=float), np.asarray(E, dtype=float),
+                                           np.asarray(rovert, dtype=float))
+
     ptL = 1.63*rovert*Ctheta - 1
     ptR = 1.63*rovert*Ctheta + 1
+    alpha1 = 0.92/1.63 - 2.03/1.63**4
 
-    if omega < 20.0*Ctheta:
+    # Evaluate every piece everywhere, with its derivatives wrt omega (w) and rovert (r), and pick one per point
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
         offset = (10.0/(20*Ctheta)**2 - 5/(20*Ctheta)**3)
         Cthetas = 1.5 + 10.0/omega**2 - 5/omega**3 - offset
-        sigma = 0.92*E*Cthetas/omega/rovert
-
-    elif omega >= 20.0*Ctheta and omega < ptL:
-
-        sigma = 0.92*E*Ctheta/omega/rovert
-
-    elif omega >= ptL and omega <= ptR:
+        sigma1 = 0.92*E*Cthetas/omega/rovert
+        w1 = 0.92*E/rovert*((-20.0/omega**3 + 15.0/omega**4)/omega - Cthetas/omega**2)
+        r1 = -sigma1/rovert
 
-        alpha1 = 0.92/1.63 - 2.03/1.63**4
+        sigma2 = 0.92*E*Ctheta/omega/rovert
+        w2 = -sigma2/omega
+        r2 = -sigma2/rovert
 
         fL = 0.92*E*Ctheta/ptL/rovert
         fR = E*(1.0/rovert)**2*(alpha1 + 2.03*(Ctheta/ptR*rovert)**4)
         gL = -0.92*E*Ctheta/rovert/ptL**2
         gR = -E*(1.0/rovert)*2.03*4*(Ctheta/ptR*rovert)**3*Ctheta/ptR**2
+        sigma3, w3, dp = _cubic_hermite(ptL, ptR, fL, fR, gL, gR, omega)
+        # the end points, values and slopes of the spline all move with rovert
+        dpt = 1.63*Ctheta
+        q   = Ctheta/ptR*rovert
+        dq  = Ctheta/ptR - q/ptR*dpt
+        dfL = -fL*(dpt/ptL + 1.0/rovert)
+        dfR = -2.0*fR/rovert + E/rovert**2*2.03*4*q**3*dq
+        dgL = -gL*(1.0/rovert + 2.0*dpt/ptL)
+        dgR = gR*(3.0*dq/q - 1.0/rovert - 2.0*dpt/ptR)
+        r3 = dpt*(dp[0] + dp[1]) + dp[2]*dfL + dp[3]*dfR + dp[4]*dgL + dp[5]*dgR
 
-        sigma = cubic_spline_eval(ptL, ptR, fL, fR, gL, gR, omega)
+        sigma4 = E*(1.0/rovert)**2*(alpha1 + 2.03*(Ctheta/omega*rovert)**4)
+        q  = Ctheta/omega*rovert
+        w4 = -E/rovert**2*2.03*4*q**4/omega
+        r4 = -2.0*sigma4/rovert + E/rovert**2*2.03*4*q**4/rovert
 
-    else:
+    pieces = [omega < 20.0*Ctheta, omega < ptL, omega <= ptR]
+    sigma = np.select(pieces, [sigma1, sigma2, sigma3], sigma4)
 
-        alpha1 = 0.92/1.63 - 2.03/1.63**4
-        sigma = E*(1.0/rovert)**2*(alpha1 + 2.03*(Ctheta/omega*rovert)**4)
+    if not derivatives:
+        return sigma
 
-    return sigma
+    # every piece is linear in E
+    dsigma_domega  = np.select(pieces, [w1, w2, w3], w4)
+    dsigma_dE      = sigma/E
+    dsigma_drovert = np.select(pieces, [r1, r2, r3], r4)
+    return sigma, dsigma_domega, dsigma_dE, dsigma_drovert
 
 
-def _tausmooth(omega, rovert):
+def _tausmooth(omega, rovert, derivatives=False):
+
+    omega, rovert = np.broadcast_arrays(np.asarray(omega, dtype=float), np.asarray(rovert, dtype=float))
+    zero = np.zeros(omega.shape)
 
     ptL1 = 9
     ptR1 = 11
@@ -394,37 +479,65 @@ def _tausmooth(omega, rovert):
     ptL2 = 8.7*rovert - 1
     ptR2 = 8.7*rovert + 1
 
-    if omega < ptL1:
-        C_tau = np.sqrt(1.0 + 42.0/omega**3 - 42.0/10**3)
+    # Evaluate every piece everywhere, with its derivatives wrt omega (w) and rovert (r), and pick one per point
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        C_tau1 = np.sqrt(1.0 + 42.0/omega**3 - 42.0/10**3)
+        w1 = -63.0/omega**4/C_tau1
 
-    elif omega >= ptL1 and omega <= ptR1:
         fL = np.sqrt(1.0 + 42.0/ptL1**3 - 42.0/10**3)
         fR = 1.0
         gL = -63.0/ptL1**4/fL
         gR = 0.0
-        C_tau = cubic_spline_eval(ptL1, ptR1, fL, fR, gL, gR, omega)
-
-    elif omega > ptR1 and omega < ptL2:
-        C_tau = 1.0
+        C_tau2, w2, _ = _cubic_hermite(ptL1, ptR1, fL, fR, gL, gR, omega)
 
-    elif omega >= ptL2 and omega <= ptR2:
         fL = 1.0
         fR = 1.0/3.0*np.sqrt(ptR2/rovert) + 1 - np.sqrt(8.7)/3
         gL = 0.0
         gR = 1.0/6/np.sqrt(ptR2*rovert)
-        C_tau = cubic_spline_eval(ptL2, ptR2, fL, fR, gL, gR, omega)
+        C_tau4, w4, dp = _cubic_hermite(ptL2, ptR2, fL, fR, gL, gR, omega)
+        dfR = -1.0/6.0/np.sqrt(ptR2/rovert)/rovert**2
+        dgR = -0.5*gR*(8.7*rovert + ptR2)/(ptR2*rovert)
+        r4 = 8.7*(dp[0] + dp[1]) + dp[3]*dfR + dp[5]*dgR
+
+        C_tau5 = 1.0/3.0*np.sqrt(omega/rovert) + 1 - np.sqrt(8.7)/3
+        w5 = 1.0/6.0/np.sqrt(omega*rovert)
+        r5 = -1.0/6.0*np.sqrt(omega/rovert)/rovert
+
+    pieces = [omega < ptL1, omega <= ptR1, omega < ptL2, omega <= ptR2]
+    C_tau = np.select(pieces, [C_tau1, C_tau2, 1.0+zero, C_tau4], C_tau5)
+
+    if not derivatives:
+        return C_tau
+
+    dC_tau_domega  = np.select(pieces, [w1, w2, zero, w4], w5)
+    dC_tau_drovert = np.select(pieces, [zero, zero, zero, r4], r5)
+    return C_tau, dC_tau_domega, dC_tau_drovert
+
+
+
+# Inputs of _shellBucklingOneSection, in the order of the trailing axis of its forward mode derivatives
+_SHELL_BUCKLING_VARS = ('h', 'r1', 'r2', 't', 'sigma_z', 'sigma_t', 'tau_zt', 'E', 'sigma_y', 'gamma_b')
 
-    else:
-        C_tau = 1.0/3.0*np.sqrt(omega/rovert) + 1 - np.sqrt(8.7)/3
+def _col(x):
+    # Value array as a column against the trailing derivative axis
+    return np.asarray(x)[..., np.newaxis]
 
-    return C_tau
 
+def _power_with_deriv(a, k, da, dk):
+    # a**k and its forward mode derivative, taken as zero where a is zero
+    p = a**k
+    apos = np.where(a > 0.0, a, 1.0)
+    dp = np.where(_col(a > 0.0), _col(p)*(_col(k)*da/_col(apos) + _col(np.log(apos))*dk), 0.0)
+    return p, dp
 
 
-def _shellBucklingOneSection(h, r1, r2, t, gamma_b, sigma_z, sigma_t, tau_zt, E, sigma_y):
+def _shellBucklingOneSection(h, r1, r2, t, gamma_b, sigma_z, sigma_t, tau_zt, E, sigma_y, derivatives=False):
     """
     Estimate shell buckling for one tapered cylindrical shell section.
 
+    The arguments can be arrays of any shapes that broadcast against each
+    other, e.g. (load_case, section), and are evaluated element-wise.
+
     Arguments:
     h - height of conical section
     r1 - radius at bottom
@@ -436,27 +549,44 @@ def _shellBucklingOneSection(h, r1, r2, t, gamma_b, sigma_z, sigma_t, tau_zt, E,
     sigma_z - axial stress component
     sigma_t - azimuthal stress component
     tau_zt - shear stress component (z, theta)
+    derivatives - if True, also return the partial derivatives
 
     Returns:
     EU_utilization, shell buckling utilization which must be < 1 to avoid failure
+    dEU_utilization, dictionary of its element-wise partial derivatives with respect to each argument
+    (only if derivatives is True)
 
     """
 
     #NOTE: definition of r1, r2 switched from Eurocode document to be consistent with FEM.
 
+    (h, r1, r2, t, sigma_z, sigma_t, tau_zt, E, sigma_y,
+     gamma_b) = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in
+                                      (h, r1, r2, t, sigma_z, sigma_t, tau_zt, E, sigma_y, gamma_b)])
+
+    # Forward mode derivatives: dx[..., k] is the derivative of x with respect to _SHELL_BUCKLING_VARS[k]
+    dh, dr1, dr2, dt, dsigma_z, dsigma_t, dtau_zt, dE, dsigma_y, dgamma_b = np.eye(len(_SHELL_BUCKLING_VARS))
+    c = _col
+
     # ----- geometric parameters --------
-    beta = atan2(r1-r2, h)
+    beta = np.arctan2(r1-r2, h)
+    dbeta = (c(h)*(dr1-dr2) - c(r1-r2)*dh) / c(h**2 + (r1-r2)**2)
     L = h/np.cos(beta)
+    dL = (dh + c(L*np.sin(beta))*dbeta) / c(np.cos(beta))
 
     # ------------- axial stress -------------
     # length parameter
     le = L
     re = 0.5*(r1+r2)/np.cos(beta)
+    dre = (0.5*(dr1+dr2) + c(re*np.sin(beta))*dbeta) / c(np.cos(beta))
     omega = le/np.sqrt(re*t)
+    domega = c(omega)*(dL/c(le) - 0.5*dre/c(re) - 0.5*dt/c(t))
     rovert = re/t
+    drovert = c(rovert)*(dre/c(re) - dt/c(t))
 
     # compute Cx
-    Cx = _cxsmooth(omega, rovert)
+    Cx, dCx_domega, dCx_drovert = _cxsmooth(omega, rovert, derivatives=True)
+    dCx = c(dCx_domega)*domega + c(dCx_drovert)*drovert
 
 
     # if omega <= 1.7:
@@ -469,6 +599,7 @@ def _shellBucklingOneSection(h, r1, r2, t, gamma_b, sigma_z, sigma_t, tau_zt, E,
 
     # critical axial buckling stress
     sigma_z_Rcr = 0.605*E*Cx/rovert
+    dsigma_z_Rcr = c(sigma_z_Rcr)*(dE/c(E) + dCx/c(Cx) - drovert/c(rovert))
 
     # compute buckling reduction factors
     lambda_z0 = 0.2
@@ -476,22 +607,23 @@ def _shellBucklingOneSection(h, r1, r2, t, gamma_b, sigma_z, sigma_t, tau_zt, E,
     eta_z = 1.0
     Q = 25.0  # quality parameter - high
     lambda_z = np.sqrt(sigma_y/sigma_z_Rcr)
+    dlambda_z = 0.5*c(lambda_z)*(dsigma_y/c(sigma_y) - dsigma_z_Rcr/c(sigma_z_Rcr))
     delta_wk = 1.0/Q*np.sqrt(rovert)*t
     alpha_z = 0.62/(1 + 1.91*(delta_wk/t)**1.44)
+    dalpha_z = -c(alpha_z**2/0.62*1.91*1.44*(delta_wk/t)**1.44*0.5/rovert)*drovert
 
-    chi_z = _buckling_reduction_factor(alpha_z, beta_z, eta_z, lambda_z0, lambda_z)
+    chi_z, dchi_z_dlambda, dchi_z_dalpha = _buckling_reduction_factor(alpha_z, beta_z, eta_z, lambda_z0, lambda_z,
+                                                                      derivatives=True)
+    dchi_z = c(dchi_z_dlambda)*dlambda_z + c(dchi_z_dalpha)*dalpha_z
 
     # design buckling stress
     sigma_z_Rk = chi_z*sigma_y
     sigma_z_Rd = sigma_z_Rk/gamma_b
+    dsigma_z_Rd = c(sigma_z_Rd)*(dchi_z/c(chi_z) + dsigma_y/c(sigma_y) - dgamma_b/c(gamma_b))
 
     # ---------------- hoop stress ------------------
 
-    # length parameter
-    le = L
-    re = 0.5*(r1+r2)/(np.cos(beta))
-    omega = le/np.sqrt(re*t)
-    rovert = re/t
+    # length parameter: same as for the axial stress
 
     # Ctheta = 1.5  # clamped-clamped
     # CthetaS = 1.5 + 10.0/omega**2 - 5.0/omega**3
@@ -504,7 +636,9 @@ def _shellBucklingOneSection(h, r1, r2, t, gamma_b, sigma_z, sigma_t, tau_zt, E,
     # else:
     #     sigma_t_Rcr = 0.92*E*Ctheta/omega/rovert
 
-    sigma_t_Rcr = np.maximum(eps, _sigmasmooth(omega, E, rovert))
+    sigma_t_cr, dsigma_t_domega, dsigma_t_dE, dsigma_t_drovert = _sigmasmooth(omega, E, rovert, derivatives=True)
+    sigma_t_Rcr = np.maximum(eps, sigma_t_cr)
+    dsigma_t_Rcr = c(sigma_t_cr > eps)*(c(dsigma_t_domega)*domega + c(dsigma_t_dE)*dE + c(dsigma_t_drovert)*drovert)
 
     # buckling reduction factor
     alpha_t = 0.65  # high fabrication quality
@@ -512,20 +646,30 @@ def _shellBucklingOneSection(h, r1, r2, t, gamma_b, sigma_z, sigma_t, tau_zt, E,
     beta_t = 0.6
     eta_t = 1.0
     lambda_t = np.sqrt(sigma_y/sigma_t_Rcr)
+    dlambda_t = 0.5*c(lambda_t)*(dsigma_y/c(sigma_y) - dsigma_t_Rcr/c(sigma_t_Rcr))
 
-    chi_theta = _buckling_reduction_factor(alpha_t, beta_t, eta_t, lambda_t0, lambda_t)
+    chi_theta, dchi_theta_dlambda, _ = _buckling_reduction_factor(alpha_t, beta_t, eta_t, lambda_t0, lambda_t,
+                                                                  derivatives=True)
+    dchi_theta = c(dchi_theta_dlambda)*dlambda_t
 
     sigma_t_Rk = chi_theta*sigma_y
     sigma_t_Rd = sigma_t_Rk/gamma_b
+    dsigma_t_Rd = c(sigma_t_Rd)*(dchi_theta/c(chi_theta) + dsigma_y/c(sigma_y) - dgamma_b/c(gamma_b))
 
     # ----------------- shear stress ----------------------
 
     # length parameter
     le = h
     rho = np.sqrt((r1+r2)/(2.0*r2))
-    re = (1.0 + rho - 1.0/rho)*r2*np.cos(beta)
+    drho = 0.5*c(rho)*((dr1+dr2)/c(r1+r2) - dr2/c(r2))
+    taper = 1.0 + rho - 1.0/rho
+    re = taper*r2*np.cos(beta)
+    dre = (c(r2*np.cos(beta)*(1.0 + 1.0/rho**2))*drho + c(taper*np.cos(beta))*dr2 -
+           c(taper*r2*np.sin(beta))*dbeta)
     omega = le/np.sqrt(re*t)
+    domega = c(omega)*(dh/c(le) - 0.5*dre/c(re) - 0.5*dt/c(t))
     rovert = re/t
+    drovert = c(rovert)*(dre/c(re) - dt/c(t))
 
     # if (omega < 10):
     #     C_tau = np.sqrt(1.0 + 42.0/omega**3)
@@ -533,9 +677,11 @@ def _shellBucklingOneSection(h, r1, r2, t, gamma_b, sigma_z, sigma_t, tau_zt, E,
     #     C_tau = 1.0/3.0*np.sqrt(omega/rovert)
     # else:
     #     C_tau = 1.0
-    C_tau = _tausmooth(omega, rovert)
+    C_tau, dC_tau_domega, dC_tau_drovert = _tausmooth(omega, rovert, derivatives=True)
+    dC_tau = c(dC_tau_domega)*domega + c(dC_tau_drovert)*drovert
 
     tau_zt_Rcr = 0.75*E*C_tau*np.sqrt(1.0/omega)/rovert
+    dtau_zt_Rcr = c(tau_zt_Rcr)*(dE/c(E) + dC_tau/c(C_tau) - 0.5*domega/c(omega) - drovert/c(rovert))
 
     # reduction factor
     alpha_tau = 0.65  # high fabrifaction quality
@@ -543,11 +689,15 @@ def _shellBucklingOneSection(h, r1, r2, t, gamma_b, sigma_z, sigma_t, tau_zt, E,
     lambda_tau0 = 0.4
     eta_tau = 1.0
     lambda_tau = np.sqrt(sigma_y/np.sqrt(3)/tau_zt_Rcr)
+    dlambda_tau = 0.5*c(lambda_tau)*(dsigma_y/c(sigma_y) - dtau_zt_Rcr/c(tau_zt_Rcr))
 
-    chi_tau = _buckling_reduction_factor(alpha_tau, beta_tau, eta_tau, lambda_tau0, lambda_tau)
+    chi_tau, dchi_tau_dlambda, _ = _buckling_reduction_factor(alpha_tau, beta_tau, eta_tau, lambda_tau0, lambda_tau,
+                                                              derivatives=True)
+    dchi_tau = c(dchi_tau_dlambda)*dlambda_tau
 
     tau_zt_Rk = chi_tau*sigma_y/np.sqrt(3)
     tau_zt_Rd = tau_zt_Rk/gamma_b
+    dtau_zt_Rd = c(tau_zt_Rd)*(dchi_tau/c(chi_tau) + dsigma_y/c(sigma_y) - dgamma_b/c(gamma_b))
 
     # buckling interaction parameters
 
@@ -564,38 +714,66 @@ def _shellBucklingOneSection(h, r1, r2, t, gamma_b, sigma_z, sigma_t, tau_zt, E,
         k_i*(sigma_z*sigma_t/sigma_z_Rd/sigma_t_Rd) + \
         (tau_zt/tau_zt_Rd)**k_tau
 
-    return utilization #this is utilization must be <1
+    if not derivatives:
+        return utilization #this is utilization must be <1
 
+    ratio_z = sigma_z/sigma_z_Rd
+    ratio_t = sigma_t/sigma_t_Rd
+    ratio_tau = tau_zt/tau_zt_Rd
+    dratio_z = dsigma_z/c(sigma_z_Rd) - c(ratio_z/sigma_z_Rd)*dsigma_z_Rd
+    dratio_t = dsigma_t/c(sigma_t_Rd) - c(ratio_t/sigma_t_Rd)*dsigma_t_Rd
+    dratio_tau = dtau_zt/c(tau_zt_Rd) - c(ratio_tau/tau_zt_Rd)*dtau_zt_Rd
+    dk_i = 2.0*c(chi_z*chi_theta)*(c(chi_theta)*dchi_z + c(chi_z)*dchi_theta)
 
+    _, dterm_z = _power_with_deriv(ratio_z, k_z, dratio_z, 0.75*dchi_z)
+    _, dterm_t = _power_with_deriv(ratio_t, k_theta, dratio_t, 0.75*dchi_theta)
+    _, dterm_tau = _power_with_deriv(ratio_tau, k_tau, dratio_tau, 0.25*dchi_tau)
+    dutilization = (dterm_z + dterm_t + dterm_tau - dk_i*c(ratio_z*ratio_t) -
+                    c(k_i)*(dratio_z*c(ratio_t) + c(ratio_z)*dratio_t))
 
-def _buckling_reduction_factor(alpha, beta, eta, lambda_0, lambda_bar):
+    dEU_utilization = dict((name, dutilization[..., k]) for k, name in enumerate(_SHELL_BUCKLING_VARS))
+    return utilization, dEU_utilization
+
+
+
+def _buckling_reduction_factor(alpha, beta, eta, lambda_0, lambda_bar, derivatives=False):
     """
     Computes a buckling reduction factor used in Eurocode shell buckling formula.
+    With derivatives=True, also returns its derivatives with respect to lambda_bar and alpha.
     """
 
+    lambda_bar = np.asarray(lambda_bar, dtype=float)
     lambda_p = np.sqrt(alpha/(1.0-beta))
+    dlambda_p = 0.5*lambda_p/alpha
 
     ptL = 0.9*lambda_0
     ptR = 1.1*lambda_0
 
-    if (lambda_bar < ptL):
-        chi = 1.0
-
-    elif lambda_bar >= ptL and lambda_bar <= ptR:  # cubic spline section
-
+    # Evaluate every piece everywhere, with its derivatives wrt lambda_bar (l) and alpha (a), and pick one per point
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # cubic spline section
         fracR = (ptR-lambda_0)/(lambda_p-lambda_0)
         fL = 1.0
         fR = 1-beta*fracR**eta
         gL = 0.0
         gR = -beta*eta*fracR**(eta-1)/(lambda_p-lambda_0)
+        chi2, l2, dp = _cubic_hermite(ptL, ptR, fL, fR, gL, gR, lambda_bar)
+        dfracR = -fracR/(lambda_p-lambda_0)
+        dfR = -beta*eta*fracR**(eta-1)*dfracR
+        dgR = gR*((eta-1)*dfracR/fracR - 1.0/(lambda_p-lambda_0))
+        a2 = (dp[3]*dfR + dp[5]*dgR)*dlambda_p
 
-        chi = cubic_spline_eval(ptL, ptR, fL, fR, gL, gR, lambda_bar)
+        frac = (lambda_bar-lambda_0)/(lambda_p-lambda_0)
+        chi3 = 1.0 - beta*frac**eta
+        l3 = -beta*eta*frac**(eta-1)/(lambda_p-lambda_0)
+        a3 = beta*eta*frac**eta/(lambda_p-lambda_0)*dlambda_p
 
-    elif lambda_bar > ptR and lambda_bar < lambda_p:
-        chi = 1.0 - beta*((lambda_bar-lambda_0)/(lambda_p-lambda_0))**eta
+        chi4 = alpha/lambda_bar**2
+        l4 = -2.0*chi4/lambda_bar
+        a4 = 1.0/lambda_bar**2
 
-    else:
-        chi = alpha/lambda_bar**2
+    pieces = [lambda_bar < ptL, lambda_bar <= ptR, lambda_bar < lambda_p]
+    chi = np.select(pieces, [np.ones(chi4.shape), chi2, chi3], chi4)
 
 
 
@@ -606,7 +784,13 @@ def _buckling_reduction_factor(alpha, beta, eta, lambda_0, lambda_bar):
     # else:
     #     chi = 1.0 - beta*((lambda_bar-lambda_0)/(lambda_p-lambda_0))**eta
 
-    return chi
+    if not derivatives:
+        return chi
+
+    zero = np.zeros(chi.shape)
+    dchi_dlambda = np.select(pieces, [zero, l2, l3], l4)
+    dchi_dalpha = np.select(pieces, [zero, a2, a3], a4)
+    return chi, dchi_dlambda, dchi_dalpha
 
 
 
@@ -921,17 +1105,17 @@ def shellBuckling_withStiffeners(P, sigma_ax, R_od, t_wall, h_section, h_web, t_
     load_per_length_Nth = hoop_stress_nostiff * t_wall
     load_ratio_k        = load_per_length_Nph / load_per_length_Nth
     def solveFthFph(Fxci, Frci, Kth):
-        Fphci = np.zeros(Fxci.shape)
-        Fthci = np.zeros(Fxci.shape)
         Kph   = 1.0
         c1    = (Fxci + Frci) / sigma_y - 1.0
         c2    = load_ratio_k * Kph / Kth
-        for k in range(Fxci.size):
-            try:
-                Fthci[k] = brentq(lambda x: (c2[k]*x/Fxci[k])**2 - c1[k]*(c2[k]*x/Fxci[k])*(x/Frci[k]) + (x/Frci[k])**2 - 1.0, 0, Fxci[k]+Frci[k], maxiter=20)
-            except:
-                Fthci[k] = Fxci[k] + Frci[k]
-            Fphci[k] = c2[k] * Fthci[k]
+        # The interaction equation (c2*x/Fxci)**2 - c1*(c2*x/Fxci)*(x/Frci) + (x/Frci)**2 = 1
+        # is x**2 * a = 1, so the root in (0, Fxci+Frci] is 1/sqrt(a).  Without one, keep the bracket end.
+        a     = (c2/Fxci)**2 - c1*(c2/Fxci)/Frci + 1.0/Frci**2
+        Fmax  = Fxci + Frci
+        with np.errstate(divide='ignore', invalid='ignore'):
+            Fthci = np.where(a > 0.0, 1.0/np.sqrt(np.where(a > 0.0, a, 1.0)), Fmax)
+        Fthci = np.where(Fthci < Fmax, Fthci, Fmax)
+        Fphci = c2 * Fthci
         return Fphci, Fthci
 
     inelastic_local_FphcL, inelastic_local_FthcL = solveFthFph(inelastic_axial_local_FxcL, inelastic_extern_local_FrcL, stiffener_factor_KthL)
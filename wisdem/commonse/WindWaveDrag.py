@@ -24,7 +24,7 @@ import math
 import numpy as np
 
 from openmdao.api import ExplicitComponent, Problem, Group
-from wisdem.commonse.utilities import sind, cosd  # , linspace_with_deriv, interp_with_deriv, hstack, vstack
+from wisdem.commonse.utilities import sind, cosd, interp_weights, condition_sparsity  # , linspace_with_deriv, interp_with_deriv, hstack, vstack
 from wisdem.commonse.csystem import DirectionVector
 
 from wisdem.commonse.akima import Akima
@@ -473,6 +473,329 @@ class CylinderWaveDrag(ExplicitComponent):
 
         
 
+# ----------------------------------------------
+#  Components over many environmental conditions
+# ----------------------------------------------
+# Loads of several environmental conditions at once: inputs and outputs that
+# change with the condition have a leading nConditions axis, e.g. U has shape
+# (nConditions, nPoints), and the partials are declared block sparse.
+# TowerSE and FloatingSE do not use them yet, their load groups are built from
+# the single condition components above.
+
+def _declare_condition_partials(comp, of, deps):
+    """declares the partials of the (nConditions, nPoints) output of with respect to the inputs
+    in deps, a dictionary of input name to dependency type of condition_sparsity"""
+    nconds = comp.options['nConditions']
+    npts = comp.options['nPoints']
+    for wrt, kind in deps.items():
+        rows, cols = condition_sparsity(nconds, npts, kind)
+        comp.declare_partials(of, wrt, rows=rows, cols=cols)
+
+
+def _identity_partials(comp, of, wrt, n):
+    comp.declare_partials(of, wrt, rows=np.arange(n), cols=np.arange(n), val=1.0)
+
+
+def _cylinderDragForce(U, d, rho, mu, cd_usr):
+    """drag force per unit length q*cd*d and dynamic pressure q over an (nConditions, nPoints)
+    array of speeds U, and their derivatives"""
+    q = 0.5*rho*U**2
+    dq_dU = rho*U
+    dq_drho = 0.5*U**2
+
+    # Reynolds number and drag
+    if float(cd_usr) < 0.:
+        Re = rho*U*d/mu
+        cd, dcd_dRe = cylinderDrag(Re)
+        dcd_dU = dcd_dRe*rho*d/mu
+        dcd_dd = dcd_dRe*rho*U/mu
+        dcd_drho = dcd_dRe*U*d/mu
+        dcd_dmu = -dcd_dRe*Re/mu
+        dF_dcd_usr = np.zeros_like(U)
+    else:
+        cd = cd_usr*np.ones_like(U)
+        dcd_dU = dcd_dd = dcd_drho = dcd_dmu = 0.0
+        dF_dcd_usr = q*d
+
+    F = q*cd*d
+    dF = {'U'      : (dq_dU*cd + q*dcd_dU)*d,
+          'd'      : q*(cd + dcd_dd*d),
+          'rho'    : (dq_drho*cd + q*dcd_drho)*d,
+          'mu'     : q*dcd_dmu*d*np.ones_like(U),
+          'cd_usr' : dF_dcd_usr}
+    return F, dF, q, dq_dU, dq_drho
+
+
+class CylinderWindDragBatch(ExplicitComponent):
+    """drag forces on a cylindrical cylinder due to wind, as CylinderWindDrag, for several
+    wind conditions (speed profile and direction)"""
+
+    def initialize(self):
+        self.options.declare('nPoints')
+        self.options.declare('nConditions')
+
+    def setup(self):
+        nPoints = self.options['nPoints']
+        nConds = self.options['nConditions']
+
+        # variables
+        self.add_input('U', np.zeros((nConds, nPoints)), units='m/s', desc='magnitude of wind speed of each condition')
+        self.add_input('z', np.zeros(nPoints), units='m', desc='heights where wind speed was computed')
+        self.add_input('d', np.zeros(nPoints), units='m', desc='corresponding diameter of cylinder section')
+
+        # parameters
+        self.add_input('beta', np.zeros(nConds), units='deg', desc='wind angle of each condition relative to inertial coordinate system')
+        self.add_input('rho', 0.0, units='kg/m**3', desc='air density')
+        self.add_input('mu', 0.0, units='kg/(m*s)', desc='dynamic viscosity of air')
+        self.add_input('cd_usr', -1., desc='User input drag coefficient to override Reynolds number based one')
+
+        # out
+        self.add_output('windLoads_Px', np.zeros((nConds, nPoints)), units='N/m', desc='distributed loads, force per unit length in x-direction')
+        self.add_output('windLoads_Py', np.zeros((nConds, nPoints)), units='N/m', desc='distributed loads, force per unit length in y-direction')
+        self.add_output('windLoads_Pz', np.zeros((nConds, nPoints)), units='N/m', desc='distributed loads, force per unit length in z-direction')
+        self.add_output('windLoads_qdyn', np.zeros((nConds, nPoints)), units='N/m**2', desc='dynamic pressure')
+        self.add_output('windLoads_z', np.zeros(nPoints), units='m', desc='corresponding heights')
+        self.add_output('windLoads_d', np.zeros(nPoints), units='m', desc='corresponding diameters')
+        self.add_output('windLoads_beta', np.zeros(nConds), units='deg', desc='wind/wave angle relative to inertia c.s.')
+
+        deps = {'U':'both', 'd':'point', 'beta':'condition', 'rho':'scalar', 'mu':'scalar', 'cd_usr':'scalar'}
+        _declare_condition_partials(self, 'windLoads_Px', deps)
+        _declare_condition_partials(self, 'windLoads_Py', deps)
+        _declare_condition_partials(self, 'windLoads_qdyn', {'U':'both', 'rho':'scalar'})
+        _identity_partials(self, 'windLoads_z', 'z', nPoints)
+        _identity_partials(self, 'windLoads_d', 'd', nPoints)
+        _identity_partials(self, 'windLoads_beta', 'beta', nConds)
+
+    def compute(self, inputs, outputs):
+
+        U = inputs['U']
+        d = inputs['d'][np.newaxis, :]
+        beta = inputs['beta'][:, np.newaxis]
+
+        Fp, dFp, q, dq_dU, dq_drho = _cylinderDragForce(U, d, inputs['rho'], inputs['mu'], inputs['cd_usr'])
+
+        # components of distributed loads
+        cb = cosd(beta)
+        sb = sind(beta)
+        outputs['windLoads_Px'] = Fp*cb
+        outputs['windLoads_Py'] = Fp*sb
+        outputs['windLoads_Pz'] = 0*Fp
+        outputs['windLoads_qdyn'] = q
+        outputs['windLoads_z'] = inputs['z']
+        outputs['windLoads_d'] = inputs['d']
+        outputs['windLoads_beta'] = inputs['beta']
+
+        self.J = {}
+        for wrt, dF in dFp.items():
+            self.J['windLoads_Px', wrt] = dF*cb
+            self.J['windLoads_Py', wrt] = dF*sb
+        self.J['windLoads_Px', 'beta'] = -Fp*sb*np.pi/180.0
+        self.J['windLoads_Py', 'beta'] = Fp*cb*np.pi/180.0
+        self.J['windLoads_qdyn', 'U'] = dq_dU
+        self.J['windLoads_qdyn', 'rho'] = dq_drho
+
+    def compute_partials(self, inputs, J):
+        for key, val in self.J.items():
+            J[key] = val.ravel()
+
+
+class CylinderWaveDragBatch(ExplicitComponent):
+    """drag forces on a cylindrical cylinder due to waves, as CylinderWaveDrag, for several sea
+    states (kinematics profile and direction)"""
+
+    def initialize(self):
+        self.options.declare('nPoints')
+        self.options.declare('nConditions')
+
+    def setup(self):
+        nPoints = self.options['nPoints']
+        nConds = self.options['nConditions']
+
+        # variables
+        self.add_input('U', np.zeros((nConds, nPoints)), units='m/s', desc='magnitude of wave speed of each sea state')
+        self.add_input('A', np.zeros((nConds, nPoints)), units='m/s**2', desc='magnitude of wave acceleration of each sea state')
+        self.add_input('p', np.zeros((nConds, nPoints)), units='N/m**2', desc='pressure oscillation of each sea state')
+        self.add_input('z', np.zeros(nPoints), units='m', desc='heights where wave speed was computed')
+        self.add_input('d', np.zeros(nPoints), units='m', desc='corresponding diameter of cylinder section')
+
+        # parameters
+        self.add_input('beta', np.zeros(nConds), units='deg', desc='wave angle of each sea state relative to inertial coordinate system')
+        self.add_input('rho', 0.0, units='kg/m**3', desc='water density')
+        self.add_input('mu', 0.0, units='kg/(m*s)', desc='dynamic viscosity of water')
+        self.add_input('cm', 0.0, desc='mass coefficient')
+        self.add_input('cd_usr', -1., desc='User input drag coefficient to override Reynolds number based one')
+
+        # out
+        self.add_output('waveLoads_Px', np.zeros((nConds, nPoints)), units='N/m', desc='distributed loads, force per unit length in x-direction')
+        self.add_output('waveLoads_Py', np.zeros((nConds, nPoints)), units='N/m', desc='distributed loads, force per unit length in y-direction')
+        self.add_output('waveLoads_Pz', np.zeros((nConds, nPoints)), units='N/m', desc='distributed loads, force per unit length in z-direction')
+        self.add_output('waveLoads_qdyn', np.zeros((nConds, nPoints)), units='N/m**2', desc='dynamic pressure')
+        self.add_output('waveLoads_pt', np.zeros((nConds, nPoints)), units='N/m**2', desc='total (static+dynamic) pressure')
+        self.add_output('waveLoads_z', np.zeros(nPoints), units='m', desc='corresponding heights')
+        self.add_output('waveLoads_d', np.zeros(nPoints), units='m', desc='corresponding diameters')
+        self.add_output('waveLoads_beta', np.zeros(nConds), units='deg', desc='wind/wave angle relative to inertia c.s.')
+
+        deps = {'U':'both', 'A':'both', 'd':'point', 'beta':'condition', 'rho':'scalar', 'mu':'scalar',
+                'cm':'scalar', 'cd_usr':'scalar'}
+        _declare_condition_partials(self, 'waveLoads_Px', deps)
+        _declare_condition_partials(self, 'waveLoads_Py', deps)
+        _declare_condition_partials(self, 'waveLoads_qdyn', {'U':'both', 'rho':'scalar'})
+        _declare_condition_partials(self, 'waveLoads_pt', {'U':'both', 'p':'both', 'rho':'scalar'})
+        _identity_partials(self, 'waveLoads_z', 'z', nPoints)
+        _identity_partials(self, 'waveLoads_d', 'd', nPoints)
+        _identity_partials(self, 'waveLoads_beta', 'beta', nConds)
+
+    def compute(self, inputs, outputs):
+
+        rho = inputs['rho']
+        cm = inputs['cm']
+        A = inputs['A']
+        d = inputs['d'][np.newaxis, :]
+        beta = inputs['beta'][:, np.newaxis]
+
+        Fd, dFp, q, dq_dU, dq_drho = _cylinderDragForce(inputs['U'], d, rho, inputs['mu'], inputs['cd_usr'])
+
+        # inertial and drag forces
+        Fi = rho*cm*math.pi/4.0*d**2*A  # Morrison's equation
+        Fp = Fi + Fd
+        dFp['A'] = rho*cm*math.pi/4.0*d**2*np.ones_like(A)
+        dFp['d'] = dFp['d'] + rho*cm*math.pi/2.0*d*A
+        dFp['rho'] = dFp['rho'] + cm*math.pi/4.0*d**2*A
+        dFp['cm'] = rho*math.pi/4.0*d**2*A
+
+        # components of distributed loads
+        cb = cosd(beta)
+        sb = sind(beta)
+        outputs['waveLoads_Px'] = Fp*cb
+        outputs['waveLoads_Py'] = Fp*sb
+        outputs['waveLoads_Pz'] = 0.*Fp
+        outputs['waveLoads_qdyn'] = q
+        outputs['waveLoads_pt'] = q + inputs['p']
+        outputs['waveLoads_z'] = inputs['z']
+        outputs['waveLoads_d'] = inputs['d']
+        outputs['waveLoads_beta'] = inputs['beta']
+
+        self.J = {}
+        for wrt, dF in dFp.items():
+            self.J['waveLoads_Px', wrt] = dF*cb
+            self.J['waveLoads_Py', wrt] = dF*sb
+        self.J['waveLoads_Px', 'beta'] = -Fp*sb*np.pi/180.0
+        self.J['waveLoads_Py', 'beta'] = Fp*cb*np.pi/180.0
+        self.J['waveLoads_qdyn', 'U'] = dq_dU
+        self.J['waveLoads_qdyn', 'rho'] = dq_drho
+        self.J['waveLoads_pt', 'U'] = dq_dU
+        self.J['waveLoads_pt', 'p'] = np.ones_like(A)
+        self.J['waveLoads_pt', 'rho'] = dq_drho
+
+    def compute_partials(self, inputs, J):
+        for key, val in self.J.items():
+            J[key] = val.ravel()
+
+
+class AeroHydroLoadsBatch(ExplicitComponent):
+    """sum of wind and wave loads, as AeroHydroLoads, for several environmental conditions"""
+
+    def initialize(self):
+        self.options.declare('nPoints')
+        self.options.declare('nConditions')
+
+    def setup(self):
+        nPoints = self.options['nPoints']
+        nConds = self.options['nConditions']
+
+        #inputs
+        for src in ['windLoads', 'waveLoads']:
+            self.add_input(src+'_Px', np.zeros((nConds, nPoints)), units='N/m', desc='distributed loads, force per unit length in x-direction')
+            self.add_input(src+'_Py', np.zeros((nConds, nPoints)), units='N/m', desc='distributed loads, force per unit length in y-direction')
+            self.add_input(src+'_Pz', np.zeros((nConds, nPoints)), units='N/m', desc='distributed loads, force per unit length in z-direction')
+            self.add_input(src+'_qdyn', np.zeros((nConds, nPoints)), units='N/m**2', desc='dynamic pressure')
+            self.add_input(src+'_z', np.zeros(nPoints), units='m', desc='corresponding heights')
+            self.add_input(src+'_d', np.zeros(nPoints), units='m', desc='corresponding diameters')
+            self.add_input(src+'_beta', np.zeros(nConds), units='deg', desc='wind/wave angle relative to inertia c.s.')
+
+        self.add_input('z', np.zeros(nPoints), units='m', desc='locations along cylinder')
+        self.add_input('yaw', 0.0, units='deg', desc='yaw angle')
+
+        #outputs
+        self.add_output('Px', np.zeros((nConds, nPoints)), units='N/m', desc='force per unit length in x-direction')
+        self.add_output('Py', np.zeros((nConds, nPoints)), units='N/m', desc='force per unit length in y-direction')
+        self.add_output('Pz', np.zeros((nConds, nPoints)), units='N/m', desc='force per unit length in z-direction')
+        self.add_output('qdyn', np.zeros((nConds, nPoints)), units='N/m**2', desc='dynamic pressure')
+
+        # Interpolation couples all nodes of a condition, rotation couples x and y
+        for src in ['windLoads', 'waveLoads']:
+            for var in ['Px', 'Py']:
+                _declare_condition_partials(self, var, {src+'_Px':'block', src+'_Py':'block', src+'_beta':'condition'})
+            _declare_condition_partials(self, 'Pz', {src+'_Pz':'block'})
+            _declare_condition_partials(self, 'qdyn', {src+'_qdyn':'block'})
+            self.declare_partials(['Px', 'Py', 'Pz', 'qdyn'], src+'_z')
+        _declare_condition_partials(self, 'Px', {'z':'point', 'yaw':'scalar'})
+        _declare_condition_partials(self, 'Py', {'z':'point', 'yaw':'scalar'})
+        _declare_condition_partials(self, 'Pz', {'z':'point'})
+        _declare_condition_partials(self, 'qdyn', {'z':'point'})
+
+    def compute(self, inputs, outputs):
+        nPoints = self.options['nPoints']
+        nConds = self.options['nConditions']
+        z = inputs['z']
+        ipts = np.arange(nPoints)
+
+        for var in ['Px', 'Py', 'Pz', 'qdyn']:
+            outputs[var] = np.zeros((nConds, nPoints))
+
+        self.J = {}
+        self.J['Px', 'yaw'] = np.zeros((nConds, nPoints))
+        self.J['Py', 'yaw'] = np.zeros((nConds, nPoints))
+        for var in ['Px', 'Py', 'Pz', 'qdyn']:
+            self.J[var, 'z'] = np.zeros((nConds, nPoints))
+
+        for src in ['windLoads', 'waveLoads']:
+            W, dW_dz, lo, dlo, dhi = interp_weights(z, inputs[src+'_z'])
+
+            # rotate to yaw-aligned c.s. by beta + yaw, as DirectionVector.inertialToWind.windToYaw
+            theta = np.radians(inputs[src+'_beta'] + inputs['yaw'])[:, np.newaxis]
+            c = np.cos(theta)
+            s = np.sin(theta)
+            loads = {'Px' : inputs[src+'_Px']*c + inputs[src+'_Py']*s,
+                     'Py' : -inputs[src+'_Px']*s + inputs[src+'_Py']*c,
+                     'Pz' : inputs[src+'_Pz'],
+                     'qdyn' : inputs[src+'_qdyn']}
+
+            Wb = W[np.newaxis, :, :]
+            self.J['Px', src+'_Px'] = c[:, :, np.newaxis]*Wb
+            self.J['Px', src+'_Py'] = s[:, :, np.newaxis]*Wb
+            self.J['Py', src+'_Px'] = -s[:, :, np.newaxis]*Wb
+            self.J['Py', src+'_Py'] = c[:, :, np.newaxis]*Wb
+            self.J['Pz', src+'_Pz'] = np.tile(Wb, (nConds, 1, 1))
+            self.J['qdyn', src+'_qdyn'] = np.tile(Wb, (nConds, 1, 1))
+
+            # derivative of the rotated loads with respect to the angle, per degree
+            dPx_dtheta = np.radians(loads['Py']).dot(W.T)
+            dPy_dtheta = -np.radians(loads['Px']).dot(W.T)
+            self.J['Px', src+'_beta'] = dPx_dtheta
+            self.J['Py', src+'_beta'] = dPy_dtheta
+            self.J['Px', 'yaw'] += dPx_dtheta
+            self.J['Py', 'yaw'] += dPy_dtheta
+
+            for var in ['Px', 'Py', 'Pz', 'qdyn']:
+                outputs[var] += loads[var].dot(W.T)
+                self.J[var, 'z'] += loads[var].dot(dW_dz.T)
+
+                # moving control points of the interpolation
+                dy = loads[var][:, lo+1] - loads[var][:, lo]
+                dzp = np.zeros((nConds, nPoints, nPoints))
+                dzp[:, ipts, lo] = dy*dlo
+                dzp[:, ipts, lo+1] = dy*dhi
+                self.J[var, src+'_z'] = dzp
+
+    def compute_partials(self, inputs, J):
+        for key, val in self.J.items():
+            if key[1] in ['windLoads_z', 'waveLoads_z']:
+                J[key] = val.reshape((-1, self.options['nPoints']))
+            else:
+                J[key] = val.ravel()
+
+
 #___________________________________________#
 
 def main():
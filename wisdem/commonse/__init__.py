@@ -3,8 +3,12 @@ from .utilities import cosd, sind, tand
 from .SegIntersect import SegIntersect, CalcDist
 from .Material import Material
 from .tube import Tube
-from .WindWaveDrag import AeroHydroLoads, CylinderWindDrag, CylinderWaveDrag
+from .WindWaveDrag import AeroHydroLoads, CylinderWindDrag, CylinderWaveDrag, AeroHydroLoadsBatch, CylinderWindDragBatch, CylinderWaveDragBatch
 from .akima import Akima
 from .enum import Enum
 from .constants import gravity, eps
+from .profiling import enable_from_environment
 NFREQ  = 5
+
+# Opt-in timing of all OpenMDAO runs, see profiling.py
+enable_from_environment()
@@ -14,7 +14,7 @@ from scipy.optimize import brentq
 from openmdao.api import ExplicitComponent, Problem, Group, IndepVarComp
 import sys
 
-from .utilities import hstack, vstack
+from .utilities import hstack, vstack, condition_sparsity
 from .constants import gravity
 
 #TODO CHECK
@@ -446,6 +446,314 @@ class TowerSoil(ExplicitComponent):
         ind = np.nonzero(inputs['k_usr'] >= 0.0)[0]
         J['k', 'd0'][ind] = 0.0
         J['k', 'depth'][ind] = 0.0
+
+
+# ----------------------------------------------
+#  Components over many environmental conditions
+# ----------------------------------------------
+# Inputs and outputs that change with the environmental condition (sea state,
+# wind speed) have a leading nConditions axis, e.g. U has shape
+# (nConditions, nPoints).  Entry [i,j] of an output only depends on condition i
+# and node j, so the partials are declared block sparse.
+# These are building blocks on their own: TowerSE (one wind/wave group per load
+# case) and FloatingSE (Column) still use the single condition components.
+
+
+def _declare_condition_partials(comp, of, deps):
+    """declares the partials of the (nConditions, nPoints) output of with respect to the inputs
+    in deps, a dictionary of input name to dependency type of condition_sparsity"""
+    nconds = comp.options['nConditions']
+    npts = comp.options['nPoints']
+    for wrt, kind in deps.items():
+        rows, cols = condition_sparsity(nconds, npts, kind)
+        comp.declare_partials(of, wrt, rows=rows, cols=cols)
+
+
+class WindBatchBase(ExplicitComponent):
+    """base component for wind speed/direction over several environmental conditions"""
+    def initialize(self):
+        self.options.declare('nPoints')
+        self.options.declare('nConditions')
+
+    def setup(self):
+        npts = self.options['nPoints']
+        nconds = self.options['nConditions']
+
+        # variables
+        self.add_input('Uref', np.zeros(nconds), units='m/s', desc='reference wind speed (usually at hub height) of each condition')
+        self.add_input('zref', 0.0, units='m', desc='corresponding reference height')
+        self.add_input('z', np.zeros(npts), units='m', desc='heights where wind speed should be computed')
+
+        # parameters
+        self.add_input('z0', 0.0, units='m', desc='bottom of wind profile (height of ground/sea)')
+
+        # out
+        self.add_output('U', np.zeros((nconds, npts)), units='m/s', desc='magnitude of wind speed at each condition and z location')
+
+    def compute_partials(self, inputs, J):
+        for key, val in self.J.items():
+            J[key] = val.ravel()
+
+
+class PowerWindBatch(WindBatchBase):
+    """power-law profile wind, as PowerWind, for several reference wind speeds and shear exponents"""
+
+    def setup(self):
+        super(PowerWindBatch, self).setup()
+
+        # parameters
+        self.add_input('shearExp', np.zeros(self.options['nConditions']), desc='shear exponent of each condition')
+
+        _declare_condition_partials(self, 'U', {'Uref':'condition', 'shearExp':'condition', 'z':'point',
+                                                'zref':'scalar', 'z0':'scalar'})
+
+    def compute(self, inputs, outputs):
+        nconds = self.options['nConditions']
+
+        # rename
+        z = inputs['z'][np.newaxis, :]
+        zref = inputs['zref']
+        z0 = inputs['z0']
+        Uref = inputs['Uref'][:, np.newaxis]
+        shearExp = inputs['shearExp'][:, np.newaxis]
+
+        # velocity, zero below z0
+        idx = np.tile(z > z0, (nconds, 1))
+        dz = np.where(idx, z - z0, zref - z0)
+        ratio = dz/(zref - z0)
+        Uratio = np.where(idx, ratio**shearExp, 0.0)
+        U = Uref*Uratio
+        outputs['U'] = U
+
+        # gradients
+        self.J = {}
+        self.J['U', 'Uref'] = Uratio
+        self.J['U', 'shearExp'] = U*np.log(ratio)
+        self.J['U', 'z'] = U*shearExp/dz
+        self.J['U', 'zref'] = -U*shearExp/(zref - z0)
+        self.J['U', 'z0'] = U*shearExp*(1.0/(zref - z0) - 1.0/dz)
+
+
+class LogWindBatch(WindBatchBase):
+    """logarithmic-profile wind, as LogWind, for several reference wind speeds"""
+
+    def setup(self):
+        super(LogWindBatch, self).setup()
+
+        # parameters
+        self.add_input('z_roughness', 0.0, units='mm', desc='surface roughness length')
+
+        _declare_condition_partials(self, 'U', {'Uref':'condition', 'z':'point', 'zref':'scalar',
+                                                'z0':'scalar', 'z_roughness':'scalar'})
+
+    def compute(self, inputs, outputs):
+        nconds = self.options['nConditions']
+
+        # rename
+        z = inputs['z'][np.newaxis, :]
+        zref = inputs['zref']
+        z0 = inputs['z0']
+        z_roughness = inputs['z_roughness']/1e3  # convert to m
+        Uref = inputs['Uref'][:, np.newaxis]
+
+        # velocity, zero below the roughness length
+        idx = np.tile(z - z0 > z_roughness, (nconds, 1))
+        dz = np.where(idx, z - z0, z_roughness)
+        lt = np.log(dz/z_roughness)
+        lb = math.log((zref - z0)/z_roughness)
+        U = Uref*lt/lb
+        outputs['U'] = U
+
+        # gradients
+        self.J = {}
+        self.J['U', 'Uref'] = lt/lb
+        self.J['U', 'z'] = np.where(idx, Uref/lb/dz, 0.0)
+        self.J['U', 'zref'] = -U/lb/(zref - z0)
+        self.J['U', 'z0'] = -self.J['U', 'z'] - self.J['U', 'zref']
+        self.J['U', 'z_roughness'] = np.where(idx, Uref*(lt - lb)/(z_roughness*lb**2), 0.0)/1e3
+
+
+def _wave_number(omega, d):
+    """wave numbers k of linear waves of circular frequencies omega in water of depth d, from the
+    dispersion relation omega^2 = g k tanh(k d), and their derivatives dk/domega and dk/dd"""
+    # Eckart's approximation, then Newton iterations
+    k = omega**2/gravity/np.sqrt(np.tanh(omega**2*d/gravity))
+    for _ in range(50):
+        th = np.tanh(k*d)
+        dF_dk = gravity*(th + k*d*(1.0 - th**2))
+        dk = (gravity*k*th - omega**2) / dF_dk
+        k -= dk
+        if np.all(np.abs(dk) <= 1e-15*k): break
+
+    th = np.tanh(k*d)
+    dF_dk = gravity*(th + k*d*(1.0 - th**2))
+    dk_domega = 2.0*omega/dF_dk
+    dk_dd = -gravity*k**2*(1.0 - th**2)/dF_dk
+    return k, dk_domega, dk_dd
+
+
+class LinearWavesBatch(ExplicitComponent):
+    """linear (Airy) wave theory, as LinearWaves, for several sea states (wave height, period and
+    current).  Sea states with a non-positive period have no waves."""
+
+    def initialize(self):
+        self.options.declare('nPoints')
+        self.options.declare('nConditions')
+
+    def setup(self):
+        npts = self.options['nPoints']
+        nconds = self.options['nConditions']
+
+        # variables
+        self.add_input('rho', 0.0, units='kg/m**3', desc='water density')
+        self.add_input('z', np.zeros(npts), units='m', desc='heights where wave speed should be computed')
+        self.add_input('z_surface', 0.0, units='m', desc='vertical location of water surface')
+        self.add_input('z_floor', 0.0, units='m', desc='vertical location of sea floor')
+        self.add_input('Uc', np.zeros(nconds), units='m/s', desc='mean current speed of each sea state')
+
+        # parameters
+        self.add_input('hmax', np.zeros(nconds), units='m', desc='maximum wave height (crest-to-trough) of each sea state')
+        self.add_input('T', np.zeros(nconds), units='s', desc='period of maximum wave height of each sea state')
+
+        # out
+        self.add_output('U', np.zeros((nconds, npts)), units='m/s', desc='horizontal wave velocity at each sea state and z location')
+        self.add_output('W', np.zeros((nconds, npts)), units='m/s', desc='vertical wave velocity at each sea state and z location')
+        self.add_output('V', np.zeros((nconds, npts)), units='m/s', desc='total wave velocity at each sea state and z location')
+        self.add_output('A', np.zeros((nconds, npts)), units='m/s**2', desc='horizontal wave acceleration at each sea state and z location')
+        self.add_output('p', np.zeros((nconds, npts)), units='N/m**2', desc='pressure oscillation at each sea state and z location')
+        self.add_output('phase_speed', np.zeros(nconds), units='m/s', desc='phase speed of wave of each sea state')
+
+        deps = {'hmax':'condition', 'T':'condition', 'z':'point', 'z_surface':'scalar', 'z_floor':'scalar'}
+        for var in ['W', 'A']:
+            _declare_condition_partials(self, var, deps)
+        deps['Uc'] = 'condition'
+        for var in ['U', 'V']:
+            _declare_condition_partials(self, var, deps)
+        deps['rho'] = 'scalar'
+        del deps['Uc']
+        _declare_condition_partials(self, 'p', deps)
+
+        self.declare_partials('phase_speed', 'T', rows=np.arange(nconds), cols=np.arange(nconds))
+        self.declare_partials('phase_speed', ['z_surface', 'z_floor'], rows=np.arange(nconds), cols=np.zeros(nconds, dtype=np.int_))
+
+    def compute(self, inputs, outputs):
+        npts = self.options['nPoints']
+        nconds = self.options['nConditions']
+
+        # water depth
+        z_floor = inputs['z_floor']
+        sign_floor = 1.0
+        if z_floor > 0.0:
+            z_floor = -z_floor
+            sign_floor = -1.0
+        z_surface = inputs['z_surface']
+        d = z_surface - z_floor
+        z = inputs['z'][np.newaxis, :]
+        rho = inputs['rho']
+
+        # default to no waves
+        self.J = {}
+        for var in ['U', 'W', 'V', 'A', 'p']:
+            outputs[var] = np.zeros((nconds, npts))
+            for wrt in ['hmax', 'T', 'z', 'z_surface', 'z_floor']:
+                self.J[var, wrt] = np.zeros((nconds, npts))
+        self.J['U', 'Uc'] = np.zeros((nconds, npts))
+        self.J['V', 'Uc'] = np.zeros((nconds, npts))
+        self.J['p', 'rho'] = np.zeros((nconds, npts))
+        outputs['phase_speed'] = np.zeros(nconds)
+        for wrt in ['T', 'z_surface', 'z_floor']:
+            self.J['phase_speed', wrt] = np.zeros(nconds)
+
+        # Use zero entries if there is no depth and no water, and for sea states without waves
+        ia = np.nonzero(inputs['T'] > 0.0)[0] if d > 0.0 else np.zeros(0, dtype=np.int_)
+        if ia.size == 0: return
+
+        # design wave amplitude, circular frequency and wave number
+        a = 0.5*inputs['hmax'][ia, np.newaxis]
+        T = inputs['T'][ia]
+        omega = 2.0*math.pi/T
+        k, dk_domega, dk_dd = _wave_number(omega, d)
+        domega_dT = -omega/T
+
+        c = omega/k
+        outputs['phase_speed'][ia] = c
+        self.J['phase_speed', 'T'][ia] = (1.0/k - c/k*dk_domega)*domega_dT
+        self.J['phase_speed', 'z_surface'][ia] = -c/k*dk_dd
+        self.J['phase_speed', 'z_floor'][ia] = sign_floor*c/k*dk_dd
+
+        omega = omega[:, np.newaxis]
+        k = k[:, np.newaxis]
+        dk_domega = dk_domega[:, np.newaxis]
+        dk_dd = dk_dd[:, np.newaxis]
+        domega_dT = domega_dT[:, np.newaxis]
+
+        # height above sea floor and below surface
+        s = np.clip(z - z_floor, 0.0, d)
+        z_rel = z - z_surface
+        wet = np.logical_and(z >= z_floor, z <= z_surface)
+
+        # ratios of hyperbolic functions, written to not overflow in deep water
+        decay = np.exp(k*(s - d))
+        es = np.exp(-2.0*k*s)
+        ed = np.exp(-2.0*k*d)
+        Cs_Sd = decay*(1.0 + es)/(1.0 - ed)  # cosh(k*s)/sinh(k*d)
+        Ss_Sd = decay*(1.0 - es)/(1.0 - ed)  # sinh(k*s)/sinh(k*d)
+        Cs_Cd = decay*(1.0 + es)/(1.0 + ed)  # cosh(k*s)/cosh(k*d)
+        Ss_Cd = decay*(1.0 - es)/(1.0 + ed)  # sinh(k*s)/cosh(k*d)
+        Td = np.tanh(k*d)
+
+        def chain(var, f, f_a, f_omega, f_k, f_s, f_d):
+            # From the derivatives with respect to amplitude, frequency, wave number, height above
+            # the sea floor and depth to those with respect to the inputs
+            outputs[var][ia] = wet*f
+            f_d = f_d + f_k*dk_dd
+            self.J[var, 'hmax'][ia] = wet*0.5*f_a
+            self.J[var, 'T'][ia] = wet*(f_omega + f_k*dk_domega)*domega_dT
+            self.J[var, 'z'][ia] = wet*f_s
+            self.J[var, 'z_surface'][ia] = wet*f_d
+            self.J[var, 'z_floor'][ia] = -sign_floor*wet*(f_s + f_d)
+
+        # maximum velocity (without current) and acceleration
+        Uw = a*omega*Cs_Sd
+        Uw_k = a*omega*(s*Ss_Sd - d*Cs_Sd/Td)
+        Uw_s = a*omega*k*Ss_Sd
+        Uw_d = -a*omega*k*Cs_Sd/Td
+        chain('U', Uw + inputs['Uc'][ia, np.newaxis], omega*Cs_Sd, a*Cs_Sd, Uw_k, Uw_s, Uw_d)
+        self.J['U', 'Uc'][ia] = wet*np.ones_like(Uw)
+
+        W = -a*omega*Ss_Sd
+        W_k = -a*omega*(s*Cs_Sd - d*Ss_Sd/Td)
+        W_s = -a*omega*k*Cs_Sd
+        W_d = a*omega*k*Ss_Sd/Td
+        chain('W', W, -omega*Ss_Sd, -a*Ss_Sd, W_k, W_s, W_d)
+
+        chain('A', omega*Uw, omega**2*Cs_Sd, 2.0*Uw, omega*Uw_k, omega*Uw_s, omega*Uw_d)
+
+        U = outputs['U'][ia]
+        W = outputs['W'][ia]
+        V = np.sqrt(U**2 + W**2)
+        dV_dU = np.where(V > 0.0, U/np.maximum(V, 1e-300), 0.0)
+        dV_dW = np.where(V > 0.0, W/np.maximum(V, 1e-300), 0.0)
+        outputs['V'][ia] = V
+        for wrt in ['hmax', 'T', 'z', 'z_surface', 'z_floor', 'Uc']:
+            dW = self.J['W', wrt][ia] if wrt != 'Uc' else 0.0
+            self.J['V', wrt][ia] = dV_dU*self.J['U', wrt][ia] + dV_dW*dW
+
+        # Pressure oscillation is just sum of static and dynamic contributions
+        # Hydrostatic is simple rho * g * z
+        # Dynamic is from standard solution to Airy (Potential Flow) Wave theory
+        # Full pressure would also include standard dynamic head (0.5*rho*V^2)
+        rg = rho*gravity
+        eta = a*Cs_Cd - z_rel
+        eta_k = a*(s*Ss_Cd - d*Cs_Cd*Td)
+        eta_s = a*k*Ss_Cd - 1.0
+        eta_d = -a*k*Cs_Cd*Td + 1.0
+        chain('p', rg*eta, rg*Cs_Cd, 0.0, rg*eta_k, rg*eta_s, rg*eta_d)
+        self.J['p', 'rho'][ia] = wet*gravity*eta
+
+    def compute_partials(self, inputs, J):
+        for key, val in self.J.items():
+            J[key] = val.ravel()
         
 
 
@@ -0,0 +1,281 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+evaluation_cache.py
+
+Opt-in cache of whole OpenMDAO group evaluations, keyed on the values that
+drive the group: the outputs of the independent variable components inside it
+(design variables and, for the top level model, the automatic IVC of
+unconnected inputs) and the inputs it receives from outside.  A repeated point
+(line search backtrack, restarted optimization, repeated run_model, DOE rerun)
+restores the stored output and input vectors instead of running the group.
+The group is still run before derivatives are computed at a restored point, as
+components may keep state for compute_partials.
+
+The cache is an LRU bounded in number of entries, optionally backed by an
+SQLite file that persists across runs.  Values are rounded to a number of
+significant digits before hashing, so points equal to that tolerance share an
+entry.  The key also covers the options and the source code of the systems in
+the group, so persisted entries are not reused after either changes.
+
+Copyright (c) NREL. All rights reserved.
+"""
+
+from __future__ import print_function
+import os
+import sys
+import copy
+import pickle
+import sqlite3
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+
+def quantize(x, digits):
+    """Rounds the array x to digits significant digits"""
+    x   = np.array(x, dtype=float).ravel()
+    idx = np.isfinite(x) & (x != 0.0)
+    scale   = 10.0**(digits - 1 - np.floor(np.log10(np.abs(x[idx]))))
+    x[idx]  = np.round(x[idx]*scale) / scale
+    return x
+
+
+class EvaluationCache(object):
+    """
+    LRU store of group evaluations with optional SQLite backing.
+
+    Parameters
+    ----------
+    max_entries : int
+        Number of evaluations kept in memory.  The SQLite file is not bounded.
+    filename : str or None
+        SQLite file that persists the entries across runs, None to keep them in memory only.
+    digits : int
+        Significant digits of the values hashed into the key.
+    """
+
+    def __init__(self, max_entries=256, filename=None, digits=12):
+        self.max_entries = max_entries
+        self.filename    = filename
+        self.digits      = digits
+        self.entries     = OrderedDict()
+        self.stats       = {'hits': 0, 'disk_hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+        self._db         = None
+
+    def key(self, layout, values, discrete):
+        """Hash of the layout string, the rounded float values and the discrete values"""
+        h = hashlib.sha1(layout.encode())
+        h.update(quantize(values, self.digits).tobytes())
+        h.update(pickle.dumps(discrete, protocol=2))
+        return h.hexdigest()
+
+    def get(self, key):
+        """Stored entry for key, or None.  Updates the hit/miss statistics."""
+        entry = self.entries.get(key, None)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return entry
+
+        db = self._connect()
+        if db is not None:
+            row = db.execute('SELECT data FROM evaluations WHERE key=?', (key,)).fetchone()
+            if row is not None:
+                entry = pickle.loads(row[0])
+                self._remember(key, entry)
+                self.stats['hits'] += 1
+                self.stats['disk_hits'] += 1
+                return entry
+
+        self.stats['misses'] += 1
+        return None
+
+    def put(self, key, entry):
+        self._remember(key, entry)
+        self.stats['stores'] += 1
+        db = self._connect()
+        if db is not None:
+            db.execute('INSERT OR REPLACE INTO evaluations (key, data) VALUES (?,?)',
+                       (key, sqlite3.Binary(pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))))
+            db.commit()
+
+    def _remember(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.stats['evictions'] += 1
+
+    def _connect(self):
+        if self.filename is None:
+            return None
+        if self._db is None:
+            self._db = sqlite3.connect(self.filename)
+            self._db.execute('CREATE TABLE IF NOT EXISTS evaluations (key TEXT PRIMARY KEY, data BLOB)')
+            self._db.commit()
+        return self._db
+
+    def clear(self):
+        """Empties the memory store and the SQLite file"""
+        self.entries.clear()
+        db = self._connect()
+        if db is not None:
+            db.execute('DELETE FROM evaluations')
+            db.commit()
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def hit_rate(self):
+        n = self.stats['hits'] + self.stats['misses']
+        return self.stats['hits'] / float(n) if n > 0 else 0.0
+
+    def report(self):
+        return ('Evaluation cache: %d hits (%d from disk), %d misses, hit rate %.1f%%, %d entries in memory, %d evictions' %
+                (self.stats['hits'], self.stats['disk_hits'], self.stats['misses'], 100.0*self.hit_rate(),
+                 len(self.entries), self.stats['evictions']))
+
+    def __getstate__(self):
+        # The SQLite connection cannot be pickled or shared across processes
+        state = self.__dict__.copy()
+        state['_db'] = None
+        return state
+
+
+def make_cache(option):
+    """EvaluationCache from an assembly 'cache' option: an EvaluationCache, True for an
+    in-memory cache, or the name of an SQLite file"""
+    if isinstance(option, EvaluationCache):
+        return option
+    if option is True:
+        return EvaluationCache()
+    return EvaluationCache(filename=option)
+
+
+_source_hashes = {}
+
+def _code_hash(module_name):
+    # Hash of the source file of a module, so that a code change invalidates persisted entries
+    if module_name not in _source_hashes:
+        fname = getattr(sys.modules.get(module_name, None), '__file__', None)
+        h = hashlib.sha1(module_name.encode())
+        if fname is not None and os.path.exists(fname):
+            with open(fname, 'rb') as f:
+                h.update(f.read())
+        _source_hashes[module_name] = h.hexdigest()
+    return _source_hashes[module_name]
+
+
+def _model_hash(group):
+    # Hash of the options and of the source code of all the systems in group
+    h = hashlib.sha1()
+    for system in group.system_iter(recurse=True, include_self=True):
+        h.update(system.pathname.encode())
+        h.update(_code_hash(type(system).__module__).encode())
+        for name, value in sorted(system.options.items(), key=lambda item: item[0]):
+            if name == 'cache' or isinstance(value, EvaluationCache):
+                continue # how the cache is configured, not part of the model
+            h.update(name.encode())
+            try:
+                h.update(pickle.dumps(value, protocol=2))
+            except Exception:
+                h.update(repr(value).encode())
+    return h.hexdigest()
+
+
+def _source_layout(group):
+    # Names, in a fixed order, of the float and discrete values that determine an evaluation of group
+    from openmdao.core.indepvarcomp import IndepVarComp
+
+    prefix  = group.pathname + '.' if group.pathname else ''
+    conns   = group._conn_global_abs_in2out
+    floats  = []
+    discrete = []
+
+    for ivc in group.system_iter(recurse=True, typ=IndepVarComp):
+        floats.extend(sorted(ivc._var_abs2meta['output']))
+        rel = ivc.pathname[len(prefix):]
+        discrete.extend(sorted(rel + '.' + k for k in ivc._var_discrete['output']))
+
+    if group.pathname:
+        for abs_in in sorted(group._var_abs2meta['input']):
+            src = conns.get(abs_in, None)
+            if src is None or not src.startswith(prefix):
+                floats.append(abs_in)
+        for rel_in in sorted(group._var_discrete['input']):
+            src = conns.get(prefix + rel_in, None)
+            if src is None or not src.startswith(prefix):
+                discrete.append(rel_in)
+
+    return floats, discrete
+
+
+def cache_group(group, cache):
+    """Serves repeated evaluations of group (an OpenMDAO Group) from cache.  Can be called
+    before setup (e.g. from configure); the layout is resolved at the first evaluation."""
+    if getattr(group, '_wisdem_cache', None) is not None:
+        group._wisdem_cache = cache
+        return
+    group._wisdem_cache = cache
+    solve     = group._solve_nonlinear
+    linearize = group._linearize
+    layout    = {}
+    # set when the outputs were restored from the cache: the components did not run at this point,
+    # so state they keep for compute_partials (e.g. a Jacobian saved in compute) is from another point
+    restored  = {'state': False}
+
+    def cached_solve_nonlinear():
+        cache = group._wisdem_cache
+        if cache is None or group.under_complex_step:
+            return solve()
+
+        if layout.get('setup', None) is not group._outputs:
+            # First call, or a new setup
+            floats, discrete = _source_layout(group)
+            layout['setup']    = group._outputs
+            layout['floats']   = floats
+            layout['discrete'] = discrete
+            layout['string']   = '%s|%d|%d|%s|%s|%s' % (type(group).__name__, len(group._outputs.asarray()),
+                                                        len(group._inputs.asarray()), ','.join(floats), ','.join(discrete),
+                                                        _model_hash(group))
+
+        outputs = group._outputs
+        inputs  = group._inputs
+        values  = [outputs._views_flat[k] if k in outputs._views_flat else inputs._views_flat[k] for k in layout['floats']]
+        values  = np.concatenate(values) if values else np.zeros(0)
+        dvalues = [group._discrete_outputs[k] if k in group._discrete_outputs else group._discrete_inputs[k]
+                   for k in layout['discrete']]
+        key     = cache.key(layout['string'], values, dvalues)
+
+        entry = cache.get(key)
+        if entry is not None:
+            out_data, in_data, dout, din = entry
+            outputs.set_val(out_data)
+            inputs.set_val(in_data)
+            for k, v in dout.items():
+                group._discrete_outputs[k] = copy.deepcopy(v)
+            for k, v in din.items():
+                group._discrete_inputs[k] = copy.deepcopy(v)
+            restored['state'] = True
+            return
+
+        solve()
+        restored['state'] = False
+        dout = dict(group._discrete_outputs.items()) if group._discrete_outputs else {}
+        din  = dict(group._discrete_inputs.items()) if group._discrete_inputs else {}
+        cache.put(key, (outputs.asarray(copy=True), inputs.asarray(copy=True),
+                        copy.deepcopy(dout), copy.deepcopy(din)))
+
+    def cached_linearize(*args, **kwargs):
+        if restored['state']:
+            # Run the group at the restored point before its derivatives are computed
+            solve()
+            restored['state'] = False
+        return linearize(*args, **kwargs)
+
+    group._solve_nonlinear = cached_solve_nonlinear
+    group._linearize       = cached_linearize
@@ -0,0 +1,452 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+profiling.py
+
+Opt-in timing of WISDEM evaluations: per-component call counts, wall and cpu
+time, and the time spent inside the compiled extensions.  Enable it by setting
+the environment variable WISDEM_PROFILE (to an output file prefix, or to 1 for
+the default prefix 'wisdem_profile') for all Problems, by calling
+profile_problem on an OpenMDAO Problem, or for one model through the 'profile'
+option of the turbine assemblies (profile_system).  A sorted report is printed
+after every run_model / run_driver (at exit for profile_system) and the timings
+are written to <prefix>.json and, as Chrome trace events (chrome://tracing,
+speedscope, perfetto), to <prefix>.trace.json.
+
+Copyright (c) NREL. All rights reserved.
+"""
+
+from __future__ import print_function
+import os
+import sys
+import json
+import time
+import functools
+import atexit
+from contextlib import contextmanager
+
+ENV_VAR = 'WISDEM_PROFILE'
+DEFAULT_PREFIX = 'wisdem_profile'
+
+# Component methods that are timed, when the component class implements them
+COMPONENT_METHODS = ('compute', 'compute_partials', 'compute_jacvec_product',
+                     'apply_nonlinear', 'solve_nonlinear', 'linearize')
+
+def _frame3dd_library(module):
+    # The ctypes library loaded by every Frame (np.ctypeslib.load_library returns the same cached CDLL)
+    import numpy as np
+    mydir = os.path.dirname(os.path.realpath(module.__file__))
+    try:
+        return np.ctypeslib.load_library(module.libname, mydir)
+    except OSError:
+        return np.ctypeslib.load_library(module.libname, os.path.dirname(mydir))
+
+# Compiled extensions: label -> (module, attribute or function of the module returning the target or None,
+# function of the target or None).  Without a function, every call through the target is timed.
+NATIVE_EXTENSIONS = {'_bem'        : ('wisdem.ccblade._bem', None, None),
+                     '_precomp'    : ('wisdem.rotorse._precomp', 'precomp', None),
+                     '_pBEAM'      : ('wisdem.pBeam._pBEAM', None, None),
+                     '_pyframe3dd' : ('wisdem.pyframe3dd.frame3dd', _frame3dd_library, 'run'),
+                     '_libmap'     : ('wisdem.pymap.pymap', 'libexec', None)}
+
+# Python entry points timed as regions of their own: label -> (module, class, method, argument naming the region)
+REGIONS = {'ORBIT install phase' : ('wisdem.orbit.manager', 'ProjectManager', 'run_install_phase', 1),
+           'ORBIT design phase'  : ('wisdem.orbit.manager', 'ProjectManager', 'run_design_phase', 1)}
+
+# Maximum number of trace events kept, to bound memory in long optimizations
+MAX_EVENTS = 200000
+
+
+class _NativeFunction(object):
+    """Stands in for a compiled function and times its calls.  Other attributes (e.g. ctypes
+    argtypes and restype) are read from and set on the function itself."""
+
+    def __init__(self, func, label, profiler):
+        object.__setattr__(self, '_func', func)
+        object.__setattr__(self, '_label', label)
+        object.__setattr__(self, '_profiler', profiler)
+        object.__setattr__(self, '__doc__', getattr(func, '__doc__', None))
+
+    def __call__(self, *args, **kwargs):
+        t = time.perf_counter()
+        try:
+            return self._func(*args, **kwargs)
+        finally:
+            self._profiler.add_native(self._label, time.perf_counter() - t)
+
+    def __getattr__(self, name):
+        return getattr(self._func, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._func, name, value)
+
+
+class _NativeProxy(object):
+    """Stands in for a compiled module (or ctypes library) and times every call made through it"""
+
+    def __init__(self, target, label, profiler):
+        self._target   = target
+        self._label    = label
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+        wrapped = self._profiler.wrap_native(attr, self._label)
+        try:
+            object.__setattr__(self, name, wrapped)
+        except Exception:
+            pass
+        return wrapped
+
+    def __setattr__(self, name, value):
+        if name.startswith('_'):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._target, name, value)
+
+
+class Profiler(object):
+    """Accumulates timings of regions (components, ORBIT phases) and native calls.
+
+    Time is attributed to the innermost active region.  'wall' and 'cpu' are
+    inclusive of nested regions and 'self' excludes them; native times are per
+    extension label.
+    """
+
+    def __init__(self):
+        self.stats   = {}
+        self.native  = {}
+        self.events  = []
+        self.stack   = []
+        self.t0      = time.perf_counter()
+        self._undo   = []
+        self._hooked = set()
+        self._depth  = 0
+        self._wrapped_systems = set()
+
+    # ---------------------------------------------------------------
+    # Recording
+
+    def _entry(self, name, kind):
+        entry = self.stats.get(name, None)
+        if entry is None:
+            entry = self.stats[name] = {'kind': kind, 'calls': 0, 'wall': 0.0, 'cpu': 0.0, 'self': 0.0, 'native': {}}
+        return entry
+
+    @contextmanager
+    def region(self, name, kind='region'):
+        """Times the enclosed block as one call of region name"""
+        entry = self._entry(name, kind)
+        frame = [name, 0.0]
+        self.stack.append(frame)
+        w0 = time.perf_counter()
+        c0 = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - w0
+            cpu  = time.process_time() - c0
+            self.stack.pop()
+            entry['calls'] += 1
+            entry['wall']  += wall
+            entry['cpu']   += cpu
+            entry['self']  += wall - frame[1]
+            if self.stack:
+                self.stack[-1][1] += wall
+            if len(self.events) < MAX_EVENTS:
+                self.events.append({'name': name, 'cat': kind, 'ph': 'X', 'pid': os.getpid(), 'tid': 0,
+                                    'ts': 1e6*(w0 - self.t0), 'dur': 1e6*wall})
+
+    def add_native(self, label, wall):
+        owner  = self.stack[-1][0] if self.stack else '<no component>'
+        native = self._entry(owner, 'region')['native'] if self.stack else self.native.setdefault(owner, {})
+        native[label] = native.get(label, 0.0) + wall
+        total = self.native.setdefault('<total>', {})
+        total[label] = total.get(label, 0.0) + wall
+
+    def wrap_native(self, func, label):
+        return _NativeFunction(func, label, self)
+
+    def wrap_region(self, func, name, kind='region'):
+        profiler = self
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            with profiler.region(name, kind):
+                return func(*args, **kwargs)
+        return timed
+
+    # ---------------------------------------------------------------
+    # Instrumentation
+
+    def instrument_system(self, system):
+        """Times the compute methods of all components in an OpenMDAO system (after setup)"""
+        from openmdao.core.component import Component
+        systems = system.system_iter(include_self=True, recurse=True, typ=Component)
+        for comp in systems:
+            if id(comp) in self._wrapped_systems:
+                continue
+            self._wrapped_systems.add(id(comp))
+            name = '%s (%s)' % (comp.pathname or '<model>', type(comp).__name__)
+            for method in COMPONENT_METHODS:
+                func = getattr(type(comp), method, None)
+                if func is None or func.__module__.startswith('openmdao'):
+                    continue
+                setattr(comp, method, self.wrap_region(getattr(comp, method), name, 'component'))
+
+    def install_hooks(self):
+        """Times calls into the compiled extensions and the ORBIT phases.  Only modules that are
+        already imported are hooked, so this is called again before every profiled run."""
+        for label, (modname, attr, method) in NATIVE_EXTENSIONS.items():
+            module = sys.modules.get(modname, None)
+            if label in self._hooked or module is None:
+                continue
+            self._hooked.add(label)
+            if attr is None:
+                target = module
+            elif callable(attr):
+                target = attr(module)
+            else:
+                target = getattr(module, attr)
+            if method is not None:
+                self._patch(target, method, self.wrap_native(getattr(target, method), label))
+            else:
+                self._replace_references(target, _NativeProxy(target, label, self))
+
+        for label, (modname, clsname, method, iarg) in REGIONS.items():
+            module = sys.modules.get(modname, None)
+            if label in self._hooked or module is None:
+                continue
+            self._hooked.add(label)
+            cls = getattr(module, clsname)
+            self._patch(cls, method, self._named_region(getattr(cls, method), label, iarg))
+
+    def remove_hooks(self):
+        for owner, name, value in reversed(self._undo):
+            setattr(owner, name, value)
+        self._undo   = []
+        self._hooked = set()
+
+    @contextmanager
+    def hooked(self):
+        """Hooks installed for the duration of the outermost enclosing block only, so that
+        evaluations that are not profiled run unchanged"""
+        if self._depth == 0:
+            self.install_hooks()
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self.remove_hooks()
+
+    def _patch(self, owner, name, value):
+        self._undo.append((owner, name, getattr(owner, name)))
+        setattr(owner, name, value)
+
+    def _replace_references(self, target, proxy):
+        # Point every WISDEM module global that refers to target at the proxy
+        for modname, module in list(sys.modules.items()):
+            if module is None or not modname.startswith('wisdem'):
+                continue
+            for name, value in list(vars(module).items()):
+                if value is target:
+                    self._patch(module, name, proxy)
+
+    def _named_region(self, func, label, iarg):
+        profiler = self
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            name = '%s: %s' % (label, args[iarg] if len(args) > iarg else kwargs.get('name', ''))
+            with profiler.region(name, 'region'):
+                return func(*args, **kwargs)
+        return timed
+
+    # ---------------------------------------------------------------
+    # Output
+
+    def to_dict(self):
+        return {'components': self.stats, 'native': self.native}
+
+    def report(self, sort='wall', limit=None):
+        """Text table of all regions sorted by decreasing sort ('wall', 'cpu', 'self' or 'calls')"""
+        labels  = sorted(set(k for v in self.stats.values() for k in v['native']) |
+                         set(self.native.get('<total>', {})))
+        entries = sorted(self.stats.items(), key=lambda kv: kv[1][sort], reverse=True)
+        if limit is not None:
+            entries = entries[:limit]
+        width = max([len(k) for k, _ in entries] + [20])
+        lines = [('%-'+str(width)+'s %8s %10s %10s %10s' + ' %12s'*len(labels)) %
+                 (('Component', 'calls', 'wall [s]', 'self [s]', 'cpu [s]') + tuple(labels))]
+        for name, e in entries:
+            lines.append(('%-'+str(width)+'s %8d %10.4f %10.4f %10.4f' + ' %12.4f'*len(labels)) %
+                         ((name, e['calls'], e['wall'], e['self'], e['cpu']) +
+                          tuple(e['native'].get(k, 0.0) for k in labels)))
+        if labels:
+            total = self.native.get('<total>', {})
+            lines.append(('%-'+str(width)+'s %8s %10s %10s %10s' + ' %12.4f'*len(labels)) %
+                         (('Total native', '', '', '', '') + tuple(total.get(k, 0.0) for k in labels)))
+        return '\n'.join(lines)
+
+    def write(self, prefix):
+        """Writes <prefix>.json (accumulated timings) and <prefix>.trace.json (Chrome trace events)"""
+        with open(prefix + '.json', 'w') as f:
+            json.dump(self.to_dict(), f, indent=1)
+        with open(prefix + '.trace.json', 'w') as f:
+            json.dump({'traceEvents': self.events, 'displayTimeUnit': 'ms'}, f)
+
+
+# ---------------------------------------------------------------
+# Module level interface
+
+_profiler  = None
+_prefix    = None
+_originals = {}     # Problem methods replaced by enable
+_written   = set()  # Prefixes written at exit
+
+def get_profiler():
+    """The process wide Profiler"""
+    global _profiler
+    if _profiler is None:
+        _profiler = Profiler()
+    return _profiler
+
+
+def output_prefix(prefix=None):
+    """Output prefix from the argument or WISDEM_PROFILE, with the MPI rank appended under MPI"""
+    if prefix is None:
+        prefix = _prefix or os.environ.get(ENV_VAR, '')
+        if prefix.lower() in ['', '1', 'true', 'yes', 'on']:
+            prefix = DEFAULT_PREFIX
+    from wisdem.commonse.mpi_tools import MPI
+    if MPI is not None and MPI.COMM_WORLD.size > 1:
+        prefix += '.rank%d' % MPI.COMM_WORLD.rank
+    return prefix
+
+
+def profiling_enabled():
+    value = os.environ.get(ENV_VAR, '')
+    return value.lower() not in ['', '0', 'false', 'no', 'off']
+
+
+def _write_at_exit(profiler, prefix):
+    # The output directory may be gone by then (temporary directories in tests)
+    if os.path.isdir(os.path.dirname(os.path.abspath(prefix))):
+        profiler.write(prefix)
+
+
+def profile_problem(prob, prefix=None, verbose=True):
+    """Instruments prob so that every run_model / run_driver is timed and reported.
+    The output files are written after every run_driver and at exit.
+
+    Parameters
+    ----------
+    prob : openmdao.api.Problem
+        Problem to profile, before or after setup.
+    prefix : str
+        Output file prefix, defaults to WISDEM_PROFILE or 'wisdem_profile'.
+    verbose : bool
+        Print the report after each run.
+
+    Returns
+    -------
+    Profiler
+    """
+    profiler = get_profiler()
+    if getattr(prob, '_wisdem_profiled', False):
+        return profiler
+    prob._wisdem_profiled = True
+    prefix = output_prefix(prefix)
+    if prefix not in _written:
+        _written.add(prefix)
+        atexit.register(_write_at_exit, profiler, prefix)
+
+    for method in ['run_model', 'run_driver']:
+        if method in _originals:
+            run = functools.partial(_originals[method], prob)
+        else:
+            run = getattr(prob, method)
+        @functools.wraps(_originals.get(method, run))
+        def timed(*args, _run=run, _method=method, **kwargs):
+            profiler.instrument_system(prob.model)
+            try:
+                with profiler.hooked(), profiler.region('Problem.' + _method, 'problem'):
+                    return _run(*args, **kwargs)
+            finally:
+                if verbose:
+                    print(profiler.report())
+                if _method == 'run_driver':
+                    profiler.write(prefix)
+        setattr(prob, method, timed)
+    return profiler
+
+
+def _report_at_exit(profiler, prefix):
+    print(profiler.report())
+    _write_at_exit(profiler, prefix)
+
+
+def profile_system(system, prefix=None, verbose=True):
+    """Instruments one OpenMDAO system, typically from its configure method, so that its
+    components and every evaluation of the system are timed.  Other systems and the Problem
+    class are left unchanged, and the native hooks are only installed while the system runs.
+    The report is printed and the output files are written at exit.
+
+    Parameters
+    ----------
+    system : openmdao.api.System
+        System to profile, after its subsystems have been set up.
+    prefix : str
+        Output file prefix, defaults to WISDEM_PROFILE or 'wisdem_profile'.
+    verbose : bool
+        Print the report at exit.
+
+    Returns
+    -------
+    Profiler
+    """
+    profiler = get_profiler()
+    profiler.instrument_system(system)
+    if getattr(system, '_wisdem_profiled', False):
+        return profiler
+    system._wisdem_profiled = True
+    prefix = output_prefix(prefix)
+    if prefix not in _written:
+        _written.add(prefix)
+        atexit.register(_report_at_exit if verbose else _write_at_exit, profiler, prefix)
+
+    # Time the system's own evaluations, whether it is the model or a subsystem
+    solve = system._solve_nonlinear
+    name  = '%s (%s)' % (system.pathname or '<model>', type(system).__name__)
+    @functools.wraps(solve)
+    def timed(*args, **kwargs):
+        with profiler.hooked(), profiler.region(name, 'system'):
+            return solve(*args, **kwargs)
+    system._solve_nonlinear = timed
+    return profiler
+
+
+def enable(prefix=None):
+    """Profiles every OpenMDAO Problem that is run from now on"""
+    global _prefix
+    if prefix is not None:
+        _prefix = prefix
+    from openmdao.api import Problem
+    if getattr(Problem, '_wisdem_profile_hook', False):
+        return
+    Problem._wisdem_profile_hook = True
+
+    for method in ['run_model', 'run_driver']:
+        _originals[method] = getattr(Problem, method)
+        def hooked(self, *args, _method=method, **kwargs):
+            profile_problem(self)
+            return getattr(self, _method)(*args, **kwargs)
+        setattr(Problem, method, hooked)
+
+
+def enable_from_environment():
+    """Calls enable if WISDEM_PROFILE is set"""
+    if profiling_enabled():
+        enable()
@@ -138,6 +138,77 @@ def interp_with_deriv(x, xp, yp):
     return y, np.diag(dydx), dydxp, dydyp
 
 
+def interp_weights(x, xp):
+    """weights of np.interp(x, xp, yp) = W.dot(yp), with the same constant extrapolation, and
+    their derivatives.  Works for any number of yp vectors at once (yp.dot(W.T) for rows of yp).
+
+    INPUTS:
+    ----------
+    x   : float vector (n), points to interpolate at
+    xp  : float vector (m), ascending control points
+
+    OUTPUTS:
+    -------
+    W      : float array (n,m), interpolation weights
+    dW_dx  : float array (n,m), d(W)/d(x), so that dy/dx = dW_dx.dot(yp)
+    lo     : int vector (n), index of the left control point of the interval of each x
+    dlo    : float vector (n), dy/dxp[lo] = (yp[lo+1]-yp[lo])*dlo
+    dhi    : float vector (n), dy/dxp[lo+1] = (yp[lo+1]-yp[lo])*dhi
+    """
+    x  = np.asarray(x, dtype=np.float_)
+    xp = np.asarray(xp, dtype=np.float_)
+    n  = x.size
+    m  = xp.size
+    i  = np.arange(n)
+
+    lo = np.clip(np.searchsorted(xp, x, side='right') - 1, 0, m-2)
+    x1 = xp[lo]
+    dx = xp[lo+1] - x1
+    t  = np.clip((x - x1) / dx, 0.0, 1.0)
+    inside = np.logical_and(x >= xp[0], x <= xp[-1])
+
+    W = np.zeros((n, m))
+    W[i, lo]   = 1.0 - t
+    W[i, lo+1] = t
+
+    slope = np.where(inside, 1.0/dx, 0.0)
+    dW_dx = np.zeros((n, m))
+    dW_dx[i, lo]   = -slope
+    dW_dx[i, lo+1] = slope
+
+    dlo = np.where(inside, (x - xp[lo+1]) / dx**2, 0.0)
+    dhi = np.where(inside, -(x - x1) / dx**2, 0.0)
+
+    return W, dW_dx, lo, dlo, dhi
+
+
+def condition_sparsity(nConditions, nPoints, wrt):
+    """rows and cols of the partials of an output of shape (nConditions, nPoints), flattened by
+    condition, where entry [i,j] depends on
+
+    wrt = 'both'      : entry [i,j] of an input of the same shape
+    wrt = 'condition' : entry [i] of an input of shape (nConditions,)
+    wrt = 'point'     : entry [j] of an input of shape (nPoints,)
+    wrt = 'scalar'    : a scalar input
+    wrt = 'block'     : all entries [i,:] of an input of the same shape (ordered as [i,j,:])
+    """
+    n = nConditions*nPoints
+    if wrt == 'both':
+        return np.arange(n), np.arange(n)
+    elif wrt == 'condition':
+        return np.arange(n), np.repeat(np.arange(nConditions), nPoints)
+    elif wrt == 'point':
+        return np.arange(n), np.tile(np.arange(nPoints), nConditions)
+    elif wrt == 'scalar':
+        return np.arange(n), np.zeros(n, dtype=np.int_)
+    elif wrt == 'block':
+        rows = np.repeat(np.arange(n), nPoints)
+        cols = np.repeat(np.arange(nConditions), nPoints*nPoints)*nPoints + np.tile(np.arange(nPoints), n)
+        return rows, cols
+    else:
+        raise ValueError('Unknown dependency: ' + str(wrt))
+
+
 def assembleI(I):
     Ixx, Iyy, Izz, Ixy, Ixz, Iyz = I[0], I[1], I[2], I[3], I[4], I[5] 
     return np.array([[Ixx, Ixy, Ixz], [Ixy, Iyy, Iyz], [Ixz, Iyz, Izz]])
@@ -1,7 +1,7 @@
 
 import numpy as np
 from openmdao.api import ExplicitComponent
-from wisdem.commonse.tube import CylindricalShellProperties
+from wisdem.commonse.tube import CylindricalShellProperties, Tube
 
 from wisdem.commonse import gravity, eps
 import wisdem.commonse.frustum as frustum
@@ -174,6 +174,11 @@ class CylinderFrame3DD(ExplicitComponent):
         self.options.declare('nK')
         self.options.declare('nMass')
         self.options.declare('nPL')
+        self.options.declare('modal_warm_start', default=True)
+
+        # modes of the previous compute, to warm start the next modal solve
+        self.modal_subspace = None
+        self.modal_stats    = {'solves':0, 'iterations':0, 'warm_starts':0, 'cold_restarts':0}
         
     def setup(self):
         npts  = self.options['npts']
@@ -272,157 +277,232 @@ class CylinderFrame3DD(ExplicitComponent):
 
         
     def compute(self, inputs, outputs, discrete_inputs, discrete_outputs):
+        cylinder = _cylinder_frame(inputs, discrete_inputs)
+        if self.options['modal_warm_start']:
+            cylinder.enableWarmStart(self.modal_subspace)
+        # Debugging
+        #cylinder.write('temp.3dd')
+        # -----------------------------------
+        # run the analysis
+        displacements, forces, reactions, internalForces, mass, modal = cylinder.run()
 
-        # ------- node data ----------------
-        z = inputs['z']
-        n = len(z)
-        node = np.arange(1, n+1)
-        x = np.zeros(n)
-        y = np.zeros(n)
-        r = np.zeros(n)
+        self.modal_subspace = cylinder.modalSubspace
+        self.modal_stats['solves']        += 1
+        self.modal_stats['iterations']    += cylinder.modalIterations
+        self.modal_stats['warm_starts']   += int(cylinder.modalWarmStarted)
+        self.modal_stats['cold_restarts'] += int(cylinder.modalColdRestart)
 
-        nodes = frame3dd.NodeData(node, x, y, z, r)
-        # -----------------------------------
+        _cylinder_frame_outputs(inputs, outputs, displacements, forces, reactions, mass, modal)
 
-        # ------ reaction data ------------
 
-        # rigid base
-        node = inputs['kidx'] + np.ones(len(inputs['kidx']))   # add one because 0-based index but 1-based node numbering
-        rigid = RIGID
 
-        reactions = frame3dd.ReactionData(node, inputs['kx'], inputs['ky'], inputs['kz'], inputs['ktx'], inputs['kty'], inputs['ktz'], rigid)
-        # -----------------------------------
+def _cylinder_frame(inputs, discrete_inputs):
+    # Frame3DD model of the cylinder with its reactions, extra masses and one static load case
 
-        # ------ frame element data ------------
-        element = np.arange(1, n)
-        N1 = np.arange(1, n)
-        N2 = np.arange(2, n+1)
-
-        roll = np.zeros(n-1)
-
-        # average across element b.c. frame3dd uses constant section elements
-        # TODO: Use nodal2sectional
-        Az  = inputs['Az']
-        Asx = inputs['Asx']
-        Asy = inputs['Asy']
-        Jz  = inputs['Jz']
-        Ixx = inputs['Ixx']
-        Iyy = inputs['Iyy']
-        E   = inputs['E']*np.ones(Az.shape)
-        G   = inputs['G']*np.ones(Az.shape)
-        rho = inputs['rho']*np.ones(Az.shape)
-
-        elements = frame3dd.ElementData(element, N1, N2, Az, Asx, Asy, Jz, Ixx, Iyy, E, G, roll, rho)
-        # -----------------------------------
+    # ------- node data ----------------
+    z = inputs['z']
+    n = len(z)
+    node = np.arange(1, n+1)
+    x = np.zeros(n)
+    y = np.zeros(n)
+    r = np.zeros(n)
 
+    nodes = frame3dd.NodeData(node, x, y, z, r)
+    # -----------------------------------
 
-        # ------ options ------------
-        options = frame3dd.Options(discrete_inputs['shear'], discrete_inputs['geom'], float(inputs['dx']))
-        # -----------------------------------
+    # ------ reaction data ------------
 
-        # initialize frame3dd object
-        cylinder = frame3dd.Frame(nodes, reactions, elements, options)
+    # rigid base
+    node = inputs['kidx'] + np.ones(len(inputs['kidx']))   # add one because 0-based index but 1-based node numbering
+    rigid = RIGID
 
+    reactions = frame3dd.ReactionData(node, inputs['kx'], inputs['ky'], inputs['kz'], inputs['ktx'], inputs['kty'], inputs['ktz'], rigid)
+    # -----------------------------------
 
-        # ------ add extra mass ------------
+    # ------ frame element data ------------
+    element = np.arange(1, n)
+    N1 = np.arange(1, n)
+    N2 = np.arange(2, n+1)
 
-        # extra node inertia data
-        N = inputs['midx'] + np.ones(len(inputs['midx']))
+    roll = np.zeros(n-1)
 
-        cylinder.changeExtraNodeMass(N, inputs['m'], inputs['mIxx'], inputs['mIyy'], inputs['mIzz'], inputs['mIxy'], inputs['mIxz'], inputs['mIyz'],
-            inputs['mrhox'], inputs['mrhoy'], inputs['mrhoz'], discrete_inputs['addGravityLoadForExtraMass'])
+    # average across element b.c. frame3dd uses constant section elements
+    # TODO: Use nodal2sectional
+    Az  = inputs['Az']
+    Asx = inputs['Asx']
+    Asy = inputs['Asy']
+    Jz  = inputs['Jz']
+    Ixx = inputs['Ixx']
+    Iyy = inputs['Iyy']
+    E   = inputs['E']*np.ones(Az.shape)
+    G   = inputs['G']*np.ones(Az.shape)
+    rho = inputs['rho']*np.ones(Az.shape)
 
-        # ------------------------------------
+    elements = frame3dd.ElementData(element, N1, N2, Az, Asx, Asy, Jz, Ixx, Iyy, E, G, roll, rho)
+    # -----------------------------------
 
-        # ------- enable dynamic analysis ----------
-        cylinder.enableDynamics(discrete_inputs['nM'], discrete_inputs['Mmethod'], discrete_inputs['lump'], float(inputs['tol']), float(inputs['shift']))
-        # ----------------------------
 
-        # ------ static load case 1 ------------
+    # ------ options ------------
+    options = frame3dd.Options(discrete_inputs['shear'], discrete_inputs['geom'], float(inputs['dx']))
+    # -----------------------------------
 
-        # gravity in the X, Y, Z, directions (global)
-        gx = 0.0
-        gy = 0.0
-        gz = -gravity
+    # initialize frame3dd object
+    cylinder = frame3dd.Frame(nodes, reactions, elements, options)
 
-        load = frame3dd.StaticLoadCase(gx, gy, gz)
 
-        # point loads
-        nF = inputs['plidx'] + np.ones(len(inputs['plidx']))
-        load.changePointLoads(nF, inputs['Fx'], inputs['Fy'], inputs['Fz'], inputs['Mxx'], inputs['Myy'], inputs['Mzz'])
+    # ------ add extra mass ------------
 
-        # distributed loads
-        Px, Py, Pz = inputs['Pz'], inputs['Py'], -inputs['Px']  # switch to local c.s.
-        z = inputs['z']
+    # extra node inertia data
+    N = inputs['midx'] + np.ones(len(inputs['midx']))
 
-        # trapezoidally distributed loads
-        EL = np.arange(1, n)
-        xx1 = xy1 = xz1 = np.zeros(n-1)
-        xx2 = xy2 = xz2 = np.diff(z) - 1e-6  # subtract small number b.c. of precision
-        wx1 = Px[:-1]
-        wx2 = Px[1:]
-        wy1 = Py[:-1]
-        wy2 = Py[1:]
-        wz1 = Pz[:-1]
-        wz2 = Pz[1:]
+    cylinder.changeExtraNodeMass(N, inputs['m'], inputs['mIxx'], inputs['mIyy'], inputs['mIzz'], inputs['mIxy'], inputs['mIxz'], inputs['mIyz'],
+        inputs['mrhox'], inputs['mrhoy'], inputs['mrhoz'], discrete_inputs['addGravityLoadForExtraMass'])
 
-        load.changeTrapezoidalLoads(EL, xx1, xx2, wx1, wx2, xy1, xy2, wy1, wy2, xz1, xz2, wz1, wz2)
+    # ------------------------------------
 
-        cylinder.addLoadCase(load)
-        # Debugging
-        #cylinder.write('temp.3dd')
-        # -----------------------------------
-        # run the analysis
-        displacements, forces, reactions, internalForces, mass, modal = cylinder.run()
-        iCase = 0
+    # ------- enable dynamic analysis ----------
+    cylinder.enableDynamics(discrete_inputs['nM'], discrete_inputs['Mmethod'], discrete_inputs['lump'], float(inputs['tol']), float(inputs['shift']))
+    # ----------------------------
 
-        # mass
-        outputs['mass'] = mass.struct_mass
+    # ------ static load case 1 ------------
 
-        # natural frequncies
-        outputs['f1'] = modal.freq[0]
-        outputs['f2'] = modal.freq[1]
+    # gravity in the X, Y, Z, directions (global)
+    gx = 0.0
+    gy = 0.0
+    gz = -gravity
 
-        # deflections due to loading (from cylinder top and wind/wave loads)
-        outputs['top_deflection'] = displacements.dx[iCase, n-1]  # in yaw-aligned direction
+    load = frame3dd.StaticLoadCase(gx, gy, gz)
 
-        # shear and bending, one per element (convert from local to global c.s.)
-        Fz = forces.Nx[iCase, 1::2]
-        Vy = forces.Vy[iCase, 1::2]
-        Vx = -forces.Vz[iCase, 1::2]
+    # point loads
+    nF = inputs['plidx'] + np.ones(len(inputs['plidx']))
+    load.changePointLoads(nF, inputs['Fx'], inputs['Fy'], inputs['Fz'], inputs['Mxx'], inputs['Myy'], inputs['Mzz'])
 
-        Mzz = forces.Txx[iCase, 1::2]
-        Myy = forces.Myy[iCase, 1::2]
-        Mxx = -forces.Mzz[iCase, 1::2]
+    # distributed loads
+    Px, Py, Pz = inputs['Pz'], inputs['Py'], -inputs['Px']  # switch to local c.s.
+    z = inputs['z']
 
-        # Record total forces and moments
-        outputs['base_F'] = -1.0 * np.array([reactions.Fx.sum(), reactions.Fy.sum(), reactions.Fz.sum()])
-        outputs['base_M'] = -1.0 * np.array([reactions.Mxx.sum(), reactions.Myy.sum(), reactions.Mzz.sum()])
+    # trapezoidally distributed loads
+    EL = np.arange(1, n)
+    xx1 = xy1 = xz1 = np.zeros(n-1)
+    xx2 = xy2 = xz2 = np.diff(z) - 1e-6  # subtract small number b.c. of precision
+    wx1 = Px[:-1]
+    wx2 = Px[1:]
+    wy1 = Py[:-1]
+    wy2 = Py[1:]
+    wz1 = Pz[:-1]
+    wz2 = Pz[1:]
 
-        outputs['Fz_out']  = Fz
-        outputs['Vx_out']  = Vx
-        outputs['Vy_out']  = Vy
-        outputs['Mxx_out'] = Mxx
-        outputs['Myy_out'] = Myy
-        outputs['Mzz_out'] = Mzz
+    load.changeTrapezoidalLoads(EL, xx1, xx2, wx1, wx2, xy1, xy2, wy1, wy2, xz1, xz2, wz1, wz2)
 
-        # axial and shear stress
-        d,_    = nodal2sectional(inputs['d'])
-        qdyn,_ = nodal2sectional(inputs['qdyn'])
-        
-        ##R = self.d/2.0
-        ##x_stress = R*np.cos(self.theta_stress)
-        ##y_stress = R*np.sin(self.theta_stress)
-        ##axial_stress = Fz/self.Az + Mxx/self.Ixx*y_stress - Myy/self.Iyy*x_stress
-#        V = Vy*x_stress/R - Vx*y_stress/R  # shear stress orthogonal to direction x,y
-#        shear_stress = 2. * V / self.Az  # coefficient of 2 for a hollow circular section, but should be conservative for other shapes
-        outputs['axial_stress'] = Fz/inputs['Az'] - np.sqrt(Mxx**2+Myy**2)/inputs['Iyy']*d/2.0  #More conservative, just use the tilted bending and add total max shear as well at the same point, if you do not like it go back to the previous lines
+    cylinder.addLoadCase(load)
+
+    return cylinder
+
+
+def _cylinder_frame_outputs(inputs, outputs, displacements, forces, reactions, mass, modal):
+    # Cylinder outputs from the Frame3DD results; results stacked along leading axes (Frame.sweep) give stacked outputs
+    n = len(inputs['z'])
+    iCase = 0
 
-        outputs['shear_stress'] = 2. * np.sqrt(Vx**2+Vy**2) / inputs['Az'] # coefficient of 2 for a hollow circular section, but should be conservative for other shapes
+    # mass
+    outputs['mass'] = mass.struct_mass
 
-        # hoop_stress (Eurocode method)
-        L_reinforced = inputs['L_reinforced'] * np.ones(Fz.shape)
-        outputs['hoop_stress_euro'] = hoopStressEurocode(inputs['z'], d, inputs['t'], L_reinforced, qdyn)
+    # natural frequncies
+    outputs['f1'] = modal.freq[..., 0]
+    outputs['f2'] = modal.freq[..., 1]
 
-        # Simpler hoop stress used in API calculations
-        outputs['hoop_stress'] = hoopStress(d, inputs['t'], qdyn)
+    # deflections due to loading (from cylinder top and wind/wave loads)
+    outputs['top_deflection'] = displacements.dx[..., iCase, n-1]  # in yaw-aligned direction
+
+    # shear and bending, one per element (convert from local to global c.s.)
+    Fz = forces.Nx[..., iCase, 1::2]
+    Vy = forces.Vy[..., iCase, 1::2]
+    Vx = -forces.Vz[..., iCase, 1::2]
+
+    Mzz = forces.Txx[..., iCase, 1::2]
+    Myy = forces.Myy[..., iCase, 1::2]
+    Mxx = -forces.Mzz[..., iCase, 1::2]
+
+    # Record total forces and moments
+    total = lambda x : x.sum(axis=(-2,-1))
+    outputs['base_F'] = -1.0 * np.stack([total(reactions.Fx), total(reactions.Fy), total(reactions.Fz)], axis=-1)
+    outputs['base_M'] = -1.0 * np.stack([total(reactions.Mxx), total(reactions.Myy), total(reactions.Mzz)], axis=-1)
+
+    outputs['Fz_out']  = Fz
+    outputs['Vx_out']  = Vx
+    outputs['Vy_out']  = Vy
+    outputs['Mxx_out'] = Mxx
+    outputs['Myy_out'] = Myy
+    outputs['Mzz_out'] = Mzz
+
+    # axial and shear stress
+    d      = 0.5*(inputs['d'][..., :-1] + inputs['d'][..., 1:])
+    qdyn,_ = nodal2sectional(inputs['qdyn'])
+    
+    ##R = self.d/2.0
+    ##x_stress = R*np.cos(self.theta_stress)
+    ##y_stress = R*np.sin(self.theta_stress)
+    ##axial_stress = Fz/self.Az + Mxx/self.Ixx*y_stress - Myy/self.Iyy*x_stress
+#        V = Vy*x_stress/R - Vx*y_stress/R  # shear stress orthogonal to direction x,y
+#        shear_stress = 2. * V / self.Az  # coefficient of 2 for a hollow circular section, but should be conservative for other shapes
+    outputs['axial_stress'] = Fz/inputs['Az'] - np.sqrt(Mxx**2+Myy**2)/inputs['Iyy']*d/2.0  #More conservative, just use the tilted bending and add total max shear as well at the same point, if you do not like it go back to the previous lines
+
+    outputs['shear_stress'] = 2. * np.sqrt(Vx**2+Vy**2) / inputs['Az'] # coefficient of 2 for a hollow circular section, but should be conservative for other shapes
+
+    # hoop_stress (Eurocode method)
+    L_reinforced = inputs['L_reinforced'] * np.ones(Fz.shape)
+    outputs['hoop_stress_euro'] = hoopStressEurocode(inputs['z'], d, inputs['t'], L_reinforced, qdyn)
+
+    # Simpler hoop stress used in API calculations
+    outputs['hoop_stress'] = hoopStress(d, inputs['t'], qdyn)
+
+
+def cylinder_frame3dd_sweep(inputs, discrete_inputs, d, t, E=None, G=None, rho=None):
+    """Runs the CylinderFrame3DD analysis for many candidate cylinders (e.g. tower and monopile
+    designs) that share node locations, reactions, extra masses, and loads.  The Frame3DD model
+    is built once and only the element properties are refilled for each candidate.
+
+    INPUTS:
+    ----------
+    inputs          : dict, values of the CylinderFrame3DD inputs.  The section properties and
+                      d, t are replaced by those of the candidates
+    discrete_inputs : dict, values of the CylinderFrame3DD discrete inputs
+    d   : float array (nCandidates, npts), effective cylinder diameters
+    t   : float array (nCandidates, npts-1), effective shell thicknesses
+    E   : float or float array broadcast to (nCandidates, npts-1), modulus of elasticity (None uses inputs['E'])
+    G   : same for the shear modulus
+    rho : same for the material density
+
+    OUTPUTS:
+    -------
+    outputs : dict, the CylinderFrame3DD outputs with a leading candidate axis
+    """
+    d = np.atleast_2d(d)
+    t = np.atleast_2d(t)
+    nCand, n = d.shape
+
+    # section properties of all candidates
+    tube = Tube(0.5*(d[:,:-1] + d[:,1:]), t)
+    sections = {'Az':tube.Area, 'Asx':tube.Asx, 'Asy':tube.Asy, 'Jz':tube.J0, 'Ixx':tube.Jxx, 'Iyy':tube.Jyy}
+
+    # Frame3DD model of the first candidate
+    first = dict(inputs)
+    first.update( {k:v[0] for k,v in sections.items()} )
+    materials = {}
+    for k, v in zip(['E', 'G', 'rho'], [E, G, rho]):
+        if v is not None:
+            materials[k] = np.broadcast_to(v, (nCand, n-1))
+            first[k] = materials[k][0]
+    cylinder = _cylinder_frame(first, discrete_inputs)
+
+    displacements, forces, reactions, mass, modal = cylinder.sweep(sections['Az'], sections['Asx'], sections['Asy'],
+                                                                   sections['Jz'], sections['Ixx'], sections['Iyy'],
+                                                                   materials.get('E'), materials.get('G'), materials.get('rho'))
+
+    stacked = dict(inputs)
+    stacked.update(sections)
+    stacked['d'] = d
+    stacked['t'] = t
+    outputs = {}
+    _cylinder_frame_outputs(stacked, outputs, displacements, forces, reactions, mass, modal)
+    return outputs
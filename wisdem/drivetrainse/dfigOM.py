@@ -5,7 +5,7 @@ Copyright (c) NREL. All rights reserved."""
 from openmdao.api import Group, Problem, ExplicitComponent,ExecComp,IndepVarComp,ScipyOptimizeDriver
 import numpy as np
 from math import pi, cos, sqrt, radians, sin, exp, log10, log, tan, atan
-from dfigSE import DFIG
+from wisdem.drivetrainse.dfigSE import DFIG
 
 class DFIG_OM(ExplicitComponent):
     """ Estimates overall mass, dimensions and Efficiency of DFIG generator. """
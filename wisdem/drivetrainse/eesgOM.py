@@ -12,7 +12,7 @@ from openmdao.api import Group, Problem, ExplicitComponent,ExecComp,IndepVarComp
 import numpy as np
 from math import pi, cos, sqrt, radians, sin, exp, log10, log, tan, atan
 import sys, os
-from eesgSE import EESG
+from wisdem.drivetrainse.eesgSE import EESG
 
 class EESG_OM(ExplicitComponent):
     """ Estimates overall mass dimensions and Efficiency of Electrically Excited Synchronous generator. """
@@ -9,7 +9,8 @@ The OpenMDAO part is in eesgOM.py
 """
 
 import numpy as np
-from math import pi, cos, sqrt, radians, sin, exp, log10, log, tan, atan
+# numpy versions of the math functions, so that compute broadcasts over arrays of designs
+from numpy import pi, cos, sqrt, radians, sin, exp, log10, log, tan, arctan as atan
 import sys, os
 
 class EESG(object):
@@ -63,9 +64,7 @@ class EESG(object):
         dia = 2 * rad_ag             # air gap diameter
         
         # air gap length and minimum values
-        g = 0.001 * dia       
-        if g < 0.005 :
-            g = 0.005
+        g = np.maximum(0.001 * dia, 0.005)
             
         r_r = rad_ag - g                          # rotor radius
         d_se = dia + 2 * h_s + 2 * h_ys           # stator outer diameter (not used)
@@ -97,10 +96,7 @@ class EESG(object):
         
         # Slot fill factor according to air gap radius
         
-        if 2 * rad_ag > 2:
-            K_fills = 0.65
-        else:
-            K_fills = 0.4
+        K_fills = np.where(2 * rad_ag > 2, 0.65, 0.4)
             
         # Calculating Stator winding factor    
         
@@ -148,8 +144,8 @@ class EESG(object):
         E_s = 2 * N_s * len_s * rad_ag * k_wd * om_m * B_g / sqrt(2) # no-load voltage
         #I_s = (E_s - (E_s**2 - 4 * R_s * machine_rating / m)**0.5) / (2 * R_s)
         erm = E_s**2 - 4 * R_s * machine_rating / m
-        if erm < 0:
-            sys.stderr.write('eesgSE ERROR: erm {:.2f} < 0   E_s {:.2f} R_s {:.2f} MachRtd {:.0f} m {}\n'.format(erm[0], E_s[0], R_s[0], machine_rating[0], m))
+        if np.any(erm < 0):
+            sys.stderr.write('eesgSE ERROR: erm {} < 0   E_s {} R_s {} MachRtd {} m {}\n'.format(erm, E_s, R_s, machine_rating, m))
         I_s = (E_s - erm**0.5) / (2 * R_s)
         
         # Calculating stator winding current density and specific current loading
@@ -278,10 +274,7 @@ class EESG(object):
         delta_v = 1
         n_brushes = I_f * 2 / 120
         
-        if n_brushes < 0.5:
-            n_brushes = 1
-        else:
-            n_brushes = np.round(n_brushes)
+        n_brushes = np.where(n_brushes < 0.5, 1, np.round(n_brushes))
             
         #3. brush losses
         
@@ -402,14 +395,10 @@ class EESG(object):
         Mass = Copper + Iron + Structural_mass
         
         # Calculating mass moments of inertia and center of mass
-        I = np.zeros(3)
-        I[0]   = 0.50 * Mass * R_out**2
-        I[1]   = 0.25 * Mass * R_out**2 + Mass * len_s**2 / 12
-        I[2]   = I[1]
-        cm = np.zeros(3)
-        cm[0]  = shaft_cm[0] + shaft_length / 2. + len_s / 2
-        cm[1]  = shaft_cm[1]
-        cm[2]  = shaft_cm[2]
+        I_xx = 0.50 * Mass * R_out**2
+        I_yy = 0.25 * Mass * R_out**2 + Mass * len_s**2 / 12
+        I  = np.stack(np.broadcast_arrays(I_xx, I_yy, I_yy), axis=-1)
+        cm = np.stack(np.broadcast_arrays(shaft_cm[0] + shaft_length / 2. + len_s / 2, shaft_cm[1], shaft_cm[2]), axis=-1)
         
         return B_symax, B_tmax, B_rymax, B_gfm, B_g, B_pc, N_s, b_s, b_t, A_Cuscalc, A_Curcalc, b_p, \
             h_p, p, E_s, f, I_s, R_s, L_m, A_1, J_s, R_r, Losses, Load_mmf_ratio, Power_ratio, \
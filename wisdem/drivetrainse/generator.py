@@ -6,7 +6,7 @@ Electromagnetic design based on conventional magnetic circuit laws
 Structural design based on McDonald's thesis """
 
 import openmdao.api as om
-from om import Group, Problem, ExplicitComponent, ExecComp, IndepVarComp
+from openmdao.api import Group, Problem, ExplicitComponent, ExecComp, IndepVarComp
 #from openmdao.api import ScipyOptimizeDriver, pyOptSparseDriver
 #from openmdao.drivers.pyoptsparse_driver import pyOptSparseDriver
 
@@ -17,11 +17,64 @@ import numpy as np
 #from pmsg_arms import PMSG_Arms
 #from pmsg_disc import PMSG_Disc
 
-from scigOM import SCIG_OM
-from dfigOM import DFIG_OM
-from eesgOM import EESG_OM
-from pmsg_armsOM import PMSG_Arms_OM
-from pmsg_discOM import PMSG_Disc_OM
+# SCIG_OM is imported in Generator.setup, since scigSE depends on ddse_utils
+from wisdem.drivetrainse.dfigOM import DFIG_OM
+from wisdem.drivetrainse.eesgOM import EESG_OM
+from wisdem.drivetrainse.pmsg_armsOM import PMSG_Arms_OM
+from wisdem.drivetrainse.pmsg_discOM import PMSG_Disc_OM
+
+eps = 1e-6
+
+# Specificiency target efficiency(%)
+Eta_Target = 93.0
+
+# Design variables and bounds of optimization_example, by generator type
+DESIGN_BOUNDS = {
+    'pmsg_arms': {'rad_ag': (0.5, 9.0), 'len_s': (0.5, 2.5), 'h_s': (0.04, 0.1), 'tau_p': (0.04, 0.1),
+                  'h_m': (0.005, 0.1), 'n_r': (5.0, 15.0), 'h_yr': (0.045, 0.25), 'h_ys': (0.045, 0.25),
+                  'n_s': (5.0, 15.0), 'b_st': (0.1, 1.5), 'd_s': (0.1, 1.5), 't_ws': (0.001, 0.2),
+                  'b_r': (0.1, 1.5), 'd_r': (0.1, 1.5), 't_wr': (0.001, 0.2)},
+    'pmsg_disc': {'rad_ag': (0.5, 9.0), 'len_s': (0.5, 2.5), 'h_s': (0.04, 0.1), 'tau_p': (0.04, 0.1),
+                  'h_m': (0.005, 0.1), 'n_r': (5.0, 15.0), 'h_yr': (0.045, 0.25), 'h_ys': (0.045, 0.25),
+                  'n_s': (5.0, 15.0), 'b_st': (0.1, 1.5), 'd_s': (0.1, 1.5), 't_ws': (0.001, 0.2),
+                  't_d': (0.1, 0.25)},
+    'eesg':      {'rad_ag': (0.5, 9.0), 'len_s': (0.5, 2.5), 'h_s': (0.06, 0.15), 'tau_p': (0.04, 0.2),
+                  'N_f': (10, 300), 'I_f': (1, 500), 'n_r': (5.0, 15.0), 'h_yr': (0.01, 0.25),
+                  'h_ys': (0.01, 0.25), 'b_r': (0.1, 1.5), 'd_r': (0.1, 1.5), 't_wr': (0.001, 0.2),
+                  'n_s': (5.0, 15.0), 'b_st': (0.1, 1.5), 'd_s': (0.1, 1.5), 't_ws': (0.001, 0.2)},
+    'dfig':      {'rad_ag': (0.2, 1.0), 'len_s': (0.4, 2.0), 'h_s': (0.04, 0.1), 'h_r': (0.04, 0.1),
+                  'B_symax': (1.0, 2.0-eps), 'I_0': (5.0, 100.0), 'S_Nmax': (-0.3, -0.1)},
+    'scig':      {'rad_ag': (0.2, 1.0), 'len_s': (0.4, 2.0), 'h_s': (0.04, 0.1), 'h_r': (0.04, 0.1),
+                  'B_symax': (1.0, 2.0-eps), 'I_0': (5.0, 200.0)},
+}
+
+# Constraints (name, lower, upper) of optimization_example, by generator type.
+# The efficiency constraint (gen_eff or Overall_eff >= Eta_Target) is added separately.
+_con_asyn = [('E_p', 500.0+eps, 5000.0-eps), ('TC', 0.0+eps, None), ('B_g', 0.7, 1.2),
+             ('B_trmax', None, 2.0-eps), ('B_tsmax', None, 2.0-eps), ('A_1', None, 60000.0-eps),
+             ('J_s', None, 6.0), ('J_r', None, 6.0), ('Slot_aspect_ratio1', 4.0, 10.0)]
+_con_pmsg = [('con_Bsmax', 0.0+eps, None), ('E_p', 500.0, 5000.0)]
+_con_sync = [('B_symax', None, 2.0-eps), ('B_rymax', None, 2.0-eps), ('B_tmax', None, 2.0-eps),
+             ('B_g', 0.7, 1.2), ('con_uAs', 0.0+eps, None), ('con_zAs', 0.0+eps, None),
+             ('con_yAs', 0.0+eps, None), ('con_uAr', 0.0+eps, None), ('con_yAr', 0.0+eps, None),
+             ('con_TC2', 0.0+eps, None), ('con_TC3', 0.0+eps, None), ('con_bst', 0.0-eps, None),
+             ('A_1', None, 60000.0-eps), ('J_s', None, 6.0), ('A_Cuscalc', 5.0, 300),
+             ('K_rad', 0.2+eps, 0.27), ('Slot_aspect_ratio', 4.0, 10.0)]
+_con_arms = [('con_zAr', 0.0+eps, None), ('con_br', 0.0+eps, None)]
+
+CONSTRAINTS = {
+    'scig':      _con_asyn + [('B_rymax', None, 2.0-eps), ('K_rad_L', 0.0, None), ('K_rad_U', None, 0.0),
+                              ('D_ratio_L', 0.0, None), ('D_ratio_U', None, 0.0)],
+    'dfig':      _con_asyn + [('K_rad', 0.2, 1.5), ('D_ratio', 1.37, 1.4), ('Current_ratio', 0.1, 0.3)],
+    'eesg':      [('B_gfm', 0.617031, 1.057768), ('B_pc', None, 2.0), ('E_s', 500.0, 5000.0),
+                  ('J_f', None, 6.0), ('n_brushes', None, 6), ('Power_ratio', None, 2-eps)] + _con_sync + _con_arms,
+    'pmsg_arms': _con_pmsg + _con_sync + _con_arms,
+    'pmsg_disc': _con_pmsg + _con_sync,
+}
+
+def efficiency_name(genType):
+    # Output that optimization_example constrains to Eta_Target
+    return 'Overall_eff' if genType.lower() in ['scig', 'dfig'] else 'gen_eff'
 
 
 class Generator_Cost(ExplicitComponent):
@@ -79,7 +132,7 @@ class Generator(Group):
         generatorIndeps.add_output('shaft_length', val=0.0, units='m')
         
         generatorIndeps.add_output('Gearbox_efficiency', val=0.0)
-        generatorIndeps.add_output('r_s',   val=0.0, units='m')
+        generatorIndeps.add_output('rad_ag', val=0.0, units='m')
         generatorIndeps.add_output('len_s', val=0.0, units='m')
         generatorIndeps.add_output('h_s',   val=0.0, units='m')
         generatorIndeps.add_output('h_r',   val=0.0, units='m')
@@ -128,6 +181,7 @@ class Generator(Group):
         
         # Add generator design component and cost
         if genType.lower() == 'scig':
+            from wisdem.drivetrainse.scigOM import SCIG_OM
             mygen = SCIG_OM
             
         elif genType.lower() == 'dfig':
@@ -194,124 +248,13 @@ def optimization_example(genType, exportFlag=False):
     opt_problem.driver = om.ScipyOptimizeDriver()
     opt_problem.driver.options['optimizer'] = 'SLSQP'
     
-    # Specificiency target efficiency(%)
-    Eta_Target = 93.0
-
-    eps = 1e-6
-    
-    # Set up design variables and bounds for a SCIG designed for a 5MW turbine
-    if genType in ['dfig', 'scig']:
-        # Design variables
-        opt_problem.model.add_design_var('r_s',     lower=0.2,  upper=1.0)
-        opt_problem.model.add_design_var('len_s',   lower=0.4,  upper=2.0)
-        opt_problem.model.add_design_var('h_s',     lower=0.04, upper=0.1)
-        opt_problem.model.add_design_var('h_r',     lower=0.04, upper=0.1)
-        opt_problem.model.add_design_var('B_symax', lower=1.0,  upper=2.0-eps)
-
-        # Constraints
-        opt_problem.model.add_constraint('Overall_eff',        lower=Eta_Target)
-        opt_problem.model.add_constraint('E_p',                lower=500.0+eps, upper=5000.0-eps)
-        opt_problem.model.add_constraint('TC',                 lower=0.0+eps)
-        opt_problem.model.add_constraint('B_g',                lower=0.7,       upper=1.2)
-        opt_problem.model.add_constraint('B_trmax',                             upper=2.0-eps)
-        opt_problem.model.add_constraint('B_tsmax',                             upper=2.0-eps)
-        opt_problem.model.add_constraint('A_1',                                 upper=60000.0-eps)
-        opt_problem.model.add_constraint('J_s',                                 upper=6.0)
-        opt_problem.model.add_constraint('J_r',                                 upper=6.0)
-        opt_problem.model.add_constraint('Slot_aspect_ratio1', lower=4.0,       upper=10.0)
-
-    if genType == 'scig':
-        opt_problem.model.add_design_var('I_0',       lower=5.0, upper=200.0)
-        opt_problem.model.add_constraint('B_rymax',   upper=2.0-eps)
-        opt_problem.model.add_constraint('K_rad_L',   lower=0.0)
-        opt_problem.model.add_constraint('K_rad_U',   upper=0.0)
-        opt_problem.model.add_constraint('D_ratio_L', lower=0.0)
-        opt_problem.model.add_constraint('D_ratio_U', upper=0.0)
-        
-    if genType == 'dfig':
-        opt_problem.model.add_design_var('I_0',          lower=5.,   upper=100.0)
-        opt_problem.model.add_design_var('S_Nmax',       lower=-0.3, upper=-0.1)
-        opt_problem.model.add_constraint('K_rad',        lower=0.2,  upper=1.5)
-        opt_problem.model.add_constraint('D_ratio',      lower=1.37, upper=1.4)
-        opt_problem.model.add_constraint('Current_ratio',lower=0.1,  upper=0.3)
-
-    if genType == 'eesg':
-        # Design variables
-        opt_problem.model.add_design_var('r_s',    lower=0.5,   upper=9.0)
-        opt_problem.model.add_design_var('len_s',  lower=0.5,   upper=2.5)
-        opt_problem.model.add_design_var('h_s',    lower=0.06,  upper=0.15)
-        opt_problem.model.add_design_var('tau_p',  lower=0.04,  upper=0.2)
-        opt_problem.model.add_design_var('N_f',    lower=10,    upper=300)
-        opt_problem.model.add_design_var('I_f',    lower=1,     upper=500)
-        opt_problem.model.add_design_var('n_r',    lower=5.0,   upper=15.0)
-        opt_problem.model.add_design_var('h_yr',   lower=0.01,  upper=0.25)
-        opt_problem.model.add_design_var('h_ys',   lower=0.01,  upper=0.25)
-        opt_problem.model.add_design_var('b_r',    lower=0.1,   upper=1.5)
-        opt_problem.model.add_design_var('d_r',    lower=0.1,   upper=1.5)
-        opt_problem.model.add_design_var('t_wr',   lower=0.001, upper=0.2)
-        opt_problem.model.add_design_var('n_s',    lower=5.0,   upper=15.0)
-        opt_problem.model.add_design_var('b_st',   lower=0.1,   upper=1.5)
-        opt_problem.model.add_design_var('d_s',    lower=0.1,   upper=1.5)
-        opt_problem.model.add_design_var('t_ws',   lower=0.001, upper=0.2)
-
-        # Constraints
-        opt_problem.model.add_constraint('B_gfm',       lower=0.617031, upper=1.057768)
-        opt_problem.model.add_constraint('B_pc',        upper=2.0)
-        opt_problem.model.add_constraint('E_s',         lower=500.0, upper=5000.0)
-        opt_problem.model.add_constraint('J_f',         upper=6.0)
-        opt_problem.model.add_constraint('n_brushes',   upper=6)
-        opt_problem.model.add_constraint('Power_ratio', upper=2-eps)
-        
-    if genType in ['pmsg_arms','pmsg_disc']:
-        # Design variables
-        opt_problem.model.add_design_var('r_s',   lower=0.5,   upper=9.0)
-        opt_problem.model.add_design_var('len_s', lower=0.5,   upper=2.5)
-        opt_problem.model.add_design_var('h_s',   lower=0.04,  upper=0.1)
-        opt_problem.model.add_design_var('tau_p', lower=0.04,  upper=0.1)
-        opt_problem.model.add_design_var('h_m',   lower=0.005, upper=0.1)
-        opt_problem.model.add_design_var('n_r',   lower=5.0,   upper=15.0)
-        opt_problem.model.add_design_var('h_yr',  lower=0.045, upper=0.25)
-        opt_problem.model.add_design_var('h_ys',  lower=0.045, upper=0.25)
-        opt_problem.model.add_design_var('n_s',   lower=5.0,   upper=15.0)
-        opt_problem.model.add_design_var('b_st',  lower=0.1,   upper=1.5)
-        opt_problem.model.add_design_var('d_s',   lower=0.1,   upper=1.5)
-        opt_problem.model.add_design_var('t_ws',  lower=0.001, upper=0.2)
-    
-        opt_problem.model.add_constraint('con_Bsmax', lower=0.0+eps)
-        opt_problem.model.add_constraint('E_p', lower=500.0, upper=5000.0)
+    # Design variables, bounds and constraints for the generator type
+    for name, (lower, upper) in DESIGN_BOUNDS[genType].items():
+        opt_problem.model.add_design_var(name, lower=lower, upper=upper)
 
-    if genType == 'pmsg_arms':
-        opt_problem.model.add_design_var('b_r',  lower=0.1,   upper=1.5)
-        opt_problem.model.add_design_var('d_r',  lower=0.1,   upper=1.5)
-        opt_problem.model.add_design_var('t_wr', lower=0.001, upper=0.2)
-        
-    if genType == 'pmsg_disc':
-        opt_problem.model.add_design_var('t_d', lower=0.1, upper=0.25)
-        
-    if genType in ['eesg', 'pmsg_arms', 'pmsg_disc']:
-        opt_problem.model.add_constraint('B_symax', upper=2.0-eps)
-        opt_problem.model.add_constraint('B_rymax', upper=2.0-eps)
-        opt_problem.model.add_constraint('B_tmax',  upper=2.0-eps)
-        opt_problem.model.add_constraint('B_g',     lower=0.7, upper=1.2)
-        opt_problem.model.add_constraint('con_uAs', lower=0.0+eps)
-        opt_problem.model.add_constraint('con_zAs', lower=0.0+eps)
-        opt_problem.model.add_constraint('con_yAs', lower=0.0+eps)
-        opt_problem.model.add_constraint('con_uAr', lower=0.0+eps)
-        opt_problem.model.add_constraint('con_yAr', lower=0.0+eps)
-        opt_problem.model.add_constraint('con_TC2', lower=0.0+eps)
-        opt_problem.model.add_constraint('con_TC3', lower=0.0+eps)
-        opt_problem.model.add_constraint('con_bst', lower=0.0-eps)
-        opt_problem.model.add_constraint('A_1', upper=60000.0-eps)
-        opt_problem.model.add_constraint('J_s', upper=6.0)
-        opt_problem.model.add_constraint('A_Cuscalc', lower=5.0, upper=300)
-        opt_problem.model.add_constraint('K_rad', lower=0.2+eps, upper=0.27)
-        opt_problem.model.add_constraint('Slot_aspect_ratio', lower=4.0, upper=10.0)
-        opt_problem.model.add_constraint('gen_eff', lower=Eta_Target)
-
-    if genType in ['eesg', 'pmsg_arms']:
-        opt_problem.model.add_constraint('con_zAr', lower=0.0+eps)
-        opt_problem.model.add_constraint('con_br', lower=0.0+eps)
-    
+    opt_problem.model.add_constraint(efficiency_name(genType), lower=Eta_Target)
+    for name, lower, upper in CONSTRAINTS[genType]:
+        opt_problem.model.add_constraint(name, lower=lower, upper=upper)
     
     Objective_function = 'Costs'
     opt_problem.model.add_objective(Objective_function, scaler=1e-5)
@@ -491,7 +434,7 @@ def optimization_example(genType, exportFlag=False):
                         
                         'Values': [opt_problem['machine_rating']/1e6,
                                    Objective_function,
-                                   2*opt_problem['r_s'],
+                                   2*opt_problem['rad_ag'],
                                    opt_problem['len_s'],
                                    opt_problem['K_rad'],
                                    opt_problem['D_ratio'],
@@ -690,7 +633,7 @@ def optimization_example(genType, exportFlag=False):
                         
                         'Values': [opt_problem['machine_rating']/1e6,
                                    Objective_function,
-                                   2*opt_problem['r_s'],
+                                   2*opt_problem['rad_ag'],
                                    opt_problem['len_s'],
                                    opt_problem['K_rad'],
                                    opt_problem['D_ratio'],
@@ -923,7 +866,7 @@ def optimization_example(genType, exportFlag=False):
                                    opt_problem['u_As']*1000,
                                    opt_problem['y_As']*1000,
                                    opt_problem['z_A_s']*1000,
-                                   2*opt_problem['r_s'],
+                                   2*opt_problem['rad_ag'],
                                    opt_problem['len_s'],
                                    opt_problem['K_rad'],
                                    opt_problem['tau_p']*1000,
@@ -1156,7 +1099,7 @@ def optimization_example(genType, exportFlag=False):
                                    opt_problem['u_Ar']*1000,
                                    opt_problem['y_Ar']*1000,
                                    opt_problem['z_A_r']*1000,
-                                   2*opt_problem['r_s'],
+                                   2*opt_problem['rad_ag'],
                                    opt_problem['R_out']*2,
                                    opt_problem['len_s'],
                                    opt_problem['K_rad'],
@@ -1361,7 +1304,7 @@ def optimization_example(genType, exportFlag=False):
                                    opt_problem['z_A_s']*1000,
                                    opt_problem['u_Ar']*1000,
                                    opt_problem['y_Ar']*1000,
-                                   2*opt_problem['r_s'],
+                                   2*opt_problem['rad_ag'],
                                    opt_problem['R_out']*2,
                                    opt_problem['len_s'],
                                    opt_problem['K_rad'],
@@ -0,0 +1,203 @@
+"""generator_sweep.py
+Batch evaluation of the DriveSE generator models.
+
+The *SE generator classes broadcast over numpy arrays, so a whole population
+of candidate designs can be sized in one call to compute. This module wraps
+that with the cost and constraint margins of generator.Generator, so that large
+random screens can be ran before handing the best designs to the optimizer in
+generator.optimization_example """
+
+import numpy as np
+
+from wisdem.drivetrainse.pmsg_armsSE import PMSG_Arms
+from wisdem.drivetrainse.pmsg_discSE import PMSG_Disc
+from wisdem.drivetrainse.eesgSE import EESG
+from wisdem.drivetrainse.dfigSE import DFIG
+from wisdem.drivetrainse.generator import DESIGN_BOUNDS, CONSTRAINTS, Eta_Target, efficiency_name
+
+genTypes = ['scig', 'dfig', 'eesg', 'pmsg_arms', 'pmsg_disc']
+
+# Arguments of each compute, in order
+INPUTS = {
+    'pmsg_arms': ('rad_ag', 'len_s', 'h_s', 'tau_p', 'h_m', 'h_ys', 'h_yr', 'machine_rating', 'n_nom', 'Torque',
+                  'b_st', 'd_s', 't_ws', 'n_r', 'n_s', 'b_r', 'd_r', 't_wr', 'R_o',
+                  'rho_Fe', 'rho_Copper', 'rho_Fes', 'rho_PM', 'shaft_cm', 'shaft_length'),
+    'pmsg_disc': ('rad_ag', 'len_s', 'h_s', 'tau_p', 'h_m', 'h_ys', 'h_yr', 'machine_rating', 'n_nom', 'Torque',
+                  'b_st', 'd_s', 't_ws', 'n_s', 't_d', 'R_o',
+                  'rho_Fe', 'rho_Copper', 'rho_Fes', 'rho_PM', 'shaft_cm', 'shaft_length'),
+    'eesg':      ('rad_ag', 'len_s', 'h_s', 'tau_p', 'N_f', 'I_f', 'h_ys', 'h_yr', 'machine_rating', 'n_nom', 'Torque',
+                  'b_st', 'd_s', 't_ws', 'n_r', 'n_s', 'b_r', 'd_r', 't_wr', 'R_o',
+                  'rho_Fe', 'rho_Copper', 'rho_Fes', 'shaft_cm', 'shaft_length'),
+    'dfig':      ('rad_ag', 'len_s', 'h_s', 'h_r', 'I_0', 'machine_rating', 'n_nom', 'Gearbox_efficiency',
+                  'rho_Fe', 'rho_Copper', 'B_symax', 'S_Nmax', 'shaft_cm', 'shaft_length'),
+    'scig':      ('rad_ag', 'len_s', 'h_s', 'h_r', 'machine_rating', 'n_nom', 'Gearbox_efficiency', 'I_0',
+                  'rho_Fe', 'rho_Copper', 'B_symax', 'shaft_cm', 'shaft_length'),
+}
+
+# Values returned by each compute, in order
+OUTPUTS = {
+    'pmsg_arms': ('B_symax', 'B_tmax', 'B_rymax', 'B_smax', 'B_pm1', 'B_g', 'N_s', 'b_s', 'b_t', 'A_Cuscalc',
+                  'b_m', 'p', 'E_p', 'f', 'I_s', 'R_s', 'L_s', 'A_1', 'J_s', 'Losses', 'K_rad', 'gen_eff', 'S',
+                  'Slot_aspect_ratio', 'Copper', 'Iron', 'u_Ar', 'y_Ar', 'z_A_r', 'u_As', 'y_As', 'z_A_s',
+                  'u_all_r', 'u_all_s', 'y_all', 'z_all_s', 'z_all_r', 'b_all_s', 'b_all_r', 'TC1', 'TC2', 'TC3',
+                  'R_out', 'Structural_mass', 'Mass', 'mass_PM', 'cm', 'I'),
+    'pmsg_disc': ('B_symax', 'B_tmax', 'B_rymax', 'B_smax', 'B_pm1', 'B_g', 'N_s', 'b_s', 'b_t', 'A_Cuscalc',
+                  'b_m', 'p', 'E_p', 'f', 'I_s', 'R_s', 'L_s', 'A_1', 'J_s', 'Losses', 'K_rad', 'gen_eff', 'S',
+                  'Slot_aspect_ratio', 'Copper', 'Iron', 'u_Ar', 'y_Ar', 'u_As', 'y_As', 'z_A_s',
+                  'u_all_r', 'u_all_s', 'y_all', 'z_all_s', 'z_all_r', 'b_all_s', 'TC1', 'TC2', 'TC3',
+                  'R_out', 'Structural_mass', 'Mass', 'mass_PM', 'cm', 'I'),
+    'eesg':      ('B_symax', 'B_tmax', 'B_rymax', 'B_gfm', 'B_g', 'B_pc', 'N_s', 'b_s', 'b_t', 'A_Cuscalc',
+                  'A_Curcalc', 'b_p', 'h_p', 'p', 'E_s', 'f', 'I_s', 'R_s', 'L_m', 'A_1', 'J_s', 'R_r', 'Losses',
+                  'Load_mmf_ratio', 'Power_ratio', 'n_brushes', 'J_f', 'K_rad', 'gen_eff', 'S',
+                  'Slot_aspect_ratio', 'Copper', 'Iron', 'u_Ar', 'y_Ar', 'z_A_r', 'u_As', 'y_As', 'z_A_s',
+                  'u_all_r', 'u_all_s', 'y_all', 'z_all_s', 'z_all_r', 'b_all_s', 'b_all_r', 'TC1', 'TC2', 'TC3',
+                  'R_out', 'Structural_mass', 'Mass', 'cm', 'I'),
+    'dfig':      ('B_g', 'B_g1', 'B_rymax', 'B_tsmax', 'B_trmax', 'q1', 'N_s', 'S', 'h_ys', 'b_s', 'b_t',
+                  'D_ratio', 'A_Cuscalc', 'Slot_aspect_ratio1', 'h_yr', 'tau_p', 'p', 'Q_r', 'N_r', 'b_r',
+                  'b_trmin', 'b_tr', 'A_Curcalc', 'Slot_aspect_ratio2', 'E_p', 'f', 'I_s', 'A_1', 'J_s', 'J_r',
+                  'R_s', 'R_R', 'L_r', 'L_s', 'L_sm', 'Mass', 'K_rad', 'Losses', 'gen_eff', 'Copper', 'Iron',
+                  'Structural_mass', 'TC1', 'TC2', 'Current_ratio', 'Overall_eff', 'cm', 'I'),
+    'scig':      ('B_tsmax', 'B_trmax', 'B_rymax', 'B_g', 'B_g1', 'q1', 'N_s', 'S', 'h_ys', 'b_s', 'b_t',
+                  'D_ratio', 'D_ratio_UL', 'D_ratio_LL', 'A_Cuscalc', 'Slot_aspect_ratio1', 'h_yr', 'tau_p', 'p',
+                  'Q_r', 'b_r', 'b_trmin', 'b_tr', 'rad_r', 'S_N', 'A_bar', 'Slot_aspect_ratio2', 'E_p', 'f',
+                  'I_s', 'A_1', 'J_s', 'J_r', 'R_s', 'R_R', 'L_s', 'L_sm', 'Mass', 'K_rad', 'K_rad_UL', 'K_rad_LL',
+                  'Losses', 'gen_eff', 'Copper', 'Iron', 'Structural_mass', 'TC1', 'TC2', 'Overall_eff', 'cm', 'I'),
+}
+
+#------------------------
+
+def get_model(genType):
+    # Return an instance of the generator model named genType
+
+    genType = genType.lower()
+    if genType == 'pmsg_arms':
+        return PMSG_Arms()
+    elif genType == 'pmsg_disc':
+        return PMSG_Disc()
+    elif genType == 'eesg':
+        return EESG()
+    elif genType == 'dfig':
+        return DFIG()
+    elif genType == 'scig':
+        # scigSE depends on ddse_utils, so only import it when requested
+        from wisdem.drivetrainse.scigSE import SCIG
+        return SCIG()
+    raise ValueError('Unknown generator type %s, expected one of %s' % (genType, genTypes))
+
+#------------------------
+
+def evaluate_designs(genType, C_Cu=4.786, C_Fe=0.556, C_Fes=0.50139, C_PM=0.0, **inputs):
+    ''' Size a batch of generator designs in one vectorized call.
+
+    Any of the inputs in INPUTS[genType] can be an array; all arrays must broadcast
+    against each other. shaft_cm is a 3-vector shared by all designs.
+    Returns a dict of all model outputs plus 'Costs' and the constraint margins
+    (con_* / TC / K_rad_L ...) of generator.Generator. cm and I have a trailing
+    axis of length 3. '''
+
+    genType = genType.lower()
+    missing = [k for k in INPUTS[genType] if k not in inputs]
+    if missing:
+        raise ValueError('Missing inputs for %s: %s' % (genType, missing))
+
+    args = [inputs[k] if k == 'shaft_cm' else np.asarray(inputs[k], dtype=float) for k in INPUTS[genType]]
+    with np.errstate(all='ignore'):
+        out = dict(zip(OUTPUTS[genType], get_model(genType).compute(*args)))
+
+    # Material cost (generator.Generator_Cost)
+    mass_PM = out.get('mass_PM', 0.0)
+    out['Costs'] = out['Copper'] * C_Cu + out['Iron'] * C_Fe + C_PM * mass_PM + C_Fes * out['Structural_mass']
+
+    # Constraint margins (the ExecComps in generator.Generator)
+    if genType in ['eesg', 'pmsg_arms', 'pmsg_disc']:
+        out['con_uAs'] = out['u_all_s'] - out['u_As']
+        out['con_zAs'] = out['z_all_s'] - out['z_A_s']
+        out['con_yAs'] = out['y_all']   - out['y_As']
+        out['con_bst'] = out['b_all_s'] - inputs['b_st']
+        out['con_uAr'] = out['u_all_r'] - out['u_Ar']
+        out['con_yAr'] = out['y_all']   - out['y_Ar']
+        out['con_TC2'] = out['TC2'] - out['TC1']
+        out['con_TC3'] = out['TC3'] - out['TC1']
+    if genType in ['pmsg_arms', 'pmsg_disc']:
+        out['con_Bsmax'] = out['B_g'] - out['B_smax']
+    if genType in ['eesg', 'pmsg_arms']:
+        out['con_zAr'] = out['z_all_r'] - out['z_A_r']
+        out['con_br']  = out['b_all_r'] - inputs['b_r']
+    if genType in ['scig', 'dfig']:
+        out['TC'] = out['TC2'] - out['TC1']
+    if genType == 'scig':
+        out['K_rad_L']   = out['K_rad']   - out['K_rad_LL']
+        out['K_rad_U']   = out['K_rad']   - out['K_rad_UL']
+        out['D_ratio_L'] = out['D_ratio'] - out['D_ratio_LL']
+        out['D_ratio_U'] = out['D_ratio'] - out['D_ratio_UL']
+
+    # Make every scalar output the full batch shape
+    shape = np.broadcast(*[a for k, a in zip(INPUTS[genType], args) if k != 'shaft_cm']).shape
+    for k, v in out.items():
+        if k not in ['cm', 'I']:
+            out[k] = np.broadcast_to(v, shape)
+
+    return out
+
+#------------------------
+
+def violations(genType, outputs, Eta_Target=Eta_Target):
+    ''' Number of constraints of generator.optimization_example violated by each
+    design in outputs (from evaluate_designs). NaN values count as violations. '''
+
+    genType = genType.lower()
+    count = (~(np.asarray(outputs[efficiency_name(genType)]) >= Eta_Target)).astype(int)
+    for name, lower, upper in CONSTRAINTS[genType]:
+        v = np.asarray(outputs[name])
+        if lower is not None:
+            count += ~(v >= lower)
+        if upper is not None:
+            count += ~(v <= upper)
+    return count
+
+def feasible(genType, outputs, Eta_Target=Eta_Target):
+    # Boolean mask of the designs in outputs that satisfy all constraints
+    return violations(genType, outputs, Eta_Target=Eta_Target) == 0
+
+#------------------------
+
+def sample_designs(genType, n, bounds=None, seed=None):
+    ''' Draw n designs uniformly within bounds (default DESIGN_BOUNDS[genType]).
+    Returns a dict of design variable arrays of length n '''
+
+    if bounds is None:
+        bounds = DESIGN_BOUNDS[genType.lower()]
+    rng = np.random.default_rng(seed)
+    return {k: rng.uniform(lo, hi, n) for k, (lo, hi) in bounds.items()}
+
+#------------------------
+
+def screen_designs(genType, n, n_best=10, seed=None, Eta_Target=Eta_Target, **inputs):
+    ''' Sample n designs, evaluate them and return (designs, outputs) of the
+    n_best best ones, sorted by number of violated constraints and then by Costs.
+    inputs gives the fixed (non-design) inputs and optional cost coefficients.
+    Feasible designs are the ones with outputs['violations'] == 0. '''
+
+    designs = sample_designs(genType, n, seed=seed)
+    args = dict(inputs)
+    args.update(designs)
+    out = evaluate_designs(genType, **args)
+
+    out['violations'] = violations(genType, out, Eta_Target=Eta_Target)
+    costs = np.where(np.isnan(out['Costs']), np.inf, out['Costs'])
+    idx = np.lexsort((costs, out['violations']))[:n_best]
+    return ({k: v[idx] for k, v in designs.items()},
+            {k: np.asarray(v)[idx] for k, v in out.items()})
+
+#------------------------
+
+if __name__ == '__main__':
+
+    fixed = {'machine_rating': 10e6, 'Torque': 12.64e6, 'n_nom': 7.54, 'R_o': 0.43,
+             'rho_Fe': 7700.0, 'rho_Fes': 7850.0, 'rho_Copper': 8900.0, 'rho_PM': 7450.0,
+             'shaft_cm': np.zeros(3), 'shaft_length': 2.0}
+    designs, out = screen_designs('pmsg_arms', 100000, n_best=5, seed=0, **fixed)
+    for k in designs:
+        print('{:8s} {}'.format(k, designs[k]))
+    print('{:8s} {}'.format('Costs', out['Costs']))
+    print('{:8s} {}'.format('violated', out['violations']))
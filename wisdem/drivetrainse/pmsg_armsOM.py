@@ -11,7 +11,7 @@ The pure-python part is in pmsg_discSE.py
 from openmdao.api import Group, Problem, ExplicitComponent,ExecComp,IndepVarComp,ScipyOptimizeDriver
 import numpy as np
 from math import pi, cos, sqrt, radians, sin, exp, log10, log, tan, atan
-from pmsg_armsSE import PMSG_Arms
+from wisdem.drivetrainse.pmsg_armsSE import PMSG_Arms
 
 class PMSG_Arms_OM(ExplicitComponent):
     """ Estimates overall mass dimensions and Efficiency of PMSG -arms generator. """
@@ -6,7 +6,8 @@ Structural design based on McDonald's thesis """
 
 import sys
 import numpy as np
-from math import pi, cos, sqrt, radians, sin, exp, log10, log, tan, atan
+# numpy versions of the math functions, so that compute broadcasts over arrays of designs
+from numpy import pi, cos, sqrt, radians, sin, exp, log10, log, tan, arctan as atan
 
 perMin_to_Hz = 1. / 60.
 
@@ -133,12 +134,12 @@ class PMSG_Arms(object):
 
         # Calculating stator current and electrical loading
         
-        if G < 0:
+        if np.any(G < 0):
             # OpenMDAO optimization can sometimes generate impossible values
             sys.stderr.write('\n*** ERROR in pmsg_armsSE.py: G < 0\n')
             sys.stderr.write('Z {} E_p {} G {} om_e {} LS {}\n'.format(Z, E_p, G, om_e, L_s))
         is2 = Z**2 + (((E_p - G**0.5) / (om_e * L_s)**2)**2)
-        if is2 < 0:
+        if np.any(is2 < 0):
             # OpenMDAO optimization can sometimes generate impossible values
             sys.stderr.write('\n*** ERROR in pmsg_armsSE.py: is2 < 0\n')
         I_s     = sqrt(Z**2 + (((E_p - G**0.5) / (om_e * L_s)**2)**2))
@@ -305,14 +306,10 @@ class PMSG_Arms(object):
         
         # Calculating mass moments of inertia and center of mass
         
-        I = np.zeros(3)
-        I[0]   = 0.50 * Mass * R_out**2
-        I[1]   = 0.25 * Mass * R_out**2 + Mass * len_s**2 / 12
-        I[2]   = I[1]
-        cm = np.zeros(3)
-        cm[0]  = shaft_cm[0] + shaft_length / 2. + len_s / 2
-        cm[1]  = shaft_cm[1]
-        cm[2]  = shaft_cm[2]
+        I_xx = 0.50 * Mass * R_out**2
+        I_yy = 0.25 * Mass * R_out**2 + Mass * len_s**2 / 12
+        I  = np.stack(np.broadcast_arrays(I_xx, I_yy, I_yy), axis=-1)
+        cm = np.stack(np.broadcast_arrays(shaft_cm[0] + shaft_length / 2. + len_s / 2, shaft_cm[1], shaft_cm[2]), axis=-1)
 		
         return B_symax, B_tmax, B_rymax, B_smax, B_pm1, B_g, N_s, b_s, b_t, A_Cuscalc, b_m, p, E_p, f, I_s, \
             R_s, L_s, A_1, J_s, Losses, K_rad, gen_eff, S, Slot_aspect_ratio, Copper, Iron, u_Ar, y_Ar, z_A_r, \
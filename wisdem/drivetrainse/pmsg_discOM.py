@@ -12,7 +12,7 @@ from openmdao.api import Group, Problem, ExplicitComponent,ExecComp,IndepVarComp
 import numpy as np
 from math import pi, cos,cosh, sqrt, radians, sin,sinh, exp, log10, log, tan, atan
 import sys
-from pmsg_discSE import PMSG_Disc
+from wisdem.drivetrainse.pmsg_discSE import PMSG_Disc
 
 class PMSG_Disc_OM(ExplicitComponent):
     """ Estimates overall mass dimensions and Efficiency of PMSG-disc rotor generator. """
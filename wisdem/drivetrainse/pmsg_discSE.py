@@ -13,7 +13,8 @@ The OpenMDAO part is in pmsg_discOM.py
 """
 
 import numpy as np
-from math import pi, cos,cosh, sqrt, radians, sin,sinh, exp, log10, log, tan, atan
+# numpy versions of the math functions, so that compute broadcasts over arrays of designs
+from numpy import pi, cos,cosh, sqrt, radians, sin,sinh, exp, log10, log, tan, arctan as atan
 import sys
 
 PSI_2_PASCAL = 6894.76
@@ -135,16 +136,10 @@ class PMSG_Disc(object):
         # If G is < 0, G**0.5 is nan, and so is I_s
         # This may happen during optimization - do we need a check? or constraints?
         #if np.isnan(Z**2 + (((E_p - G**0.5) / (om_e * L_s)**2)**2)):
-        if type(G) == np.float64:
-            if G < 0:
-                sys.stderr.write('I_s^2 {:}\n'.format(Z**2 + (((E_p - G**0.5) / (om_e * L_s)**2)**2)))
-                sys.stderr.write('Z {:.5f} Ep {:.5f} G {:.5f} ome {:.5f} L_s {:.5f} Epg {:.5f} omL {:.5f}\n'.format(Z[0], 
+        if np.any(G < 0):
+            sys.stderr.write('I_s^2 {}\n'.format(Z**2 + (((E_p - G**0.5) / (om_e * L_s)**2)**2)))
+            sys.stderr.write('Z {} Ep {} G {} ome {} L_s {} Epg {} omL {}\n'.format(Z, 
                              E_p, G, om_e, L_s, E_p-G**0.5, (om_e * L_s)**2))
-        else:
-            if G[0] < 0:
-                sys.stderr.write('I_s^2 {:}\n'.format(Z**2 + (((E_p - G**0.5) / (om_e * L_s)**2)**2)))
-                sys.stderr.write('Z {:.5f} Ep {:.5f} G {:.5f} ome {:.5f} L_s {:.5f} Epg {:.5f} omL {:.5f}\n'.format(Z[0], 
-                             E_p[0], G[0], om_e[0], L_s[0], E_p[0]-G[0]**0.5, (om_e[0] * L_s[0])**2))
         
         # Calculating stator current and electrical loading
         I_s = sqrt(Z**2 + (((E_p - G**0.5) / (om_e * L_s)**2)**2))       
@@ -234,11 +229,12 @@ class PMSG_Disc(object):
         Fa4arg = pi / 180 * lamb * (0.5 * len_s - a)
         F_a4_ls2 = chsMshc(Fa4arg)
         
-        print('pmsg_disc: F_a4_ls2, Fa4arg, lamb, len_s, a ', F_a4_ls2, Fa4arg, lamb, len_s, a)
-        if np.isnan(F_a4_ls2):
-            sys.stderr.write('*** pmsg_discSE error: F_a4_ls2 is nan\n')
-            sys.exit()
-            
+        # cosh/sinh overflow for long stacks (inf - inf); mark those designs infeasible with nan
+        # so that they propagate to the outputs and fail the constraints, rather than stopping the run
+        F_a4_ls2 = np.where(np.isfinite(F_a4_ls2), F_a4_ls2, np.nan)
+        if np.any(np.isnan(F_a4_ls2)):
+            sys.stderr.write('*** pmsg_discSE warning: F_a4_ls2 is nan for {} design(s)\n'.format(np.count_nonzero(np.isnan(F_a4_ls2))))
+
         #C_2 = cosh(x1) * sin(x1) + sinh(x1) * cos(x1)
         C_3 = sinh(x1) * sin(x1)
         #C_4 = cosh(x1) * sin(x1) - sinh(x1) * cos(x1)
@@ -252,10 +248,7 @@ class PMSG_Disc(object):
         #F_2_x0  = cosh(lamb * 0) * sin(lamb * 0) + sinh(lamb * 0) * cos(lamb * 0)
         #F_2_ls2 = cosh(x1 / 2)   * sin(x1 / 2)   + sinh(x1 / 2)   * cos(x1 / 2)
         
-        if (len_s < 2 * a):
-            a = len_s / 2
-        else:
-            a = len_s * 0.5 - 1
+        a = np.where(len_s < 2 * a, len_s / 2, len_s * 0.5 - 1)
        
         #F_a4_x0 = cosh(lamb * (0)) * sin(lamb * (0)) \
         #        - sinh(lamb * (0)) * cos(lamb * (0))
@@ -379,15 +372,10 @@ class PMSG_Disc(object):
         Mass =  Structural_mass + Iron + Copper + mass_PM        
         
         # Calculating mass moments of inertia and center of mass
-        I = np.zeros(3)
-        I[0]   = 0.50 * Mass * R_out**2
-        I[1]   = 0.25 * Mass * R_out**2 + Mass * len_s**2 / 12
-        I[2]   = I[1]
-        
-        cm = np.zeros(3)
-        cm[0]  = shaft_cm[0] + shaft_length / 2 + len_s / 2
-        cm[1]  = shaft_cm[1]
-        cm[2]  = shaft_cm[2]
+        I_xx = 0.50 * Mass * R_out**2
+        I_yy = 0.25 * Mass * R_out**2 + Mass * len_s**2 / 12
+        I  = np.stack(np.broadcast_arrays(I_xx, I_yy, I_yy), axis=-1)
+        cm = np.stack(np.broadcast_arrays(shaft_cm[0] + shaft_length / 2 + len_s / 2, shaft_cm[1], shaft_cm[2]), axis=-1)
         
         return B_symax, B_tmax, B_rymax, B_smax, B_pm1, B_g, N_s, b_s, b_t, A_Cuscalc, b_m, p, E_p, \
             f, I_s, R_s, L_s, A_1, J_s, Losses, K_rad, gen_eff, S, Slot_aspect_ratio, Copper, Iron, \
@@ -10,7 +10,7 @@ from openmdao.api import Group, Problem, ExplicitComponent,ExecComp,IndepVarComp
 import numpy as np
 from math import pi, cos, sqrt, radians, sin, exp, log10, log, tan, atan
 import sys
-from scigSE import SCIG
+from wisdem.drivetrainse.scigSE import SCIG
 from ddse_utils import carterFactor
 
 #-------------------------
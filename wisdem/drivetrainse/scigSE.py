@@ -3,7 +3,8 @@
 
 import sys
 import numpy as np
-from math import pi, sin, cos, radians, sqrt, log
+# numpy versions of the math functions, so that compute broadcasts over arrays of designs
+from numpy import pi, sin, cos, radians, sqrt, log
 from ddse_utils import carterFactor
 
 #--------------------------------
@@ -148,10 +149,7 @@ class SCIG(object):
             D_ratio_UL = 1.24
             
         # Stator slot fill factor
-        if ag_dia > 2:
-            k_fills = 0.65
-        else:
-            k_fills = 0.4
+        k_fills = np.where(ag_dia > 2, 0.65, 0.4)
         
         # Stator winding length and cross-section
         l_fs      = 2 * (0.015 + y_tau_p * tau_p / 2 / cos(radians(40))) + pi * h_s # end connection
@@ -301,15 +299,11 @@ class SCIG(object):
         
         # Calculating mass moments of inertia and center of mass
         
-        I = np.zeros(3)
         r_out = d_se * 0.5
-        I[0]   = 0.50 * Mass * r_out**2
-        I[1]   = 0.25 * Mass * r_out**2 + Mass * len_s**2 / 12
-        I[2]   = I[1]
-        cm = np.zeros(3)
-        cm[0]  = shaft_cm[0] + shaft_length/2. + len_s/2.
-        cm[1]  = shaft_cm[1]
-        cm[2]  = shaft_cm[2]
+        I_xx = 0.50 * Mass * r_out**2
+        I_yy = 0.25 * Mass * r_out**2 + Mass * len_s**2 / 12
+        I  = np.stack(np.broadcast_arrays(I_xx, I_yy, I_yy), axis=-1)
+        cm = np.stack(np.broadcast_arrays(shaft_cm[0] + shaft_length/2. + len_s/2., shaft_cm[1], shaft_cm[2]), axis=-1)
 
         return B_tsmax, B_trmax, B_rymax, B_g, B_g1, q1, N_s, S, h_ys, b_s, b_t, D_ratio, D_ratio_UL, \
             D_ratio_LL, A_Cuscalc, Slot_aspect_ratio1, h_yr, tau_p, p, Q_r, b_r, b_trmin, b_tr, \
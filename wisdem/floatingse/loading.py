@@ -1027,6 +1027,8 @@ class FloatingFrame(ExplicitComponent):
         # ---FRAME3DD INSTANCE---
 
         # Initialize frame3dd object
+        myframe = getattr(self, 'myframe', None)
+        modal_subspace = None if myframe is None else myframe.modalSubspace
         self.myframe = frame3dd.Frame(nodes, reactions, elements, other)
         
         # Add in extra mass of rna
@@ -1057,6 +1059,7 @@ class FloatingFrame(ExplicitComponent):
         shift = 0.0        # shift value ... for unrestrained or partially restrained structures
         
         #self.myframe.enableDynamics(nM, Mmethod, lump, tol, shift)
+        self.myframe.enableWarmStart(modal_subspace) # start the modal solve from the previous modes
 
         # ---DEBUGGING---
         #self.myframe.write('debug.3dd') # For debugging
@@ -2,6 +2,7 @@ from openmdao.api import ExplicitComponent
 import numpy as np
 import os
 import sys
+import multiprocessing as mp
 from wisdem.pymap import pyMAP
 
 from wisdem.commonse import gravity, Enum
@@ -17,6 +18,16 @@ class MapMooring(ExplicitComponent):
     Should be tightly coupled with Spar class for full system representation.
     """
 
+    def initialize(self):
+        # Only sweep the headings that are unique under the rotational and mirror symmetry of the lines
+        self.options.declare('symmetric_sweep', default=True)
+        # Number of processes (independent MAP++ instances) for the offset sweep, None for all cpus
+        self.options.declare('sweep_processes', default=1)
+        # Mooring response database (MooringDatabase or its file name) to interpolate instead of running MAP++
+        self.options.declare('mooring_database', default=None)
+        # Fall back to MAP++ when the database error bound on the line tension exceeds this relative tolerance
+        self.options.declare('surrogate_rtol', default=None)
+        
     def setup(self):
     
         # Variables local to the class and not OpenMDAO
@@ -27,6 +38,8 @@ class MapMooring(ExplicitComponent):
         self.cost_per_length     = None
         self.finput              = None
         self.tlpFlag             = False
+        self.max_tension         = None
+        self.surrogate_errors    = None
 
         # Environment
         self.add_input('water_density', val=0.0, units='kg/m**3', desc='density of water')
@@ -93,8 +106,10 @@ class MapMooring(ExplicitComponent):
         # Set geometry profile
         self.set_geometry(inputs, outputs)
 
-        # Write MAP input file and analyze the system at every angle
-        self.runMAP(inputs, discrete_inputs, outputs)
+        # Interpolate the mooring response database or, if the design isn't covered,
+        # write MAP input file and analyze the system at every angle
+        if not self.runSurrogate(inputs, discrete_inputs, outputs):
+            self.runMAP(inputs, discrete_inputs, outputs)
 
         # Compute costs for the system
         self.compute_cost(inputs, discrete_inputs, outputs)
@@ -338,7 +353,7 @@ class MapMooring(ExplicitComponent):
         angles = np.linspace(0, 360, n_connect+1)[1:-1]
         line = 'repeat'
         for degree in angles:
-            line += (' %d' % degree)
+            line += (' %f' % degree)
         self.finput.append(line)
         self.finput.append(' krylov_accelerator 3')
         self.finput.append(' ref_position 0.0 0.0 0.0')
@@ -440,34 +455,27 @@ class MapMooring(ExplicitComponent):
         nptsMOI   = 100
         xyzpts    = np.zeros((ntotal, nptsMOI, 3)) # For MOI calculation
         for k in range(ntotal):
-            (F_neutral[k,0], F_neutral[k,1], F_neutral[k,2]) = mymap.get_fairlead_force_3d(k)
-            plotMat[k,:,0] = mymap.plot_x(k, NPTS_PLOT)
-            plotMat[k,:,1] = mymap.plot_y(k, NPTS_PLOT)
-            plotMat[k,:,2] = mymap.plot_z(k, NPTS_PLOT)
-            xyzpts[k,:,0]  = mymap.plot_x(k, nptsMOI)
-            xyzpts[k,:,1]  = mymap.plot_y(k, nptsMOI)
-            xyzpts[k,:,2]  = mymap.plot_z(k, nptsMOI)
-            if self.tlpFlag:
-                # Seems to be a bug in the plot arrays from MAP++ for plotting output with taut lines
-                plotMat[k,:,2] = np.linspace(-fairleadDepth, -waterDepth, NPTS_PLOT)
-                xyzpts[k,:,2]  = np.linspace(-fairleadDepth, -waterDepth, nptsMOI)
+            F_neutral[k,:] = mymap.get_fairlead_force_3d(k)
+            plotMat[k,:,:] = mymap.plot_xyz(k, NPTS_PLOT)
+            xyzpts[k,:,:]  = mymap.plot_xyz(k, nptsMOI)
+        if self.tlpFlag:
+            # Seems to be a bug in the plot arrays from MAP++ for plotting output with taut lines
+            plotMat[:ntotal,:,2] = np.linspace(-fairleadDepth, -waterDepth, NPTS_PLOT)
+            xyzpts[:,:,2]        = np.linspace(-fairleadDepth, -waterDepth, nptsMOI)
         outputs['mooring_neutral_load'] = F_neutral
         outputs['mooring_plot_matrix']  = plotMat
         
         # Fine line segment length, ds = sqrt(dx^2 + dy^2 + dz^2)
-        xyzpts_dx = np.gradient(xyzpts[:,:,0], axis=1)
-        xyzpts_dy = np.gradient(xyzpts[:,:,1], axis=1)
-        xyzpts_dz = np.gradient(xyzpts[:,:,2], axis=1)
-        xyzpts_ds = np.sqrt(xyzpts_dx**2 + xyzpts_dy**2 + xyzpts_dz**2)
+        xyzpts_ds = np.sqrt( np.sum(np.gradient(xyzpts, axis=1)**2, axis=2) )
 
-        # Initialize inertia tensor integrands in https://en.wikipedia.org/wiki/Moment_of_inertia#Inertia_tensor
+        # Inertia tensor integrands in https://en.wikipedia.org/wiki/Moment_of_inertia#Inertia_tensor,
+        # (r.r)*I - r r^T in the [xx yy zz xy xz yz] order of unassembleI
         # Taking MOI relative to body centerline at fairlead depth
         r0 = np.array([0.0, 0.0, -fairleadDepth])
-        R  = np.zeros((ntotal, nptsMOI, 6))
-        for ii in range(nptsMOI):
-            for k in range(ntotal):
-                r = xyzpts[k,ii,:] - r0
-                R[k,ii,:] = unassembleI(np.dot(r,r)*np.eye(3) - np.outer(r,r))
+        r  = xyzpts - r0
+        rr = np.sum(r*r, axis=2)
+        R  = np.stack([rr - r[:,:,0]**2, rr - r[:,:,1]**2, rr - r[:,:,2]**2,
+                       -r[:,:,0]*r[:,:,1], -r[:,:,0]*r[:,:,2], -r[:,:,1]*r[:,:,2]], axis=2)
         Imat = self.wet_mass_per_length * np.trapz(R, x=xyzpts_ds[:,:,np.newaxis], axis=1)
         outputs['mooring_moments_of_inertia'] = np.abs( Imat.sum(axis=0) )
 
@@ -487,49 +495,40 @@ class MapMooring(ExplicitComponent):
 
         # Get angles by which to find the weakest line
         dangle  = 2.0
-        angles  = np.deg2rad( np.arange(0.0, 360.0, dangle) )
-        nangles = len(angles)
+        angles  = offset_sweep_headings(n_connect, dangle, symmetric=self.options['symmetric_sweep'])
 
         # Get restoring force at weakest line at maximum allowable offset
         # Will global minimum always be along mooring angle?
-        max_tension   = 0.0
-        max_angle     = None
-        min_angle     = None
-        F_max_tension = None
-        F_min         = np.inf
-        T = np.zeros((NLINES_MAX,))
-        F = np.zeros((NLINES_MAX,))
-        # Loop around all angles to find weakest point
-        for a in angles:
-            # Unit vector and offset in x-y components
-            idir  = np.array([np.cos(a), np.sin(a)])
-            surge = offset * idir[0]
-            sway  = offset * idir[1]
-
-            # Get restoring force of offset at this angle
-            mymap.displace_vessel(surge, sway, 0, 0, 0, 0) # 0s for z, angles
+        nproc = self.options['sweep_processes']
+        if nproc is None: nproc = mp.cpu_count()
+        nproc = min(nproc, angles.size)
+        if nproc > 1:
+            # Split the headings in contiguous blocks, each solved by its own MAP++ instance
+            setup = (self.finput[:], float(waterDepth), float(rhoWater), float(offset), ntotal)
+            tasks = [setup + (a,) for a in np.array_split(angles, nproc)]
+            pool  = mp.Pool(nproc)
+            try:
+                parts = pool.map(_map_offset_sweep, tasks)
+            finally:
+                pool.close()
+                pool.join()
+            T_max = np.concatenate([p[0] for p in parts])
+            F_sum = np.concatenate([p[1] for p in parts])
+        else:
+            # Start from the neutral position so each heading is warm started from its neighbor
+            mymap.displace_vessel(0, 0, 0, 0, 0, 0)
             mymap.update_states(0.0, 0)
-            for k in range(ntotal):
-                # Force in x-y-z coordinates
-                fx,fy,fz = mymap.get_fairlead_force_3d(k)
-                T[k]     = np.sqrt(fx*fx + fy*fy + fz*fz)
-                # Total restoring force
-                F[k]     = np.dot([fx, fy], idir)
-                
-            # Check if this is the weakest direction (highest tension)
-            tempMax = T.max()
-            if tempMax > max_tension:
-                max_tension   = tempMax
-                F_max_tension = F.sum()
-                max_angle     = a
-            if F.sum() < F_min:
-                F_min     = F.sum()
-                min_angle = a
+            T_max, F_sum = offset_sweep(mymap, offset, angles, ntotal)
+
+        # Check the weakest direction (highest tension) and the weakest restoring force
+        max_tension = np.maximum(T_max.max(), 0.0)
+        F_min       = F_sum.min()
                 
         # Store the weakest restoring force when the vessel is offset the maximum amount
         outputs['max_offset_restoring_force'] = F_min
 
         # Check for good convergence
+        self.max_tension = max_tension
         if (plotMat[0,-1,-1] + fairleadDepth) > 1.0:
             outputs['axial_unity'] = 1e30
         else:
@@ -537,6 +536,47 @@ class MapMooring(ExplicitComponent):
 
         mymap.end()
 
+
+    def runSurrogate(self, inputs, discrete_inputs, outputs):
+        """Sets the MAP++ outputs by interpolation of the mooring response database, if there is one
+        and it covers this design.
+        
+        INPUTS:
+        ----------
+        inputs   : dictionary of input parameters
+        outputs : dictionary of output parameters
+        
+        OUTPUTS  : True if the outputs were set, False if runMAP is needed
+        """
+        self.surrogate_errors = None
+        db = self.options['mooring_database']
+        if db is None:
+            return False
+        if isinstance(db, str):
+            # Load the file once and keep the database in place of its name
+            from wisdem.floatingse.mooring_database import MooringDatabase
+            db = self.options['mooring_database'] = MooringDatabase.load(db)
+
+        if not db.covers(inputs, discrete_inputs):
+            return False
+        values, errors = db.interpolate(inputs)
+
+        # Fall back to MAP++ near designs that didn't converge or where the error bound is too large
+        max_tension = values['max_tension']
+        if np.isnan(max_tension):
+            return False
+        rtol = self.options['surrogate_rtol']
+        if rtol is not None and errors['max_tension'] > rtol * np.abs(max_tension):
+            return False
+
+        for k in ['mooring_stiffness', 'mooring_neutral_load', 'operational_heel_restoring_force',
+                  'max_offset_restoring_force', 'mooring_moments_of_inertia', 'mooring_plot_matrix']:
+            outputs[k] = values[k]
+        self.max_tension      = max_tension
+        self.surrogate_errors = errors
+        outputs['axial_unity'] = inputs['gamma_f'] * max_tension / self.min_break_load
+        return True
+
         
     def compute_cost(self, inputs, discrete_inputs, outputs):
         """Computes cost, based on mass scaling, of mooring system.
@@ -575,3 +615,81 @@ class MapMooring(ExplicitComponent):
         outputs['mooring_cost'] = costFact*(legs_total + anchor_total)
         outputs['mooring_mass'] = self.wet_mass_per_length*L_mooring*ntotal
         outputs['number_of_mooring_lines'] = ntotal
+
+
+def offset_sweep_headings(n_connect, dangle=2.0, symmetric=True):
+    """Headings (rad) of the vessel offset sweep in runMAP.
+
+    The mooring lines are identical, evenly spaced every 360/n_connect degrees and each
+    connection is symmetric about its own axis, so the response at heading a is the same
+    as at a + 360/n_connect and at -a.  With symmetric=True each heading of the full
+    0-360 degree sweep is folded back to [0, 180/n_connect] and only the unique headings are kept.
+    
+    INPUTS:
+    ----------
+    n_connect : number of mooring connections
+    dangle    : heading step of the full sweep (deg)
+    symmetric : fold the headings by symmetry
+    
+    OUTPUTS  : array of headings in radians
+    """
+    angles = np.arange(0.0, 360.0, dangle)
+    if symmetric:
+        period = 360.0 / max(1, int(n_connect))
+        angles = np.mod(angles, period)
+        angles = np.unique( np.round(np.minimum(angles, period - angles), 10) )
+    return np.deg2rad(angles)
+
+
+def offset_sweep(mymap, offset, angles, ntotal):
+    """Solves MAP++ with the vessel offset by offset at each heading in angles, in order,
+    so every solve starts from the converged state of the previous heading.
+    
+    INPUTS:
+    ----------
+    mymap  : initialized pyMAP instance
+    offset : vessel offset (m)
+    angles : headings (rad)
+    ntotal : number of mooring lines
+    
+    OUTPUTS  : maximum line tension and total restoring force along the offset direction at each heading
+    """
+    T_max = np.zeros(angles.size)
+    F_sum = np.zeros(angles.size)
+    T = np.zeros(ntotal)
+    F = np.zeros(ntotal)
+    for i, a in enumerate(angles):
+        # Unit vector and offset in x-y components
+        idir  = np.array([np.cos(a), np.sin(a)])
+        surge = offset * idir[0]
+        sway  = offset * idir[1]
+
+        # Get restoring force of offset at this angle
+        mymap.displace_vessel(surge, sway, 0, 0, 0, 0) # 0s for z, angles
+        mymap.update_states(0.0, 0)
+        for k in range(ntotal):
+            # Force in x-y-z coordinates
+            fx,fy,fz = mymap.get_fairlead_force_3d(k)
+            T[k]     = np.sqrt(fx*fx + fy*fy + fz*fz)
+            # Total restoring force
+            F[k]     = fx*idir[0] + fy*idir[1]
+        T_max[i] = T.max()
+        F_sum[i] = F.sum()
+    return T_max, F_sum
+
+
+def _map_offset_sweep(task):
+    # Process pool worker for runMAP: builds its own MAP++ instance from the input deck
+    # and sweeps a block of headings, starting from the neutral position
+    finput, waterDepth, rhoWater, offset, ntotal, angles = task
+    mymap = pyMAP( )
+    mymap.map_set_sea_depth(waterDepth)
+    mymap.map_set_gravity(gravity)
+    mymap.map_set_sea_density(rhoWater)
+    mymap.read_list_input(finput)
+    mymap.init( )
+    mymap.displace_vessel(0, 0, 0, 0, 0, 0)
+    mymap.update_states(0.0, 0)
+    out = offset_sweep(mymap, offset, angles, ntotal)
+    mymap.end()
+    return out
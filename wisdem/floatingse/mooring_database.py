@@ -0,0 +1,190 @@
+import numpy as np
+import multiprocessing as mp
+import itertools
+import os
+
+from wisdem.floatingse.map_mooring import MapMooring, NLINES_MAX, NPTS_PLOT
+
+# Grid axes of the database, all nondimensional except for the water depth
+AXES = ('water_depth', 'fairlead_ratio', 'scope', 'anchor_ratio', 'offset_ratio')
+
+# Inputs that are fixed when the database is built and must match at lookup
+FIXED = ('water_density', 'fairlead_radius', 'operational_heel',
+         'number_of_mooring_connections', 'mooring_lines_per_connection')
+
+# Responses of MapMooring.runMAP that are stored, with their shapes.  All of them but the
+# plot matrix scale exactly with the square of the mooring diameter (mass, buoyancy and
+# axial stiffness of the lines all do), so they are stored per unit diameter squared.
+RESPONSES = {'mooring_stiffness'                : (6, 6),
+             'mooring_neutral_load'             : (NLINES_MAX, 3),
+             'operational_heel_restoring_force' : (NLINES_MAX, 3),
+             'max_offset_restoring_force'       : (),
+             'max_tension'                      : (),
+             'mooring_moments_of_inertia'       : (6,),
+             'mooring_plot_matrix'              : (NLINES_MAX, NPTS_PLOT, 3)}
+UNSCALED = ('mooring_plot_matrix',)
+
+
+def design_coordinates(inputs):
+    """Returns the database coordinates (see AXES) of a MapMooring design
+
+    INPUTS:
+    ----------
+    inputs   : dictionary of MapMooring input parameters
+
+    OUTPUTS  : array of coordinates, in the order of AXES
+    """
+    waterDepth    = float(inputs['water_depth'])
+    fairleadDepth = float(inputs['fairlead'])
+    return np.array([waterDepth,
+                     fairleadDepth / waterDepth,
+                     float(inputs['mooring_line_length']) / (waterDepth - fairleadDepth),
+                     float(inputs['anchor_radius']) / waterDepth,
+                     float(inputs['max_offset']) / waterDepth])
+
+
+def design_inputs(point, base_inputs):
+    """Inverse of design_coordinates: MapMooring inputs at database coordinates point,
+    with all other inputs taken from base_inputs"""
+    waterDepth, fairlead_ratio, scope, anchor_ratio, offset_ratio = point
+    inputs = dict(base_inputs)
+    inputs['water_depth']         = waterDepth
+    inputs['fairlead']            = fairlead_ratio * waterDepth
+    inputs['mooring_line_length'] = scope * (1.0 - fairlead_ratio) * waterDepth
+    inputs['anchor_radius']       = anchor_ratio * waterDepth
+    inputs['max_offset']          = offset_ratio * waterDepth
+    return inputs
+
+
+def _solve_point(task):
+    # Process pool worker for build_database: runs MAP++ at one grid point.
+    # Points where MAP++ does not converge are stored as NaN.
+    point, base_inputs, discrete_inputs = task
+    inputs  = design_inputs(point, base_inputs)
+    outputs = {}
+    D2      = float(inputs['mooring_diameter'])**2
+    mymoor  = MapMooring(symmetric_sweep=True)
+    mymoor.set_properties(inputs, discrete_inputs)
+    mymoor.set_geometry(inputs, outputs)
+    mymoor.runMAP(inputs, discrete_inputs, outputs)
+    outputs['max_tension'] = mymoor.max_tension
+
+    valid = outputs['axial_unity'] < 1e30
+    resp  = {}
+    for k, shape in RESPONSES.items():
+        val = np.array(outputs[k], dtype=float).reshape(shape)
+        if k not in UNSCALED: val = val / D2
+        resp[k] = val if valid else np.nan*val
+    return resp
+
+
+def build_database(filename, axes, base_inputs, discrete_inputs, processes=None):
+    """Fills a mooring response database with MAP++ on the full grid of axes, in a process pool,
+    and saves it to filename (numpy .npz)
+
+    INPUTS:
+    ----------
+    filename        : output file
+    axes            : dictionary of increasing grid values for every name in AXES
+    base_inputs     : dictionary of MapMooring input parameters for everything not in AXES.
+                      The mooring diameter only sets the reference for the D^2 scaling.
+    discrete_inputs : dictionary with 'mooring_type' (and 'anchor_type')
+    processes       : number of worker processes, None for all cpus
+
+    OUTPUTS  : MooringDatabase
+    """
+    grid   = [np.asarray(axes[k], dtype=float) for k in AXES]
+    shape  = tuple(g.size for g in grid)
+    tasks  = [(point, base_inputs, discrete_inputs) for point in itertools.product(*grid)]
+
+    if processes == 1:
+        results = [_solve_point(t) for t in tasks]
+    else:
+        with mp.Pool(processes) as pool:
+            results = pool.map(_solve_point, tasks)
+
+    data = {}
+    for k, rshape in RESPONSES.items():
+        data[k] = np.array([r[k] for r in results]).reshape(shape + rshape)
+    fixed = np.array([float(base_inputs[k]) for k in FIXED])
+    db = MooringDatabase(grid, data, fixed, discrete_inputs['mooring_type'])
+    db.save(filename)
+    return db
+
+
+class MooringDatabase(object):
+    """
+    Precomputed MAP++ responses of MapMooring on a regular grid of AXES, for one mooring
+    material and fixed values of FIXED.  Lookups interpolate multilinearly and return,
+    for every response, a bound on the interpolation error: the largest distance between
+    the interpolated value and the values at the corners of the enclosing grid cell.  That
+    is a strict bound wherever the response is monotonic within the cell.
+    """
+
+    def __init__(self, axes, data, fixed, mooring_type):
+        self.axes         = [np.asarray(a, dtype=float) for a in axes]
+        self.data         = data
+        self.fixed        = np.asarray(fixed, dtype=float)
+        self.mooring_type = mooring_type.upper()
+
+    def save(self, filename):
+        arrays = {'axis_'+k: a for k, a in zip(AXES, self.axes)}
+        arrays.update(self.data)
+        np.savez(filename, fixed=self.fixed, mooring_type=self.mooring_type, **arrays)
+
+    @classmethod
+    def load(cls, filename):
+        with np.load(filename) as f:
+            axes = [f['axis_'+k] for k in AXES]
+            data = {k: f[k] for k in RESPONSES}
+            return cls(axes, data, f['fixed'], str(f['mooring_type']))
+
+    def covers(self, inputs, discrete_inputs):
+        """Whether the design is inside the database domain with the same material and fixed inputs"""
+        if discrete_inputs['mooring_type'].upper() != self.mooring_type:
+            return False
+        fixed = np.array([float(inputs[k]) for k in FIXED])
+        if not np.allclose(fixed, self.fixed, rtol=1e-8, atol=0.0):
+            return False
+        x = design_coordinates(inputs)
+        return all(a[0] <= xi <= a[-1] for a, xi in zip(self.axes, x))
+
+    def interpolate(self, inputs):
+        """Interpolated responses of a design covered by the database
+
+        INPUTS:
+        ----------
+        inputs   : dictionary of MapMooring input parameters
+
+        OUTPUTS  : dictionaries of responses and of their error bounds, scaled to the mooring
+                   diameter of the design.  Responses are NaN if any corner of the cell did not converge.
+        """
+        x = design_coordinates(inputs)
+
+        # Lower corner index and weight along each axis
+        idx = []
+        wts = []
+        for a, xi in zip(self.axes, x):
+            i = int(np.clip(np.searchsorted(a, xi, side='right') - 1, 0, max(a.size-2, 0)))
+            t = 0.0 if a.size == 1 else (xi - a[i]) / (a[i+1] - a[i])
+            idx.append(i)
+            wts.append(t)
+
+        # All 2^d corners of the cell
+        corners = [c for c in itertools.product((0, 1), repeat=len(self.axes))]
+        cidx    = tuple(np.array([min(i+c[j], a.size-1) for c in corners]) for j, (i, a) in enumerate(zip(idx, self.axes)))
+        weight  = np.array([np.prod([t if cj else 1.0-t for t, cj in zip(wts, c)]) for c in corners])
+
+        D2     = float(inputs['mooring_diameter'])**2
+        values = {}
+        errors = {}
+        for k, rshape in RESPONSES.items():
+            cval = self.data[k][cidx]
+            val  = np.tensordot(weight, cval, axes=1)
+            err  = np.maximum(cval.max(axis=0) - val, val - cval.min(axis=0))
+            if k not in UNSCALED:
+                val *= D2
+                err *= D2
+            values[k] = val
+            errors[k] = err
+        return values, errors
@@ -6,6 +6,7 @@ __status__ = "Development"
 
 
 from .manager import ProjectManager  # isort:skip
+from .sweep import run_start_date_sweep  # isort:skip
 from ._version import get_versions
 
 __version__ = get_versions()["version"]
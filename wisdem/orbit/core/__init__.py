@@ -9,4 +9,5 @@ __email__ = "jake.nunemaker@nrel.gov"
 from .port import Port
 from .cargo import Cargo
 from .vessel import Vessel
+from .environment import Environment
 from .components import Crane, JackingSys
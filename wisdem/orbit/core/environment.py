@@ -0,0 +1,189 @@
+"""Provides the `Environment` class."""
+
+__author__ = "Jake Nunemaker"
+__copyright__ = "Copyright 2020, National Renewable Energy Laboratory"
+__maintainer__ = "Jake Nunemaker"
+__email__ = "jake.nunemaker@nrel.gov"
+
+
+from math import ceil
+
+import numpy as np
+import marmot
+from marmot._exceptions import StateExhausted, WindowNotFound
+
+
+class Environment(marmot.Environment):
+    """
+    `marmot.Environment` that precomputes weather window indices.
+
+    The base environment applies the task constraints to the remaining
+    weather profile and searches it for a valid window every time a task is
+    started. Installation phases submit thousands of tasks against only a few
+    distinct constraint sets (eg. vessel transit and operational limits), so
+    the constraints are instead applied once to the full weather profile and
+    the resulting indices are used to answer delay queries directly.
+    """
+
+    @property
+    def state(self):
+        """
+        Returns forecast of `self.state`, starting at `ceil(self.now)`.
+        """
+
+        return self._state[ceil(self.now) :]
+
+    @state.setter
+    def state(self, data):
+        """
+        Sets the state data for the environment and resets the window
+        indices.
+
+        Parameters
+        ----------
+        data : np.ndarray | None
+        """
+
+        marmot.Environment.state.fset(self, data)
+        self._constraint_index = {}
+        self._window_index = {}
+
+    def find_operational_window(self, n, constraints):
+        """
+        Finds the first window of length `n` that satisfies `constraints`.
+        See `marmot.Environment.find_operational_window`.
+
+        Parameters
+        ----------
+        n : int
+            Length of required operational window.
+        constraints : dict
+            Dictionary of `Constraints` applied to `self.env.state` columns.
+
+        Returns
+        -------
+        delay : int
+            Duration of delay until operational window begins.
+        """
+
+        if not self.state.size > 0:
+            return 0
+
+        valid = self._find_valid_constraints(**constraints)
+        key = self._constraint_key(valid)
+        start = ceil(self.now)
+
+        window = self._window_index.get((key, n), None)
+        if window is None:
+            run = self._get_constraint_index(key, valid)["run"]
+            size = run.size
+            candidates = np.where(run >= n, np.arange(size), size)
+            window = np.minimum.accumulate(candidates[::-1])[::-1]
+            self._window_index[(key, n)] = window
+
+        if window[start] >= window.size:
+            raise WindowNotFound(n, **valid)
+
+        return int(window[start] - start)
+
+    def calculate_operational_delays(self, n, constraints):
+        """
+        Calculates the accumulated operational delay associated with an
+        operation of length `n` that can be suspended when `constraints` are
+        violated. See `marmot.Environment.calculate_operational_delays`.
+
+        Parameters
+        ----------
+        n : int | float
+            Operation length.
+        constraints : dict
+            Dictionary of `Constraints` applied to `self.env.state` columns.
+
+        Returns
+        -------
+        durations : list
+            List of delays and operation times.
+        """
+
+        if not self.state.size > 0:
+            return [n]
+
+        valid = self._find_valid_constraints(**constraints)
+        index = self._get_constraint_index(self._constraint_key(valid), valid)
+        count = index["count"]
+        start = ceil(self.now)
+
+        # First step where the required number of valid steps is reached
+        target = count[start] + max(ceil(n), 1)
+        end = np.searchsorted(count, target)
+        if end >= count.size:
+            raise StateExhausted(len(self._state), **valid)
+
+        changes = index["changes"]
+        bounds = changes[
+            np.searchsorted(changes, start, side="right") : np.searchsorted(
+                changes, end, side="left"
+            )
+        ]
+        edges = [start, *bounds.tolist(), end]
+        durations = [b - a for a, b in zip(edges[:-1], edges[1:])]
+
+        # The final valid group only needs the remaining operation time
+        durations[-1] = n - int(count[edges[-2]] - count[start])
+
+        return durations
+
+    @staticmethod
+    def _constraint_key(constraints):
+        """
+        Returns a hashable representation of `constraints`.
+
+        Parameters
+        ----------
+        constraints : dict
+            Dictionary of `self.state` column names and `Constraints`.
+        """
+
+        return tuple(
+            sorted(
+                (k, type(v).__name__, repr(v)) for k, v in constraints.items()
+            )
+        )
+
+    def _get_constraint_index(self, key, constraints):
+        """
+        Returns the window index of `constraints` over the full weather
+        profile, computing it if required.
+
+        The index contains:
+        - 'run': number of consecutive valid steps starting at each step.
+        - 'count': cumulative number of valid steps before each step.
+        - 'changes': steps where the validity changes.
+
+        Parameters
+        ----------
+        key : tuple
+            Output of `self._constraint_key(constraints)`.
+        constraints : dict
+            Dictionary of `self.state` column names and `Constraints`.
+        """
+
+        index = self._constraint_index.get(key, None)
+        if index is not None:
+            return index
+
+        arr = self._apply_constraints(self._state, constraints)
+        size = arr.size
+        steps = np.arange(size)
+
+        invalid = np.where(arr, size, steps)
+        next_invalid = np.minimum.accumulate(invalid[::-1])[::-1]
+
+        index = {
+            "run": next_invalid - steps,
+            "count": np.concatenate(([0], np.cumsum(arr))),
+            "changes": np.flatnonzero(arr[1:] != arr[:-1]) + 1,
+        }
+        self._constraint_index[key] = index
+
+        return index
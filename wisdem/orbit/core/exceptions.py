@@ -238,16 +238,23 @@ class WeatherProfileError(Exception):
         ----------
         start : datetime
             Starting index for output weather profile.
-        weather : DataFrame
+        weather : DataFrame | np.ndarray
             Master weather profile.
         """
 
         self.start = start
         self.weather = weather
+
+        try:
+            index = self.weather.index
+
+        except AttributeError:
+            index = self.weather[self.weather.dtype.names[0]]
+
         self.message = (
             f"Timestep '{self.start}' not contained within input weather:\n"
-            f"\tStart: '{self.weather.index[0]}'\n"
-            f"\tEnd: '{self.weather.index[-1]}'"
+            f"\tStart: '{index[0]}'\n"
+            f"\tEnd: '{index[-1]}'"
         )
 
     def __str__(self):
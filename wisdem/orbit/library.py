@@ -33,6 +33,8 @@ __email__ = "robert.hammond@nrel.gov"
 import os
 import re
 import csv
+import copy
+import hashlib
 import warnings
 
 import yaml
@@ -44,6 +46,10 @@ from wisdem.orbit.core.exceptions import LibraryItemNotFoundError
 ROOT = os.path.abspath(os.path.join(os.path.abspath(__file__), "../.."))
 default_library = os.path.join(ROOT, "library")
 
+# Parsed library items, keyed by resolved filepath and stored alongside the
+# (mtime, size) stamp of the file at the time it was parsed
+_LIBRARY_CACHE = {}
+
 # Need a custom loader to read in scientific notation correctly
 loader = yaml.SafeLoader
 loader.add_implicit_resolver(
@@ -94,6 +100,28 @@ def initialize_library(library_path):
     print(f"ORBIT library intialized at '{library_path}'")
 
 
+def initialize_cache(cache_path):
+    """
+    Creates an environment variable named "DATA_LIBRARY_CACHE" pointing to a
+    directory where parsed CSV library items (weather profiles, cable tables,
+    etc.) are pickled, allowing them to be reused across Python sessions.
+
+    Parameters
+    ----------
+    cache_path : str
+        Absolute path to the cache directory. Created if it doesn't exist.
+    """
+
+    os.makedirs(cache_path, exist_ok=True)
+    os.environ["DATA_LIBRARY_CACHE"] = cache_path
+
+
+def clear_library_cache():
+    """Clears the in-process cache of parsed library items."""
+
+    _LIBRARY_CACHE.clear()
+
+
 def extract_library_data(config, additional_keys=[]):
     """
     Extracts the configuration data from the specified library.
@@ -174,17 +202,61 @@ def extract_library_specs(key, filename, file_type="yaml"):
 def _extract_file(filepath):
     """
     Extracts file from valid filepath. Currently only supports "yaml" or "csv".
+    Parsed files are cached in-process and invalidated when the modification
+    time or size of the file changes. A copy of the cached data is returned
+    so that callers are free to modify it.
+
+    Parameters
+    ----------
+    filepath : str
+        Valid filepath of library item.
+    """
+
+    path = os.path.realpath(filepath)
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _LIBRARY_CACHE.get(path, None)
+    if cached is not None and cached[0] == stamp:
+        data = cached[1]
+
+    else:
+        data = _read_file(path, stamp)
+        _LIBRARY_CACHE[path] = (stamp, data)
+
+    if isinstance(data, pd.DataFrame):
+        return data.copy()
+
+    return copy.deepcopy(data)
+
+
+def _read_file(filepath, stamp):
+    """
+    Parses a library file. CSV files are additionally stored in, and read
+    from, the on-disk cache if "DATA_LIBRARY_CACHE" is defined.
 
     Parameters
     ----------
     filepath : str
         Valid filepath of library item.
+    stamp : tuple
+        (mtime, size) of `filepath`, used to validate the on-disk cache.
     """
 
     if filepath.endswith("yaml"):
-        return yaml.load(open(filepath, "r"), Loader=loader)
+        with open(filepath, "r") as f:
+            return yaml.load(f, Loader=loader)
 
     elif filepath.endswith("csv"):
+        cache_dir = os.environ.get("DATA_LIBRARY_CACHE", None)
+        if cache_dir is not None:
+            key = f"{filepath}:{stamp[0]}:{stamp[1]}".encode("utf-8")
+            pkl = os.path.join(
+                cache_dir, hashlib.sha1(key).hexdigest() + ".pkl"
+            )
+            if os.path.isfile(pkl):
+                return pd.read_pickle(pkl)
+
         df = pd.read_csv(filepath, index_col=False)
 
         # Drop empty rows and columns
@@ -193,6 +265,10 @@ def _extract_file(filepath):
 
         # Enforce strictly lowercase and "_" separated column names
         df.columns = [el.replace(" ", "_").lower() for el in df.columns]
+
+        if cache_dir is not None:
+            df.to_pickle(pkl)
+
         return df
 
     else:
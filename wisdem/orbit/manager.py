@@ -12,6 +12,7 @@ from math import ceil
 from numbers import Number
 from itertools import product
 
+import numpy as np
 import pandas as pd
 
 from wisdem.orbit import library
@@ -60,7 +61,9 @@ class ProjectManager:
         ScourProtectionInstallation,
     ]
 
-    def __init__(self, config, library_path=None, weather=None):
+    def __init__(
+        self, config, library_path=None, weather=None, columnar_logs=False
+    ):
         """
         Creates and instance of ProjectManager.
 
@@ -70,8 +73,19 @@ class ProjectManager:
             Project configuration.
         library_path: str, default: None
             The absolute path to the project library.
-        weather : np.ndarray
-            Site weather timeseries.
+        weather : pd.DataFrame | np.ndarray
+            Site weather timeseries. Record arrays, eg. produced by
+            `pd.DataFrame.to_records()`, are used without copying and must
+            have the timestamps as their first field.
+        columnar_logs : bool, default: False
+            If True, the logs of each phase are collected into a DataFrame
+            instead of copied per log and `project_logs`/`project_actions`
+            are returned as DataFrames. The phases still write one dict per
+            log, so the DataFrame is built from these records once per
+            phase; this removes the per-log copy and time offset loops but
+            not the per-log cost of writing them. It is about 5% of
+            `run_project` for the ORBIT-WISDEM fixed bottom project (3409
+            logs), see the 'orbit.ProjectManager.columnar_logs' benchmark.
         """
 
         initialize_library(library_path)
@@ -86,6 +100,7 @@ class ProjectManager:
         self.config = self.resolve_project_capacity(config)
 
         self.weather = weather
+        self.columnar_logs = columnar_logs
         self.phase_times = {}
         self.phase_costs = {}
         self._output_logs = []
@@ -379,8 +394,9 @@ class ProjectManager:
             Total phase time.
         cost : int | float
             Total phase cost.
-        logs : list
-            List of phase logs.
+        logs : list | pd.DataFrame
+            List of phase logs or DataFrame of phase logs if
+            `self.columnar_logs` is True.
         """
 
         _catch = kwargs.get("catch_exceptions", False)
@@ -411,7 +427,13 @@ class ProjectManager:
 
         time = phase.total_phase_time
         cost = phase.total_phase_cost
-        logs = deepcopy(phase.env.logs)
+
+        if self.columnar_logs:
+            # Records are written by the agents as dicts, see `columnar_logs`
+            logs = pd.DataFrame.from_records(phase.env.logs)
+
+        else:
+            logs = deepcopy(phase.env.logs)
 
         self.phase_costs[name] = cost
         self.phase_times[name] = time
@@ -510,25 +532,22 @@ class ProjectManager:
         _start = 0
 
         for name in phase_list:
-            if self.weather is not None:
+            if isinstance(self.weather, np.ndarray):
+                weather = self.weather[ceil(_start) :]
+
+            elif self.weather is not None:
                 weather = self.weather.iloc[ceil(_start) :].copy().to_records()
 
             else:
                 weather = None
 
-            time, cost, logs = self.run_install_phase(name, weather, **kwargs)
+            cost, time, logs = self.run_install_phase(name, weather, **kwargs)
 
             if logs is None:
                 continue
 
             else:
-                for l in logs:
-                    try:
-                        l["time"] += _start
-                    except KeyError:
-                        pass
-
-                self._output_logs.extend(logs)
+                self.append_logs(logs, _start)
                 _start = ceil(_start + time)
 
     def run_multiple_phases_overlapping(self, phase_dict, **kwargs):
@@ -556,19 +575,39 @@ class ProjectManager:
             else:
                 weather = None
 
-            time, cost, logs = self.run_install_phase(name, weather, **kwargs)
+            cost, time, logs = self.run_install_phase(name, weather, **kwargs)
 
             if logs is None:
                 continue
 
             else:
-                for l in logs:
-                    try:
-                        l["time"] += (start - _zero).days * 24
-                    except KeyError:
-                        pass
+                self.append_logs(logs, (start - _zero).days * 24)
+
+    def append_logs(self, logs, offset):
+        """
+        Shifts the times of phase `logs` by `offset` and appends them to the
+        project logs.
 
-                self._output_logs.extend(logs)
+        Parameters
+        ----------
+        logs : list | pd.DataFrame
+            Phase logs returned by `self.run_install_phase`.
+        offset : int | float
+            Phase start time relative to the start of the project (h).
+        """
+
+        if isinstance(logs, pd.DataFrame):
+            logs["time"] += offset
+            self._output_logs.append(logs)
+
+        else:
+            for l in logs:
+                try:
+                    l["time"] += offset
+                except KeyError:
+                    pass
+
+            self._output_logs.extend(logs)
 
     def get_weather_profile(self, start):
         """
@@ -586,6 +625,16 @@ class ProjectManager:
             Weather profile with first index at 'start'.
         """
 
+        if isinstance(self.weather, np.ndarray):
+            dates = self.weather[self.weather.dtype.names[0]]
+            i = np.searchsorted(dates, np.datetime64(start))
+            profile = self.weather[i:]
+
+            if not profile.size:
+                raise WeatherProfileError(start, self.weather)
+
+            return profile
+
         if not isinstance(self.weather.index, pd.DatetimeIndex):
             self.weather.index = pd.to_datetime(self.weather.index)
 
@@ -610,20 +659,36 @@ class ProjectManager:
 
     @property
     def project_logs(self):
-        """Returns list of all logs in the project."""
+        """
+        Returns list of all logs in the project, or a DataFrame if
+        `self.columnar_logs` is True.
+        """
 
         if not self._output_logs:
             raise Exception("Project hasn't been ran yet.")
 
+        if self.columnar_logs:
+            return pd.concat(self._output_logs, ignore_index=True)
+
         return self._output_logs
 
     @property
     def project_actions(self):
-        """Returns list of all actions in the project."""
+        """
+        Returns list of all actions in the project sorted by time, or a
+        DataFrame if `self.columnar_logs` is True.
+        """
 
         if not self._output_logs:
             raise Exception("Project hasn't been ran yet.")
 
+        if self.columnar_logs:
+            logs = self.project_logs
+            actions = logs.loc[logs["level"] == "ACTION"]
+            return actions.sort_values("time", kind="mergesort").reset_index(
+                drop=True
+            )
+
         actions = [l for l in self._output_logs if l["level"] == "ACTION"]
         return sorted(actions, key=lambda l: l["time"])
 
@@ -18,6 +18,115 @@ from wisdem.orbit.library import export_library_specs, extract_library_specs
 from wisdem.orbit.phases.design._cables import Plant, CableSystem
 
 
+# WGS-84 ellipsoid parameters
+WGS84_A = 6378137.0
+WGS84_F = 1 / 298.257223563
+
+
+def geodesic_distance(lat1, lon1, lat2, lon2, tol=1e-12, max_iter=200):
+    """
+    Computes the geodesic distance on the WGS-84 ellipsoid between arrays of
+    points using Vincenty's inverse formula. Any pairs that don't converge
+    (nearly antipodal points) are computed with `geopy.distance.geodesic`.
+
+    Parameters
+    ----------
+    lat1, lon1, lat2, lon2 : np.ndarray
+        Latitude and longitude of the start and end points, in degrees.
+        Pairs containing a NaN coordinate result in a NaN distance.
+    tol : float
+        Convergence tolerance on the difference in longitude on the
+        auxiliary sphere, in radians.
+    max_iter : int
+        Maximum number of iterations.
+
+    Returns
+    -------
+    np.ndarray
+        Distances, in km.
+    """
+
+    lat1, lon1, lat2, lon2 = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (lat1, lon1, lat2, lon2))
+    )
+
+    a = WGS84_A
+    f = WGS84_F
+    b = (1 - f) * a
+
+    L = np.radians(lon2 - lon1)
+    U1 = np.arctan((1 - f) * np.tan(np.radians(lat1)))
+    U2 = np.arctan((1 - f) * np.tan(np.radians(lat2)))
+    sinU1, cosU1 = np.sin(U1), np.cos(U1)
+    sinU2, cosU2 = np.sin(U2), np.cos(U2)
+
+    lam = L.copy()
+    active = np.isfinite(L) & np.isfinite(U1) & np.isfinite(U2)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for _ in range(max_iter):
+            sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+            sin_sigma = np.hypot(
+                cosU2 * sin_lam, cosU1 * sinU2 - sinU1 * cosU2 * cos_lam
+            )
+            cos_sigma = sinU1 * sinU2 + cosU1 * cosU2 * cos_lam
+            sigma = np.arctan2(sin_sigma, cos_sigma)
+
+            sin_alpha = np.where(
+                sin_sigma == 0, 0.0, cosU1 * cosU2 * sin_lam / sin_sigma
+            )
+            cos2_alpha = 1 - sin_alpha ** 2
+            cos_2sigma_m = np.where(
+                cos2_alpha == 0,
+                0.0,
+                cos_sigma - 2 * sinU1 * sinU2 / cos2_alpha,
+            )
+
+            C = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
+            lam_prev = lam
+            lam = L + (1 - C) * f * sin_alpha * (
+                sigma
+                + C
+                * sin_sigma
+                * (
+                    cos_2sigma_m
+                    + C * cos_sigma * (-1 + 2 * cos_2sigma_m ** 2)
+                )
+            )
+
+            active &= np.abs(lam - lam_prev) > tol
+            if not active.any():
+                break
+
+        u2 = cos2_alpha * (a ** 2 - b ** 2) / b ** 2
+        A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+        B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+        delta_sigma = (
+            B
+            * sin_sigma
+            * (
+                cos_2sigma_m
+                + B
+                / 4
+                * (
+                    cos_sigma * (-1 + 2 * cos_2sigma_m ** 2)
+                    - B
+                    / 6
+                    * cos_2sigma_m
+                    * (-3 + 4 * sin_sigma ** 2)
+                    * (-3 + 4 * cos_2sigma_m ** 2)
+                )
+            )
+        )
+        d = b * A * (sigma - delta_sigma) / 1000.0
+
+    for ix in zip(*np.nonzero(active)):
+        d[ix] = distance.geodesic(
+            (lat1[ix], lon1[ix]), (lat2[ix], lon2[ix]), ellipsoid="WGS-84"
+        ).km
+
+    return d
+
+
 class ArraySystemDesign(CableSystem):
     """
     The design phase for an array cabling system.
@@ -771,14 +880,16 @@ class CustomArraySystemDesign(ArraySystemDesign):
     def _check_optional_input(self):
         """
         Ensures that the optionally input parameters have valid data and were
-        all filled out.
+        all filled out for each section with a turbine.
         """
-        if np.any(self.sections_cable_lengths == 0):
+        sections = self.windfarm_x[:, 1:] != 0
+
+        if np.any(self.sections_cable_lengths[sections] == 0):
             self.sections_cable_lengths = np.zeros(
                 (self.num_strings, self.num_turbines_full_string), dtype=float
             )
 
-        if np.any(self.sections_bury_speeds == 0):
+        if np.any(self.sections_bury_speeds[sections] == 0):
             self.sections_bury_speeds = np.zeros(
                 (self.num_strings, self.num_turbines_full_string), dtype=float
             )
@@ -809,34 +920,22 @@ class CustomArraySystemDesign(ArraySystemDesign):
             (self.num_strings, self.num_turbines_full_string), dtype=float
         )
 
-        i = 0
-        for oss in self.windfarm.substation_id.unique():
-            layout = self.windfarm[self.windfarm.substation_id == oss]
-            string_id = np.sort(layout.string.unique())
-            string_id += 0 if i == 0 else i
-            self.windfarm_x[string_id, 0] = layout.substation_longitude.values[
-                0
-            ]
-            self.windfarm_y[string_id, 0] = layout.substation_latitude.values[
-                0
-            ]
+        # Offset the string numbers of each substation to be unique
+        strings = self.windfarm.groupby("substation_id", sort=False).string
+        n_strings = strings.max() + 1
+        offsets = n_strings.cumsum() - n_strings
+        string = (
+            self.windfarm.string.values
+            + offsets.loc[self.windfarm.substation_id].values
+        )
+        order = self.windfarm.order.values
 
-            for string in string_id:
-                data = layout[layout.string == string - i]
-                order = data["order"].values
-                self.windfarm_x[
-                    string, order + 1
-                ] = data.turbine_longitude.values[order]
-                self.windfarm_y[
-                    string, order + 1
-                ] = data.turbine_latitude.values[order]
-                self.sections_cable_lengths[
-                    string, order - 1
-                ] = data.cable_length.values[order - 1]
-                self.sections_bury_speeds[
-                    string, order - 1
-                ] = data.bury_speed.values[order - 1]
-            i += string + 1
+        self.windfarm_x[string, 0] = self.windfarm.substation_longitude.values
+        self.windfarm_y[string, 0] = self.windfarm.substation_latitude.values
+        self.windfarm_x[string, order + 1] = self.windfarm.turbine_longitude
+        self.windfarm_y[string, order + 1] = self.windfarm.turbine_latitude
+        self.sections_cable_lengths[string, order] = self.windfarm.cable_length
+        self.sections_bury_speeds[string, order] = self.windfarm.bury_speed
 
         self._check_optional_input()
 
@@ -848,18 +947,12 @@ class CustomArraySystemDesign(ArraySystemDesign):
         self.coordinates = np.dstack((self.windfarm_x, self.windfarm_y))
 
         # Create the distances between each subsequent turbine in a string
-        self.sections_distance = np.zeros(
-            (self.num_strings, self.num_turbines_full_string), dtype=float
+        self.sections_distance = geodesic_distance(
+            self.windfarm_y[:, :-1],
+            self.windfarm_x[:, :-1],
+            self.windfarm_y[:, 1:],
+            self.windfarm_x[:, 1:],
         )
-        for i in range(self.coordinates.shape[0]):
-            for j in range(self.coordinates.shape[1] - 1):
-                c1 = self.coordinates[i, j][::-1]
-                c2 = self.coordinates[i, j + 1][::-1]
-                if np.isnan(c1).sum() > 0 or np.isnan(c2).sum() > 0:
-                    d = None
-                else:
-                    d = distance.geodesic(c1, c2, ellipsoid="WGS-84").km
-                self.sections_distance[i, j] = d
         self.sections_distance = np.round_(self.sections_distance, 10)
 
     def run(self):
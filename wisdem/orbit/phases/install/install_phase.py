@@ -11,9 +11,8 @@ from itertools import groupby
 
 import numpy as np
 import simpy
-from marmot import Environment
 
-from wisdem.orbit.core import Port
+from wisdem.orbit.core import Port, Environment
 from wisdem.orbit.phases import BasePhase
 
 
@@ -35,7 +34,7 @@ class InstallPhase(BasePhase):
 
     def initialize_environment(self, weather, **kwargs):
         """
-        Initializes a `marmot.Environment` at `self.env`.
+        Initializes a `wisdem.orbit.core.Environment` at `self.env`.
 
         Parameters
         ----------
@@ -0,0 +1,174 @@
+"""Parallel start date and weather year sweeps of `ProjectManager`."""
+
+__author__ = ["Jake Nunemaker"]
+__copyright__ = "Copyright 2020, National Renewable Energy Laboratory"
+__maintainer__ = "Jake Nunemaker"
+__email__ = ["jake.nunemaker@nrel.gov"]
+
+
+import datetime as dt
+import multiprocessing as mp
+from copy import deepcopy
+
+import numpy as np
+import pandas as pd
+
+from wisdem.orbit.manager import ProjectManager
+from wisdem.orbit.library import initialize_library, extract_library_data
+from wisdem.orbit.core.exceptions import WeatherProfileError
+
+# Weather record array shared by all projects ran in the current process. Set
+# once per worker by `_initialize_worker` rather than pickled for every task.
+_WEATHER = None
+
+
+def run_start_date_sweep(
+    config, weather, start_dates, library_path=None, processes=None, **kwargs
+):
+    """
+    Runs `config` once for each date in `start_dates`, returning the phase
+    times and costs of each project in a tidy DataFrame. Each project is ran
+    in a process pool and the weather profile is converted to a read-only
+    record array once and shared across workers.
+
+    If `config['install_phases']` is a list, the phases are ran in serial
+    starting at each start date. If it is a dict of phase start dates, all
+    dates are shifted so that the earliest phase starts at each start date.
+
+    Parameters
+    ----------
+    config : dict
+        Project configuration.
+    weather : pd.DataFrame
+        Site weather timeseries with a datetime index.
+    start_dates : list
+        Project start dates. Items can be a `datetime` or a string in
+        `ProjectManager.date_format_short`.
+    library_path : str, default: None
+        The absolute path to the project library.
+    processes : int, default: None
+        Number of worker processes. Defaults to `os.cpu_count()`. If 1, the
+        projects are ran serially in the current process.
+    kwargs
+        Passed through to `ProjectManager.run_project`.
+
+    Returns
+    -------
+    results : pd.DataFrame
+        One row per project and phase with columns 'start_date', 'phase',
+        'phase_time', 'phase_cost', 'installation_time',
+        'installation_capex', 'bos_capex' and 'total_capex'.
+    """
+
+    initialize_library(library_path)
+    config = extract_library_data(
+        deepcopy(config),
+        additional_keys=[
+            *config.get("design_phases", []),
+            *config.get("install_phases", []),
+        ],
+    )
+
+    if not isinstance(weather.index, pd.DatetimeIndex):
+        weather = weather.set_index(pd.to_datetime(weather.index))
+
+    records = weather.to_records()
+    records.flags.writeable = False
+
+    starts = [_parse_date(d) for d in start_dates]
+    tasks = [(config, start, library_path, kwargs) for start in starts]
+
+    if processes == 1:
+        _initialize_worker(records)
+        rows = [_run_project(task) for task in tasks]
+
+    else:
+        with mp.Pool(
+            processes, initializer=_initialize_worker, initargs=(records,)
+        ) as pool:
+            rows = pool.map(_run_project, tasks)
+
+    return pd.DataFrame([r for project in rows for r in project])
+
+
+def _parse_date(date):
+    """Returns `date` as a `datetime`."""
+
+    if isinstance(date, str):
+        return dt.datetime.strptime(date, ProjectManager.date_format_short)
+
+    return pd.Timestamp(date).to_pydatetime()
+
+
+def _initialize_worker(weather):
+    """Stores the shared weather record array in the worker process."""
+
+    global _WEATHER
+    _WEATHER = weather
+
+
+def _run_project(task):
+    """
+    Runs a single project of the sweep against the shared weather profile.
+
+    Parameters
+    ----------
+    task : tuple
+        (config, start, library_path, kwargs)
+
+    Returns
+    -------
+    rows : list
+        List of per phase results.
+    """
+
+    config, start, library_path, kwargs = task
+    config = deepcopy(config)
+
+    install_phases = config.get("install_phases", [])
+    if isinstance(install_phases, dict):
+        fmt = ProjectManager.date_format_short
+        dates = {
+            k: dt.datetime.strptime(v, fmt) for k, v in install_phases.items()
+        }
+        offset = start - min(dates.values())
+        config["install_phases"] = {
+            k: (v + offset).strftime(fmt) for k, v in dates.items()
+        }
+        weather = _WEATHER
+
+    else:
+        dates = _WEATHER[_WEATHER.dtype.names[0]]
+        i = np.searchsorted(dates, np.datetime64(start))
+        weather = _WEATHER[i:]
+
+        if not weather.size:
+            raise WeatherProfileError(start, _WEATHER)
+
+    project = ProjectManager(
+        config,
+        library_path=library_path,
+        weather=weather,
+        columnar_logs=True,
+    )
+    project.run_project(**kwargs)
+
+    summary = {
+        "installation_time": project.installation_time,
+        "installation_capex": project.installation_capex,
+        "bos_capex": project.bos_capex,
+        "total_capex": project.total_capex,
+    }
+
+    rows = [
+        {
+            "start_date": start,
+            "phase": name,
+            "phase_time": time,
+            "phase_cost": project.phase_costs[name],
+            **summary,
+        }
+        for name, time in project.phase_times.items()
+    ]
+
+    return rows
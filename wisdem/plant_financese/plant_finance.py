@@ -1,6 +1,124 @@
 from openmdao.api import ExplicitComponent, Group, Problem
 import numpy as np
 
+from wisdem.commonse.utilities import condition_sparsity
+
+
+def plant_finance(machine_rating, tcc_per_kW, bos_per_kW, opex_per_kW, turbine_number, turbine_aep=0.0, park_aep=0.0,
+                  wake_loss_factor=0.15, fixed_charge_rate=0.075, availability=1.0, electricity_price=0.0,
+                  discount_rate=0.07, plant_life=20.0, derivatives=False):
+    """LCOE and net present value of many plants and financial scenarios at once.
+
+    All inputs are arrays (or scalars) that broadcast together, e.g. per site
+    quantities of shape (n_sites, 1) and per scenario quantities of shape
+    (1, n_scenarios).  As in PlantFinance, the plant AEP is park_aep where it is
+    non-zero, and turbine_number * turbine_aep * (1 - wake_loss_factor) elsewhere.
+
+    Parameters
+    ----------
+    machine_rating : array_like (kW)
+        rating of the turbine
+    tcc_per_kW, bos_per_kW : array_like (USD/kW)
+        turbine capital and balance of system costs
+    opex_per_kW : array_like (USD/kW/yr)
+        annual operational expenditures
+    turbine_number : array_like
+        number of turbines at the plant
+    turbine_aep, park_aep : array_like (kW*h)
+        annual energy production of one turbine and of the plant
+    wake_loss_factor : array_like
+        losses in turbine AEP due to waked conditions
+    fixed_charge_rate : array_like
+        fixed charge rate for the LCOE
+    availability : array_like
+        fraction of the plant AEP that is delivered
+    electricity_price : array_like (USD/kW/h)
+        price of the delivered energy, for the net present value
+    discount_rate : array_like
+        discount rate of the net present value
+    plant_life : array_like (yr)
+        years of operation of the net present value
+
+    Returns
+    -------
+    outputs : dict
+        lcoe (USD/kW/h), npv (USD), capex (USD), opex (USD/yr) and net_aep (kW*h),
+        all of the broadcast shape of the inputs
+    partials : dict, if derivatives
+        partials[output][input] of the same shape, for every input above
+    """
+    names = ['machine_rating', 'tcc_per_kW', 'bos_per_kW', 'opex_per_kW', 'turbine_number', 'turbine_aep', 'park_aep',
+             'wake_loss_factor', 'fixed_charge_rate', 'availability', 'electricity_price', 'discount_rate', 'plant_life']
+    args = np.broadcast_arrays(*[np.asarray(x, dtype=np.float_) for x in
+                                 [machine_rating, tcc_per_kW, bos_per_kW, opex_per_kW, turbine_number, turbine_aep, park_aep,
+                                  wake_loss_factor, fixed_charge_rate, availability, electricity_price, discount_rate, plant_life]])
+    rating, tcc, bos, opex, nturb, taep, paep, wlf, fcr, avail, price, rate, life = args
+    shape = rating.shape
+
+    # Run a few checks on the inputs
+    if np.any(nturb == 0):
+        raise ValueError('The number of the turbines in the plant is equal to 0 for some plants')
+    if np.any(np.logical_and(paep == 0.0, taep == 0.0)):
+        raise ValueError('AEP is not set properly. Both turbine_aep and park_aep are equal to 0 Wh for some plants')
+
+    # plant AEP, from the turbine AEP where it is not given
+    use_turb  = paep == 0.0
+    park      = np.where(use_turb, nturb*taep*(1.0 - wlf), paep)
+    dpark     = {'turbine_aep'      : np.where(use_turb, nturb*(1.0 - wlf), 0.0),
+                 'turbine_number'   : np.where(use_turb, taep*(1.0 - wlf), 0.0),
+                 'wake_loss_factor' : np.where(use_turb, -nturb*taep, 0.0),
+                 'park_aep'         : np.where(use_turb, 0.0, 1.0)}
+    net_aep   = park*avail
+
+    npr   = nturb*rating  # net park rating
+    icc   = tcc + bos     # USD/kW
+    capex = icc*npr
+    c_opex = opex*npr
+
+    # LCOE per COE report: (icc*fcr + opex) / net energy capture, with nec = net_aep / npr
+    lcoe = (icc*fcr + opex)*npr/net_aep
+
+    # net present value of constant annual cash flows
+    growth = (1.0 + rate)**(-life)
+    safe_rate = np.where(rate == 0.0, 1.0, rate)
+    annuity = np.where(rate == 0.0, life, (1.0 - growth)/safe_rate)
+    cash = price*net_aep - c_opex
+    npv = cash*annuity - capex
+
+    outputs = {'lcoe':lcoe, 'npv':npv, 'capex':capex, 'opex':c_opex, 'net_aep':net_aep}
+    if not derivatives:
+        return outputs
+
+    zero = np.zeros(shape)
+    dnet = {k:zero for k in names}
+    for k, v in dpark.items():
+        dnet[k] = v*avail
+    dnet['availability'] = park
+
+    dnpr = {k:zero for k in names}
+    dnpr['turbine_number'] = rating
+    dnpr['machine_rating'] = nturb
+
+    dicc = {k:zero for k in names}
+    dicc['tcc_per_kW'] = dicc['bos_per_kW'] = np.ones(shape)
+
+    dannuity = {k:zero for k in names}
+    dannuity['discount_rate'] = np.where(rate == 0.0, -0.5*life*(life + 1.0),
+                                         (life*growth/(1.0 + rate) - annuity)/safe_rate)
+    dannuity['plant_life'] = np.where(rate == 0.0, 1.0, growth*np.log(1.0 + rate)/safe_rate)
+
+    partials = {'lcoe':{}, 'npv':{}, 'capex':{}, 'opex':{}, 'net_aep':dnet}
+    for k in names:
+        dcopex = opex*dnpr[k] + (npr if k == 'opex_per_kW' else zero)
+        dnum   = (dicc[k]*fcr + (icc if k == 'fixed_charge_rate' else zero) + (1.0 if k == 'opex_per_kW' else 0.0))*npr + (icc*fcr + opex)*dnpr[k]
+        partials['lcoe'][k]  = (dnum - lcoe*dnet[k])/net_aep
+        partials['capex'][k] = dicc[k]*npr + icc*dnpr[k]
+        partials['opex'][k]  = dcopex
+        dcash = price*dnet[k] - dcopex + (net_aep if k == 'electricity_price' else zero)
+        partials['npv'][k]   = dcash*annuity + cash*dannuity[k] - partials['capex'][k]
+
+    return outputs, partials
+
 class PlantFinance(ExplicitComponent):
     def initialize(self):
         self.options.declare('verbosity',default=False)
@@ -127,6 +245,86 @@ class PlantFinance(ExplicitComponent):
 
 
 
+class PlantFinanceBatch(ExplicitComponent):
+    """LCOE and net present value, as PlantFinance, of n_sites plants (per site turbine count,
+    costs and AEP) under n_scenarios financial scenarios (fixed charge rate, wake losses,
+    availability, price and discount rate) in one evaluation.  Outputs have shape
+    (n_sites, n_scenarios)."""
+
+    def initialize(self):
+        self.options.declare('n_sites')
+        self.options.declare('n_scenarios')
+
+    def setup(self):
+        n_sites = self.options['n_sites']
+        n_scen  = self.options['n_scenarios']
+
+        # Turbine
+        self.add_input('machine_rating',    val=0.0, units='kW',        desc='Rating of the turbine')
+        self.add_input('tcc_per_kW' ,       val=0.0, units='USD/kW',    desc='A wind turbine capital cost')
+
+        # Sites
+        self.add_discrete_input('turbine_number', val=np.zeros(n_sites, dtype=np.int_), desc='Number of turbines at each plant')
+        self.add_input('bos_per_kW',        val=np.zeros(n_sites), units='USD/kW',    desc='Balance of system costs of the turbine at each site')
+        self.add_input('opex_per_kW',       val=np.zeros(n_sites), units='USD/kW/yr', desc='Average annual operational expenditures of the turbine at each site')
+        self.add_input('park_aep',          val=np.zeros(n_sites), units='kW*h',      desc='Annual Energy Production of the wind plant at each site')
+        self.add_input('turbine_aep',       val=np.zeros(n_sites), units='kW*h',      desc='Annual Energy Production of the wind turbine at each site')
+
+        # Scenarios
+        self.add_input('wake_loss_factor',  val=0.15*np.ones(n_scen),  desc='The losses in AEP due to waked conditions')
+        self.add_input('fixed_charge_rate', val=0.075*np.ones(n_scen), desc='Fixed charge rate for coe calculation')
+        self.add_input('availability',      val=np.ones(n_scen),       desc='Fraction of the plant AEP that is delivered')
+        self.add_input('electricity_price', val=np.zeros(n_scen), units='USD/kW/h', desc='Price of the delivered energy')
+        self.add_input('discount_rate',     val=0.07*np.ones(n_scen),  desc='Discount rate of the net present value')
+        self.add_input('plant_life',        val=20.0, units='yr',      desc='Years of operation of the plant')
+
+        #Outputs
+        self.add_output('lcoe',    val=np.zeros((n_sites, n_scen)), units='USD/kW/h', desc='Levelized cost of energy of each wind plant and scenario')
+        self.add_output('npv',     val=np.zeros((n_sites, n_scen)), units='USD',      desc='Net present value of each wind plant and scenario')
+        self.add_output('net_aep', val=np.zeros((n_sites, n_scen)), units='kW*h',     desc='Delivered annual energy of each wind plant and scenario')
+        self.add_output('capex',   val=np.zeros(n_sites), units='USD',    desc='Initial capital cost of each wind plant')
+        self.add_output('opex',    val=np.zeros(n_sites), units='USD/yr', desc='Annual operational expenditures of each wind plant')
+
+        # Each entry [i,j] depends on site i, scenario j and the turbine only
+        self.dependencies = {'machine_rating':'scalar', 'tcc_per_kW':'scalar', 'plant_life':'scalar',
+                             'bos_per_kW':'condition', 'opex_per_kW':'condition', 'park_aep':'condition', 'turbine_aep':'condition',
+                             'wake_loss_factor':'point', 'fixed_charge_rate':'point', 'availability':'point',
+                             'electricity_price':'point', 'discount_rate':'point'}
+        for wrt, kind in self.dependencies.items():
+            rows, cols = condition_sparsity(n_sites, n_scen, kind)
+            for var in ['lcoe', 'npv', 'net_aep']:
+                self.declare_partials(var, wrt, rows=rows, cols=cols)
+        for wrt in ['machine_rating', 'tcc_per_kW', 'bos_per_kW', 'opex_per_kW']:
+            cols = np.zeros(n_sites, dtype=np.int_) if wrt in ['machine_rating', 'tcc_per_kW'] else np.arange(n_sites)
+            self.declare_partials('capex', wrt, rows=np.arange(n_sites), cols=cols)
+            if wrt != 'tcc_per_kW':
+                self.declare_partials('opex', wrt, rows=np.arange(n_sites), cols=cols)
+
+    def compute(self, inputs, outputs, discrete_inputs, discrete_outputs):
+        site = lambda x : x[:, np.newaxis]
+        out, self.partials = plant_finance(inputs['machine_rating'], inputs['tcc_per_kW'], site(inputs['bos_per_kW']),
+                                           site(inputs['opex_per_kW']), site(discrete_inputs['turbine_number']),
+                                           turbine_aep=site(inputs['turbine_aep']), park_aep=site(inputs['park_aep']),
+                                           wake_loss_factor=inputs['wake_loss_factor'], fixed_charge_rate=inputs['fixed_charge_rate'],
+                                           availability=inputs['availability'], electricity_price=inputs['electricity_price'],
+                                           discount_rate=inputs['discount_rate'], plant_life=inputs['plant_life'],
+                                           derivatives=True)
+        outputs['lcoe']    = out['lcoe']
+        outputs['npv']     = out['npv']
+        outputs['net_aep'] = out['net_aep']
+        outputs['capex']   = out['capex'][:, 0]
+        outputs['opex']    = out['opex'][:, 0]
+
+    def compute_partials(self, inputs, J, discrete_inputs):
+        for wrt in self.dependencies:
+            for var in ['lcoe', 'npv', 'net_aep']:
+                J[var, wrt] = self.partials[var][wrt].ravel()
+        for wrt in ['machine_rating', 'tcc_per_kW', 'bos_per_kW', 'opex_per_kW']:
+            J['capex', wrt] = self.partials['capex'][wrt][:, 0]
+            if wrt != 'tcc_per_kW':
+                J['opex', wrt] = self.partials['opex'][wrt][:, 0]
+
+
     
 class Finance(Group):
     
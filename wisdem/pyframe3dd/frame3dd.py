@@ -202,7 +202,11 @@ class C_DynamicData(Structure):
                 ('lump', c_int),
                 ('tol', c_double),
                 ('shift', c_double),
-                ('exagg_modal', c_double)]
+                ('exagg_modal', c_double),
+                ('warm', c_int),
+                ('V0', c_double_p),
+                ('iter', c_int_p),
+                ('missed', c_int_p)]
 
 
 class C_ExtraInertia(Structure):
@@ -434,6 +438,14 @@ class Frame(object):
         self.tol = 1e-9          # mode shape tolerance
         self.shift = 0.0         # shift value ... for unrestrained structures
 
+        # subspace iteration starts from unit vectors by default (see enableWarmStart)
+        self.warmStart = False
+        self.modalStart = None
+        self.modalSubspace = None     # converged subspace of the last run, shape (6*nN, nM_calc)
+        self.modalIterations = 0      # subspace iterations of the last run
+        self.modalWarmStarted = False # whether the last run converged from the warm start
+        self.modalColdRestart = False # whether the last run fell back to a cold start
+
         # create list for load cases
         self.loadCases = []
 
@@ -526,6 +538,23 @@ class Frame(object):
         self.shift = shift
 
 
+    def enableWarmStart(self, V=None):
+        """Starts the subspace iteration of each run from the subspace of the previous one
+        instead of from unit vectors.  If the warm started solve fails or misses modes
+        (Sturm check), it is repeated from a cold start.
+
+        Parameters
+        ----------
+        V : ndarray, optional
+            starting subspace for the first run, e.g. the modalSubspace of a previous Frame
+            with the same nodes and number of modes.  Ignored if its shape does not match.
+
+        """
+
+        self.warmStart = True
+        self.modalStart = V
+
+
     def __addGravityToExtraMass(self):
 
         if self.addGravityLoadForExtraNodeMass:
@@ -650,10 +679,6 @@ class Frame(object):
     def run(self):
 
         nCases = len(self.loadCases)  # number of load cases
-        nN = len(self.nodes.node)  # number of nodes
-        nE = len(self.elements.element)  # number of elements
-        nR = len(self.reactions.node)  # number of reactions
-        nM = self.nM  # number of modes
 
         if nCases == 0:
             print('error: must have at least 1 load case')
@@ -661,6 +686,85 @@ class Frame(object):
 
         self.__addGravityToExtraMass()
 
+        results, c_args = self.__allocateResults()
+
+        return self.__solve(results, c_args)
+
+
+
+    def sweep(self, Ax, Asy, Asz, Jx, Iy, Iz, E=None, G=None, density=None):
+        """Runs the frame for many sets of element properties on the same nodes, reactions,
+        extra masses, and load cases.  The C structs and result buffers are allocated once and
+        the element property arrays are refilled in place for every candidate.
+
+        Parameters
+        ----------
+        Ax, Asy, Asz, Jx, Iy, Iz : ndarray
+            element section properties, shape (nCandidates, nE)
+        E, G, density : ndarray, optional
+            element material properties, broadcast to (nCandidates, nE).
+            If None the values the frame was constructed with are used.
+
+        Returns
+        -------
+        displacements, forces, reactions, mass, modal
+            as returned by run, with each array (and total_mass, struct_mass, and the modal
+            participation factors) stacked along a new leading candidate axis.
+            Internal forces along the elements are not returned.
+
+        """
+
+        nCases = len(self.loadCases)  # number of load cases
+
+        if nCases == 0:
+            print('error: must have at least 1 load case')
+            return
+
+        Ax = np.atleast_2d(Ax)
+        nCand = Ax.shape[0]
+        shape = (nCand, len(self.eelement))
+
+        sections = [(self.eAx, Ax), (self.eAsy, Asy), (self.eAsz, Asz), (self.eJx, Jx), (self.eIy, Iy), (self.eIz, Iz),
+                    (self.eE, E), (self.eG, G), (self.edensity, density)]
+        sections = [(buf, np.broadcast_to(val, shape)) for buf, val in sections if val is not None]
+        original = [np.copy(buf) for buf, val in sections]
+
+        self.__addGravityToExtraMass()
+
+        results, c_args = self.__allocateResults()
+        stacked = None
+
+        try:
+            for k in range(nCand):
+                # refill the arrays the C structs point to
+                for buf, val in sections:
+                    buf[:] = val[k]
+
+                out = self.__solve(results, c_args)
+                out = out[:3] + out[4:]  # skip internal forces
+
+                if stacked is None:
+                    stacked = [type(o)(*[np.zeros((nCand,) + np.shape(v), dtype=np.asarray(v).dtype) for v in o])
+                               for o in out]
+                for o, so in zip(out, stacked):
+                    for v, sv in zip(o, so):
+                        sv[k] = v
+
+        finally:
+            for (buf, val), orig in zip(sections, original):
+                buf[:] = orig
+
+        return tuple(stacked)
+
+
+
+    def __allocateResults(self):
+
+        nCases = len(self.loadCases)  # number of load cases
+        nN = len(self.nodes.node)  # number of nodes
+        nE = len(self.elements.element)  # number of elements
+        nR = len(self.reactions.node)  # number of reactions
+        nM = self.nM  # number of modes
 
         # initialize output arrays
 
@@ -765,19 +869,68 @@ class Frame(object):
 
         # set dynamics data
         exagg_modal = 1.0  # not used
-        c_dynamicData = C_DynamicData(self.nM, self.Mmethod, self.lump, self.tol, self.shift, exagg_modal)
+        nM_calc = min(nM+8, 2*nM)  # subspace dimension used by Frame3DD
+        V0 = np.zeros(6*nN*nM_calc)
+        iterations = c_int()
+        missed = c_int()
+        c_dynamicData = C_DynamicData(self.nM, self.Mmethod, self.lump, self.tol, self.shift, exagg_modal,
+                                      0, dp(V0), pointer(iterations), pointer(missed))
+
+        results = (dout, fout, rout, ifout, mout, modalout)
+        c_args = (c_loadcases, c_dynamicData, c_disp, c_forces, c_reactions, c_internalForces, c_massResults, c_modalResults,
+                  total_mass, struct_mass, freq, xmpf, ympf, zmpf, V0, iterations, missed)
 
-        exitCode = self._frame3dd.run(self.c_nodes, self.c_reactions, self.c_elements, self.c_other,
-                                      nCases, c_loadcases, c_dynamicData, self.c_extraInertia,
-                                      self.c_extraMass, self.c_condensation,
-                                      c_disp, c_forces, c_reactions, c_internalForces, c_massResults, c_modalResults)
+        return results, c_args
 
-        nantest = np.isnan( np.c_[fout.Nx, fout.Vy, fout.Vz, fout.Txx, fout.Myy, fout.Mzz] )
-        if (exitCode == 182 or exitCode == 183) and not np.any(nantest):
-            pass
-        elif exitCode != 0 or np.any(nantest):
+
+
+    def __solve(self, results, c_args):
+
+        nCases = len(self.loadCases)  # number of load cases
+        nM = self.nM  # number of modes
+        dout, fout, rout, ifout, mout, modalout = results
+        (c_loadcases, c_dynamicData, c_disp, c_forces, c_reactions, c_internalForces, c_massResults, c_modalResults,
+         total_mass, struct_mass, freq, xmpf, ympf, zmpf, V0, iterations, missed) = c_args
+
+        def solve():
+            exitCode = self._frame3dd.run(self.c_nodes, self.c_reactions, self.c_elements, self.c_other,
+                                          nCases, c_loadcases, c_dynamicData, self.c_extraInertia,
+                                          self.c_extraMass, self.c_condensation,
+                                          c_disp, c_forces, c_reactions, c_internalForces, c_massResults, c_modalResults)
+
+            nantest = np.isnan( np.c_[fout.Nx, fout.Vy, fout.Vz, fout.Txx, fout.Myy, fout.Mzz] )
+            return ((exitCode == 182 or exitCode == 183) or exitCode == 0) and not np.any(nantest)
+
+        # warm start from the previous subspace if it fits this frame
+        warm = (self.warmStart and nM > 0 and self.Mmethod == 1 and self.modalStart is not None and
+                np.size(self.modalStart) == V0.size)
+        if warm:
+            V = np.reshape(self.modalStart, (-1, V0.size//(6*len(self.nodes.node))))
+            # a null or non-finite start vector cannot span the modes
+            warm = bool(np.all(np.isfinite(V)) and np.all(np.any(V != 0.0, axis=0)))
+        if warm:
+            V0[:] = np.ravel(self.modalStart)
+        c_dynamicData.warm = int(warm)
+
+        ok = solve()
+        self.modalColdRestart = warm and (not ok or missed.value > 0)
+        if self.modalColdRestart:
+            iterations_warm = iterations.value
+            c_dynamicData.warm = 0
+            ok = solve()
+            iterations.value += iterations_warm
+
+        if not ok:
             raise RuntimeError('Frame3DD did not exit gracefully')
 
+        # keep the converged subspace
+        self.modalIterations = iterations.value
+        self.modalWarmStarted = warm and not self.modalColdRestart
+        if nM > 0:
+            self.modalSubspace = V0.reshape((6*len(self.nodes.node), -1)).copy()
+            if self.warmStart:
+                self.modalStart = self.modalSubspace
+
         # put mass values back in since tuple is read only
         mout = NodeMasses(total_mass.value, struct_mass.value, mout.node,
             mout.xmass, mout.ymass, mout.zmass,
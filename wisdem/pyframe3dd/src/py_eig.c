@@ -70,7 +70,8 @@ int subspace(
 	double tol, double shift,
 	int *iter,	/**< sub-space iterations		*/
 	int *ok,	/**< Sturm check result			*/
-	int verbose
+	int verbose,
+	int warm	/**< 1: start from the given V		*/
 ){
 	double	**Kb, **Mb, **Xb, **Qb, *d, *u, *v, km, km_old,
 		error=1.0, w_old = 0.0;
@@ -102,7 +103,8 @@ int subspace(
 	  Kb[i][j]=Kb[j][i] = Mb[i][j]=Mb[j][i] = Qb[i][j]=Qb[j][i] = 0.0;
 	}
 
-	for (i=1; i<=n; i++) for (j=1; j<=m; j++) Xb[i][j] = V[i][j] = 0.0;
+	for (i=1; i<=n; i++) for (j=1; j<=m; j++) Xb[i][j] = 0.0;
+	if ( !warm ) for (i=1; i<=n; i++) for (j=1; j<=m; j++) V[i][j] = 0.0;
 
 	modes = (int) ( (double)(0.5*m) > (double)(m-8.0) ? (int)(m/2.0) : m-8 );
 
@@ -144,7 +146,7 @@ int subspace(
 	}
 
 //	for (k=1; k<=m; k++) printf(" idx[%d] = %d \n", k, idx[k] ); /*debug*/
-	for (k=1; k<=m; k++) {
+	for (k=1; k<=m && !warm; k++) {	/* warm start: keep the given V */
 	  //printf("%d %d %d %d\n",n,m,k,idx[k]);
 		V[idx[k]][k] = 1.0;
 		*ok = idx[k] % 6; 
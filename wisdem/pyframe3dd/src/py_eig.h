@@ -45,7 +45,8 @@ int subspace(
 	double shift,		/**< frequency shift for unrestrained frames */
 	int *iter,		/**< number of sub-space iterations	*/
 	int *ok,		/**< Sturm check result			*/
-	int verbose		/**< 1: copious screen output, 0: none	*/
+	int verbose,		/**< 1: copious screen output, 0: none	*/
+	int warm		/**< 1: start from the given V, 0: from unit vectors */
 );
 
 
@@ -168,6 +168,7 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
     nM_calc,	// number of modes to calculate
     lump=1,		// 1: lumped, 0: consistent mass matrix
     iter=0,		// number of iterations	
+    warm=0,		// 1: sub-space iteration starts from the previous modes
     ok=1,		// number of (-ve) diag. terms of L D L'
     anim[128],	// the modes to be animated
     Cdof=0,		// number of condensed degrees o freedom
@@ -623,11 +624,23 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
     }
 
     if ( anlyz ) {	/* subspace or stodola methods */
+      warm = ( dynamic->V0 != NULL && dynamic->warm );
+      if ( warm )	/* previous sub-space as the starting vectors */
+	for (i=1; i<=DoF; i++) for (j=1; j<=nM_calc; j++) V[i][j] = dynamic->V0[(i-1)*nM_calc + j-1];
+
       if( Mmethod == 1 )
-	ExitCode += subspace( K, M, DoF, nM_calc, f, V, tol,shift,&iter,&ok, verbose );
+	ExitCode += subspace( K, M, DoF, nM_calc, f, V, tol,shift,&iter,&ok, verbose, warm );
       if( Mmethod == 2 )
 	ExitCode += stodola ( K, M, DoF, nM_calc, f, V, tol,shift,&iter,&ok, verbose );
 
+      if ( dynamic->V0 != NULL )	/* keep the sub-space for the next run */
+	for (i=1; i<=DoF; i++) for (j=1; j<=nM_calc; j++) dynamic->V0[(i-1)*nM_calc + j-1] = V[i][j];
+      if ( dynamic->iter != NULL )	*(dynamic->iter) = iter;
+      if ( dynamic->missed != NULL ) {	/* Sturm count minus the modes found below the same frequency */
+	*(dynamic->missed) = -ok;
+	for (j=1; j<=nM_calc; j++) if ( f[j] <= f[nM] + tol ) (*(dynamic->missed))--;
+      }
+
       for (j=1; j<=nM_calc; j++) f[j] = sqrt(f[j])/(2.0*PI);
 
       write_modal_results ( massResults, modalResults,
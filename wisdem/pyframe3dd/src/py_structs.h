@@ -122,6 +122,10 @@ typedef struct {
     int nM;
     int Mmethod, lump;
     double tol, shift, exagg_modal;
+    int warm;       // 1: start the sub-space iteration from V0
+    double *V0;     // DoF x nM_calc sub-space, row-major; start vectors in, converged vectors out (may be NULL)
+    int *iter;      // number of sub-space iterations (may be NULL)
+    int *missed;    // number of modes below the highest computed one that were not found (Sturm check, may be NULL)
 
 } DynamicData;
 
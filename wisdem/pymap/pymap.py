@@ -21,6 +21,7 @@
 from __future__ import print_function
 
 import sys
+import numpy as np
 from ctypes import *
 import os
 import six
@@ -449,6 +450,21 @@ class pyMAP(object):
         return arr 
 
 
+    def plot_xyz( self, lineNum, length ) :
+        # x, y and z of plot_x, plot_y and plot_z as one (length, 3) array
+        xyz = np.zeros((length, 3))
+        for k, plot_array in enumerate([libexec.map_plot_x_array, libexec.map_plot_y_array, libexec.map_plot_z_array]):
+            array = plot_array( self.f_type_d, lineNum, length, self.status, pointer(self.ierr) )
+            if self.ierr.value != 0 :
+                print(self.status.value)
+                self.end( )
+                libexec.map_plot_array_free( array )
+                sys.exit('MAP terminated premature.')
+            xyz[:,k] = np.ctypeslib.as_array(array, shape=(length,))
+            libexec.map_plot_array_free( array )
+        return xyz
+
+
     def get_fairlead_force_2d(self, index):
         """Gets the horizontal and vertical fairlead force in a 2D plane along the 
         straight-line line. Must ensure update_states() is called before accessing 
@@ -112,14 +112,17 @@ class blade_bom(object):
         
         self.material_dict  = material_dict
         
-    def extract_specs(self):
-
+    def material_specs(self):
+        # Properties of the PreComp materials (density, cost, waste, fiber fractions and ply thickness),
+        # flags of the core materials and ids of the materials used for coating, shell skins, web
+        # skins, spar caps and LE/TE reinforcements
         precomp_mat = {}
         
         core_mat_id      = np.zeros(len(self.materials))
-        coating_mat_id   = -1
-        le_reinf_mat_id  = -1
-        te_reinf_mat_id  = -1
+        mat_ids          = {}
+        mat_ids['coating']  = -1
+        mat_ids['le_reinf'] = -1
+        mat_ids['te_reinf'] = -1
 
         
         for i, mat in enumerate(self.materials):
@@ -148,36 +151,22 @@ class blade_bom(object):
                         precomp_mat[mat.name]['ply_t']  = self.material_dict[mat.name]['ply_t']
                 
                 if 0 in self.material_dict[mat.name]['component']:
-                    coating_mat_id = precomp_mat[mat.name]['id']        # Assigning the material to the coating
+                    mat_ids['coating']  = precomp_mat[mat.name]['id']   # Assigning the material to the coating
                 elif 1 in self.material_dict[mat.name]['component']:    
                     core_mat_id[precomp_mat[mat.name]['id'] - 1]  = 1   # Assigning the material to the core
                 elif 2 in self.material_dict[mat.name]['component']:    
-                    skin_mat_id    = precomp_mat[mat.name]['id']        # Assigning the material to the shell skin
+                    mat_ids['skin']     = precomp_mat[mat.name]['id']   # Assigning the material to the shell skin
                 elif 3 in self.material_dict[mat.name]['component']:    
-                    skinwebs_mat_id= precomp_mat[mat.name]['id']        # Assigning the material to the webs skin 
+                    mat_ids['skinwebs'] = precomp_mat[mat.name]['id']   # Assigning the material to the webs skin 
                 elif 4 in self.material_dict[mat.name]['component']:    
-                    sc_mat_id      = precomp_mat[mat.name]['id']        # Assigning the material to the spar caps
+                    mat_ids['sc']       = precomp_mat[mat.name]['id']   # Assigning the material to the spar caps
                 elif 5 in self.material_dict[mat.name]['component']:    
-                    le_reinf_mat_id= precomp_mat[mat.name]['id']        # Assigning the material to the te reinf  
-                    te_reinf_mat_id= precomp_mat[mat.name]['id']        # Assigning the material to the le reinf
+                    mat_ids['le_reinf'] = precomp_mat[mat.name]['id']   # Assigning the material to the te reinf  
+                    mat_ids['te_reinf'] = precomp_mat[mat.name]['id']   # Assigning the material to the le reinf
             
             except:
                 print('WARNING: The material ' + mat.name + ' does not have its properties fully defined. Please set them in the first lines of blade_bom.py in RotorSE')
         
-        
-        
-        # Width and thickness of the flanges
-        blade_specs                                        = {}
-        blade_specs['flange_width_inboard_LETE']           = 0.10         # [m] Width of the flanges of the outer surface until 70% of blade span
-        blade_specs['flange_span_reduce_LETE']             = 70           # [%] Spanwise position after which flanges are reduced in width
-        blade_specs['flange_width_tip_LETE']               = 0.01         # [m] Width of the flanges of the outer surface at blade tip
-        blade_specs['flange_width_webs_SW']                = 0.05         # [m] Width of the flanges of the webs
-        
-        
-        
-        # ###############################################################################################################################
-        # Code
-        
         mat_names = precomp_mat.keys()
 
         
@@ -205,6 +194,42 @@ class blade_bom(object):
                     print('Filler    :' + name)
                 density[precomp_mat[name]['id']-1] = precomp_mat[name]['density']
         
+        return precomp_mat, core_mat_id, mat_ids, t_layer, density
+    
+    def flange_specs(self):
+        # Width and thickness of the flanges
+        blade_specs                                        = {}
+        blade_specs['flange_width_inboard_LETE']           = 0.10         # [m] Width of the flanges of the outer surface until 70% of blade span
+        blade_specs['flange_span_reduce_LETE']             = 70           # [%] Spanwise position after which flanges are reduced in width
+        blade_specs['flange_width_tip_LETE']               = 0.01         # [m] Width of the flanges of the outer surface at blade tip
+        blade_specs['flange_width_webs_SW']                = 0.05         # [m] Width of the flanges of the webs
+        return blade_specs
+    
+    def dimension_specs(self, blade_specs, n_webs):
+        # Blade and mold dimensions
+        blade_specs['blade_length']             = self.bladeLength
+        blade_specs['root_D']                   = self.chord[0]
+        blade_specs['max_chord']                = max(self.chord)
+        blade_specs['root_preform_length']      = 0.01 * blade_specs['blade_length'] # Currently assumed as 1% of BL
+        blade_specs['n_webs']                   = n_webs
+        blade_specs['LE_length']                = blade_specs['blade_length']
+        blade_specs['TE_length']                = blade_specs['blade_length']
+        blade_specs['skin_perimeter_wo_root']   = 2. * blade_specs['blade_length']
+        blade_specs['skin_perimeter_w_root']    = blade_specs['skin_perimeter_wo_root'] + np.pi * blade_specs['root_D']
+        # Flanges extend to 70% of blade span at full width and they do taper down towards the tip
+        blade_specs['flange_area_LETE']         = blade_specs['skin_perimeter_wo_root'] * blade_specs['flange_span_reduce_LETE'] / 100 * blade_specs['flange_width_inboard_LETE'] + blade_specs['skin_perimeter_wo_root'] * (1 - blade_specs['flange_span_reduce_LETE'] / 100) * (blade_specs['flange_width_inboard_LETE'] - blade_specs['flange_width_tip_LETE'])/2
+        
+    def extract_specs(self):
+        
+        precomp_mat, core_mat_id, mat_ids, t_layer, density = self.material_specs()
+        skin_mat_id     = mat_ids['skin']
+        skinwebs_mat_id = mat_ids['skinwebs']
+        sc_mat_id       = mat_ids['sc']
+        le_reinf_mat_id = mat_ids['le_reinf']
+        te_reinf_mat_id = mat_ids['te_reinf']
+        mat_names       = precomp_mat.keys()
+        blade_specs     = self.flange_specs()
+        
         # Reconstruct number of plies from laminate thickness and single ply thickness
         composite_rounding = False
         # Upper mold
@@ -259,11 +284,7 @@ class blade_bom(object):
         
         
         
-        blade_specs['blade_length']             = self.bladeLength
-        blade_specs['root_D']                   = self.chord[0]
-        blade_specs['max_chord']                = max(self.chord)
-        blade_specs['root_preform_length']      = 0.01 * blade_specs['blade_length'] # Currently assumed as 1% of BL
-        blade_specs['n_webs']                   = n_webs
+        self.dimension_specs(blade_specs, n_webs)
         
         
         # Reconstruct total area of the mold and total area per ply
@@ -405,13 +426,7 @@ class blade_bom(object):
         
         
         
-        # Mold dimensions
-        blade_specs['LE_length']                    = blade_specs['blade_length']
-        blade_specs['TE_length']                    = blade_specs['blade_length']
-        blade_specs['skin_perimeter_wo_root']       = 2. * blade_specs['blade_length']
-        blade_specs['skin_perimeter_w_root']        = blade_specs['skin_perimeter_wo_root'] + np.pi * blade_specs['root_D']
-         # Flanges extend to 70% of blade span at full width and they do taper down towards the tip
-        blade_specs['flange_area_LETE']             = blade_specs['skin_perimeter_wo_root'] * blade_specs['flange_span_reduce_LETE'] / 100 * blade_specs['flange_width_inboard_LETE'] + blade_specs['skin_perimeter_wo_root'] * (1 - blade_specs['flange_span_reduce_LETE'] / 100) * (blade_specs['flange_width_inboard_LETE'] - blade_specs['flange_width_tip_LETE'])/2
+        # Mold
         blade_specs['area_lpskin_wo_flanges']       = np.trapz(edge_lpskin_wo_flanges, self.r)
         blade_specs['area_lpskin_w_flanges']        = blade_specs['area_lpskin_wo_flanges'] + blade_specs['flange_area_LETE']
         
@@ -662,7 +677,15 @@ class blade_bom(object):
         mass_per_comp               = np.trapz(unit_mass_mat, self.r)
         
         blade_specs['blade_mass']   = np.trapz(unit_mass_tot, self.r)
-
+        
+        self.material_totals(blade_specs, precomp_mat, core_mat_id, mass_per_comp)
+        
+        return blade_specs, precomp_mat
+    
+    def material_totals(self, blade_specs, precomp_mat, core_mat_id, mass_per_comp):
+        # Mass, volume, ply area and cost of each material and total mass of the matrix, from the
+        # mass of each material along the blade
+        mat_names = precomp_mat.keys()
         blade_specs['matrix_total_mass_wo_waste'] = 0.
         
         for name in mat_names:
@@ -700,9 +723,6 @@ class blade_bom(object):
                 print('cost no waste   %.2f $   \t \t ---  \t \t cost with waste   %.2f \n' % (precomp_mat[name]['total_cost_wo_waste'] , precomp_mat[name]['total_cost_w_waste']))
         
         
-        return blade_specs, precomp_mat
-        
-        
     def compute_matrix_bonding(self, blade_specs, precomp_mat):
         
         # Resin and hardener
@@ -1185,6 +1205,7 @@ class blade_labor_ct(object):
         # # Blade input parameters
         # # Material inputs
         self.materials                               = precomp_mat
+        self.shape                                   = np.shape(blade_specs['blade_mass'])   # Trailing dimensions of a batch of designs, () for a single blade
         # Root preform low pressure side
         self.root_parameters_lp = {}
         self.root_parameters_lp['blade_length']      = blade_specs['blade_length']              # Length of the blade [m]
@@ -1192,7 +1213,7 @@ class blade_labor_ct(object):
         self.root_parameters_lp['root_D']            = blade_specs['root_D']                    # Root PF diameter [m]
         self.root_parameters_lp['half_circum']       = 0.5*np.pi*blade_specs['root_D']          # 1/2 root circumference [m]
         self.root_parameters_lp['area']              = self.root_parameters_lp['half_circum'] * self.root_parameters_lp['length']    # Root PF area [m2]
-        self.root_parameters_lp['fabric2lay']        = round(blade_specs['n_plies_root_lp']/2)  # Number of root plies [-]
+        self.root_parameters_lp['fabric2lay']        = np.round(blade_specs['n_plies_root_lp']/2)  # Number of root plies [-]
         self.root_parameters_lp['ply_volume']        = blade_specs['volume_root_preform_lp']    # Ply volume [m3]    
         # Root preform high pressure side
         self.root_parameters_hp = {}
@@ -1201,7 +1222,7 @@ class blade_labor_ct(object):
         self.root_parameters_hp['root_D']            = self.root_parameters_lp['root_D']        # Root PF diameter [m]
         self.root_parameters_hp['half_circum']       = self.root_parameters_lp['half_circum']   # 1/2 root circumference [m]
         self.root_parameters_hp['area']              = self.root_parameters_lp['area']          # Root PF area [m2]
-        self.root_parameters_hp['fabric2lay']        = round(blade_specs['n_plies_root_hp']/2)  # Number of root plies [-]
+        self.root_parameters_hp['fabric2lay']        = np.round(blade_specs['n_plies_root_hp']/2)  # Number of root plies [-]
         self.root_parameters_hp['ply_volume']        = blade_specs['volume_root_preform_hp']    # Ply volume [m3]    
         # Shear webs
         self.n_webs                                  = blade_specs['n_webs']
@@ -1317,6 +1338,33 @@ class blade_labor_ct(object):
         self.shipping_prep['n_bolts']                = self.cut_drill['n_bolts']             # Number of root bolts
         
     
+    def gating_team_size(self, labor_ct, target_ct, verbosity):
+        # Sizes the team of a skin mold gating process so that its cycle time meets target_ct, and
+        # returns labor and cycle time for that team. labor_ct is compiled once into its team size
+        # model and the team size solved in closed form, falling back to a root search on labor_ct
+        # should the process not follow team_size_basis.
+        coeff = compile_team_size_model(labor_ct, self.shape)
+        if coeff is not None:
+            team_size = solve_team_size(coeff, target_ct)
+        else:
+            team_size = np.zeros(self.shape)
+            target_ct = np.broadcast_to(target_ct, self.shape)
+            for idx in np.ndindex(self.shape):
+                ct_error = lambda x: np.asarray(labor_ct(x)[1])[idx] - target_ct[idx]
+                try:
+                    team_size[idx] = brentq(ct_error, 0.01, 100., xtol=1e-4)
+                except:
+                    team_size[idx] = brentq(ct_error, 0.01, 250., xtol=1e-4)
+            team_size = team_size[()]
+        
+        if self.options['discrete']:
+            team_size = np.round(team_size)
+        
+        if verbosity or coeff is None:
+            return labor_ct(team_size, verbosity)
+        labor, ct = np.sum(np.moveaxis(team_size_basis(team_size), -1, 0)[:,None] * coeff, axis=0)
+        return labor, ct
+    
     def execute_blade_labor_ct(self):
         
        
@@ -1329,9 +1377,9 @@ class blade_labor_ct(object):
         
         
         n_operations                                 = 20 + self.n_webs
-        labor                                        = np.zeros(n_operations) # [hr]
-        skin_mold_gating_ct                          = np.zeros(n_operations) # [hr]
-        non_gating_ct                                = np.zeros(n_operations) # [hr]
+        labor                                        = np.zeros((n_operations,) + self.shape) # [hr]
+        skin_mold_gating_ct                          = np.zeros((n_operations,) + self.shape) # [hr]
+        non_gating_ct                                = np.zeros((n_operations,) + self.shape) # [hr]
         operation                                    = [[] for i in range(int(n_operations))]
         
         if verbosity:
@@ -1377,70 +1425,36 @@ class blade_labor_ct(object):
         
         # LP skin infusion
         operation[5 + self.n_webs]  = 'Lp skin'
-        def labor_ct_lp_skin(team_size):
+        def labor_ct_lp_skin(team_size, verbosity=0):
             lp_skin  = lphp_skin_labor(self.lp_skin_parameters, team_size)
             lp_skin.manufacturing_steps(core=True , Extra_Operations_Skin = True, trim_excess = False)
             labor, ct = compute_total_labor_ct(lp_skin, operation[5 + self.n_webs], verbosity, no_contribution2ct = ['layup_root_layers' , 'insert_TE_layers' , 'vacuum_line' , 'tack_tape'])
             
             return labor, ct
         
-        def min_ct_lp_skin(team_size):
-            _, ct = labor_ct_lp_skin(team_size)
-            return ct - (23.9999 - skin_mold_gating_ct[8 + self.n_webs]) * 0.7    
-
-        try:        
-            team_size = brentq(lambda x: min_ct_lp_skin(x), 0.01, 100., xtol=1e-4)
-        except:
-            team_size = brentq(lambda x: min_ct_lp_skin(x), 0.01, 250., xtol=1e-4)
-
-        if self.options['discrete']:
-            team_size = round(team_size)
-        labor[5 + self.n_webs] , skin_mold_gating_ct[5 + self.n_webs] = labor_ct_lp_skin(team_size)
+        labor[5 + self.n_webs] , skin_mold_gating_ct[5 + self.n_webs] = self.gating_team_size(labor_ct_lp_skin, (23.9999 - skin_mold_gating_ct[8 + self.n_webs]) * 0.7, verbosity)
         
         # HP skin infusion
         operation[6 + self.n_webs]  = 'Hp skin'
-        def labor_ct_hp_skin(team_size):
+        def labor_ct_hp_skin(team_size, verbosity=0):
             hp_skin  = lphp_skin_labor(self.hp_skin_parameters, team_size)
             hp_skin.manufacturing_steps(core=True , Extra_Operations_Skin = True, trim_excess = False)
             labor, ct = compute_total_labor_ct(hp_skin, operation[6 + self.n_webs], verbosity, no_contribution2ct = ['layup_root_layers' , 'insert_TE_layers' , 'vacuum_line' , 'tack_tape'])
             
             return labor, ct
         
-        def min_ct_hp_skin(team_size):
-            _, ct = labor_ct_hp_skin(team_size)
-            
-            return ct - (23.9999 - skin_mold_gating_ct[8 + self.n_webs]) * 0.7     
+        labor[6 + self.n_webs] , non_gating_ct[6 + self.n_webs] = self.gating_team_size(labor_ct_hp_skin, (23.9999 - skin_mold_gating_ct[8 + self.n_webs]) * 0.7, verbosity)
         
-        try:        
-            team_size = brentq(lambda x: min_ct_hp_skin(x), 0.01, 100., xtol=1e-4)
-        except:
-            team_size = brentq(lambda x: min_ct_hp_skin(x), 0.01, 250., xtol=1e-4)
-
-        if self.options['discrete']:
-            team_size = round(team_size)
-        labor[6 + self.n_webs] , non_gating_ct[6 + self.n_webs] = labor_ct_hp_skin(team_size)
-        
-        # HP skin infusion
+        # Assembly
         operation[7 + self.n_webs]  = 'Assembly'
-        def labor_ct_assembly(team_size):
+        def labor_ct_assembly(team_size, verbosity=0):
             assembly  = assembly_labor(self.assembly, team_size)
             assembly.assembly_steps()
             labor, ct = compute_total_labor_ct(assembly , operation[7 + self.n_webs], verbosity, no_contribution2ct = ['remove_nonsand_prep_hp' , 'insert_sw' , 'fillet_sw_low', 'shear_clips'])
             
             return labor, ct
         
-        def min_ct_assembly(team_size):
-            _, ct = labor_ct_assembly(team_size)
-                        
-            return ct - (23.9999 - skin_mold_gating_ct[5 + self.n_webs] - skin_mold_gating_ct[8 + self.n_webs])      
-        
-        try:        
-            team_size = brentq(lambda x: min_ct_assembly(x), 0.01, 100., xtol=1e-4)
-        except:
-            team_size = brentq(lambda x: min_ct_assembly(x), 0.01, 250., xtol=1e-4)
-        if self.options['discrete']:
-            team_size = round(team_size)
-        labor[7 + self.n_webs] , skin_mold_gating_ct[7 + self.n_webs] = labor_ct_assembly(team_size)
+        labor[7 + self.n_webs] , skin_mold_gating_ct[7 + self.n_webs] = self.gating_team_size(labor_ct_assembly, 23.9999 - skin_mold_gating_ct[5 + self.n_webs] - skin_mold_gating_ct[8 + self.n_webs], verbosity)
         
         operation[9 + self.n_webs]                                    = 'Trim'
         trim                                                          = trim_labor(self.trim)
@@ -2901,8 +2915,73 @@ def compute_labor_ct(n_workers, action, rate, time, flag):
     
     return labor, ct
 
-def compute_total_labor_ct(data_struct, name, verbose, no_contribution2ct = []):
+# Team sizes at which the skin and assembly processes are sampled to build their team size models
+TEAM_SIZE_SAMPLES = np.array([1., 2., 4., 8., 16., 32.])
+
+def team_size_basis(team_size):
+    # Labor and cycle time of every step of the skin and assembly processes are a combination of
+    # these terms: steps with a crew proportional to the team size have labor independent of it
+    # (flag 0) or proportional to it (flag 1), and cycle time in 1/n or constant. Debagging also
+    # has its rate proportional to the team size, hence the 1/n^2 cycle time.
+    n = np.asarray(team_size, dtype=float)
+    return np.stack([np.ones_like(n), n, 1./n, 1./n**2], axis=-1)
+
+TEAM_SIZE_BASIS      = team_size_basis(TEAM_SIZE_SAMPLES)
+TEAM_SIZE_BASIS_PINV = np.linalg.pinv(TEAM_SIZE_BASIS)
+
+def compile_team_size_model(labor_ct, shape = ()):
+    # labor_ct(team_size) returns the total labor and cycle time of a process. It is evaluated once
+    # on the sample team sizes, and the coefficients of labor and cycle time in team_size_basis are
+    # returned as a (4, 2) + shape array, shape being that of the process parameters when several
+    # designs are evaluated at once, or None if the process does not follow the basis
+    labor, ct = labor_ct(TEAM_SIZE_SAMPLES.reshape((-1,) + (1,) * len(shape)))
+    values    = np.empty((len(TEAM_SIZE_SAMPLES), 2) + shape)
+    values[:,0] = labor
+    values[:,1] = ct
+    coeff     = np.tensordot(TEAM_SIZE_BASIS_PINV, values, 1)
+    scale     = np.abs(values).max(axis=(0, 1))
+    coeff[np.abs(coeff) < 1e-12 * scale] = 0.
+    if np.any(np.abs(np.tensordot(TEAM_SIZE_BASIS, coeff, 1) - values).max(axis=(0, 1)) > 1e-9 * scale):
+        return None
+    return coeff
+
+def solve_team_size(coeff, target_ct, brackets = [(0.01, 100.), (0.01, 250.)]):
+    # Team size at which the cycle time of a compiled team size model equals target_ct:
+    # ct = c0 + c1*n + c2/n + c3/n^2 is multiplied by n^2 and solved for its real roots, keeping
+    # the smallest one in the first bracket that has one. Trailing dimensions of coeff and
+    # target_ct are independent designs
+    c0, c1, c2, c3 = coeff[:,1]
+    a, b, c   = np.broadcast_arrays(c0 - target_ct, c2, c3)
+    roots     = np.full(a.shape + (3,), np.nan)
+    
+    # Quadratic a*n^2 + b*n + c = 0 where c1 is 0, the usual case
+    with np.errstate(divide='ignore', invalid='ignore'):
+        delta     = b**2 - 4.*a*c
+        quadratic = (-b[...,None] + np.array([-1., 1.]) * np.sqrt(delta)[...,None]) / (2.*a[...,None])
+        linear    = np.where(b != 0., -c / b, np.nan)
+    roots[...,:2] = np.where((a == 0.)[...,None], linear[...,None], quadratic)
     
+    # Cubic where c1 is not 0
+    c1 = np.broadcast_to(c1, a.shape)
+    for idx in (np.ndindex(a.shape) if np.any(c1 != 0.) else []):
+        if c1[idx] == 0.:
+            continue
+        cubic = np.roots([c1[idx], a[idx], b[idx], c[idx]])
+        cubic = cubic[np.abs(cubic.imag) <= 1e-9 * np.maximum(1., np.abs(cubic.real))].real
+        roots[idx] = np.nan
+        roots[idx][:len(cubic)] = cubic
+    
+    team_size = np.full(a.shape, np.nan)
+    for lo, hi in brackets:
+        inside    = np.where((roots >= lo) & (roots <= hi), roots, np.inf).min(axis=-1)
+        team_size = np.where(np.isnan(team_size) & np.isfinite(inside), inside, team_size)
+    if np.any(np.isnan(team_size)):
+        target_ct = np.broadcast_to(target_ct, a.shape)[np.isnan(team_size)][0]
+        raise ValueError('No team size between %g and %g gives a cycle time of %g hr' % (brackets[-1][0], brackets[-1][1], target_ct))
+    return team_size[()]
+
+def compute_total_labor_ct(data_struct, name, verbose, no_contribution2ct = []):
+
     process = data_struct.__dict__.keys()
     labor_total_per_process = 0.
     ct_total_per_process    = 0.
@@ -2910,12 +2989,12 @@ def compute_total_labor_ct(data_struct, name, verbose, no_contribution2ct = []):
         print('\n----------')
     for var in process:
         data = getattr(data_struct, var)
-        labor_total_per_process += data['labor']
+        labor_total_per_process = labor_total_per_process + data['labor']
         if verbose:
             print('Activity: ' + var)
             print('labor: {:8.2f} hr \t \t --- \t \t ct: {:8.2f} hr'.format(float(data['labor']),float(data['ct'])))
         if  var not in no_contribution2ct:
-            ct_total_per_process += data['ct']
+            ct_total_per_process = ct_total_per_process + data['ct']
     if verbose:
         print('\n' + name + ':')
         print('labor: {:8.2f} hr \t \t --- \t \t ct: {:8.2f} hr'.format(labor_total_per_process , float(ct_total_per_process)))
@@ -2930,6 +3009,7 @@ class virtual_factory(object):
         
         # Blade inputs
         self.n_webs                           = blade_specs['n_webs']
+        self.shape                            = np.shape(gating_ct)[1:]   # Trailing dimensions of a batch of designs, () for a single blade
                                               
         # Financial parameters                
         self.wage                             = 20.       # [$] Wage of an unskilled worker
@@ -2971,28 +3051,21 @@ class virtual_factory(object):
             self.n_set_molds_skins            = self.n_blades * sum(gating_ct) / (1 - self.cum_rejr[5 + self.n_webs]) / (self.hours * self.days) # [-] Number of skin mold sets (low and high pressure)
         
         # Number of parallel processes
-        self.parallel_proc                    = np.ones(len(operation)) # [-]
+        self.parallel_proc                    = np.ones((len(operation),) + self.shape) # [-]
         
         if self.options['discrete']:
             for i_op in range(0, len(operation)):
                 self.parallel_proc[i_op]      = np.ceil(self.n_set_molds_skins * non_gating_ct[i_op] / sum(gating_ct) / (1 - self.cum_rejr[i_op]))
             n_molds_root                      = 2 * self.n_set_molds_skins * non_gating_ct[1] / sum(gating_ct) / (1 - self.cum_rejr[1])
-            if n_molds_root < 1:
-                self.parallel_proc[2]         = 0
-            else:
-                self.parallel_proc[1]         = np.ceil(self.n_set_molds_skins * non_gating_ct[ 1] / sum(gating_ct) / (1 - self.cum_rejr[1]))
-                self.parallel_proc[2]         = np.ceil(self.n_set_molds_skins * non_gating_ct[ 2] / sum(gating_ct) / (1 - self.cum_rejr[2]))
+            # A single root preform mold is shared by lp and hp when less than one is needed
+            self.parallel_proc[2]             = np.where(n_molds_root < 1, 0., self.parallel_proc[2])
             for i_web in range(self.n_webs):    
                 self.parallel_proc[3 + i_web] = np.ceil(2 * self.n_set_molds_skins * non_gating_ct[3 + i_web] / sum(gating_ct)  / (1 - self.cum_rejr[3 + i_web]))
         else:
             for i_op in range(0, len(operation)):
                 self.parallel_proc[i_op]      = self.n_set_molds_skins * non_gating_ct[i_op] / sum(gating_ct) / (1 - self.cum_rejr[i_op])
             n_molds_root                      = 2 * self.n_set_molds_skins * non_gating_ct[1] / sum(gating_ct) / (1 - self.cum_rejr[1])
-            if n_molds_root < 1:
-                self.parallel_proc[2]         = 0
-            else:
-                self.parallel_proc[1]         = self.n_set_molds_skins * non_gating_ct[ 1] / sum(gating_ct) / (1 - self.cum_rejr[1])
-                self.parallel_proc[2]         = self.n_set_molds_skins * non_gating_ct[ 2] / sum(gating_ct) / (1 - self.cum_rejr[2])
+            self.parallel_proc[2]             = np.where(n_molds_root < 1, 0., self.parallel_proc[2])
             for i_web in range(self.n_webs):  
                 self.parallel_proc[3 + i_web] = 2 * self.n_set_molds_skins * non_gating_ct[3 + i_web] / sum(gating_ct)  / (1 - self.cum_rejr[3 + i_web])            
         
@@ -3005,7 +3078,7 @@ class virtual_factory(object):
         
         # Building space per operation
         delta                                    = 2. #[m] Distance between blades
-        self.floor_space                         = np.zeros(len(operation)) # [m2]
+        self.floor_space                         = np.zeros((len(operation),) + self.shape) # [m2]
         self.floor_space[0]                      = 3. * blade_specs['blade_length'] # [m2] Material cutting        
         self.floor_space[1]                      = self.parallel_proc[ 1] * (delta + blade_specs['root_D']) * (delta + blade_specs['root_preform_length']) # [m2] Infusion root preform lp
         self.floor_space[2]                      = self.parallel_proc[ 2] * (delta + blade_specs['root_D']) * (delta + blade_specs['root_preform_length']) # [m2] Infusion root preform hp
@@ -3049,7 +3122,7 @@ class virtual_factory(object):
         self.power_consumpt[11 + self.n_webs]    = self.power_consumpt[11 + self.n_webs] + self.parallel_proc[11 + self.n_webs] * blade_specs['blade_mass'] * kJ_per_kg # [kW] Post cure
         
         # Tooling investment per station per operation (molds)
-        self.tooling_investment                  = np.zeros(len(operation)) # [$]
+        self.tooling_investment                  = np.zeros((len(operation),) + self.shape) # [$]
         price_mold_sqm                           = 5000.
         self.tooling_investment[1]               = price_mold_sqm * self.parallel_proc[1] * blade_specs['area_lp_root']  # [$] Mold of the root preform - lp, cost assumed equal to 50000 $ per meter square of surface
         self.tooling_investment[2]               = price_mold_sqm * self.parallel_proc[2] * blade_specs['area_hp_root']  # [$] Mold of the root preform - hp, cost assumed equal to 50000 $ per meter square of surface
@@ -3062,7 +3135,7 @@ class virtual_factory(object):
         
         
         # Equipment investment per station per operation
-        self.equipm_investment                   = np.zeros(len(operation)) # [$]     
+        self.equipm_investment                   = np.zeros((len(operation),) + self.shape) # [$]     
         self.equipm_investment[0]                =   5000. * self.parallel_proc[ 0] * blade_specs['blade_length']  # [$] Equipment for material cutting is assumed at 5000 $ per meter of blade length
         self.equipm_investment[1]                =  15000. * self.parallel_proc[ 1] * blade_specs['root_D']        # [$] Equipment for root preform infusion is assumed at 15000 $ per meter of blade root diameter
         self.equipm_investment[2]                =  15000. * self.parallel_proc[ 2] * blade_specs['root_D']        # [$] Equipment for root preform infusion is assumed at 15000 $ per meter of blade root diameter
@@ -3101,8 +3174,8 @@ class virtual_factory(object):
         else:
             verbosity                                   = 0
         
-        direct_labor_cost_per_blade             = np.zeros(len(operation)) # [$]
-        direct_labor_cost_per_year              = np.zeros(len(operation)) # [$]
+        direct_labor_cost_per_blade             = np.zeros((len(operation),) + self.shape) # [$]
+        direct_labor_cost_per_year              = np.zeros((len(operation),) + self.shape) # [$]
         
         if verbosity:
             print('\n#################################\nDirect labor cost')
@@ -3125,8 +3198,8 @@ class virtual_factory(object):
         else:
             verbosity                                   = 0
         
-        utility_cost_per_blade                  = np.zeros(len(operation)) # [$]
-        utility_cost_per_year                   = np.zeros(len(operation)) # [$]
+        utility_cost_per_blade                  = np.zeros((len(operation),) + self.shape) # [$]
+        utility_cost_per_year                   = np.zeros((len(operation),) + self.shape) # [$]
         
         if verbosity:
             print('\n#################################\nUtility cost')
@@ -3146,17 +3219,17 @@ class virtual_factory(object):
         else:
             verbosity                                   = 0
         
-        building_cost_per_blade                     = np.zeros(len(operation)) # [$]
-        building_cost_per_year                      = np.zeros(len(operation)) # [$]
-        building_annuity                            = np.zeros(len(operation)) # [$]
-        tooling_cost_per_blade                      = np.zeros(len(operation)) # [$]
-        tooling_cost_per_year                       = np.zeros(len(operation)) # [$]
-        tooling_annuity                             = np.zeros(len(operation)) # [$]
-        equipment_cost_per_blade                    = np.zeros(len(operation)) # [$]
-        equipment_cost_per_year                     = np.zeros(len(operation)) # [$]
-        equipment_annuity                           = np.zeros(len(operation)) # [$]
-        maintenance_cost_per_blade                  = np.zeros(len(operation)) # [$]
-        maintenance_cost_per_year                   = np.zeros(len(operation)) # [$]
+        building_cost_per_blade                     = np.zeros((len(operation),) + self.shape) # [$]
+        building_cost_per_year                      = np.zeros((len(operation),) + self.shape) # [$]
+        building_annuity                            = np.zeros((len(operation),) + self.shape) # [$]
+        tooling_cost_per_blade                      = np.zeros((len(operation),) + self.shape) # [$]
+        tooling_cost_per_year                       = np.zeros((len(operation),) + self.shape) # [$]
+        tooling_annuity                             = np.zeros((len(operation),) + self.shape) # [$]
+        equipment_cost_per_blade                    = np.zeros((len(operation),) + self.shape) # [$]
+        equipment_cost_per_year                     = np.zeros((len(operation),) + self.shape) # [$]
+        equipment_annuity                           = np.zeros((len(operation),) + self.shape) # [$]
+        maintenance_cost_per_blade                  = np.zeros((len(operation),) + self.shape) # [$]
+        maintenance_cost_per_year                   = np.zeros((len(operation),) + self.shape) # [$]
         
         
         if self.options['verbosity']:
@@ -3201,7 +3274,7 @@ class virtual_factory(object):
         tooling_annuity_tot                     = sum(tooling_annuity)
         building_annuity_tot                    = sum(building_annuity)
         
-        working_annuity                         = np.pmt(self.crr /100. / 12. , self.wcp, -(self.wcp / 12. * (total_maintenance_labor_cost_per_year + blade_variable_cost_w_overhead * self.n_blades))) * 12.
+        working_annuity                         = pmt(self.crr /100. / 12. , self.wcp, -(self.wcp / 12. * (total_maintenance_labor_cost_per_year + blade_variable_cost_w_overhead * self.n_blades))) * 12.
 
         annuity_tot_per_year                    = equipment_annuity_tot + tooling_annuity_tot + building_annuity_tot + working_annuity
         
@@ -3212,6 +3285,13 @@ class virtual_factory(object):
         
         return total_equipment_cost_per_blade, total_tooling_cost_per_blade, total_building_cost_per_blade, total_maintenance_cost_per_blade, cost_of_capital_per_blade
 
+def pmt(rate, nper, pv):
+    # Payment per period of a loan pv repaid in nper periods at the given rate, as the former
+    # np.pmt with fv=0 and payments at the end of the periods (removed from numpy 1.20)
+    if rate == 0.:
+        return -pv / nper
+    return -pv * rate * (1. + rate)**nper / ((1. + rate)**nper - 1.)
+
 def compute_direct_labor_cost(self, labor_hours, operation, cum_rejr, verbosity):
         
         cost_per_blade = (self.wage * (1. + self.beni / 100.) * labor_hours) / (1. - self.avg_dt / 100.)/(1. - cum_rejr)
@@ -3238,7 +3318,7 @@ def compute_cost_annuity(self, operation, investment, life, verbosity):
        
         cost_per_year   = investment / life
         cost_per_blade  = cost_per_year / self.n_blades
-        annuity         = np.pmt(self.crr / 100. / 12. , life * 12., -investment) * 12.
+        annuity         = pmt(self.crr / 100. / 12. , life * 12., -investment) * 12.
         
         if verbosity == 1:
             print('Activity: ' + operation)
@@ -3460,6 +3540,329 @@ class blade_cost_model(object):
     
         return self.total_blade_cost, self.blade_mass
 
+def last_layer(x, mask):
+    # Value of x (..., layer, station) at the last layer of each station where mask (layer, station)
+    # is set, 0 at the stations where it is not set on any layer
+    idx = mask.shape[0] - 1 - np.argmax(mask[::-1], axis=0)
+    return np.where(mask.any(axis=0), x[..., idx, np.arange(mask.shape[1])], 0.)
+
+class blade_bom_batch(blade_bom):
+    # Bill of materials of a batch of blades sharing geometry and layup topology (panels, webs and
+    # material of every layer) with a reference blade and differing in the thickness of the layers.
+    # The layers of each station are numbered as in upperCS, lowerCS and websCS, panel by panel and
+    # web by web, and padded to the station with most layers. Thicknesses are given as
+    # (design, layer, station) arrays, and the quantities of blade_specs and precomp_mat that depend
+    # on them come out with a trailing design dimension.
+    
+    def init_layup(self):
+        
+        precomp_mat, core_mat_id, mat_ids, t_layer, density = self.material_specs()
+        self.precomp_mat    = precomp_mat
+        self.core_mat_id    = core_mat_id
+        self.mat_ids        = mat_ids
+        self.t_layer        = t_layer
+        self.density        = density
+        
+        npts                = len(self.r)
+        layers              = [[] for i in range(npts)]             # surface, part, material, width, first core of the panel, thickness
+        n_panels            = np.zeros((2, npts), dtype=int)        # Panels of the low and high pressure sides
+        edge_skin           = np.zeros((2, npts))                   # Arc length of the low and high pressure sides [m]
+        n_webs              = max([len(self.websCS[i_section].n_plies) for i_section in range(npts)])
+        web_height          = np.zeros((n_webs, npts))
+        
+        for i_section in range(npts):
+            x  = self.profile[i_section].x
+            yu = self.profile[i_section].yu
+            yl = self.profile[i_section].yl
+            for surface, cs, y in [(0, self.upperCS[i_section], yu), (1, self.lowerCS[i_section], yl)]:
+                arc_length  = self.chord[i_section] * ((x[1:] - x[:-1])**2 + (y[1:] - y[:-1])**2)**0.5
+                n_panels[surface, i_section] = len(cs.loc) - 1
+                for i_panel in range(len(cs.loc) - 1):
+                    edge1       = np.argmin(abs(x - cs.loc[i_panel]))
+                    edge2       = np.argmin(abs(x - cs.loc[i_panel+1]))
+                    width_panel = sum(arc_length[edge1:edge2])
+                    edge_skin[surface, i_section] += width_panel
+                    core_check  = 0
+                    for i_mat in range(len(cs.n_plies[i_panel])):
+                        mat_id  = int(cs.mat_idx[i_panel][i_mat])
+                        layers[i_section].append((surface, i_panel, mat_id, width_panel, core_mat_id[mat_id] == 1 and core_check == 0, cs.t[i_panel][i_mat]))
+                        if core_mat_id[mat_id] == 1:
+                            core_check = 1
+            
+            webs = self.websCS[i_section]
+            for i_web in range(len(webs.n_plies)):
+                index_x                       = np.argmin(abs(x - webs.loc[i_web]))
+                web_height[i_web, i_section]  = self.chord[i_section] * (yu[index_x] - yl[index_x])
+                for i_mat in range(len(webs.n_plies[i_web])):
+                    mat_id  = int(webs.mat_idx[i_web][i_mat])
+                    layers[i_section].append((2, i_web, mat_id, web_height[i_web, i_section], core_mat_id[mat_id] == 1, webs.t[i_web][i_mat]))
+        
+        # Layers padded to the station with most layers, padding has surface -1 and no width
+        n_layers            = max([len(layers_section) for layers_section in layers])
+        layup               = {}
+        layup['surface']    = -np.ones((n_layers, npts), dtype=int)   # 0 - low pressure shell, 1 - high pressure shell, 2 - shear web
+        layup['part']       = np.zeros((n_layers, npts), dtype=int)   # Panel or web
+        layup['mat']        = -np.ones((n_layers, npts), dtype=int)   # Material index
+        layup['width']      = np.zeros((n_layers, npts))              # Width of the panel or height of the web [m]
+        layup['core_first'] = np.zeros((n_layers, npts), dtype=bool)  # First sandwich core layer of a panel
+        layup['t']          = np.zeros((n_layers, npts))              # Thickness of the reference blade [m]
+        for i_section in range(npts):
+            for i_layer, layer in enumerate(layers[i_section]):
+                layup['surface'][i_layer, i_section], layup['part'][i_layer, i_section], layup['mat'][i_layer, i_section], \
+                    layup['width'][i_layer, i_section], layup['core_first'][i_layer, i_section], layup['t'][i_layer, i_section] = layer
+        layup['core']       = (core_mat_id[layup['mat']] == 1) & (layup['surface'] >= 0)
+        layup['n_panels']   = n_panels
+        self.layup          = layup
+        
+        # Quantities that only depend on geometry and topology
+        blade_specs         = self.flange_specs()
+        self.dimension_specs(blade_specs, n_webs)
+        self.root_preform_end = np.argmin(abs(self.r - blade_specs['root_preform_length']))
+        root                = np.arange(npts) <= self.root_preform_end
+        
+        for surface, side in enumerate(['lp', 'hp']):
+            on_side = layup['surface'] == surface
+            sc      = on_side & (layup['mat'] == mat_ids['sc'] - 1) & (layup['part'] > 0) & (layup['part'] < n_panels[surface] - 1)
+            width_sc = (layup['width'] * sc).sum(axis=0)
+            
+            width_sc_start = width_sc_end = 0.
+            sc_start_section = sc_end_section = 0
+            for i_section in range(npts):
+                if width_sc_start == 0:
+                    width_sc_start      = width_sc[i_section]
+                    sc_start_section    = i_section
+                if width_sc[i_section] != 0:
+                    width_sc_end        = width_sc[i_section]
+                    sc_end_section      = i_section
+            
+            blade_specs['area_%sskin_wo_flanges' % side]  = np.trapz(edge_skin[surface], self.r)
+            blade_specs['area_%sskin_w_flanges' % side]   = blade_specs['area_%sskin_wo_flanges' % side] + blade_specs['flange_area_LETE']
+            blade_specs['area_%s_root' % side]            = np.trapz(edge_skin[surface] * root, self.r)
+            blade_specs['length_sc_%s' % side]            = self.r[sc_end_section] - self.r[sc_start_section]      # [m]
+            blade_specs['width_sc_start_%s' % side]       = width_sc_start                                         # [m]
+            blade_specs['width_sc_end_%s' % side]         = width_sc_end                                           # [m]
+            blade_specs['area_sc_%s' % side]              = width_sc_start * blade_specs['length_sc_%s' % side]    # [m2]
+            blade_specs['areacore2lay_shell_%s' % side]   = np.trapz((layup['width'] * (on_side & layup['core_first'])).sum(axis=0), self.r)
+        
+        height_webs_start   = np.zeros(n_webs)
+        height_webs_end     = np.zeros(n_webs)
+        webs_start_section  = np.zeros(n_webs, dtype=int)
+        webs_end_section    = np.zeros(n_webs, dtype=int)
+        for i_web in range(n_webs):
+            for i_section in range(npts):
+                if height_webs_start[i_web] == 0:
+                    height_webs_start[i_web]    = web_height[i_web, i_section]
+                    webs_start_section[i_web]   = i_section
+                if web_height[i_web, i_section] != 0:
+                    height_webs_end[i_web]      = web_height[i_web, i_section]
+                    webs_end_section[i_web]     = i_section
+        
+        on_web = [(layup['surface'] == 2) & (layup['part'] == i_web) for i_web in range(n_webs)]
+        blade_specs['height_webs_start']    = height_webs_start
+        blade_specs['height_webs_end']      = height_webs_end
+        blade_specs['length_webs']          = self.r[webs_end_section] - self.r[webs_start_section]
+        blade_specs['area_webs_wo_flanges'] = np.trapz(web_height, self.r)
+        blade_specs['area_webs_w_core']     = np.array([np.trapz((layup['width'] * (on_web[i_web] & layup['core'])).sum(axis=0), self.r) for i_web in range(n_webs)])
+        blade_specs['area_webs_w_flanges']  = blade_specs['area_webs_wo_flanges'] + 2 * blade_specs['length_webs'] * blade_specs['flange_width_webs_SW']
+        self.layup_specs                    = blade_specs
+        
+        return layup
+    
+    def layer_mask(self, material=None, surface=None):
+        # Boolean (layer, station) array of the layers made of material (a name of precomp_mat) and
+        # lying on surface (0 - low pressure shell, 1 - high pressure shell, 2 - shear webs)
+        mask = self.layup['surface'] >= 0
+        if material is not None:
+            mask = mask & (self.layup['mat'] == self.precomp_mat[material]['id'] - 1)
+        if surface is not None:
+            mask = mask & (self.layup['surface'] == surface)
+        return mask
+    
+    def extract_specs(self, thickness):
+        
+        layup           = self.layup
+        t               = np.asarray(thickness, dtype=float)   # [m] (design, layer, station)
+        if t.shape[-2:] != layup['t'].shape:
+            raise ValueError('Layer thicknesses have shape %s, the layup of the reference blade has %d layers at %d stations' % (t.shape, layup['t'].shape[0], layup['t'].shape[1]))
+        t               = np.where(layup['surface'] >= 0, t, 0.)
+        
+        skin_mat_id     = self.mat_ids['skin']
+        skinwebs_mat_id = self.mat_ids['skinwebs']
+        sc_mat_id       = self.mat_ids['sc']
+        le_reinf_mat_id = self.mat_ids['le_reinf']
+        te_reinf_mat_id = self.mat_ids['te_reinf']
+        precomp_mat     = dict([(name, dict(self.precomp_mat[name])) for name in self.precomp_mat])
+        t_layer         = self.t_layer
+        density         = self.density
+        mat             = layup['mat']
+        part            = layup['part']
+        width           = layup['width']
+        
+        # Reconstruct number of plies from laminate thickness and single ply thickness
+        ply_t           = np.where(layup['core'], 1., t_layer[mat])
+        n_plies         = np.where(layup['core'], 0., t / ply_t)
+        if self.options['discrete']:
+            if self.options['show_warnings'] and np.any(n_plies != np.round(n_plies)):
+                print('WARNING: number of composite plies not consistent with the thicknesses specified along the blade. Rounding is performed.')
+            n_plies     = np.round(n_plies)
+        
+        blade_specs     = dict(self.layup_specs)
+        mass            = width * t * density[mat]     # [kg/m]
+        fabric          = width * n_plies              # [m]
+        root            = np.arange(len(self.r)) <= self.root_preform_end
+        
+        for surface, side in enumerate(['lp', 'hp']):
+            on_side     = layup['surface'] == surface
+            last_panel  = layup['n_panels'][surface] - 1
+            sc          = on_side & (mat == sc_mat_id - 1) & (part > 0) & (part < last_panel)
+            skin        = on_side & (mat == skin_mat_id - 1)
+            le_reinf    = on_side & (mat == le_reinf_mat_id - 1) & (part == 0)
+            te_reinf    = on_side & (mat == te_reinf_mat_id - 1) & (part == last_panel)
+            core        = on_side & layup['core_first']
+            fabric_skin = (fabric * skin).sum(axis=-2)
+            
+            # Shell
+            blade_specs['fabric2lay_shell_%s' % side]      = np.trapz(np.where(root, 0.5, 1.) * fabric_skin, self.r)
+            blade_specs['volume_shell_%s' % side]          = blade_specs['fabric2lay_shell_%s' % side] * t_layer[skin_mat_id-1]
+            blade_specs['mass_shell_%s' % side]            = blade_specs['volume_shell_%s' % side] * density[skin_mat_id-1]
+            
+            # Root preform
+            blade_specs['volume_root_preform_%s' % side]   = np.trapz(0.5 * root * fabric_skin, self.r) * t_layer[skin_mat_id-1]
+            blade_specs['mass_root_preform_%s' % side]     = blade_specs['volume_root_preform_%s' % side] * density[skin_mat_id-1]
+            blade_specs['n_plies_root_%s' % side]          = (n_plies[..., 0] * (skin & (part == 0))[:, 0]).sum(axis=-1)
+            
+            # Spar cap
+            blade_specs['fabric2lay_sc_%s' % side]         = np.trapz(last_layer(n_plies, sc), self.r)                          # [m]
+            blade_specs['volume2lay_sc_%s' % side]         = np.trapz((fabric * sc).sum(axis=-2), self.r) * t_layer[sc_mat_id-1]  # [m3]
+            blade_specs['mass_sc_%s' % side]               = blade_specs['volume2lay_sc_%s' % side] * density[sc_mat_id-1]     # [kg]
+            
+            # LE and TE reinforcements
+            for reinf, mask, reinf_mat_id in [('le', le_reinf, le_reinf_mat_id), ('te', te_reinf, te_reinf_mat_id)]:
+                blade_specs['fabric2lay_%s_reinf_%s' % (reinf, side)] = np.trapz(last_layer(n_plies, mask), self.r)
+                if reinf_mat_id > -1:
+                    blade_specs['volume_%s_reinf_%s' % (reinf, side)] = np.trapz(last_layer(fabric, mask), self.r) * t_layer[reinf_mat_id-1]
+                else:
+                    blade_specs['volume_%s_reinf_%s' % (reinf, side)] = np.zeros(t.shape[:-2])
+                blade_specs['mass_%s_reinf_%s' % (reinf, side)]       = blade_specs['volume_%s_reinf_%s' % (reinf, side)] * density[reinf_mat_id-1]
+            
+            # Core
+            blade_specs['volume_core_shell_%s' % side]     = np.trapz((width * t * core).sum(axis=-2), self.r)
+            blade_specs['mass_core_shell_%s' % side]       = np.trapz((mass * core).sum(axis=-2), self.r)
+        
+        # Shear webs, with the design dimension last
+        volume_core_webs    = []
+        mass_core_webs      = []
+        fabric2lay_webs     = []
+        volumeskin2lay_webs = []
+        for i_web in range(blade_specs['n_webs']):
+            on_web      = (layup['surface'] == 2) & (part == i_web)
+            core        = on_web & layup['core']
+            skin        = on_web & (mat == skinwebs_mat_id - 1)
+            volume_core_webs.append(np.trapz((width * t * core).sum(axis=-2), self.r))
+            mass_core_webs.append(np.trapz((mass * core).sum(axis=-2), self.r))
+            fabric2lay_webs.append(np.trapz((fabric * skin).sum(axis=-2), self.r))
+            volumeskin2lay_webs.append(np.trapz((fabric * t_layer[mat] * skin).sum(axis=-2), self.r))
+        blade_specs['volume_core_webs']     = np.array(volume_core_webs)
+        blade_specs['mass_core_webs']       = np.array(mass_core_webs)
+        blade_specs['fabric2lay_webs']      = np.array(fabric2lay_webs)
+        blade_specs['volumeskin2lay_webs']  = np.array(volumeskin2lay_webs)
+        blade_specs['mass_webs']            = blade_specs['volumeskin2lay_webs'] * density[skinwebs_mat_id-1]
+        
+        mass_per_comp               = np.array([np.trapz((mass * (mat == i_mat)).sum(axis=-2), self.r) for i_mat in range(len(precomp_mat))])
+        
+        blade_specs['blade_mass']   = np.trapz(mass.sum(axis=-2), self.r)
+        
+        self.material_totals(blade_specs, precomp_mat, self.core_mat_id, mass_per_comp)
+        
+        return blade_specs, precomp_mat
+
+class blade_cost_model_batch(blade_cost_model):
+    # Blade cost model of a batch of designs sharing geometry and layup topology with the reference
+    # blade set by init_from_refBlade or init_from_Ontology, and differing in the thickness of the
+    # layers (see blade_bom_batch). The bill of materials, labor, cycle times and virtual factory
+    # are evaluated for all designs at once.
+    
+    def init_layup(self):
+        # Builds the layup of the reference blade, a dictionary of (layer, station) arrays whose
+        # entry 't' holds the reference thicknesses
+        bom                 = blade_bom_batch()
+        # self.options may be an OpenMDAO OptionsDictionary, copy the settings that apply to a batch
+        bom.options         = {'verbosity'      : False,
+                               'tex_table'      : False,
+                               'generate_plots' : False,
+                               'show_plots'     : False,
+                               'show_warnings'  : self.options['show_warnings'],
+                               'discrete'       : self.options['discrete']}
+        bom.name            = self.name
+        bom.bladeLength     = self.bladeLength
+        bom.r               = self.r
+        bom.chord           = self.chord
+        bom.le_location     = self.le_location
+        bom.materials       = self.materials
+        bom.upperCS         = self.upperCS
+        bom.lowerCS         = self.lowerCS
+        bom.websCS          = self.websCS
+        bom.profile         = self.profile
+        self.bom            = bom
+        
+        return bom.init_layup()
+    
+    def layer_mask(self, material=None, surface=None):
+        return self.bom.layer_mask(material, surface)
+    
+    def execute_blade_cost_model(self, thickness):
+        # thickness is a (design, layer, station) array of layer thicknesses [m]. Returns a dictionary
+        # of per design arrays, with the operations along the second dimension of labor and cycle times
+        if not hasattr(self, 'bom'):
+            self.init_layup()
+        bom     = self.bom
+        options = bom.options
+        
+        # Bill of Materials
+        blade_specs, precomp_mat                                       = bom.extract_specs(thickness)
+        matrix, bonding                                                = bom.compute_matrix_bonding(blade_specs, precomp_mat)
+        metallic_parts                                                 = bom.compute_metallic_parts(blade_specs)
+        consumables                                                    = bom.compute_consumables(blade_specs)
+        total_blade_mat_cost_w_waste, blade_mass                       = bom.compute_bom(blade_specs, precomp_mat, matrix, bonding, metallic_parts, consumables)
+        
+        # Labor and cycle time
+        labor_ct                                                       = blade_labor_ct(blade_specs, precomp_mat , metallic_parts)
+        labor_ct.options                                               = options
+        labor_ct.name                                                  = self.name
+        operation , labor_hours , skin_mold_gating_ct , non_gating_ct  = labor_ct.execute_blade_labor_ct()
+        
+        # Virtual factory
+        vf                                                             = virtual_factory(blade_specs , operation, skin_mold_gating_ct, non_gating_ct, options)
+        total_cost_labor , total_labor_overhead                        = vf.execute_direct_labor_cost(operation , labor_hours)
+        total_cost_utility                                             = vf.execute_utility_cost(operation , skin_mold_gating_ct + non_gating_ct)
+        blade_variable_cost                                            = total_blade_mat_cost_w_waste + total_cost_labor + total_cost_utility
+        total_cost_equipment , total_cost_tooling, total_cost_building, total_maintenance_cost, cost_capital = vf.execute_fixed_cost(operation , skin_mold_gating_ct + non_gating_ct, blade_variable_cost + total_labor_overhead)
+        blade_fixed_cost                                               = total_cost_equipment + total_cost_tooling + total_cost_building + total_maintenance_cost + total_labor_overhead + cost_capital
+        
+        results = {}
+        results['operation']                    = operation
+        results['labor_hours']                  = np.moveaxis(labor_hours, 0, -1)           # [hr]
+        results['skin_mold_gating_ct']          = np.moveaxis(skin_mold_gating_ct, 0, -1)   # [hr]
+        results['non_gating_ct']                = np.moveaxis(non_gating_ct, 0, -1)         # [hr]
+        results['total_labor_hours']            = sum(labor_hours)
+        results['total_skin_mold_gating_ct']    = sum(skin_mold_gating_ct)
+        results['total_non_gating_ct']          = sum(non_gating_ct)
+        results['blade_mass']                   = blade_mass
+        results['total_blade_mat_cost_w_waste'] = total_blade_mat_cost_w_waste
+        results['total_cost_labor']             = total_cost_labor
+        results['total_labor_overhead']         = total_labor_overhead
+        results['total_cost_utility']           = total_cost_utility
+        results['total_cost_equipment']         = total_cost_equipment
+        results['total_cost_tooling']           = total_cost_tooling
+        results['total_cost_building']          = total_cost_building
+        results['total_maintenance_cost']       = total_maintenance_cost
+        results['cost_capital']                 = cost_capital
+        results['blade_variable_cost']          = blade_variable_cost
+        results['blade_fixed_cost']             = blade_fixed_cost
+        results['total_blade_cost']             = blade_variable_cost + blade_fixed_cost
+        
+        return results
+
 # Class to initiate the blade cost model
 class RotorCost(ExplicitComponent):
     def initialize(self):
@@ -16,7 +16,7 @@ import jsonschema as json
 
 from wisdem.ccblade.ccblade_component import CCBladeGeometry
 from wisdem.ccblade import CCAirfoil
-from wisdem.airfoilprep.airfoilprep import Airfoil, Polar
+from wisdem.airfoilprep.airfoilprep import Airfoil, Polar, PolarSet
 
 from wisdem.rotorse.precomp import Profile, Orthotropic2DMaterial, CompositeSection, _precomp, PreCompWriter
 from wisdem.rotorse.geometry_tools.geometry import AirfoilShape, Curve
@@ -713,17 +713,18 @@ class ReferenceBlade(object):
 
         # stall delay
         if self.apply_stall_delay:
-            for i in range(n_span):
-                for j in range(n_Re):
-                    if thk_span[i]<0.5:
-                        polar_ij     = Polar(Re[j], np.degrees(alpha), cl[:,i,j], cd[:,i,j], cm[:,i,j])
-                        r_over_R     = blade['pf']['s'][i]
-                        chord_over_r = blade['pf']['chord'][i]/blade['pf']['r'][i]
-                        tsr          = blade['config']['tsr']
-                        polar_ij_out = polar_ij.correction3D(r_over_R, chord_over_r, tsr, alpha_max_corr=30, alpha_linear_min=-5, alpha_linear_max=5)
-
-                        cl[:,i,j]    = polar_ij_out.cl
-                        cd[:,i,j]    = polar_ij_out.cd
+            # all polars of the stations thinner than 50% at once, as (station, Re, aoa) arrays
+            idx = np.nonzero(np.asarray(thk_span) < 0.5)[0]
+            if len(idx) > 0:
+                to_set       = lambda x : np.transpose(x[:,idx,:], (1, 2, 0))
+                polars       = PolarSet(Re, np.degrees(alpha), to_set(cl), to_set(cd), to_set(cm))
+                r_over_R     = np.asarray(blade['pf']['s'])[idx]
+                chord_over_r = np.asarray(blade['pf']['chord'])[idx]/np.asarray(blade['pf']['r'])[idx]
+                tsr          = blade['config']['tsr']
+                polars_out   = polars.correction3D(r_over_R, chord_over_r, tsr, alpha_max_corr=30, alpha_linear_min=-5, alpha_linear_max=5)
+
+                cl[:,idx,:]  = np.transpose(polars_out.cl, (2, 0, 1))
+                cd[:,idx,:]  = np.transpose(polars_out.cd, (2, 0, 1))
 
         # CCBlade airfoil class instances
         # airfoils = [None]*n_span
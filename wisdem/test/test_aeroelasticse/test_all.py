@@ -0,0 +1,16 @@
+import unittest
+
+from wisdem.test.test_aeroelasticse import test_casegen_general, test_casegen_dists, test_fast_wrapper, test_fast_reader, test_pyiecwind
+
+def suite():
+    suite = unittest.TestSuite( (test_casegen_general.suite(),
+                                 test_casegen_dists.suite(),
+                                 test_fast_wrapper.suite(),
+                                 test_fast_reader.suite(),
+                                 test_pyiecwind.suite(),
+    ) )
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
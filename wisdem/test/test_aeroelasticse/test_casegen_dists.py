@@ -0,0 +1,146 @@
+import os
+import tempfile
+import shutil
+import numpy as np
+import numpy.testing as npt
+import unittest
+from scipy.stats import vonmises, weibull_min, gamma
+import wisdem.aeroelasticse.CaseGen_Dists as cgd
+
+# Joint wind and wave distribution of the CaseGen_Dists documentation, Hs and Tp conditional on Vhub
+joint_dist = """
+AnalTime = 600
+Vhub = W(2.120, 9.767)
+WaveDir = VM(0.029265 + 0.119759 * Vhub, -0.620138 + 0.030709 * Vhub)
+Hs = G(4.229440 + 0.222745 * WaveDir  + 0.328602 * Vhub, 0.145621 + -0.006188 * WaveDir  + 0.007561 * Vhub)
+Tp = G(19.677865 + 6.617868 * Hs  + -0.532952 * Vhub, 0.202077 + 0.286631 / Hs  + -0.004321 * Vhub)
+"""
+
+conditional_dist = """
+Vhub = W(2.120, 9.767)
+Hs = G(4.229440 + 0.328602 * Vhub, 0.145621 + 0.007561 * Vhub)
+"""
+
+
+def parse(text):
+    dparser = cgd.DistnParser()
+    dparser.parse(text.splitlines())
+    return dparser
+
+
+class TestCaseGenDists(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def write_dist(self, text):
+        fname = os.path.join(self.tmpdir, 'dist.txt')
+        with open(fname, 'w') as f:
+            f.write(text)
+        return fname
+
+    def testLatinHypercube(self):
+        # One point in each of the n strata of every dimension
+        n = 50
+        u = cgd.sample_unit_hypercube(n, 3, method='lhs', seed=1)
+        self.assertEqual(u.shape, (n, 3))
+        for j in range(3):
+            npt.assert_equal(np.sort(np.floor(u[:,j]*n)), np.arange(n))
+        npt.assert_equal(u, cgd.sample_unit_hypercube(n, 3, method='lhs', seed=1))
+        self.assertFalse(np.array_equal(u, cgd.sample_unit_hypercube(n, 3, method='lhs', seed=2)))
+
+        u = cgd.sample_unit_hypercube(64, 2, method='sobol', seed=0)
+        for j in range(2):
+            npt.assert_equal(np.sort(np.floor(u[:,j]*64)), np.arange(64))
+        self.assertRaises(ValueError, cgd.sample_unit_hypercube, 4, 1, 'grid')
+
+    def testJointProbability(self):
+        # 'p' of the vectorized sampler is the density of DistnParser.calc_prob for each case
+        dparser = parse(joint_dist)
+        samples = dparser.space_filling_sample(40, method='lhs', seed=0)
+        self.assertTrue(np.all(samples['AnalTime'] == 600.))
+        for i in range(40):
+            samp = {var: samples[var][i] for var in ['AnalTime', 'Vhub', 'WaveDir', 'Hs', 'Tp']}
+            # calc_prob evaluates the parameters from values printed with %f
+            npt.assert_allclose(samples['p'][i], dparser.calc_prob(samp), rtol=1e-4)
+
+    def testGammaClamp(self):
+        # Shape below the former 1e-1 bound: the density is the derivative of the CDF used for sampling
+        x = np.linspace(0.5, 3., 6)
+        for shape in [0.05, 1e-4]:
+            dx = 1e-6
+            dcdf = (cgd.cdf_gamma(x + dx, shape, 2.) - cgd.cdf_gamma(x - dx, shape, 2.)) / (2*dx)
+            npt.assert_allclose(cgd.pdf_gamma(x, shape, 2.), dcdf, rtol=1e-6)
+            npt.assert_allclose([cgd.prob_gamma(xi, shape, 2.) for xi in x], cgd.pdf_gamma(x, shape, 2.), rtol=1e-12)
+
+    def testTruncated(self):
+        # Truncated distributions rescale u to the truncation range, so the design stays stratified
+        n = 200
+        dparser = parse("x = TN(1, 2, -1, 2)\n")
+        samples = dparser.space_filling_sample(n, method='lhs', seed=3)
+        x = samples['x']
+        self.assertTrue(np.all((x >= -1.) & (x <= 2.)))
+        F0, F1 = cgd.cdf_normal(-1., 1., 2.), cgd.cdf_normal(2., 1., 2.)
+        u = (cgd.cdf_normal(x, 1., 2.) - F0) / (F1 - F0)
+        npt.assert_equal(np.sort(np.floor(u*n + 1e-9)), np.arange(n))
+
+        # Density renormalized over the range, as calc_prob
+        for i in range(0, n, 20):
+            npt.assert_allclose(samples['p'][i], dparser.calc_prob({'x': x[i]}), rtol=1e-6)
+        npt.assert_equal(dparser.dlist[0].pdf(np.array([-1.5, 2.5]), [1., 2., -1., 2.]), 0.)
+
+    def testConditionalMapping(self):
+        # Hs is mapped through the Gamma inverse CDF with the parameters of its own Vhub
+        n = 32
+        dparser = parse(conditional_dist)
+        samples = dparser.space_filling_sample(n, method='lhs', seed=5)
+        u = cgd.sample_unit_hypercube(n, 2, method='lhs', seed=5)
+        vhub = weibull_min.ppf(u[:,0], 2.120, scale=9.767)
+        npt.assert_allclose(samples['Vhub'], vhub, rtol=1e-12)
+        npt.assert_allclose(samples['Hs'], gamma.ppf(u[:,1], 4.229440 + 0.328602*vhub, scale=0.145621 + 0.007561*vhub), rtol=1e-12)
+
+        # The case generator keeps each Hs with its Vhub, rather than crossing them
+        fname = self.write_dist(conditional_dist)
+        case_inputs, samp = cgd.sample_case_inputs(fname, n, method='lhs', seed=5)
+        npt.assert_equal(case_inputs[('HydroDyn','WaveHs')]['vals'], samples['Hs'])
+        self.assertEqual(case_inputs[('HydroDyn','WaveHs')]['group'], case_inputs[('InflowWind','HWindSpeed')]['group'])
+
+        case_list, case_name = cgd.CaseGen_Dists({'dist': fname, 'nsamples': n, 'sampling': 'lhs', 'seed': 5, 'tmax': 60.})
+        self.assertEqual(len(case_list), n)
+        self.assertEqual(len(case_name), n)
+        npt.assert_allclose([c[('InflowWind','HWindSpeed')] for c in case_list], samples['Vhub'])
+        npt.assert_allclose([c[('HydroDyn','WaveHs')] for c in case_list], samples['Hs'])
+
+    def testTmax(self):
+        # tmax is the simulation time unless the distribution file defines AnalTime
+        fname = self.write_dist(conditional_dist)
+        for sampling in ['lhs', 'random']:
+            case_list, _ = cgd.CaseGen_Dists({'dist': fname, 'nsamples': 4, 'sampling': sampling, 'tmax': 60.})
+            for case in case_list:
+                self.assertEqual(np.ravel(case[('Fst','TMax')])[0], 60.)
+
+        fname = self.write_dist("AnalTime = 600\n" + conditional_dist)
+        for sampling in ['lhs', 'random']:
+            case_list, _ = cgd.CaseGen_Dists({'dist': fname, 'nsamples': 4, 'sampling': sampling, 'tmax': 60.})
+            for case in case_list:
+                self.assertEqual(np.ravel(case[('Fst','TMax')])[0], 600.)
+
+    def testVonMises(self):
+        # Bisection of the CDF against scipy's root finding, including arrays of parameters
+        u = np.array([1e-6, 0.01, 0.25, 0.5, 0.75, 0.99, 1 - 1e-6])
+        for kappa, loc in [(0.1, 0.), (1.5, -0.6), (20., 1.)]:
+            npt.assert_allclose(cgd.ppf_vonmises(u, kappa, loc), vonmises.ppf(u, kappa, loc=loc), atol=1e-9)
+        kappa = np.array([0.1, 1.5, 20.])
+        x = cgd.ppf_vonmises(0.3, kappa, 0.)
+        npt.assert_allclose(vonmises.cdf(x, kappa), 0.3, atol=1e-12)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestCaseGenDists))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
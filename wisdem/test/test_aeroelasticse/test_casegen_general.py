@@ -0,0 +1,145 @@
+import os
+import itertools
+import warnings
+import tempfile
+import shutil
+import numpy as np
+import numpy.testing as npt
+import unittest
+import wisdem.aeroelasticse.CaseGen_General as cgg
+from wisdem.aeroelasticse.runFAST_pywrapper import runFAST_pywrapper_batch
+
+
+def reference_case_list(case_inputs):
+    # Case dicts as generated by CaseGen_General before the columnar case matrix, row by row
+    change_vars  = sorted(case_inputs.keys())
+    change_vals  = [case_inputs[var]['vals'] for var in change_vars]
+    change_group = [case_inputs[var]['group'] for var in change_vars]
+    group_set    = list(set(change_group))
+    group_len    = [len(change_vals[change_group.index(i)]) for i in group_set]
+    matrix_idx   = list(itertools.product(*[range(n) for n in group_len]))
+    matrix_group_idx = [np.where([group_i == group_j for group_j in change_group])[0].tolist() for group_i in group_set]
+
+    matrix_out = []
+    for row in matrix_idx:
+        row_out = [None]*len(change_vars)
+        for j, val in enumerate(row):
+            for g in matrix_group_idx[j]:
+                row_out[g] = change_vals[g][val]
+        matrix_out.append(row_out)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore') # ragged rows
+        try:
+            matrix_out = np.asarray(matrix_out)
+        except ValueError:
+            # numpy >= 1.24 requires the object dtype of ragged rows to be explicit
+            matrix_out = np.asarray(matrix_out, dtype=object)
+
+    case_list = [{var:cgg.convert_str(matrix_out[i,j]) for j, var in enumerate(change_vars)} for i in range(len(matrix_idx))]
+    return case_list, matrix_out, change_vars
+
+
+def reference_text(matrix_out, change_vars):
+    # case_matrix.txt as written row by row before the columnar case matrix
+    n_cases    = np.shape(matrix_out)[0]
+    matrix_out = np.hstack((np.asarray([[i] for i in range(n_cases)]), matrix_out))
+    change_vars = [('Case_ID', '')] + change_vars
+    col_len = [max([len(str(val)) for val in matrix_out[:,j]] + [len(change_vars[j][h]) for h in range(2)]) for j in range(len(change_vars))]
+    text_out = []
+    for h in range(2):
+        text_out.append(''.join([var[h].center(col+2) for var, col in zip(change_vars, col_len)])+'\n')
+    for row in matrix_out:
+        text_out.append(''.join([str(val).center(col+2) for val, col in zip(row, col_len)])+'\n')
+    return ''.join(text_out)
+
+
+def signature(case_list):
+    # values and their types, so that 1 and 1.0 differ
+    return [[(var, repr(val), type(val).__name__) for var, val in case.items()] for case in case_list]
+
+
+def example_inputs():
+    case_inputs = {}
+    case_inputs[("Fst","TMax")] = {'vals':[10.], 'group':0}
+    case_inputs[("InflowWind","WindType")] = {'vals':[1], 'group':0}
+    case_inputs[("InflowWind","HWindSpeed")] = {'vals':[8., 9., 10., 11., 12.], 'group':1}
+    case_inputs[("ElastoDyn","RotSpeed")] = {'vals':[9.156, 10.296, 11.431, 11.89, 12.1], 'group':1}
+    case_inputs[("ElastoDyn","BlPitch1")] = {'vals':[0., 0., 0., 0., 3.823], 'group':1}
+    case_inputs[("ElastoDyn","BlPitch2")] = case_inputs[("ElastoDyn","BlPitch1")]
+    case_inputs[("ElastoDyn","GenDOF")] = {'vals':['True','False'], 'group':2}
+    return case_inputs
+
+
+cases = {'example'       : example_inputs(),
+         'numeric'       : {("Fst","TMax"):{'vals':[600.], 'group':0}, ("InflowWind","HWindSpeed"):{'vals':list(np.linspace(3,25,7)), 'group':1},
+                            ("ElastoDyn","NacYaw"):{'vals':[-8.,0,8.], 'group':2}, ("InflowWind","WindType"):{'vals':[1,2], 'group':3}},
+         'mixed_str'     : {("A","a"):{'vals':[1, 2.5], 'group':1}, ("B","b"):{'vals':['x'], 'group':2}},
+         'mixed_bool'    : {("A","a"):{'vals':[np.float64(1.5), 2], 'group':1}, ("B","b"):{'vals':[True, False], 'group':2}},
+         'mixed_np_str'  : {("A","a"):{'vals':[np.float64(1.5), 2, True], 'group':1}, ("B","b"):{'vals':['x', 'True'], 'group':2}},
+         'list_float'    : {("A","a"):{'vals':[[1,2],[3,4]], 'group':1}, ("B","b"):{'vals':[0.5, 2.], 'group':2}},
+         'list_str'      : {("A","a"):{'vals':[[1,2],[3,4]], 'group':1}, ("B","b"):{'vals':['x','y'], 'group':2}},
+         'list_ragged'   : {("A","a"):{'vals':[[1,2],[3,4,5]], 'group':1}, ("B","b"):{'vals':[1.], 'group':2}},
+         }
+
+
+class TestCaseGenGeneral(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def testAgainstReference(self):
+        for name, case_inputs in cases.items():
+            case_list, case_name = cgg.CaseGen_General(case_inputs, dir_matrix=self.tmpdir, namebase='test')
+            ref_list, matrix_out, change_vars = reference_case_list(case_inputs)
+            self.assertEqual(signature(case_list), signature(ref_list), name)
+            self.assertEqual(case_name[0], 'test_' + '0'*(len(str(len(ref_list)-1))))
+            with open(os.path.join(self.tmpdir, 'case_matrix.txt')) as f:
+                self.assertEqual(f.read(), reference_text(matrix_out, change_vars), name)
+
+    def testListValues(self):
+        # Equal length lists are single values, not a dimension of the matrix
+        case_inputs = {("A","a"):{'vals':[[1,2],[3,4]], 'group':1}}
+        case_list, _ = cgg.CaseGen_General(case_inputs, save_matrix=False)
+        self.assertEqual(case_list, [{("A","a"):[1,2]}, {("A","a"):[3,4]}])
+
+    def testColumnar(self):
+        for name, case_inputs in cases.items():
+            case_matrix, _ = cgg.CaseGen_General(case_inputs, save_matrix=False, columnar=True)
+            ref_list, _, _ = reference_case_list(case_inputs)
+            self.assertEqual(len(case_matrix), len(ref_list))
+            self.assertEqual(signature(case_matrix.to_list()), signature(ref_list), name)
+            self.assertEqual(signature(case_matrix[1:3]), signature(ref_list[1:3]), name)
+            self.assertEqual(signature(case_matrix[[-1, 0]]), signature([ref_list[-1], ref_list[0]]), name)
+            self.assertEqual(signature([case_matrix[-1]]), signature([ref_list[-1]]), name)
+
+            # save / load
+            fname = os.path.join(self.tmpdir, 'cases.npz')
+            case_matrix.save(fname)
+            loaded = cgg.CaseMatrix.load(fname)
+            self.assertEqual(loaded.change_vars, case_matrix.change_vars)
+            self.assertEqual(signature(loaded), signature(ref_list), name)
+
+        case_matrix, _ = cgg.CaseGen_General(example_inputs(), save_matrix=False, columnar=True)
+        npt.assert_equal(case_matrix.column(("InflowWind","HWindSpeed")), np.repeat([8., 9., 10., 11., 12.], 2))
+
+    def testBatchCases(self):
+        # The batch runner takes a CaseMatrix as case_list and builds the case arguments one at a time
+        case_matrix, case_name = cgg.CaseGen_General(example_inputs(), save_matrix=False, columnar=True)
+        ref_list, _, _ = reference_case_list(example_inputs())
+        batch = runFAST_pywrapper_batch(case_list=case_matrix, case_name_list=case_name)
+        for i in range(len(case_matrix)):
+            case_data = batch.case_data(i)
+            self.assertEqual(signature([case_data[0]]), signature([ref_list[i]]))
+            self.assertEqual(case_data[1], case_name[i])
+        self.assertEqual(signature(list(iter(case_matrix))), signature(ref_list))
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestCaseGenGeneral))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
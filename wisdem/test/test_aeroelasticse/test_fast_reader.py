@@ -0,0 +1,833 @@
+import os
+import copy
+import tempfile
+import shutil
+import numpy as np
+import numpy.testing as npt
+import unittest
+import wisdem.aeroelasticse.FAST_reader as FAST_reader
+from wisdem.aeroelasticse.FAST_reader import read_table, tokenize_file, clear_file_cache, InputReader_OpenFAST
+from wisdem.aeroelasticse.FAST_reader import bool_read, float_read, int_read
+from wisdem.aeroelasticse.FAST_writer import InputWriter_OpenFAST
+from wisdem.aeroelasticse.FAST_vars import FstModel
+
+blade_file = """------- AERODYN v15.00.* BLADE DEFINITION INPUT FILE -------------------------------------
+Test blade
+======  Blade Properties =================================================================
+          3   NumBlNds           - Number of blade nodes used in the analysis (-)
+    BlSpn        BlCrvAC        BlSwpAC        BlCrvAng       BlTwist        BlChord          BlAFID
+     (m)           (m)            (m)            (deg)         (deg)           (m)              (-)
+0.0000000E+00  0.0000000E+00  0.0000000E+00  0.0000000E+00  1.3308000E+01  3.5420000E+00           1
+3.0000000E+01 -1.5000000E-01  0.0000000E+00  0.0000000E+00  6.5440000E+00  4.1670000E+00           2
+6.1500000E+01 -4.0000000E-01  0.0000000E+00  0.0000000E+00  1.0600000E-01  1.4190000E+00           3
+"""
+
+
+class Inputs(dict):
+    # module inputs that are not set are written as 0
+    def __missing__(self, key):
+        return 0
+
+
+def example_fst_vt():
+    # OpenFAST deck with ElastoDyn, AeroDyn15 (two airfoils, one with unsteady aero data), ServoDyn and HydroDyn tables
+    fst_vt = {k: Inputs(v) if isinstance(v, dict) else v for k, v in copy.deepcopy(FstModel).items()}
+    fst_vt['Fst'].update({'AbortLevel': 'FATAL', 'TMax': 10., 'DT': 0.01, 'InterpOrder': 2, 'CompElast': 1, 'CompInflow': 1,
+                          'CompAero': 2, 'CompServo': 1, 'CompHydro': 1, 'CompSub': 0, 'CompMooring': 0, 'OutFmt': 'ES10.3E2'})
+    # quoted strings (file names not read by the reader are left 'unused')
+    for module, keys in [('ElastoDyn', ['FurlFile', 'OutFmt']), ('Fst', ['IceFile', 'MooringFile', 'SubFile', 'BDBldFile(1)', 'BDBldFile(2)', 'BDBldFile(3)']),
+                         ('HydroDyn', ['PotFile', 'WvKinFile']), ('BeamDyn', ['BldFile']),
+                         ('InflowWind', ['FileName_u', 'FileName_v', 'FileName_w', 'Filename', 'FilenameRoot']),
+                         ('ServoDyn', ['DLL_FileName', 'DLL_InFile', 'DLL_ProcName', 'NTMDfile', 'TTMDfile', 'OutFmt'])]:
+        for k in keys:
+            fst_vt[module][k] = 'ES10.3E2' if k == 'OutFmt' else 'unused'
+    # integer inputs with float defaults
+    for k in ['WaveSeed1', 'WaveSeed2', 'WaveStMod', 'WaveNDir', 'WaveDirMod', 'CurrMod', 'PotMod', 'RdtnMod', 'OutSwtch']:
+        fst_vt['HydroDyn'][k] = int(fst_vt['HydroDyn'][k])
+    fst_vt['ElastoDyn']['DecFact'] = int(fst_vt['ElastoDyn']['DecFact'])
+    fst_vt['ServoDyn'].update({'Ptch_Cntrl': 0, 'DLL_NumTrq': 2, 'GenSpd_TLU': [0., 1200.], 'GenTrq_TLU': [0., 4.3e4]})
+    edb = fst_vt['ElastoDynBlade']
+    edb['NBlInpSt'] = 4
+    for k, v in [('BlFract', [0., .3, .7, 1.]), ('PitchAxis', [.25, .3, .35, .4]), ('StrcTwst', [13.3, 8.2, 1.5, 0.]),
+                 ('BMassDen', [678.9, 400., 200.5, 10.3]), ('FlpStff', [1.8e10, 3.2e9, 2.9e8, 1.7e5]),
+                 ('EdgStff', [1.8e10, 6.1e9, 8.3e8, 5e5])]:
+        edb[k] = np.array(v)
+    for k in ['BldFl1Sh', 'BldFl2Sh', 'BldEdgSh']:
+        edb[k] = np.array([0.0622, 1.7254, -3.2452, 4.7131, -2.2555])
+    edt = fst_vt['ElastoDynTower']
+    edt['NTwInpSt'] = 3
+    for k, v in [('HtFract', [0., .5, 1.]), ('TMassDen', [5590.9, 4200.2, 2536.3]), ('TwFAStif', [6.1e11, 3.2e11, 1.1e11]),
+                 ('TwSSStif', [6.1e11, 3.2e11, 1.1e11])]:
+        edt[k] = np.array(v)
+    for k in ['TwFAM1Sh', 'TwFAM2Sh', 'TwSSM1Sh', 'TwSSM2Sh']:
+        edt[k] = np.array([0.7004, 2.1963, -5.6202, 6.2275, -2.504])
+
+    adb = fst_vt['AeroDynBlade']
+    adb['NumBlNds'] = 3
+    for k, v in [('BlSpn', [0., 30., 61.5]), ('BlCrvAC', [0., -.15, -.4]), ('BlSwpAC', [0., 0., 0.]),
+                 ('BlCrvAng', [0., 0., 0.]), ('BlTwist', [13.3, 6.5, 0.1]), ('BlChord', [3.54, 4.17, 1.42]), ('BlAFID', [1, 2, 2])]:
+        adb[k] = v
+    fst_vt['AeroDyn15'].update({'InCol_Alfa': 1, 'InCol_Cl': 2, 'InCol_Cd': 3, 'InCol_Cm': 4, 'InCol_Cpmin': 0})
+    alpha = np.linspace(-180., 180., 9)
+    fst_vt['AeroDyn15']['af_data'] = []
+    for i, ua in enumerate([False, True]):
+        af = Inputs({'InterpOrd': 1, 'NonDimArea': 1, 'NumTabs': 1, 'Re': 0.75, 'Ctrl': 0, 'InclUAdata': ua,
+                     'Alpha': alpha, 'Cl': np.sin(np.deg2rad(2*alpha))*(i+1), 'Cd': 0.01 + 1e-5*alpha**2, 'Cm': -0.01*np.sin(np.deg2rad(alpha)),
+                     'Cpmin': np.zeros(alpha.size), 'NumAlf': alpha.size})
+        if ua:
+            for k in ['T_f0', 'T_V0', 'T_p', 'T_VL', 'b1', 'b2', 'b5', 'A1', 'A2', 'A5', 'St_sh', 'x_cp_bar', 'UACutout', 'filtCutOff']:
+                af[k] = 'Default'
+            af.update({'alpha0': -3.2, 'alpha1': 9., 'alpha2': -9., 'eta_e': 1., 'C_nalpha': 7.1, 'Cn1': 1.6, 'Cn2': -0.8, 'Cd0': 0.006})
+        fst_vt['AeroDyn15']['af_data'].append(af)
+    hd = fst_vt['HydroDyn']
+    hd.update({'WaveElevxi': ['0.0'], 'WaveElevyi': ['0.0'], 'NWaveElev': 1, 'AddF0': [0.]*6, 'AddCLin': np.zeros((6, 6)),
+               'AddBLin': np.zeros((6, 6)), 'AddBQuad': np.zeros((6, 6))})
+    hd.update({'NAxCoef': 1, 'AxCoefID': [1], 'AxCd': [0.], 'AxCa': [0.], 'AxCp': [1.]})
+    hd.update({'NJoints': 3, 'JointID': [1, 2, 3], 'Jointxi': [0., 0., 0.], 'Jointyi': [0., 0., 0.],
+               'Jointzi': [-120., -12., 10.], 'JointAxID': [1, 1, 1], 'JointOvrlp': [0, 0, 0]})
+    hd.update({'NPropSets': 2, 'PropSetID': [1, 2], 'PropD': [9.4, 6.5], 'PropThck': [0.0625, 0.0625]})
+    hd.update({'SimplCd': 0.6, 'SimplCa': 0.97, 'SimplCp': 1.})
+    hd.update({'NCoefDpth': 2, 'Dpth': [-120., 0.]})
+    for k in ['DpthCd', 'DpthCdMG', 'DpthCa', 'DpthCaMG', 'DpthCp', 'DpthCpMG', 'DpthAxCa', 'DpthAxCaMG', 'DpthAxCp', 'DpthAxCpMG']:
+        hd[k] = [0.6, 0.5]
+    hd.update({'NCoefMembers': 1, 'MemberID_HydC': [1]})
+    for k in ['Cd', 'CdMG', 'Ca', 'CaMG', 'Cp', 'CpMG', 'AxCa', 'AxCaMG', 'AxCp', 'AxCpMG']:
+        hd['Member%s1' % k] = [0.6]
+        hd['Member%s2' % k] = [0.5]
+    hd.update({'NMembers': 2, 'MemberID': [1, 2], 'MJointID1': [1, 2], 'MJointID2': [2, 3], 'MPropSetID1': [1, 2],
+               'MPropSetID2': [1, 2], 'MDivSize': [0.5, 0.5], 'MCoefMod': [1, 3], 'PropPot': [True, False]})
+    hd.update({'NFillGroups': 1, 'FillNumM': [2], 'FillMList': [[1, 2]], 'FillFSLoc': [0.], 'FillDens': [1025.]})
+    hd.update({'NMGDepths': 2, 'MGDpth': [-120., 0.], 'MGThck': [0.05, 0.1], 'MGDens': [1100., 1100.]})
+    hd.update({'NMOutputs': 1, 'MemberID_out': [1], 'NOutLoc': [2], 'NodeLocs': ['0.0 1.0']})
+    hd.update({'NJOutputs': 1, 'JOutLst': [1], 'OutFmt': '"ES11.4e2"', 'OutSFmt': '"A11"'})
+    return fst_vt
+
+
+class PreviousReader(InputReader_OpenFAST):
+    # The table readers as they were before the bulk loaded tables and the tokenized AeroDyn files
+    def read_ElastoDynBlade(self):
+        # ElastoDyn v1.00 Blade Input File
+        # Currently no differences between FASTv8.16 and OpenFAST.
+        if self.FAST_ver.lower() == 'fast7':
+            blade_file = os.path.join(self.FAST_directory, self.fst_vt['Fst7']['BldFile1'])
+        else:
+            blade_file = os.path.join(self.FAST_directory, self.fst_vt['ElastoDyn']['BldFile1'])
+
+        f = open(blade_file)
+        # print blade_file
+        f.readline()
+        f.readline()
+        f.readline()
+        if self.FAST_ver.lower() == 'fast7':
+            f.readline()
+
+        # Blade Parameters
+        self.fst_vt['ElastoDynBlade']['NBlInpSt'] = int(f.readline().split()[0])
+        if self.FAST_ver.lower() == 'fast7':
+            self.fst_vt['ElastoDynBlade']['CalcBMode'] = bool_read(f.readline().split()[0])
+        self.fst_vt['ElastoDynBlade']['BldFlDmp1'] = float_read(f.readline().split()[0])
+        self.fst_vt['ElastoDynBlade']['BldFlDmp2'] = float_read(f.readline().split()[0])
+        self.fst_vt['ElastoDynBlade']['BldEdDmp1'] = float_read(f.readline().split()[0])
+
+        # Blade Adjustment Factors
+        f.readline()
+        self.fst_vt['ElastoDynBlade']['FlStTunr1'] = float_read(f.readline().split()[0])
+        self.fst_vt['ElastoDynBlade']['FlStTunr2'] = float_read(f.readline().split()[0])
+        self.fst_vt['ElastoDynBlade']['AdjBlMs'] = float_read(f.readline().split()[0])
+        self.fst_vt['ElastoDynBlade']['AdjFlSt'] = float_read(f.readline().split()[0])
+        self.fst_vt['ElastoDynBlade']['AdjEdSt'] = float_read(f.readline().split()[0])
+
+        # Distrilbuted Blade Properties
+        f.readline()
+        f.readline()
+        f.readline()
+        self.fst_vt['ElastoDynBlade']['BlFract'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
+        self.fst_vt['ElastoDynBlade']['PitchAxis'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
+        self.fst_vt['ElastoDynBlade']['StrcTwst'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
+        self.fst_vt['ElastoDynBlade']['BMassDen'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
+        self.fst_vt['ElastoDynBlade']['FlpStff'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
+        self.fst_vt['ElastoDynBlade']['EdgStff'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
+        if self.FAST_ver.lower() == 'fast7':
+            self.fst_vt['ElastoDynBlade']['GJStff'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
+            self.fst_vt['ElastoDynBlade']['EAStff'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
+            self.fst_vt['ElastoDynBlade']['Alpha'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
+            self.fst_vt['ElastoDynBlade']['FlpIner'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
+            self.fst_vt['ElastoDynBlade']['EdgIner'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
+            self.fst_vt['ElastoDynBlade']['PrecrvRef'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
+            self.fst_vt['ElastoDynBlade']['PreswpRef'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
+            self.fst_vt['ElastoDynBlade']['FlpcgOf'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
+            self.fst_vt['ElastoDynBlade']['Edgcgof'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
+            self.fst_vt['ElastoDynBlade']['FlpEAOf'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
+            self.fst_vt['ElastoDynBlade']['EdgEAOf'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
+        for i in range(self.fst_vt['ElastoDynBlade']['NBlInpSt']):
+            data = f.readline().split()
+            self.fst_vt['ElastoDynBlade']['BlFract'][i]  = float_read(data[0])
+            self.fst_vt['ElastoDynBlade']['PitchAxis'][i]  = float_read(data[1])
+            self.fst_vt['ElastoDynBlade']['StrcTwst'][i]  = float_read(data[2])
+            self.fst_vt['ElastoDynBlade']['BMassDen'][i]  = float_read(data[3])
+            self.fst_vt['ElastoDynBlade']['FlpStff'][i]  = float_read(data[4])
+            self.fst_vt['ElastoDynBlade']['EdgStff'][i]  = float_read(data[5])
+            if self.FAST_ver.lower() == 'fast7':
+                self.fst_vt['ElastoDynBlade']['GJStff'][i]  = float_read(data[6])
+                self.fst_vt['ElastoDynBlade']['EAStff'][i]  = float_read(data[7])
+                self.fst_vt['ElastoDynBlade']['Alpha'][i]  = float_read(data[8])
+                self.fst_vt['ElastoDynBlade']['FlpIner'][i]  = float_read(data[9])
+                self.fst_vt['ElastoDynBlade']['EdgIner'][i]  = float_read(data[10])
+                self.fst_vt['ElastoDynBlade']['PrecrvRef'][i]  = float_read(data[11])
+                self.fst_vt['ElastoDynBlade']['PreswpRef'][i]  = float_read(data[12])
+                self.fst_vt['ElastoDynBlade']['FlpcgOf'][i]  = float_read(data[13])
+                self.fst_vt['ElastoDynBlade']['Edgcgof'][i]  = float_read(data[14])
+                self.fst_vt['ElastoDynBlade']['FlpEAOf'][i]  = float_read(data[15])
+                self.fst_vt['ElastoDynBlade']['EdgEAOf'][i]  = float_read(data[16])
+
+        f.readline()
+        self.fst_vt['ElastoDynBlade']['BldFl1Sh'] = [None] * 5
+        self.fst_vt['ElastoDynBlade']['BldFl2Sh'] = [None] * 5
+        self.fst_vt['ElastoDynBlade']['BldEdgSh'] = [None] * 5
+        for i in range(5):
+            self.fst_vt['ElastoDynBlade']['BldFl1Sh'][i]  = float_read(f.readline().split()[0])
+        for i in range(5):
+            self.fst_vt['ElastoDynBlade']['BldFl2Sh'][i]  = float_read(f.readline().split()[0])
+        for i in range(5):
+            self.fst_vt['ElastoDynBlade']['BldEdgSh'][i]  = float_read(f.readline().split()[0])
+
+        f.close()
+
+    def read_ElastoDynTower(self):
+        # ElastoDyn v1.00 Tower Input Files
+        # Currently no differences between FASTv8.16 and OpenFAST.
+
+        if self.FAST_ver.lower() == 'fast7':
+            tower_file = os.path.join(self.FAST_directory, self.fst_vt['Fst7']['TwrFile'])
+        else:
+            tower_file = os.path.join(self.FAST_directory, self.fst_vt['ElastoDyn']['TwrFile'])
+
+        f = open(tower_file)
+
+        f.readline()
+        f.readline()
+        if self.FAST_ver.lower() == 'fast7':
+            f.readline()
+
+        # General Tower Paramters
+        f.readline()
+        self.fst_vt['ElastoDynTower']['NTwInpSt'] = int(f.readline().split()[0])
+        if self.FAST_ver.lower() == 'fast7':
+            self.fst_vt['ElastoDynTower']['CalcTMode'] = bool_read(f.readline().split()[0])
+        self.fst_vt['ElastoDynTower']['TwrFADmp1'] = float_read(f.readline().split()[0])
+        self.fst_vt['ElastoDynTower']['TwrFADmp2'] = float_read(f.readline().split()[0])
+        self.fst_vt['ElastoDynTower']['TwrSSDmp1'] = float_read(f.readline().split()[0])
+        self.fst_vt['ElastoDynTower']['TwrSSDmp2'] = float_read(f.readline().split()[0])
+
+        # Tower Adjustment Factors
+        f.readline()
+        self.fst_vt['ElastoDynTower']['FAStTunr1'] = float_read(f.readline().split()[0])
+        self.fst_vt['ElastoDynTower']['FAStTunr2'] = float_read(f.readline().split()[0])
+        self.fst_vt['ElastoDynTower']['SSStTunr1'] = float_read(f.readline().split()[0])
+        self.fst_vt['ElastoDynTower']['SSStTunr2'] = float_read(f.readline().split()[0])
+        self.fst_vt['ElastoDynTower']['AdjTwMa'] = float_read(f.readline().split()[0])
+        self.fst_vt['ElastoDynTower']['AdjFASt'] = float_read(f.readline().split()[0])
+        self.fst_vt['ElastoDynTower']['AdjSSSt'] = float_read(f.readline().split()[0])
+
+        # Distributed Tower Properties
+        f.readline()
+        f.readline()
+        f.readline()
+        self.fst_vt['ElastoDynTower']['HtFract'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
+        self.fst_vt['ElastoDynTower']['TMassDen'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
+        self.fst_vt['ElastoDynTower']['TwFAStif'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
+        self.fst_vt['ElastoDynTower']['TwSSStif'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
+        if self.FAST_ver.lower() == 'fast7':
+            self.fst_vt['ElastoDynTower']['TwGJStif'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
+            self.fst_vt['ElastoDynTower']['TwEAStif'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
+            self.fst_vt['ElastoDynTower']['TwFAIner'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
+            self.fst_vt['ElastoDynTower']['TwSSIner'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
+            self.fst_vt['ElastoDynTower']['TwFAcgOf'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
+            self.fst_vt['ElastoDynTower']['TwSScgOf'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
+
+        for i in range(self.fst_vt['ElastoDynTower']['NTwInpSt']):
+            data = f.readline().split()
+            self.fst_vt['ElastoDynTower']['HtFract'][i]  = float_read(data[0])
+            self.fst_vt['ElastoDynTower']['TMassDen'][i]  = float_read(data[1])
+            self.fst_vt['ElastoDynTower']['TwFAStif'][i]  = float_read(data[2])
+            self.fst_vt['ElastoDynTower']['TwSSStif'][i]  = float_read(data[3])
+            if self.FAST_ver.lower() == 'fast7':
+                self.fst_vt['ElastoDynTower']['TwGJStif'][i]  = float_read(data[4])
+                self.fst_vt['ElastoDynTower']['TwEAStif'][i]  = float_read(data[5])
+                self.fst_vt['ElastoDynTower']['TwFAIner'][i]  = float_read(data[6])
+                self.fst_vt['ElastoDynTower']['TwSSIner'][i]  = float_read(data[7])
+                self.fst_vt['ElastoDynTower']['TwFAcgOf'][i]  = float_read(data[8])
+                self.fst_vt['ElastoDynTower']['TwSScgOf'][i]  = float_read(data[9])
+
+        # Tower Mode Shapes
+        f.readline()
+        self.fst_vt['ElastoDynTower']['TwFAM1Sh'] = [None] * 5
+        self.fst_vt['ElastoDynTower']['TwFAM2Sh'] = [None] * 5
+        for i in range(5):
+            self.fst_vt['ElastoDynTower']['TwFAM1Sh'][i]  = float_read(f.readline().split()[0])
+        for i in range(5):
+            self.fst_vt['ElastoDynTower']['TwFAM2Sh'][i]  = float_read(f.readline().split()[0])
+        f.readline()
+        self.fst_vt['ElastoDynTower']['TwSSM1Sh'] = [None] * 5
+        self.fst_vt['ElastoDynTower']['TwSSM2Sh'] = [None] * 5
+        for i in range(5):
+            self.fst_vt['ElastoDynTower']['TwSSM1Sh'][i]  = float_read(f.readline().split()[0])
+        for i in range(5):
+            self.fst_vt['ElastoDynTower']['TwSSM2Sh'][i]  = float_read(f.readline().split()[0])
+
+        f.close()
+
+    def read_AeroDyn15Blade(self):
+        # AeroDyn v5.00 Blade Definition File
+
+        ad_blade_file = os.path.join(self.FAST_directory, self.fst_vt['AeroDyn15']['ADBlFile1'])
+        f = open(ad_blade_file)
+
+        f.readline()
+        f.readline()
+        f.readline()
+        # Blade Properties
+        self.fst_vt['AeroDynBlade']['NumBlNds']       = int(f.readline().split()[0])
+        f.readline()
+        f.readline()
+        self.fst_vt['AeroDynBlade']['BlSpn']          = [None]*self.fst_vt['AeroDynBlade']['NumBlNds']
+        self.fst_vt['AeroDynBlade']['BlCrvAC']        = [None]*self.fst_vt['AeroDynBlade']['NumBlNds']
+        self.fst_vt['AeroDynBlade']['BlSwpAC']        = [None]*self.fst_vt['AeroDynBlade']['NumBlNds']
+        self.fst_vt['AeroDynBlade']['BlCrvAng']       = [None]*self.fst_vt['AeroDynBlade']['NumBlNds']
+        self.fst_vt['AeroDynBlade']['BlTwist']        = [None]*self.fst_vt['AeroDynBlade']['NumBlNds']
+        self.fst_vt['AeroDynBlade']['BlChord']        = [None]*self.fst_vt['AeroDynBlade']['NumBlNds']
+        self.fst_vt['AeroDynBlade']['BlAFID']         = [None]*self.fst_vt['AeroDynBlade']['NumBlNds']
+        for i in range(self.fst_vt['AeroDynBlade']['NumBlNds']):
+            data = [float(val) for val in f.readline().split()]
+            self.fst_vt['AeroDynBlade']['BlSpn'][i]   = data[0]
+            self.fst_vt['AeroDynBlade']['BlCrvAC'][i] = data[1]
+            self.fst_vt['AeroDynBlade']['BlSwpAC'][i] = data[2]
+            self.fst_vt['AeroDynBlade']['BlCrvAng'][i]= data[3]
+            self.fst_vt['AeroDynBlade']['BlTwist'][i] = data[4]
+            self.fst_vt['AeroDynBlade']['BlChord'][i] = data[5]
+            self.fst_vt['AeroDynBlade']['BlAFID'][i]  = data[6]
+
+        f.close()
+
+    def read_AeroDyn15Polar(self):
+        # AirfoilInfo v1.01
+
+        def readline_filterComments(f):
+            read = True
+            while read:
+                line = f.readline().strip()
+                if len(line)>0:
+                    if line[0] != '!':
+                        read = False
+            return line
+
+
+        self.fst_vt['AeroDyn15']['af_data'] = [None]*self.fst_vt['AeroDyn15']['NumAFfiles']
+
+        for afi, af_filename in enumerate(self.fst_vt['AeroDyn15']['AFNames']):
+            f = open(af_filename)
+            # print af_filename
+
+            polar = {}
+
+            polar['InterpOrd']      = int_read(readline_filterComments(f).split()[0])
+            polar['NonDimArea']     = int_read(readline_filterComments(f).split()[0])
+            polar['NumCoords']      = readline_filterComments(f).split()[0]
+            polar['NumTabs']        = int_read(readline_filterComments(f).split()[0])
+            polar['Re']             = float_read(readline_filterComments(f).split()[0])
+            polar['Ctrl']           = int_read(readline_filterComments(f).split()[0])
+            polar['InclUAdata']     = bool_read(readline_filterComments(f).split()[0])
+
+            # Unsteady Aero Data
+            if polar['InclUAdata']:
+                polar['alpha0']     = float_read(readline_filterComments(f).split()[0])
+                polar['alpha1']     = float_read(readline_filterComments(f).split()[0])
+                polar['alpha2']     = float_read(readline_filterComments(f).split()[0])
+                polar['eta_e']      = float_read(readline_filterComments(f).split()[0])
+                polar['C_nalpha']   = float_read(readline_filterComments(f).split()[0])
+                polar['T_f0']       = float_read(readline_filterComments(f).split()[0])
+                polar['T_V0']       = float_read(readline_filterComments(f).split()[0])
+                polar['T_p']        = float_read(readline_filterComments(f).split()[0])
+                polar['T_VL']       = float_read(readline_filterComments(f).split()[0])
+                polar['b1']         = float_read(readline_filterComments(f).split()[0])
+                polar['b2']         = float_read(readline_filterComments(f).split()[0])
+                polar['b5']         = float_read(readline_filterComments(f).split()[0])
+                polar['A1']         = float_read(readline_filterComments(f).split()[0])
+                polar['A2']         = float_read(readline_filterComments(f).split()[0])
+                polar['A5']         = float_read(readline_filterComments(f).split()[0])
+                polar['S1']         = float_read(readline_filterComments(f).split()[0])
+                polar['S2']         = float_read(readline_filterComments(f).split()[0])
+                polar['S3']         = float_read(readline_filterComments(f).split()[0])
+                polar['S4']         = float_read(readline_filterComments(f).split()[0])
+                polar['Cn1']        = float_read(readline_filterComments(f).split()[0])
+                polar['Cn2']        = float_read(readline_filterComments(f).split()[0])
+                polar['St_sh']      = float_read(readline_filterComments(f).split()[0])
+                polar['Cd0']        = float_read(readline_filterComments(f).split()[0])
+                polar['Cm0']        = float_read(readline_filterComments(f).split()[0])
+                polar['k0']         = float_read(readline_filterComments(f).split()[0])
+                polar['k1']         = float_read(readline_filterComments(f).split()[0])
+                polar['k2']         = float_read(readline_filterComments(f).split()[0])
+                polar['k3']         = float_read(readline_filterComments(f).split()[0])
+                polar['k1_hat']     = float_read(readline_filterComments(f).split()[0])
+                polar['x_cp_bar']   = float_read(readline_filterComments(f).split()[0])
+                polar['UACutout']   = float_read(readline_filterComments(f).split()[0])
+                polar['filtCutOff'] = float_read(readline_filterComments(f).split()[0])
+
+            # Polar Data
+            polar['NumAlf']         = int_read(readline_filterComments(f).split()[0])
+            polar['Alpha']          = [None]*polar['NumAlf']
+            polar['Cl']             = [None]*polar['NumAlf']
+            polar['Cd']             = [None]*polar['NumAlf']
+            polar['Cm']             = [None]*polar['NumAlf']
+            polar['Cpmin']          = [None]*polar['NumAlf']
+            for i in range(polar['NumAlf']):
+                data = [float(val) for val in readline_filterComments(f).split()]
+                if self.fst_vt['AeroDyn15']['InCol_Alfa'] > 0:
+                    polar['Alpha'][i] = data[self.fst_vt['AeroDyn15']['InCol_Alfa']-1]
+                if self.fst_vt['AeroDyn15']['InCol_Cl'] > 0:
+                    polar['Cl'][i]    = data[self.fst_vt['AeroDyn15']['InCol_Cl']-1]
+                if self.fst_vt['AeroDyn15']['InCol_Cd'] > 0:
+                    polar['Cd'][i]    = data[self.fst_vt['AeroDyn15']['InCol_Cd']-1]
+                if self.fst_vt['AeroDyn15']['InCol_Cm'] > 0:
+                    polar['Cm'][i]    = data[self.fst_vt['AeroDyn15']['InCol_Cm']-1]
+                if self.fst_vt['AeroDyn15']['InCol_Cpmin'] > 0:
+                    polar['Cpmin'][i] = data[self.fst_vt['AeroDyn15']['InCol_Cpmin']-1]
+
+            self.fst_vt['AeroDyn15']['af_data'][afi] = polar
+
+            f.close()
+
+    def read_HydroDyn(self):
+        # AeroDyn v2.03
+
+        hd_file = os.path.normpath(os.path.join(self.FAST_directory, self.fst_vt['Fst']['HydroFile']))
+        f = open(hd_file)
+
+        f.readline()
+        f.readline()
+
+        self.fst_vt['HydroDyn']['Echo'] = bool_read(f.readline().split()[0])
+        # ENVIRONMENTAL CONDITIONS
+        f.readline()
+        self.fst_vt['HydroDyn']['WtrDens'] = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['WtrDpth'] = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['MSL2SWL'] = float_read(f.readline().split()[0])
+
+        # WAVES
+        f.readline()
+        self.fst_vt['HydroDyn']['WaveMod']       = int_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['WaveStMod']     = int_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['WaveTMax']      = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['WaveDT']        = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['WaveHs']        = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['WaveTp']        = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['WavePkShp']     = float_read(f.readline().split()[0]) # default
+        self.fst_vt['HydroDyn']['WvLowCOff']     = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['WvHiCOff']      = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['WaveDir']       = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['WaveDirMod']    = int_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['WaveDirSpread'] = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['WaveNDir']      = int_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['WaveDirRange']  = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['WaveSeed1']     = int_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['WaveSeed2']     = int_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['WaveNDAmp']     = bool_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['WvKinFile']     = f.readline().split()[0][1:-1]
+        self.fst_vt['HydroDyn']['NWaveElev']     = int_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['WaveElevxi']    = [idx.strip() for idx in f.readline().split('WaveElevxi')[0].split(',')]
+        self.fst_vt['HydroDyn']['WaveElevyi']    = [idx.strip() for idx in f.readline().split('WaveElevyi')[0].split(',')]
+
+        # 2ND-ORDER WAVES
+        f.readline()
+        self.fst_vt['HydroDyn']['WvDiffQTF']     = bool_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['WvSumQTF']      = bool_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['WvLowCOffD']    = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['WvHiCOffD']     = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['WvLowCOffS']    = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['WvHiCOffS']     = float_read(f.readline().split()[0])
+
+        # CURRENT
+        f.readline()
+        self.fst_vt['HydroDyn']['CurrMod']       = int_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['CurrSSV0']      = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['CurrSSDir']     = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['CurrNSRef']     = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['CurrNSV0']      = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['CurrNSDir']     = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['CurrDIV']       = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['CurrDIDir']     = float_read(f.readline().split()[0])
+
+        # FLOATING PLATFORM
+        f.readline()
+        self.fst_vt['HydroDyn']['PotMod']        = int_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['PotFile']       = os.path.normpath(os.path.join(os.path.split(hd_file)[0], f.readline().split()[0][1:-1]))
+        self.fst_vt['HydroDyn']['WAMITULEN']     = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['PtfmVol0']      = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['PtfmCOBxt']     = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['PtfmCOByt']     = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['RdtnMod']       = int_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['RdtnTMax']      = float_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['RdtnDT']        = float_read(f.readline().split()[0])
+
+        # 2ND-ORDER FLOATING PLATFORM FORCES
+        f.readline()
+        self.fst_vt['HydroDyn']['MnDrift']       = int_read(f.readline().split()[0]) # ?
+        self.fst_vt['HydroDyn']['NewmanApp']     = int_read(f.readline().split()[0]) # ?
+        self.fst_vt['HydroDyn']['DiffQTF']       = int_read(f.readline().split()[0]) # ?
+        self.fst_vt['HydroDyn']['SumQTF']        = int_read(f.readline().split()[0]) # ?
+
+        # FLOATING PLATFORM FORCE FLAGS
+        f.readline()
+        self.fst_vt['HydroDyn']['PtfmSgF']       = bool_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['PtfmSwF']       = bool_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['PtfmHvF']       = bool_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['PtfmRF']        = bool_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['PtfmPF']        = bool_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['PtfmYF']        = bool_read(f.readline().split()[0])
+
+        # PLATFORM ADDITIONAL STIFFNESS AND DAMPING
+        f.readline()
+        self.fst_vt['HydroDyn']['AddF0']         = [float(idx) for idx in f.readline().strip().split()[:6]]
+        self.fst_vt['HydroDyn']['AddCLin']       = np.array([[float(idx) for idx in f.readline().strip().split()[:6]] for i in range(6)])
+        self.fst_vt['HydroDyn']['AddBLin']       = np.array([[float(idx) for idx in f.readline().strip().split()[:6]] for i in range(6)])
+        self.fst_vt['HydroDyn']['AddBQuad']      = np.array([[float(idx) for idx in f.readline().strip().split()[:6]] for i in range(6)])
+
+        #AXIAL COEFFICIENTS
+        f.readline()
+        self.fst_vt['HydroDyn']['NAxCoef']       = int_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['AxCoefID']      = [None]*self.fst_vt['HydroDyn']['NAxCoef']
+        self.fst_vt['HydroDyn']['AxCd']          = [None]*self.fst_vt['HydroDyn']['NAxCoef']
+        self.fst_vt['HydroDyn']['AxCa']          = [None]*self.fst_vt['HydroDyn']['NAxCoef']
+        self.fst_vt['HydroDyn']['AxCp']          = [None]*self.fst_vt['HydroDyn']['NAxCoef']
+        ln = f.readline().split()
+        ln = f.readline().split()
+        for i in range(self.fst_vt['HydroDyn']['NAxCoef']):
+            ln = f.readline().split()
+            self.fst_vt['HydroDyn']['AxCoefID'][i] = int(ln[0])
+            self.fst_vt['HydroDyn']['AxCd'][i]     = float(ln[1])
+            self.fst_vt['HydroDyn']['AxCa'][i]     = float(ln[2])
+            self.fst_vt['HydroDyn']['AxCp'][i]     = float(ln[3])
+
+        #MEMBER JOINTS
+        f.readline()
+        self.fst_vt['HydroDyn']['NJoints']    = int_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['JointID']    = [None]*self.fst_vt['HydroDyn']['NJoints']
+        self.fst_vt['HydroDyn']['Jointxi']    = [None]*self.fst_vt['HydroDyn']['NJoints']
+        self.fst_vt['HydroDyn']['Jointyi']    = [None]*self.fst_vt['HydroDyn']['NJoints']
+        self.fst_vt['HydroDyn']['Jointzi']    = [None]*self.fst_vt['HydroDyn']['NJoints']
+        self.fst_vt['HydroDyn']['JointAxID']  = [None]*self.fst_vt['HydroDyn']['NJoints']
+        self.fst_vt['HydroDyn']['JointOvrlp'] = [None]*self.fst_vt['HydroDyn']['NJoints']
+        ln = f.readline().split()
+        ln = f.readline().split()
+        for i in range(self.fst_vt['HydroDyn']['NJoints']):
+            ln = f.readline().split()
+            self.fst_vt['HydroDyn']['JointID'][i]    = int(ln[0])
+            self.fst_vt['HydroDyn']['Jointxi'][i]    = float(ln[1])
+            self.fst_vt['HydroDyn']['Jointyi'][i]    = float(ln[2])
+            self.fst_vt['HydroDyn']['Jointzi'][i]    = float(ln[3])
+            self.fst_vt['HydroDyn']['JointAxID'][i]  = int(ln[4])
+            self.fst_vt['HydroDyn']['JointOvrlp'][i] = int(ln[5])
+
+        #MEMBER CROSS-SECTION PROPERTIES
+        f.readline()
+        self.fst_vt['HydroDyn']['NPropSets'] = int_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['PropSetID'] = [None]*self.fst_vt['HydroDyn']['NPropSets']
+        self.fst_vt['HydroDyn']['PropD']     = [None]*self.fst_vt['HydroDyn']['NPropSets']
+        self.fst_vt['HydroDyn']['PropThck']  = [None]*self.fst_vt['HydroDyn']['NPropSets']
+        ln = f.readline().split()
+        ln = f.readline().split()
+        for i in range(self.fst_vt['HydroDyn']['NPropSets']):
+            ln = f.readline().split()
+            self.fst_vt['HydroDyn']['PropSetID'][i] = int(ln[0])
+            self.fst_vt['HydroDyn']['PropD'][i]     = float(ln[1])
+            self.fst_vt['HydroDyn']['PropThck'][i]  = float(ln[2])
+
+        #SIMPLE HYDRODYNAMIC COEFFICIENTS
+        f.readline()
+        f.readline()
+        f.readline()
+        ln = f.readline().split()
+        self.fst_vt['HydroDyn']['SimplCd']     = float(ln[0])
+        self.fst_vt['HydroDyn']['SimplCdMG']   = float(ln[1])
+        self.fst_vt['HydroDyn']['SimplCa']     = float(ln[2])
+        self.fst_vt['HydroDyn']['SimplCaMG']   = float(ln[3])
+        self.fst_vt['HydroDyn']['SimplCp']     = float(ln[4])
+        self.fst_vt['HydroDyn']['SimplCpMG']   = float(ln[5])
+        self.fst_vt['HydroDyn']['SimplAxCa']   = float(ln[6])
+        self.fst_vt['HydroDyn']['SimplAxCaMG'] = float(ln[7])
+        self.fst_vt['HydroDyn']['SimplAxCp']   = float(ln[8])
+        self.fst_vt['HydroDyn']['SimplAxCpMG'] = float(ln[9])
+
+        #DEPTH-BASED HYDRODYNAMIC COEFFICIENTS
+        f.readline()
+        self.fst_vt['HydroDyn']['NCoefDpth']  = int_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['Dpth']       = [None]*self.fst_vt['HydroDyn']['NCoefDpth']
+        self.fst_vt['HydroDyn']['DpthCd']     = [None]*self.fst_vt['HydroDyn']['NCoefDpth']
+        self.fst_vt['HydroDyn']['DpthCdMG']   = [None]*self.fst_vt['HydroDyn']['NCoefDpth']
+        self.fst_vt['HydroDyn']['DpthCa']     = [None]*self.fst_vt['HydroDyn']['NCoefDpth']
+        self.fst_vt['HydroDyn']['DpthCaMG']   = [None]*self.fst_vt['HydroDyn']['NCoefDpth']
+        self.fst_vt['HydroDyn']['DpthCp']     = [None]*self.fst_vt['HydroDyn']['NCoefDpth']
+        self.fst_vt['HydroDyn']['DpthCpMG']   = [None]*self.fst_vt['HydroDyn']['NCoefDpth']
+        self.fst_vt['HydroDyn']['DpthAxCa']   = [None]*self.fst_vt['HydroDyn']['NCoefDpth']
+        self.fst_vt['HydroDyn']['DpthAxCaMG'] = [None]*self.fst_vt['HydroDyn']['NCoefDpth']
+        self.fst_vt['HydroDyn']['DpthAxCp']   = [None]*self.fst_vt['HydroDyn']['NCoefDpth']
+        self.fst_vt['HydroDyn']['DpthAxCpMG'] = [None]*self.fst_vt['HydroDyn']['NCoefDpth']
+        ln = f.readline().split()
+        ln = f.readline().split()
+        for i in range(self.fst_vt['HydroDyn']['NCoefDpth']):
+            ln = f.readline().split()
+            self.fst_vt['HydroDyn']['Dpth'][i]       = float(ln[0])
+            self.fst_vt['HydroDyn']['DpthCd'][i]     = float(ln[1])
+            self.fst_vt['HydroDyn']['DpthCdMG'][i]   = float(ln[2])
+            self.fst_vt['HydroDyn']['DpthCa'][i]     = float(ln[3])
+            self.fst_vt['HydroDyn']['DpthCaMG'][i]   = float(ln[4])
+            self.fst_vt['HydroDyn']['DpthCp'][i]     = float(ln[5])
+            self.fst_vt['HydroDyn']['DpthCpMG'][i]   = float(ln[6])
+            self.fst_vt['HydroDyn']['DpthAxCa'][i]   = float(ln[7])
+            self.fst_vt['HydroDyn']['DpthAxCaMG'][i] = float(ln[8])
+            self.fst_vt['HydroDyn']['DpthAxCp'][i]   = float(ln[9])
+            self.fst_vt['HydroDyn']['DpthAxCpMG'][i] = float(ln[10])
+
+        #MEMBER-BASED HYDRODYNAMIC COEFFICIENTS
+        f.readline()
+        self.fst_vt['HydroDyn']['NCoefMembers']  = int_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['MemberID_HydC']      = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
+        self.fst_vt['HydroDyn']['MemberCd1']     = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
+        self.fst_vt['HydroDyn']['MemberCd2']     = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
+        self.fst_vt['HydroDyn']['MemberCdMG1']   = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
+        self.fst_vt['HydroDyn']['MemberCdMG2']   = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
+        self.fst_vt['HydroDyn']['MemberCa1']     = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
+        self.fst_vt['HydroDyn']['MemberCa2']     = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
+        self.fst_vt['HydroDyn']['MemberCaMG1']   = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
+        self.fst_vt['HydroDyn']['MemberCaMG2']   = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
+        self.fst_vt['HydroDyn']['MemberCp1']     = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
+        self.fst_vt['HydroDyn']['MemberCp2']     = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
+        self.fst_vt['HydroDyn']['MemberCpMG1']   = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
+        self.fst_vt['HydroDyn']['MemberCpMG2']   = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
+        self.fst_vt['HydroDyn']['MemberAxCa1']   = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
+        self.fst_vt['HydroDyn']['MemberAxCa2']   = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
+        self.fst_vt['HydroDyn']['MemberAxCaMG1'] = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
+        self.fst_vt['HydroDyn']['MemberAxCaMG2'] = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
+        self.fst_vt['HydroDyn']['MemberAxCp1']   = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
+        self.fst_vt['HydroDyn']['MemberAxCp2']   = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
+        self.fst_vt['HydroDyn']['MemberAxCpMG1'] = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
+        self.fst_vt['HydroDyn']['MemberAxCpMG2'] = [None]*self.fst_vt['HydroDyn']['NCoefMembers']
+
+        f.readline()
+        f.readline()
+        for i in range(self.fst_vt['HydroDyn']['NCoefMembers']):
+            ln = f.readline().split()
+            self.fst_vt['HydroDyn']['MemberID_HydC'][i]      = int(ln[0])
+            self.fst_vt['HydroDyn']['MemberCd1'][i]     = float(ln[1])
+            self.fst_vt['HydroDyn']['MemberCd2'][i]     = float(ln[2])
+            self.fst_vt['HydroDyn']['MemberCdMG1'][i]   = float(ln[3])
+            self.fst_vt['HydroDyn']['MemberCdMG2'][i]   = float(ln[4])
+            self.fst_vt['HydroDyn']['MemberCa1'][i]     = float(ln[5])
+            self.fst_vt['HydroDyn']['MemberCa2'][i]     = float(ln[6])
+            self.fst_vt['HydroDyn']['MemberCaMG1'][i]   = float(ln[7])
+            self.fst_vt['HydroDyn']['MemberCaMG2'][i]   = float(ln[8])
+            self.fst_vt['HydroDyn']['MemberCp1'][i]     = float(ln[9])
+            self.fst_vt['HydroDyn']['MemberCp2'][i]     = float(ln[10])
+            self.fst_vt['HydroDyn']['MemberCpMG1'][i]   = float(ln[11])
+            self.fst_vt['HydroDyn']['MemberCpMG2'][i]   = float(ln[12])
+            self.fst_vt['HydroDyn']['MemberAxCa1'][i]   = float(ln[13])
+            self.fst_vt['HydroDyn']['MemberAxCa2'][i]   = float(ln[14])
+            self.fst_vt['HydroDyn']['MemberAxCaMG1'][i] = float(ln[15])
+            self.fst_vt['HydroDyn']['MemberAxCaMG2'][i] = float(ln[16])
+            self.fst_vt['HydroDyn']['MemberAxCp1'][i]   = float(ln[17])
+            self.fst_vt['HydroDyn']['MemberAxCp2'][i]   = float(ln[18])
+            self.fst_vt['HydroDyn']['MemberAxCpMG1'][i] = float(ln[19])
+            self.fst_vt['HydroDyn']['MemberAxCpMG2'][i] = float(ln[20])
+
+        #MEMBERS
+        f.readline()
+        self.fst_vt['HydroDyn']['NMembers']    = int_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['MemberID']    = [None]*self.fst_vt['HydroDyn']['NMembers']
+        self.fst_vt['HydroDyn']['MJointID1']   = [None]*self.fst_vt['HydroDyn']['NMembers']
+        self.fst_vt['HydroDyn']['MJointID2']   = [None]*self.fst_vt['HydroDyn']['NMembers']
+        self.fst_vt['HydroDyn']['MPropSetID1'] = [None]*self.fst_vt['HydroDyn']['NMembers']
+        self.fst_vt['HydroDyn']['MPropSetID2'] = [None]*self.fst_vt['HydroDyn']['NMembers']
+        self.fst_vt['HydroDyn']['MDivSize']    = [None]*self.fst_vt['HydroDyn']['NMembers']
+        self.fst_vt['HydroDyn']['MCoefMod']    = [None]*self.fst_vt['HydroDyn']['NMembers']
+        self.fst_vt['HydroDyn']['PropPot']     = [None]*self.fst_vt['HydroDyn']['NMembers']
+        ln = f.readline().split()
+        ln = f.readline().split()
+        for i in range(self.fst_vt['HydroDyn']['NMembers']):
+            ln = f.readline().split()
+            self.fst_vt['HydroDyn']['MemberID'][i]    = int(ln[0])
+            self.fst_vt['HydroDyn']['MJointID1'][i]   = int(ln[1])
+            self.fst_vt['HydroDyn']['MJointID2'][i]   = int(ln[2])
+            self.fst_vt['HydroDyn']['MPropSetID1'][i] = int(ln[3])
+            self.fst_vt['HydroDyn']['MPropSetID2'][i] = int(ln[4])
+            self.fst_vt['HydroDyn']['MDivSize'][i]    = float(ln[5])
+            self.fst_vt['HydroDyn']['MCoefMod'][i]    = int(ln[6])
+            self.fst_vt['HydroDyn']['PropPot'][i]     = bool_read(ln[7])
+
+        #FILLED MEMBERS
+        f.readline()
+        self.fst_vt['HydroDyn']['NFillGroups'] = int_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['FillNumM']    = [None]*self.fst_vt['HydroDyn']['NFillGroups']
+        self.fst_vt['HydroDyn']['FillMList']   = [None]*self.fst_vt['HydroDyn']['NFillGroups']
+        self.fst_vt['HydroDyn']['FillFSLoc']   = [None]*self.fst_vt['HydroDyn']['NFillGroups']
+        self.fst_vt['HydroDyn']['FillDens']    = [None]*self.fst_vt['HydroDyn']['NFillGroups']
+        ln = f.readline().split()
+        ln = f.readline().split()
+        for i in range(self.fst_vt['HydroDyn']['NFillGroups']):
+            ln = f.readline().split()
+            self.fst_vt['HydroDyn']['FillNumM'][i]  = int(ln[0])
+            self.fst_vt['HydroDyn']['FillMList'][i] = [int(j) for j in ln[1:-2]]
+            self.fst_vt['HydroDyn']['FillFSLoc'][i] = float(ln[-2])
+            self.fst_vt['HydroDyn']['FillDens'][i]  = float(ln[-1])
+
+        #MARINE GROWTH
+        f.readline()
+        self.fst_vt['HydroDyn']['NMGDepths'] = int_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['MGDpth']    = [None]*self.fst_vt['HydroDyn']['NMGDepths']
+        self.fst_vt['HydroDyn']['MGThck']    = [None]*self.fst_vt['HydroDyn']['NMGDepths']
+        self.fst_vt['HydroDyn']['MGDens']    = [None]*self.fst_vt['HydroDyn']['NMGDepths']
+        ln = f.readline().split()
+        ln = f.readline().split()
+        for i in range(self.fst_vt['HydroDyn']['NMGDepths']):
+            ln = f.readline().split()
+            self.fst_vt['HydroDyn']['MGDpth'][i] = float(ln[0])
+            self.fst_vt['HydroDyn']['MGThck'][i] = float(ln[1])
+            self.fst_vt['HydroDyn']['MGDens'][i] = float(ln[2])
+
+        #MEMBER OUTPUT LIST
+        f.readline()
+        self.fst_vt['HydroDyn']['NMOutputs'] = int_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['MemberID_out']  = [None]*self.fst_vt['HydroDyn']['NMOutputs']
+        self.fst_vt['HydroDyn']['NOutLoc']   = [None]*self.fst_vt['HydroDyn']['NMOutputs']
+        self.fst_vt['HydroDyn']['NodeLocs']  = [None]*self.fst_vt['HydroDyn']['NMOutputs']
+        ln = f.readline().split()
+        ln = f.readline().split()
+        for i in range(self.fst_vt['HydroDyn']['NMOutputs']):
+            ln = f.readline().split()
+            self.fst_vt['HydroDyn']['MemberID_out'][i] = int(ln[0])
+            self.fst_vt['HydroDyn']['NOutLoc'][i]  = int(ln[1])
+            self.fst_vt['HydroDyn']['NodeLocs'][i] = float(ln[2])
+
+        #JOINT OUTPUT LIST
+        f.readline()
+        self.fst_vt['HydroDyn']['NJOutputs'] = int_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['JOutLst']   = [int(idx.strip()) for idx in f.readline().split('JOutLst')[0].split(',')]
+
+        #OUTPUT
+        f.readline()
+        self.fst_vt['HydroDyn']['HDSum']     = bool_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['OutAll']    = bool_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['OutSwtch']  = int_read(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['OutFmt']    = str(f.readline().split()[0])
+        self.fst_vt['HydroDyn']['OutSFmt']   = str(f.readline().split()[0])
+
+        self.fst_vt['HydroDyn']['HDSum']
+        self.fst_vt['HydroDyn']['OutAll']
+        self.fst_vt['HydroDyn']['OutSwtch']
+        self.fst_vt['HydroDyn']['OutFmt']
+        self.fst_vt['HydroDyn']['OutSFmt']
+
+        # HydroDyn Outlist
+        f.readline()
+        data = f.readline()
+        while data.split()[0] != 'END':
+            channels = data.split('"')
+            channel_list = channels[1].split(',')
+            self.set_outlist(self.fst_vt['outlist']['HydroDyn'], channel_list)
+            data = f.readline()
+
+        f.close()
+
+
+class TestFastReader(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        clear_file_cache()
+
+    def tearDown(self):
+        clear_file_cache()
+        shutil.rmtree(self.tmpdir)
+
+    def write(self, name, text):
+        fname = os.path.join(self.tmpdir, name)
+        with open(fname, 'w') as f:
+            f.write(text)
+        return fname
+
+    def testReadTable(self):
+        data = read_table(['1 2.5 -3e2 ! comment', '4 5 6 7'], 3)
+        self.assertEqual(data.dtype, float)
+        npt.assert_equal(data, [[1., 2.5, -300.], [4., 5., 6.]])
+
+        # Non-numeric entries are returned as strings, as float_read does
+        data = read_table(['1 default 3', '4 5 six'], 3)
+        self.assertEqual(data[:,0].tolist(), [1., 4.])
+        self.assertEqual(data[:,1].tolist(), ['default', 5.])
+        self.assertEqual(data[:,2].tolist(), [3., 'six'])
+
+        self.assertEqual(read_table([], 4).shape, (0, 4))
+
+    def testFileCache(self):
+        fname = self.write('blade.dat', blade_file)
+        f = tokenize_file(fname)
+        self.assertIs(tokenize_file(os.path.join(self.tmpdir, '.', 'blade.dat')), f)
+        self.assertIs(f.table(6, 3, 7), f.table(6, 3, 7))
+
+        # A modified file is read again
+        self.write('blade.dat', blade_file.replace('6.1500000E+01', '6.3000000E+01') + '! end of file\n')
+        g = tokenize_file(fname)
+        self.assertIsNot(g, f)
+        self.assertEqual(g.table(6, 3, 7)[2,0], 63.)
+
+        clear_file_cache()
+        self.assertIsNot(tokenize_file(fname), g)
+
+    def testFileCacheBounded(self):
+        fnames = [self.write('file_%d.dat' % i, '%d  KEY\n' % i) for i in range(FAST_reader.FILE_CACHE_SIZE + 10)]
+        first = tokenize_file(fnames[0])
+        for fname in fnames:
+            self.assertEqual(tokenize_file(fname).value('KEY'), os.path.basename(fname)[5:-4])
+        self.assertEqual(FAST_reader._tokenized_file.cache_info().currsize, FAST_reader.FILE_CACHE_SIZE)
+        # the least recently used file has been dropped
+        self.assertIsNot(tokenize_file(fnames[0]), first)
+
+    def testAeroDynBlade(self):
+        self.write('blade.dat', blade_file)
+        reader = InputReader_OpenFAST(FAST_directory=self.tmpdir, fst_vt=copy.deepcopy(FstModel))
+        reader.fst_vt['AeroDyn15']['ADBlFile1'] = 'blade.dat'
+        reader.read_AeroDyn15Blade()
+        blade = reader.fst_vt['AeroDynBlade']
+        self.assertEqual(blade['NumBlNds'], 3)
+        self.assertEqual(blade['BlSpn'], [0., 30., 61.5])
+        self.assertEqual(blade['BlCrvAC'], [0., -0.15, -0.4])
+        self.assertEqual(blade['BlChord'], [3.542, 4.167, 1.419])
+        self.assertEqual(blade['BlAFID'], [1., 2., 3.])
+
+    def testFullDeck(self):
+        # A complete OpenFAST deck reads back to the same fst_vt as with the previous readers
+        writer = InputWriter_OpenFAST(FAST_ver='OpenFAST')
+        writer.fst_vt = example_fst_vt()
+        writer.FAST_runDirectory = self.tmpdir
+        writer.FAST_namingOut = 'test'
+        writer.execute()
+
+        readers = []
+        for Reader in [InputReader_OpenFAST, PreviousReader]:
+            reader = Reader(FAST_ver='OpenFAST', FAST_InputFile='test.fst', FAST_directory=self.tmpdir)
+            reader.execute()
+            readers.append(reader.fst_vt)
+        new, old = readers
+        self.assertEqual(sorted(new.keys()), sorted(old.keys()))
+        for module in old:
+            npt.assert_equal(new[module], old[module], err_msg=module)
+        self.assertEqual(new['AeroDynBlade']['BlAFID'], [1., 2., 2.])
+        self.assertEqual(len(new['AeroDyn15']['af_data']), 2)
+        self.assertEqual(new['HydroDyn']['MCoefMod'], [1, 3])
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestFastReader))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
@@ -0,0 +1,154 @@
+import os
+import sys
+import stat
+import asyncio
+import tempfile
+import shutil
+import unittest
+from wisdem.aeroelasticse.FAST_wrapper import FastWrapper, gather_async, run_async
+from wisdem.aeroelasticse.runFAST_pywrapper import runFAST_pywrapper_batch
+from wisdem.test.test_aeroelasticse.test_fast_reader import example_fst_vt
+
+# Stand-in for the OpenFAST executable: reads its input file, which holds the
+# seconds to sleep and the return code, and writes <input>.out next to it
+stub_source = """#!%s
+import sys, time
+fname = sys.argv[1]
+with open(fname) as f:
+    sleep, returncode = f.read().split()
+print('running', fname)
+time.sleep(float(sleep))
+with open(fname + '.out', 'w') as f:
+    f.write('done')
+sys.exit(int(returncode))
+""" % sys.executable
+
+# Same for a written OpenFAST deck: sleeps TMax seconds, exits with return
+# code TStart and writes <case_name>.outb
+batch_stub_source = """#!%s
+import sys, time
+fname = sys.argv[1]
+fst = {}
+with open(fname) as f:
+    for line in f:
+        data = line.split()
+        if len(data) > 1:
+            fst[data[1]] = data[0]
+time.sleep(float(fst['TMax']))
+with open(fname[:-3] + 'outb', 'w') as f:
+    f.write(fst['TMax'])
+sys.exit(int(float(fst['TStart'])))
+""" % sys.executable
+
+
+def write_stub(fname, source):
+    with open(fname, 'w') as f:
+        f.write(source)
+    os.chmod(fname, os.stat(fname).st_mode | stat.S_IEXEC)
+    return fname
+
+
+class TestFastWrapper(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.exe = write_stub(os.path.join(self.tmpdir, 'openfast_stub'), stub_source)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def wrappers(self, runs, timeout=None):
+        # One FastWrapper per (sleep, returncode), each in its own run directory
+        out = []
+        for i, (sleep, returncode) in enumerate(runs):
+            run_dir = os.path.join(self.tmpdir, 'case_%d' % i)
+            os.makedirs(run_dir)
+            with open(os.path.join(run_dir, 'case.fst'), 'w') as f:
+                f.write('%g %d' % (sleep, returncode))
+            out.append(FastWrapper(FAST_exe=self.exe, FAST_InputFile='case.fst', FAST_directory=run_dir,
+                                   timeout=timeout, log_file=os.path.join(run_dir, 'case.log')))
+        return out
+
+    def testRunAsync(self):
+        wrappers = self.wrappers([(0.2, 0), (0.0, 3), (0.1, 0), (0.0, 0)])
+        calls = []
+        returncodes = run_async(wrappers, n_concurrent=2, progress=lambda *args: calls.append(args))
+        self.assertEqual(returncodes, [0, 3, 0, 0])
+        for w in wrappers:
+            self.assertTrue(os.path.exists(os.path.join(w.FAST_directory, 'case.fst.out')))
+            with open(w.log_file) as f:
+                self.assertEqual(f.read().strip(), 'running case.fst')
+
+        # Progress is reported once per run, as each completes
+        self.assertEqual([c[0] for c in calls], [1, 2, 3, 4])
+        self.assertTrue(all(c[1] == 4 for c in calls))
+        self.assertEqual(sorted(id(c[2]) for c in calls), sorted(id(w) for w in wrappers))
+        self.assertEqual({id(c[2]): c[3] for c in calls}[id(wrappers[1])], 3)
+
+    def testTimeout(self):
+        wrappers = self.wrappers([(10., 0), (0.0, 0)], timeout=0.5)
+        self.assertEqual(run_async(wrappers), [None, 0])
+        self.assertFalse(os.path.exists(os.path.join(wrappers[0].FAST_directory, 'case.fst.out')))
+
+    def testRunningEventLoop(self):
+        # From a coroutine (e.g. in Jupyter) run_async does not call asyncio.run in the running loop
+        wrappers = self.wrappers([(0.0, 0), (0.0, 1)])
+
+        async def blocking():
+            return run_async(wrappers)
+        self.assertEqual(asyncio.run(blocking()), [0, 1])
+
+        async def awaiting():
+            return await gather_async(wrappers, n_concurrent=1)
+        self.assertEqual(asyncio.run(awaiting()), [0, 1])
+
+
+class TestBatchRunAsync(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def testRunAsync(self):
+        # Cases: success, non-zero exit code, timeout, success
+        batch = runFAST_pywrapper_batch(FAST_ver='OpenFAST')
+        batch.FAST_exe = write_stub(os.path.join(self.tmpdir, 'openfast_stub'), batch_stub_source)
+        batch.FAST_runDirectory = os.path.join(self.tmpdir, 'runs')
+        batch.fst_vt = example_fst_vt()
+        batch.case_list = [{('Fst', 'TMax'): 0.1, ('Fst', 'TStart'): 0},
+                           {('Fst', 'TMax'): 0.0, ('Fst', 'TStart'): 2},
+                           {('Fst', 'TMax'): 20., ('Fst', 'TStart'): 0},
+                           {('Fst', 'TMax'): 0.2, ('Fst', 'TStart'): 0}]
+        batch.case_name_list = ['case_%d' % i for i in range(len(batch.case_list))]
+        post_calls = []
+
+        def post(FAST_Output):
+            post_calls.append(os.path.basename(FAST_Output))
+            with open(FAST_Output) as f:
+                return float(f.read())
+        batch.post = post
+
+        output = batch.run_async(cores=2, timeout=1.)
+        self.assertEqual(output, [0.1, None, None, 0.2])
+        # post processing is only run on the successful cases
+        self.assertEqual(sorted(post_calls), ['case_0.outb', 'case_3.outb'])
+        self.assertTrue(os.path.exists(os.path.join(batch.FAST_runDirectory, 'case_1.outb')))
+        self.assertFalse(os.path.exists(os.path.join(batch.FAST_runDirectory, 'case_2.outb')))
+        for case_name in batch.case_name_list:
+            self.assertTrue(os.path.exists(os.path.join(batch.FAST_runDirectory, case_name + '.log')))
+
+        # Without post processing successful runs give an empty list
+        batch.post = None
+        batch.case_list = batch.case_list[:2]
+        batch.case_name_list = batch.case_name_list[:2]
+        self.assertEqual(batch.run_async(), [[], None])
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestFastWrapper))
+    suite.addTest(unittest.makeSuite(TestBatchRunAsync))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
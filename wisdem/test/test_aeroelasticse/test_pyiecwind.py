@@ -0,0 +1,129 @@
+import os
+import tempfile
+import shutil
+import numpy as np
+import numpy.testing as npt
+import unittest
+from wisdem.aeroelasticse.pyIECWind import pyIECWind_extreme
+
+# Hub height wind speeds, including one below the 4 m/s ECD direction change limit
+U_vals = [3., 5.5, 11.4, 18., 25.]
+
+
+def reference_events(iec, V_hub_in):
+    # .wnd columns of one wind speed, time step by time step as generated before the batch events
+    iec.setup()
+    V_hub = V_hub_in*np.cos(iec.Vert_Slope*np.pi/180)
+    V_vert = V_hub_in*np.sin(iec.Vert_Slope*np.pi/180)
+    sigma_1 = iec.NTM(V_hub)
+    alpha = 0.2
+
+    def columns(T, row):
+        t = np.linspace(0., T, num=int(round(T/iec.dt))+1)
+        return np.array([[ti] + row(ti) for ti in t])
+
+    events = {}
+
+    # EOG
+    T = 10.5
+    V_e1 = iec.EWM(V_hub)[2]
+    V_gust = min([1.35*(V_e1 - V_hub), 3.3*(sigma_1/(1+0.1*(iec.D/iec.Sigma_1)))])
+    events['EOG'] = columns(T, lambda ti: [V_hub, 0., V_vert, 0., alpha, 0.,
+                                           0. - 0.37*V_gust*np.sin(3*np.pi*ti/T)*(1-np.cos(2*np.pi*ti/T)) if ti<T else 0.])
+
+    # EDC
+    T = 6.
+    Theta_e = min(4.*np.arctan(sigma_1/(V_hub*(1.+0.01*(iec.D/iec.Sigma_1))))*180./np.pi, 180.)
+    for sign, name in [(1, 'EDC_P'), (-1, 'EDC_N')]:
+        events[name] = columns(T, lambda ti: [V_hub, sign*(0.5*Theta_e*(1-np.cos(np.pi*ti/T)) if ti<T else Theta_e),
+                                              V_vert, 0., alpha, 0., 0.])
+
+    # ECD
+    T = 10.
+    V_cg = 15.
+    Theta_cg = 180. if V_hub < 4 else 720/V_hub
+    for sign, name in [(1, 'ECD_P'), (-1, 'ECD_N')]:
+        events[name] = columns(T, lambda ti: [V_hub + 0.5*V_cg*(1-np.cos(np.pi*ti/T)) if ti<T else V_hub+V_cg,
+                                              sign*(0.5*Theta_cg*(1-np.cos(np.pi*ti/T)) if ti<T else Theta_cg),
+                                              V_vert, 0., alpha, 0., 0.])
+
+    # EWS
+    T = 12.
+    Beta = 6.4
+    shear = lambda ti: (2.5+0.2*Beta*sigma_1*(iec.D/iec.Sigma_1)**(1/4))*(1-np.cos(2*np.pi*ti/T))/V_hub
+    for sign, name in [(1, 'P'), (-1, 'N')]:
+        events['EWS_V_'+name] = columns(T, lambda ti: [V_hub, 0., V_vert, 0., alpha, sign*shear(ti), 0.])
+        events['EWS_H_'+name] = columns(T, lambda ti: [V_hub, 0., V_vert, sign*shear(ti), alpha, 0., 0.])
+
+    return events
+
+
+class TestPyIECWind(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def iecwind(self, outdir='wind'):
+        iec = pyIECWind_extreme()
+        iec.Turbine_Class = 'II'
+        iec.Turbulence_Class = 'A'
+        iec.Vert_Slope = 8.
+        iec.z_hub = 119.
+        iec.D = 178.
+        iec.outdir = os.path.join(self.tmpdir, outdir)
+        iec.case_name = 'test'
+        return iec
+
+    def testBatchVsScalar(self):
+        # Each wind speed of a batch matches the per time step waveforms of that wind speed on its own
+        iec = self.iecwind()
+        batch = iec.execute_batch('EOG EDC ECD EWS', U_vals, write_files=False)
+        self.assertEqual(iec.fname_out, [])
+        self.assertFalse(os.path.exists(iec.outdir))
+        for i, U in enumerate(U_vals):
+            ref = reference_events(iec, U)
+            self.assertEqual(sorted(batch.keys()), sorted(ref.keys()))
+            for name, data in batch.items():
+                self.assertEqual(data.shape, (len(U_vals), ref[name].shape[0]+2, 8))
+                npt.assert_allclose(data[i], iec.pad_time(ref[name]), rtol=1e-12, atol=1e-12, err_msg='%s U=%g' % (name, U))
+                npt.assert_equal(data[i,[0,-1],0], [iec.T0, iec.TF])
+
+    def testDirectionOptions(self):
+        # Only the requested signs and shear orientations are generated
+        iec = self.iecwind()
+        iec.dir_change = '-'
+        iec.shear_orient = 'h'
+        batch = iec.execute_batch('EDC ECD EWS', U_vals, write_files=False)
+        self.assertEqual(sorted(batch.keys()), ['ECD_N', 'EDC_N', 'EWS_H_N'])
+
+    def testBatchFiles(self):
+        # The .wnd files written by one batch call are those of one execute call per wind speed
+        for Vtype in ['EOG', 'EDC', 'ECD', 'EWS']:
+            iec_batch = self.iecwind('batch')
+            iec_batch.execute_batch(Vtype, U_vals)
+            fname_batch = list(iec_batch.fname_out)
+
+            iec = self.iecwind('scalar')
+            fname_scalar = []
+            for U in U_vals:
+                fname_out, fname_type = iec.execute(Vtype, U)
+                fname_scalar.extend(fname_out)
+                self.assertEqual(fname_type, [2]*len(fname_out))
+
+            self.assertEqual([os.path.basename(f) for f in fname_batch], [os.path.basename(f) for f in fname_scalar])
+            self.assertEqual(iec_batch.fname_type, [2]*len(fname_batch))
+            for fb, fs in zip(fname_batch, fname_scalar):
+                self.assertEqual(os.path.dirname(fb), os.path.realpath(iec_batch.outdir))
+                with open(fb) as f_b, open(fs) as f_s:
+                    self.assertEqual(f_b.read(), f_s.read(), os.path.basename(fb))
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestPyIECWind))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
@@ -2,7 +2,7 @@ import unittest
 import numpy as np
 from math import pi
 
-from wisdem.airfoilprep import Polar, Airfoil
+from wisdem.airfoilprep import Polar, Airfoil, PolarSet
 
 
 class TestBlend(unittest.TestCase):
@@ -592,6 +592,90 @@ class TestExtrap(unittest.TestCase):
         np.testing.assert_allclose(cm, cm_extrap, atol=5e-3)
 
 
+class TestPolarSet(unittest.TestCase):
+
+    def setUp(self):
+        alpha = np.array([-10.1, -8.2, -6.1, -4.1, -2.1, 0.1, 2, 4.1, 6.2, 8.1, 10.2,
+                          11.3, 12.1, 13.2, 14.2, 15.3, 16.3, 17.1, 18.1, 19.1, 20.1])
+        cl = np.array([-0.6300, -0.5600, -0.6400, -0.4200, -0.2100, 0.0500, 0.3000,
+                       0.5400, 0.7900, 0.9000, 0.9300, 0.9200, 0.9500, 0.9900, 1.0100,
+                       1.0200, 1.0000, 0.9400, 0.8500, 0.7000, 0.6600])
+        cd = np.array([0.0390, 0.0233, 0.0131, 0.0134, 0.0119, 0.0122, 0.0116, 0.0144,
+                       0.0146, 0.0162, 0.0274, 0.0303, 0.0369, 0.0509, 0.0648, 0.0776,
+                       0.0917, 0.0994, 0.2306, 0.3142, 0.3186])
+        cm = np.array([-0.0044, -0.0051, 0.0018, -0.0216, -0.0282, -0.0346, -0.0405,
+                       -0.0455, -0.0507, -0.0404, -0.0321, -0.0281, -0.0284, -0.0322,
+                       -0.0361, -0.0363, -0.0393, -0.0398, -0.0983, -0.1242, -0.1155])
+
+        # three stations with two Reynolds numbers each, the last without cm
+        self.airfoils = []
+        for k, scale in enumerate([1.0, 1.1, 0.9]):
+            cm_k = cm if k < 2 else np.zeros(len(cm))
+            p1 = Polar(1e6, alpha, scale*cl, cd, cm_k)
+            p2 = Polar(3e6, alpha[1:], 1.05*scale*cl[1:], 0.9*cd[1:], cm_k[1:])
+            self.airfoils.append(Airfoil([p1, p2]))
+        self.ps = PolarSet.fromAirfoils(self.airfoils)
+
+
+    def test_grid(self):
+        self.assertEqual(self.ps.cl.shape, (3, 2, len(self.ps.alpha)))
+        for i, af in enumerate(self.airfoils):
+            alpha, Re, cl, cd, cm = af.createDataGrid()
+            np.testing.assert_allclose(self.ps.alpha, alpha)
+            np.testing.assert_allclose(self.ps.Re, Re)
+            np.testing.assert_allclose(self.ps.cl[i], cl.T)
+            np.testing.assert_allclose(self.ps.cd[i], cd.T)
+            np.testing.assert_allclose(self.ps.cm[i], cm.T)
+
+        alpha, Re, cl, cd, cm = self.ps.createDataGrid()
+        self.assertEqual(cl.shape, (3, len(alpha), 2))
+
+
+    def test_correction3D(self):
+        r_over_R = np.array([0.2, 0.3, 0.5])
+        chord_over_r = np.array([0.3, 0.2, 0.1])
+        tsr = 7.0
+        new = self.ps.correction3D(r_over_R, chord_over_r, tsr, alpha_linear_min=-4, alpha_linear_max=4)
+
+        for i, af in enumerate(new.toAirfoils()):
+            ref = Airfoil([Polar(self.ps.Re[j], self.ps.alpha, self.ps.cl[i,j], self.ps.cd[i,j], self.ps.cm[i,j])
+                           for j in range(2)]).correction3D(r_over_R[i], chord_over_r[i], tsr,
+                                                           alpha_linear_min=-4, alpha_linear_max=4)
+            for p, pref in zip(af.polars, ref.polars):
+                np.testing.assert_allclose(p.cl, pref.cl, rtol=1e-10, atol=1e-12)
+                np.testing.assert_allclose(p.cd, pref.cd, rtol=1e-10, atol=1e-12)
+                np.testing.assert_allclose(p.cm, pref.cm)
+
+
+    def test_extrapolate(self):
+        new = self.ps.extrapolate(cdmax=1.29)
+
+        for i, af in enumerate(new.toAirfoils()):
+            for j, p in enumerate(af.polars):
+                pref = Polar(self.ps.Re[j], self.ps.alpha, self.ps.cl[i,j], self.ps.cd[i,j],
+                             self.ps.cm[i,j]).extrapolate(cdmax=1.29)
+                np.testing.assert_allclose(p.alpha, pref.alpha)
+                np.testing.assert_allclose(p.cl, pref.cl, rtol=1e-10, atol=1e-12)
+                np.testing.assert_allclose(p.cd, pref.cd, rtol=1e-10, atol=1e-12)
+                np.testing.assert_allclose(p.cm, pref.cm, rtol=1e-10, atol=1e-12)
+
+
+    def test_blend(self):
+        other = PolarSet.fromAirfoils(self.airfoils[::-1], Re=[2e6])
+        weight = np.array([0.2, 0.5, 0.8])
+        new = self.ps.blend(other, weight)
+
+        afs_other = other.toAirfoils()
+        for i, af in enumerate(new.toAirfoils()):
+            ref = self.airfoils[i].interpToCommonAlpha(self.ps.alpha).blend(afs_other[i], weight[i])
+            self.assertEqual(len(af.polars), len(ref.polars))
+            for p, pref in zip(af.polars, ref.polars):
+                np.testing.assert_allclose(p.alpha, pref.alpha)
+                np.testing.assert_allclose(p.cl, pref.cl, rtol=1e-10, atol=1e-12)
+                np.testing.assert_allclose(p.cd, pref.cd, rtol=1e-10, atol=1e-12)
+                np.testing.assert_allclose(p.cm, pref.cm, rtol=1e-10, atol=1e-12)
+
+
 # class TestSpline(unittest.TestCase):
 
 #     def setUp(self):
@@ -632,6 +716,7 @@ def suite():
     suite.addTest(unittest.makeSuite(TestBlend))
     suite.addTest(unittest.makeSuite(Test3DStall))
     suite.addTest(unittest.makeSuite(TestExtrap))
+    suite.addTest(unittest.makeSuite(TestPolarSet))
     return suite
 
 if __name__ == '__main__':
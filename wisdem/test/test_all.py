@@ -1,8 +1,10 @@
 import unittest
 import pytest
 
+import wisdem.test.test_aeroelasticse as test_aeroelasticse
 import wisdem.test.test_assemblies as test_assemblies
 import wisdem.test.test_airfoilprep as test_airfoilprep
+import wisdem.test.test_benchmarks as test_benchmarks
 import wisdem.test.test_ccblade as test_ccblade
 import wisdem.test.test_commonse as test_commonse
 import wisdem.test.test_drivetrainse as test_drivetrainse
@@ -19,11 +21,13 @@ import wisdem.test.test_wisdem as test_wisdem
 
 def suite():
     suite = unittest.TestSuite( (
+        test_aeroelasticse.test_all.suite(),
         test_assemblies.test_all.suite(),
         test_airfoilprep.test_all.suite(),
+        test_benchmarks.test_all.suite(),
         test_ccblade.test_all.suite(),
         test_commonse.test_all.suite(),
-        #test_drivetrainse.test_all.suite(),
+        test_drivetrainse.test_all.suite(),
         test_floatingse.test_all.suite(),
         #test_nrelcsm.test_all.suite(),
         test_pbeam.test_all.suite(),
@@ -38,8 +42,10 @@ def suite():
     return suite
 
 valid_tests = ['test_orbit',
+               'test_aeroelasticse',
                'test_assemblies',
                'test_airfoilprep',
+               'test_benchmarks',
                'test_ccblade',
                'test_commonse',
                'test_floatingse',
@@ -0,0 +1,12 @@
+import unittest
+
+from wisdem.test.test_benchmarks import test_runner
+
+def suite():
+    suite = unittest.TestSuite( (test_runner.suite(),
+    ) )
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
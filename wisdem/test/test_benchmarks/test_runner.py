@@ -0,0 +1,137 @@
+import numpy as np
+import numpy.testing as npt
+import unittest
+import tempfile
+import shutil
+import copy
+import os
+import wisdem.benchmarks.runner as runner
+
+
+def results(times, signature=1.0):
+    return {'metadata': {},
+            'benchmarks': {k: {'group': 'kernel', 'min': t, 'median': t, 'mean': t, 'std': 0.0,
+                               'number': 1, 'repeat': 1, 'signature': signature} for k, t in times.items()}}
+
+
+class TestRunner(unittest.TestCase):
+
+    def testSignature(self):
+        self.assertEqual(runner.signature(2.0), 2.0)
+        self.assertEqual(runner.signature([np.array([1.0, -2.0]), (3.0, np.nan)]), 6.0)
+        self.assertEqual(runner.signature({'b': 1.0, 'a': -1.0}), 2.0)
+        self.assertEqual(runner.signature('text'), 0.0)
+
+    def testTiming(self):
+        calls = []
+        res = runner.time_benchmark(lambda : calls.append(1) or 3.0, number=2, repeat=3)
+        self.assertEqual(len(calls), 7)
+        self.assertEqual(res['signature'], 3.0)
+        self.assertLessEqual(res['min'], res['median'])
+
+    def testCompare(self):
+        base = results({'a': 1.0, 'b': 1.0, 'c': 1.0, 'gone': 1.0})
+        cur  = results({'a': 1.05, 'b': 1.5, 'c': 0.5, 'new': 1.0})
+        out  = {name: (status, ratio) for name, status, ratio in runner.compare(cur, base, threshold=0.1)}
+        self.assertEqual(out['a'][0], 'ok')
+        self.assertEqual(out['b'][0], 'regression')
+        self.assertEqual(out['c'][0], 'improvement')
+        self.assertEqual(out['new'][0], 'new')
+        self.assertEqual(out['gone'][0], 'missing')
+        npt.assert_almost_equal(out['b'][1], 1.5)
+
+        cur['benchmarks']['a']['signature'] = 2.0
+        cur['benchmarks']['b'] = {'group': 'kernel', 'skipped': 'No module named _pBEAM'}
+        out  = {name: status for name, status, _ in runner.compare(cur, base, threshold=0.1)}
+        self.assertEqual(out['a'], 'changed')
+        self.assertEqual(out['b'], 'skipped')
+
+    def testCompareNoise(self):
+        # The threshold widens to the spread of the repeats of either run
+        base = results({'quiet': 1.0, 'noisy': 1.0})
+        cur  = results({'quiet': 1.3, 'noisy': 1.3})
+        cur['benchmarks']['noisy']['median'] = 1.3*1.2
+        out  = {name: status for name, status, _ in runner.compare(cur, base)}
+        self.assertEqual(out['quiet'], 'regression')
+        self.assertEqual(out['noisy'], 'ok')
+        self.assertAlmostEqual(runner.spread(cur['benchmarks']['noisy']), 0.2)
+
+        # Past MAX_NOISE_TOLERANCE the widening is capped: large changes are still flagged,
+        # smaller ones are inconclusive
+        base = results({'noisy_ok': 1.0, 'noisy_slow': 1.0, 'noisy_fast': 1.0})
+        cur  = results({'noisy_ok': 1.3, 'noisy_slow': 1.6, 'noisy_fast': 0.4})
+        for res in cur['benchmarks'].values():
+            res['median'] = 10.0*res['min']
+        out  = {name: status for name, status, _ in runner.compare(cur, base)}
+        self.assertEqual(out, {'noisy_ok': 'noisy', 'noisy_slow': 'regression', 'noisy_fast': 'improvement'})
+
+        slow = {'group': 'kernel', 'min': 2.0}
+        fast = {'group': 'kernel', 'min': 1.0}
+        self.assertIs(runner.faster(slow, fast), fast)
+        self.assertIs(runner.faster(fast, slow), fast)
+        self.assertIs(runner.faster({'skipped': ''}, fast), fast)
+        self.assertIs(runner.faster(fast, {'skipped': ''}), fast)
+
+    def testCompareSelected(self):
+        # Baseline benchmarks left out by --filter / --group are skipped, unregistered ones are missing
+        base = results({'pyframe3dd.Frame.run': 1.0, 'ccblade.CCBlade.evaluate': 1.0, 'gone': 1.0})
+        cur  = results({'pyframe3dd.Frame.run': 1.0})
+        runner.load_suite()
+        out  = {name: status for name, status, _ in runner.compare(cur, base, selected=['pyframe3dd.Frame.run'])}
+        self.assertEqual(out, {'pyframe3dd.Frame.run': 'ok', 'ccblade.CCBlade.evaluate': 'skipped', 'gone': 'missing'})
+        out  = {name: status for name, status, _ in runner.compare(cur, base)}
+        self.assertEqual(out['ccblade.CCBlade.evaluate'], 'missing')
+
+    def testSuite(self):
+        names = runner.select()
+        for k in ['ccblade.CCBlade.evaluate', 'rotorse.PreComp.sectionProperties', 'pyframe3dd.Frame.run',
+                  'aeroelasticse.ReadFASTbinary', 'floatingse.MapMooring.runMAP',
+                  'orbit.ProjectManager.run_project', 'orbit.ProjectManager.columnar_logs', 'towerse.TowerSE',
+                  'assemblies.LandBasedTurbine']:
+            self.assertIn(k, names)
+        self.assertEqual(runner.select('Frame', 'assembly'), [])
+
+    def testMain(self):
+        # Save a baseline, then compare against a copy made 10 times faster
+        tmpdir = tempfile.mkdtemp()
+        try:
+            fname = os.path.join(tmpdir, 'base.json')
+            self.assertEqual(runner.main(['-k', 'Frame.run', '-r', '1', '-s', fname]), 0)
+            base = runner.load_results(fname)
+            self.assertGreater(base['benchmarks']['pyframe3dd.Frame.run']['min'], 0.0)
+            self.assertEqual(runner.main(['-k', 'Frame.run', '-r', '1', '-c', fname, '-t', '10.0']), 0)
+
+            fast = copy.deepcopy(base)
+            for v in fast['benchmarks'].values():
+                v['min'] *= 0.1
+                v['median'] *= 0.1
+            runner.save_results(fname, fast)
+            self.assertEqual(runner.main(['-k', 'Frame.run', '-r', '1', '-c', fname]), 1)
+
+            # Regressions are run again before being reported, the saved result is the faster run
+            calls = []
+            run_benchmarks = runner.run_benchmarks
+            def counted(names, *args, **kwargs):
+                calls.append(list(names))
+                return run_benchmarks(names, *args, **kwargs)
+            runner.run_benchmarks = counted
+            try:
+                saved = os.path.join(tmpdir, 'cur.json')
+                self.assertEqual(runner.main(['-k', 'Frame.run', '-r', '1', '-c', fname, '--confirm', '2', '-s', saved]), 1)
+                self.assertEqual(calls, [['pyframe3dd.Frame.run']]*3)
+                self.assertEqual(runner.main(['-k', 'Frame.run', '-r', '1', '-c', fname, '--confirm', '0']), 1)
+                self.assertEqual(len(calls), 4)
+            finally:
+                runner.run_benchmarks = run_benchmarks
+            self.assertIn('pyframe3dd.Frame.run', runner.load_results(saved)['benchmarks'])
+        finally:
+            shutil.rmtree(tmpdir)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestRunner))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
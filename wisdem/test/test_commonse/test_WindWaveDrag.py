@@ -2,6 +2,7 @@ import numpy as np
 import numpy.testing as npt
 import unittest
 import wisdem.commonse.WindWaveDrag as wwd
+from openmdao.api import Problem
 
 npts = 100
 myones = np.ones((npts,))
@@ -70,10 +71,82 @@ class TestDrag(unittest.TestCase):
         Fp = Fi + D
         self.wave.compute(self.params, self.unknowns)
         npt.assert_equal(self.unknowns['waveLoads_Px'], Fp)
+
+
+def check_batch_partials(comp, values):
+    prob = Problem()
+    prob.model.add_subsystem('comp', comp, promotes=['*'])
+    prob.setup()
+    for k, v in values.items():
+        prob[k] = v
+    prob.run_model()
+    data = prob.check_partials(out_stream=None, method='fd', form='central', step=1e-6, step_calc='rel')
+    for key, val in data['comp'].items():
+        npt.assert_allclose(val['J_fwd'], val['J_fd'], rtol=1e-5, atol=1e-6*np.abs(val['J_fd']).max(), err_msg=str(key))
+    return prob
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.nPoints = 10
+        self.z = np.linspace(-30.0, 85.0, self.nPoints)
+        self.d = np.linspace(6.0, 3.87, self.nPoints)
+        self.beta = np.array([0.0, 30.0, -45.0, 90.0])
+        self.U = np.outer([1.0, 2.0, 3.0, 4.0], np.linspace(0.5, 2.0, self.nPoints))
+
+    def testWindDrag(self):
+        for cd_usr in [-1.0, 1.2]:
+            params = {'U':10*self.U, 'z':self.z, 'd':self.d, 'beta':self.beta, 'rho':1.225, 'mu':1.7934e-5, 'cd_usr':cd_usr}
+            prob = check_batch_partials(wwd.CylinderWindDragBatch(nPoints=self.nPoints, nConditions=4), params)
+
+            for i in range(4):
+                unknowns = {}
+                params_i = dict(params, U=10*self.U[i,:], beta=self.beta[i])
+                wwd.CylinderWindDrag(nPoints=self.nPoints).compute(params_i, unknowns)
+                for k in ['windLoads_Px', 'windLoads_Py', 'windLoads_Pz', 'windLoads_qdyn']:
+                    npt.assert_allclose(prob[k][i,:], unknowns[k], rtol=1e-13)
+            npt.assert_equal(prob['windLoads_d'], self.d)
+
+    def testWaveDrag(self):
+        for cd_usr in [-1.0, 1.2]:
+            params = {'U':self.U, 'A':0.7*self.U, 'p':100*self.U, 'z':self.z, 'd':self.d, 'beta':self.beta,
+                      'rho':1025.0, 'mu':1.3351e-3, 'cm':2.0, 'cd_usr':cd_usr}
+            prob = check_batch_partials(wwd.CylinderWaveDragBatch(nPoints=self.nPoints, nConditions=4), params)
+
+            for i in range(4):
+                unknowns = {}
+                params_i = dict(params, U=self.U[i,:], A=0.7*self.U[i,:], p=100*self.U[i,:], beta=self.beta[i])
+                wwd.CylinderWaveDrag(nPoints=self.nPoints).compute(params_i, unknowns)
+                for k in ['waveLoads_Px', 'waveLoads_Py', 'waveLoads_Pz', 'waveLoads_qdyn', 'waveLoads_pt']:
+                    npt.assert_allclose(prob[k][i,:], unknowns[k], rtol=1e-13)
+
+    def testAeroHydroLoads(self):
+        np.random.seed(0)
+        params = {}
+        for src in ['windLoads', 'waveLoads']:
+            for k in ['Px', 'Py', 'Pz', 'qdyn']:
+                params[src+'_'+k] = np.random.rand(4, self.nPoints)
+            params[src+'_beta'] = 90*np.random.rand(4)
+            params[src+'_d'] = self.d
+        params['windLoads_z'] = np.linspace(0.5, 90.0, self.nPoints)
+        params['waveLoads_z'] = np.linspace(-30.0, 10.0, self.nPoints)
+        params['z'] = self.z + 0.1
+        params['yaw'] = 7.0
+        prob = check_batch_partials(wwd.AeroHydroLoadsBatch(nPoints=self.nPoints, nConditions=4), params)
+
+        for i in range(4):
+            unknowns = {}
+            params_i = {}
+            for k, v in params.items():
+                params_i[k] = v[i] if k.endswith('_beta') or np.ndim(v) == 2 else v
+            wwd.AeroHydroLoads(nPoints=self.nPoints).compute(params_i, unknowns)
+            for k in ['Px', 'Py', 'Pz', 'qdyn']:
+                npt.assert_allclose(prob[k][i,:], unknowns[k], rtol=1e-13)
         
 def suite():
     suite = unittest.TestSuite()
     suite.addTest(unittest.makeSuite(TestDrag))
+    suite.addTest(unittest.makeSuite(TestBatch))
     return suite
 
 if __name__ == '__main__':
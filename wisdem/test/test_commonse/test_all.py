@@ -3,7 +3,9 @@ import unittest
 from wisdem.test.test_commonse import test_WindWaveDrag
 from wisdem.test.test_commonse import test_enum
 from wisdem.test.test_commonse import test_environment
+from wisdem.test.test_commonse import test_evaluation_cache
 from wisdem.test.test_commonse import test_frustum
+from wisdem.test.test_commonse import test_profiling
 from wisdem.test.test_commonse import test_tube
 from wisdem.test.test_commonse import test_utilities
 from wisdem.test.test_commonse import test_utilizationSupplement
@@ -16,7 +18,9 @@ def suite():
     suite = unittest.TestSuite( (test_WindWaveDrag.suite(),
                                  test_enum.suite(),
                                  test_environment.suite(),
+                                 test_evaluation_cache.suite(),
                                  test_frustum.suite(),
+                                 test_profiling.suite(),
                                  test_tube.suite(),
                                  test_utilities.suite(),
                                  test_utilizationSupplement.suite(),
@@ -2,6 +2,7 @@ import numpy as np
 import numpy.testing as npt
 import unittest
 import wisdem.commonse.environment as env
+from openmdao.api import Problem
 from wisdem.commonse import gravity as g
 
 npts = 100
@@ -110,11 +111,94 @@ class TestLinearWaves(unittest.TestCase):
         npt.assert_equal(self.unknowns['A'], 0.0)
         npt.assert_equal(self.unknowns['p'], p_exp)
         
-        
+
+
+def check_batch_partials(comp, values, check=True):
+    prob = Problem()
+    prob.model.add_subsystem('comp', comp, promotes=['*'])
+    prob.setup()
+    for k, v in values.items():
+        prob[k] = v
+    prob.run_model()
+    if not check:
+        return prob
+    data = prob.check_partials(out_stream=None, method='fd', form='central', step=1e-6, step_calc='rel')
+    for key, val in data['comp'].items():
+        npt.assert_allclose(val['J_fwd'], val['J_fd'], rtol=1e-5, atol=1e-6*np.abs(val['J_fd']).max(), err_msg=str(key))
+    return prob
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.z = np.linspace(-28.1, 85.1, 15)
+        self.Uref = np.array([5.0, 11.4, 25.0])
+        self.shearExp = np.array([0.1, 0.14, 0.2])
+        self.hmax = np.array([2.0, 8.0, 0.0])
+        self.T = np.array([4.0, 10.0, 0.0])
+        self.Uc = np.array([0.0, 0.5, 1.0])
+
+    def testPowerWind(self):
+        params = {'Uref':self.Uref, 'shearExp':self.shearExp, 'z':self.z, 'zref':90.0, 'z0':1.0}
+        prob = check_batch_partials(env.PowerWindBatch(nPoints=self.z.size, nConditions=3), params)
+
+        for i in range(3):
+            unknowns = {}
+            env.PowerWind(nPoints=self.z.size).compute({'Uref':self.Uref[i], 'shearExp':self.shearExp[i], 'z':self.z, 'zref':90.0, 'z0':1.0}, unknowns)
+            npt.assert_allclose(prob['U'][i,:], unknowns['U'], rtol=1e-13)
+
+    def testLogWind(self):
+        params = {'Uref':self.Uref, 'z':self.z, 'zref':90.0, 'z0':1.0, 'z_roughness':10.0}
+        prob = check_batch_partials(env.LogWindBatch(nPoints=self.z.size, nConditions=3), params)
+
+        U_exp = np.zeros((3, self.z.size))
+        idx = self.z - 1.0 > 0.01
+        U_exp[:,idx] = self.Uref[:,np.newaxis]*np.log((self.z[idx] - 1.0)/0.01)/np.log(89.0/0.01)
+        npt.assert_allclose(prob['U'], U_exp, rtol=1e-13)
+
+    def testLinearWaves(self):
+        # Sea states without waves have zero entries
+        params = {'rho':1025.0, 'z':self.z, 'z_surface':0.5, 'z_floor':-30.0, 'Uc':self.Uc, 'hmax':self.hmax, 'T':self.T}
+        batch = env.LinearWavesBatch(nPoints=self.z.size, nConditions=3)
+        unknowns = {}
+        for k in ['U', 'W', 'V', 'A', 'p']:
+            unknowns[k] = np.zeros((3, self.z.size))
+        unknowns['phase_speed'] = np.zeros(3)
+        batch.compute(params, unknowns)
+        for k in ['U', 'W', 'V', 'A', 'p']:
+            npt.assert_equal(unknowns[k][2,:], 0.0)
+        npt.assert_equal(unknowns['phase_speed'][2], 0.0)
+
+        # Shallow, positive depth input and deep water (where the sea floor partials are below finite difference noise)
+        params['hmax'][2] = 4.0
+        params['T'][2] = 1.0
+        for z_floor in [-30.0, 30.0, -300.0]:
+            params['z_floor'] = z_floor
+            prob = check_batch_partials(env.LinearWavesBatch(nPoints=self.z.size, nConditions=3), params, check=(z_floor > -100.0))
+
+            for i in range(3):
+                unknowns = {}
+                env.LinearWaves(nPoints=self.z.size).compute({'rho':1025.0, 'z':self.z, 'z_surface':0.5, 'z_floor':z_floor,
+                                                              'Uc':self.Uc[i], 'hmax':self.hmax[i], 'T':self.T[i]}, unknowns)
+                npt.assert_allclose(prob['phase_speed'][i], unknowns['phase_speed'], rtol=1e-10)
+                if np.all(np.isfinite(unknowns['U'])):
+                    for k in ['U', 'W', 'V', 'A', 'p']:
+                        npt.assert_allclose(prob[k][i,:], unknowns[k], rtol=1e-9, atol=1e-9)
+                else:
+                    # LinearWaves overflows in deep water, compare to the deep water limit
+                    omega = 2*np.pi/self.T[i]
+                    k = omega**2/g
+                    z_rel = self.z - 0.5
+                    idx = z_rel <= 0.0
+                    npt.assert_allclose(prob['U'][i,idx], 2.0*omega*np.exp(k*z_rel[idx]) + self.Uc[i], rtol=1e-12)
+                    npt.assert_allclose(prob['W'][i,idx], -2.0*omega*np.exp(k*z_rel[idx]), rtol=1e-12)
+                    npt.assert_equal(prob['U'][i,~idx], 0.0)
+
+
 def suite():
     suite = unittest.TestSuite()
     suite.addTest(unittest.makeSuite(TestPowerWind))
     suite.addTest(unittest.makeSuite(TestLinearWaves))
+    suite.addTest(unittest.makeSuite(TestBatch))
     return suite
 
 if __name__ == '__main__':
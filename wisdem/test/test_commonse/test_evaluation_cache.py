@@ -0,0 +1,202 @@
+import numpy as np
+import numpy.testing as npt
+import unittest
+import tempfile
+import shutil
+import os
+import openmdao.api as om
+import wisdem.commonse.evaluation_cache as ec
+
+
+class Counted(om.ExplicitComponent):
+    def initialize(self):
+        self.ncalls = 0
+
+    def setup(self):
+        self.add_input('x', val=np.zeros(2))
+        self.add_input('a', val=1.0)
+        self.add_discrete_input('n', val=2)
+        self.add_output('y', val=np.zeros(2))
+
+    def compute(self, inputs, outputs, discrete_inputs, discrete_outputs):
+        self.ncalls += 1
+        outputs['y'] = inputs['a'] * inputs['x']**discrete_inputs['n']
+
+
+class Assembly(om.Group):
+    def setup(self):
+        ivc = self.add_subsystem('ivc', om.IndepVarComp(), promotes=['*'])
+        ivc.add_output('x', val=np.ones(2))
+        ivc.add_discrete_output('n', val=2)
+        self.add_subsystem('comp', Counted(), promotes=['*'])
+
+
+class Square(om.ExplicitComponent):
+    # Saves its Jacobian in compute, as many WISDEM components do
+    def initialize(self):
+        self.options.declare('scale', default=1.0)
+        self.ncalls = 0
+
+    def setup(self):
+        self.add_input('x', val=1.0)
+        self.add_output('y', val=1.0)
+        self.declare_partials('y', 'x')
+
+    def compute(self, inputs, outputs):
+        self.ncalls += 1
+        outputs['y'] = self.options['scale'] * inputs['x']**2
+        self.J = {('y','x'): 2.0 * self.options['scale'] * inputs['x']}
+
+    def compute_partials(self, inputs, J):
+        for k in self.J:
+            J[k] = self.J[k]
+
+
+class SquareAssembly(om.Group):
+    def initialize(self):
+        self.options.declare('scale', default=1.0)
+
+    def setup(self):
+        ivc = self.add_subsystem('ivc', om.IndepVarComp(), promotes=['*'])
+        ivc.add_output('x', val=1.0)
+        self.add_subsystem('comp', Square(scale=self.options['scale']), promotes=['*'])
+
+
+def problem(cache, sub=False):
+    prob = om.Problem()
+    if sub:
+        prob.model.add_subsystem('asm', Assembly(), promotes=['*'])
+        ec.cache_group(prob.model.asm, cache)
+    else:
+        prob.model = Assembly()
+        ec.cache_group(prob.model, cache)
+    prob.setup()
+    return prob
+
+
+class TestEvaluationCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def testQuantize(self):
+        npt.assert_equal(ec.quantize([123.456, -0.0012345, 0.0, np.inf], 3), [123., -0.00123, 0.0, np.inf])
+
+    def testHitMiss(self):
+        cache = ec.EvaluationCache()
+        prob  = problem(cache)
+        comp  = prob.model.comp
+        prob['x'] = np.array([1.0, 2.0])
+        prob.run_model()
+        prob.run_model()
+        self.assertEqual(comp.ncalls, 1)
+        self.assertEqual(cache.stats['hits'], 1)
+        self.assertEqual(cache.stats['misses'], 1)
+
+        # New point, then back to the first one
+        prob['x'] = np.array([1.0, 3.0])
+        prob.run_model()
+        npt.assert_equal(prob['y'], [1.0, 9.0])
+        prob['x'] = np.array([1.0, 2.0])
+        prob['y'] = 0.0
+        prob.run_model()
+        npt.assert_equal(prob['y'], [1.0, 4.0])
+        self.assertEqual(comp.ncalls, 2)
+
+        # Discrete values are part of the key
+        prob['n'] = 3
+        prob.run_model()
+        npt.assert_equal(prob['y'], [1.0, 8.0])
+        self.assertEqual(comp.ncalls, 3)
+
+        # Within the tolerance is the same point
+        prob['n'] = 2
+        prob['x'] = np.array([1.0, 2.0 + 1e-14])
+        prob.run_model()
+        self.assertEqual(comp.ncalls, 3)
+
+    def testLRU(self):
+        cache = ec.EvaluationCache(max_entries=2)
+        prob  = problem(cache)
+        for x in [1.0, 2.0, 3.0, 1.0]:
+            prob['x'] = x
+            prob.run_model()
+        self.assertEqual(prob.model.comp.ncalls, 4)
+        self.assertEqual(cache.stats['evictions'], 2)
+        self.assertEqual(len(cache.entries), 2)
+
+    def testSubgroup(self):
+        # Inputs from outside of the group are part of the key
+        cache = ec.EvaluationCache()
+        prob  = problem(cache, sub=True)
+        prob['a'] = 2.0
+        prob.run_model()
+        prob.run_model()
+        self.assertEqual(prob.model.asm.comp.ncalls, 1)
+        prob['a'] = 3.0
+        prob.run_model()
+        npt.assert_equal(prob['y'], [3.0, 3.0])
+        self.assertEqual(prob.model.asm.comp.ncalls, 2)
+
+    def testSQLite(self):
+        fname = os.path.join(self.tmpdir, 'cache.sqlite')
+        cache = ec.make_cache(fname)
+        prob  = problem(cache)
+        prob['x'] = np.array([1.0, 2.0])
+        prob.run_model()
+        cache.close()
+
+        # A new run starts with an empty memory but finds the point on disk
+        cache = ec.make_cache(fname)
+        prob  = problem(cache)
+        prob['x'] = np.array([1.0, 2.0])
+        prob.run_model()
+        npt.assert_equal(prob['y'], [1.0, 4.0])
+        self.assertEqual(prob.model.comp.ncalls, 0)
+        self.assertEqual(cache.stats['disk_hits'], 1)
+        cache.clear()
+        cache.close()
+
+    def testDerivativesAfterHit(self):
+        cache = ec.EvaluationCache()
+        prob  = om.Problem(model=SquareAssembly())
+        ec.cache_group(prob.model, cache)
+        prob.setup()
+        for x in [1.0, 5.0, 1.0]:
+            prob['x'] = x
+            prob.run_model()
+        self.assertEqual(cache.stats['hits'], 1)
+        J = prob.compute_totals(of=['y'], wrt=['x'])
+        npt.assert_equal(J['y','x'], [[2.0]])
+
+        # No hit, no extra run
+        prob['x'] = 3.0
+        prob.run_model()
+        ncalls = prob.model.comp.ncalls
+        J = prob.compute_totals(of=['y'], wrt=['x'])
+        npt.assert_equal(J['y','x'], [[6.0]])
+        self.assertEqual(prob.model.comp.ncalls, ncalls)
+
+    def testOptionsInKey(self):
+        fname = os.path.join(self.tmpdir, 'cache.sqlite')
+        for scale, y, ncalls in [(1.0, 4.0, 1), (1.0, 4.0, 0), (3.0, 12.0, 1)]:
+            cache = ec.make_cache(fname)
+            prob  = om.Problem(model=SquareAssembly(scale=scale))
+            ec.cache_group(prob.model, cache)
+            prob.setup()
+            prob['x'] = 2.0
+            prob.run_model()
+            npt.assert_equal(prob['y'], y)
+            self.assertEqual(prob.model.comp.ncalls, ncalls)
+            cache.close()
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestEvaluationCache))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
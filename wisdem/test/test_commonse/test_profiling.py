@@ -0,0 +1,137 @@
+import numpy as np
+import numpy.testing as npt
+import unittest
+import tempfile
+import shutil
+import json
+import os
+import openmdao.api as om
+import wisdem.commonse.profiling as profiling
+from wisdem.pyframe3dd import Frame, NodeData, ReactionData, ElementData, Options, StaticLoadCase
+
+
+class Square(om.ExplicitComponent):
+    def setup(self):
+        self.add_input('x', val=np.zeros(3))
+        self.add_output('y', val=np.zeros(3))
+
+    def compute(self, inputs, outputs):
+        outputs['y'] = inputs['x']**2
+
+
+def cantilever():
+    # One element cantilever with a tip load
+    nodes     = NodeData(np.array([1, 2]), np.zeros(2), np.zeros(2), np.array([0.0, 10.0]), np.zeros(2))
+    reactions = ReactionData(np.array([1]), np.ones(1), np.ones(1), np.ones(1), np.ones(1), np.ones(1), np.ones(1), 1)
+    elements  = ElementData(np.array([1]), np.array([1]), np.array([2]), np.ones(1), np.ones(1), np.ones(1),
+                            np.ones(1), np.ones(1), np.ones(1), 2e11*np.ones(1), 8e10*np.ones(1), np.zeros(1), 7850*np.ones(1))
+    frame = Frame(nodes, reactions, elements, Options(False, False, 1.0))
+    load  = StaticLoadCase(0.0, 0.0, 0.0)
+    load.changePointLoads(np.array([2]), np.array([1e3]), np.zeros(1), np.zeros(1), np.zeros(1), np.zeros(1), np.zeros(1))
+    frame.addLoadCase(load)
+    return frame
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.prefix = os.path.join(self.tmpdir, 'prof')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def testRegion(self):
+        prof = profiling.Profiler()
+        with prof.region('outer'):
+            with prof.region('inner'):
+                prof.add_native('_lib', 0.5)
+            with prof.region('inner'):
+                pass
+        self.assertEqual(prof.stats['outer']['calls'], 1)
+        self.assertEqual(prof.stats['inner']['calls'], 2)
+        self.assertAlmostEqual(prof.stats['outer']['self'],
+                               prof.stats['outer']['wall'] - prof.stats['inner']['wall'])
+        self.assertEqual(prof.stats['inner']['native'], {'_lib': 0.5})
+        self.assertEqual(prof.native['<total>'], {'_lib': 0.5})
+        self.assertEqual(len(prof.events), 3)
+        self.assertIn('_lib', prof.report())
+
+    def testProblem(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('sq', Square(), promotes=['*'])
+        prob.setup()
+        prof = profiling.profile_problem(prob, prefix=self.prefix, verbose=False)
+        prob['x'] = np.arange(3.)
+        prob.run_model()
+        prob.run_driver()
+        npt.assert_equal(prob['y'], np.arange(3.)**2)
+
+        self.assertEqual(prof.stats['sq (Square)']['calls'], 2)
+        self.assertEqual(prof.stats['Problem.run_model']['calls'], 1)
+        self.assertEqual(prof.stats['Problem.run_driver']['calls'], 1)
+        with open(self.prefix + '.json') as f:
+            data = json.load(f)
+        self.assertEqual(data['components']['sq (Square)']['calls'], 2)
+        with open(self.prefix + '.trace.json') as f:
+            trace = json.load(f)
+        self.assertTrue(all(e['ph'] == 'X' for e in trace['traceEvents']))
+
+    def testSystem(self):
+        # Only the profiled group is timed, the Problem class and other problems are unchanged
+        prob = om.Problem()
+        group = prob.model.add_subsystem('group', om.Group(), promotes=['*'])
+        group.add_subsystem('sq', Square(), promotes=['*'])
+        prob.setup()
+        prof = profiling.Profiler()
+        profiling._profiler, saved = prof, profiling._profiler
+        try:
+            self.assertIs(profiling.profile_system(group, prefix=self.prefix, verbose=False), prof)
+            profiling.profile_system(group, prefix=self.prefix, verbose=False)
+            prob.run_model()
+            prob.run_driver()
+
+            other = om.Problem()
+            other.model.add_subsystem('sq', Square(), promotes=['*'])
+            other.setup()
+            other.run_model()
+        finally:
+            profiling._profiler = saved
+        self.assertNotIn('run_model', vars(prob))
+        self.assertFalse(getattr(om.Problem, '_wisdem_profile_hook', False))
+        self.assertEqual(prof.stats['group (Group)']['calls'], 2)
+        self.assertEqual(prof.stats['group.sq (Square)']['calls'], 2)
+        self.assertEqual(len(prof.stats), 2)
+        self.assertEqual(prof._undo, [])
+
+    def testFrame3DDNative(self):
+        # The native time is that of the compiled run, hooked only within the profiled block
+        frame = cantilever()
+        lib = frame._frame3dd
+        native_run = lib.run
+        prof = profiling.Profiler()
+        with prof.hooked(), prof.region('frame'):
+            self.assertIsInstance(lib.run, profiling._NativeFunction)
+            displacements = frame.run()[0]
+            # attributes such as the ctypes argument types are those of the compiled function
+            self.assertIs(lib.run.restype, native_run.restype)
+        self.assertIs(lib.run, native_run)
+        npt.assert_array_less(0.0, displacements.dx[0,-1])
+        self.assertIn('_pyframe3dd', prof.stats['frame']['native'])
+        self.assertEqual(prof._undo, [])
+
+    def testNativeProxy(self):
+        prof  = profiling.Profiler()
+        proxy = profiling._NativeProxy(np.linalg, '_linalg', prof)
+        with prof.region('solve'):
+            x = proxy.solve(np.eye(2), np.ones(2))
+        npt.assert_equal(x, np.ones(2))
+        self.assertIn('_linalg', prof.stats['solve']['native'])
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestProfiling))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
@@ -203,6 +203,64 @@ class TestUtilization(unittest.TestCase):
         npt.assert_almost_equal(external_local_unity, 1.07, 1)
         npt.assert_almost_equal(external_general_unity, 0.59, 1)
 
+
+    def testShellBucklingLoadCases(self):
+        # Stresses of several load cases against one set of sections
+        nsec = 12
+        d = np.linspace(6.0, 3.9, nsec)
+        t = np.linspace(0.035, 0.018, nsec)
+        L = np.r_[2.0, 5.0, 10.0, 30.0*np.ones(nsec-3)]
+        E = 210e9*np.ones(nsec)
+        sigma_y = 345e6*np.ones(nsec)
+        sigma_z = -1e8*np.outer(np.linspace(0.5, 2.0, 4), np.linspace(1.0, 0.3, nsec))
+        sigma_t = -2e5*np.ones((4, nsec))
+        tau_zt = 3e6*np.outer(np.linspace(0.5, 2.0, 4), np.ones(nsec))
+
+        EU = util.shellBucklingEurocode(d, t, sigma_z, sigma_t, tau_zt, L, E, sigma_y, 1.35, 1.1)
+        self.assertEqual(EU.shape, (4, nsec))
+        for k in range(4):
+            npt.assert_equal(EU[k,:], util.shellBucklingEurocode(d, t, sigma_z[k,:], sigma_t[k,:], tau_zt[k,:],
+                                                                 L, E, sigma_y, 1.35, 1.1))
+
+        # One section at a time
+        for i in range(nsec):
+            EUi = util._shellBucklingOneSection(L[i], 0.5*(d[i]-t[i]), 0.5*(d[i]-t[i]), t[i], 1.1, 1.35*np.abs(sigma_z[0,i]),
+                                                1.35*np.abs(sigma_t[0,i]), 1.35*np.abs(tau_zt[0,i]), E[i], sigma_y[i])
+            self.assertAlmostEqual(EUi, EU[0,i], 12)
+
+    def testShellBucklingDerivatives(self):
+        nsec = 12
+        inputs = {'d': np.linspace(6.0, 3.9, nsec), 't': np.linspace(0.035, 0.018, nsec),
+                  'sigma_z': -np.linspace(1.5e8, 2e7, nsec), 'sigma_t': np.linspace(-5e6, 1e6, nsec),
+                  'tau_zt': np.linspace(8e6, 1e6, nsec), 'L_reinforced': np.r_[0.5, 2.0, 5.0, 10.0, 30.0*np.ones(nsec-4)],
+                  'E': 210e9*np.ones(nsec), 'sigma_y': 345e6*np.ones(nsec), 'gamma_f': 1.35, 'gamma_b': 1.1}
+        EU, dEU = util.shellBucklingEurocode(derivatives=True, **inputs)
+
+        for k in inputs:
+            step = 1e-6*np.abs(inputs[k])
+            xp = dict(inputs)
+            xm = dict(inputs)
+            xp[k] = inputs[k] + step
+            xm[k] = inputs[k] - step
+            fd = (util.shellBucklingEurocode(**xp) - util.shellBucklingEurocode(**xm)) / (2*step)
+            npt.assert_allclose(dEU[k], fd, rtol=1e-5, atol=1e-8*np.abs(fd).max(), err_msg=k)
+
+    def testFatigue(self):
+        d = np.array([6.0, 5.0, 4.0])
+        t = np.array([0.02, 0.025, 0.03])
+        M = np.array([[1e6, 2e6, 3e6], [2e6, 4e6, 6e6]])
+        N = 20*365*24*3600.0*np.ones(3)
+        damage, dD = util.fatigue(M, N, d, t, derivatives=True)
+
+        # Weld factor is 1 at 20 mm, (25/30)**0.25 at 30 mm, and a spline around 25 mm
+        sigma = M*1e-6/(np.pi*(0.5*d)**2*t)  # N/mm^2
+        weld = np.array([1.0, util.CubicSplineSegment(24.0, 26.0, 1.0, (25.0/26.0)**0.25, 0.0,
+                                                     25.0**0.25*-0.25*26.0**-1.25).eval(25.0), (25.0/30.0)**0.25])
+        npt.assert_allclose(damage, N/2e6*(sigma/(80.0*weld/1.265))**4)
+        npt.assert_allclose(damage[1,:], 16*damage[0,:])
+        npt.assert_allclose(dD['M_DEL'], 4*damage/M)
+        npt.assert_allclose(dD['d'], -8*damage/d)
+
         
 def suite():
     suite = unittest.TestSuite()
@@ -3,6 +3,7 @@ import numpy.testing as npt
 import unittest
 import wisdem.commonse.vertical_cylinder as vc
 from wisdem.commonse.utilities import nodal2sectional
+from wisdem.commonse.tube import Tube
 
 npts = 100
 myones = np.ones((npts,))
@@ -98,10 +99,91 @@ class TestMass(unittest.TestCase):
         '''
 
         
+class TestFrameSweep(unittest.TestCase):
+    def setUp(self):
+        n = 11
+        self.params = {}
+        self.params['z'] = np.linspace(0, 90.0, n)
+        self.params['E'] = 200e9
+        self.params['G'] = 79.3e9
+        self.params['rho'] = 8500.0
+        self.params['sigma_y'] = 345e6
+        self.params['L_reinforced'] = 30.0
+        for k in ['kx','ky','kz','ktx','kty','ktz']:
+            self.params[k] = np.array([vc.RIGID])
+        self.params['kidx'] = np.array([0])
+        self.params['midx'] = np.array([n-1])
+        self.params['m'] = np.array([3e5])
+        for k in ['mIxx','mIyy','mIzz']:
+            self.params[k] = np.array([1e7])
+        for k in ['mIxy','mIxz','mIyz','mrhoy']:
+            self.params[k] = np.zeros(1)
+        self.params['mrhox'] = np.array([-1.0])
+        self.params['mrhoz'] = np.array([1.0])
+        self.params['plidx'] = np.array([n-1])
+        self.params['Fx'] = np.array([8e5])
+        self.params['Fy'] = np.zeros(1)
+        self.params['Fz'] = np.array([-1e6])
+        self.params['Mxx'] = np.zeros(1)
+        self.params['Myy'] = np.array([1e6])
+        self.params['Mzz'] = np.zeros(1)
+        self.params['Px'] = np.linspace(1e3, 3e3, n)
+        self.params['Py'] = np.zeros(n)
+        self.params['Pz'] = np.zeros(n)
+        self.params['qdyn'] = np.linspace(100.0, 300.0, n)
+        self.params['dx'] = 5.0
+        self.params['tol'] = 1e-9
+        self.params['shift'] = 0.0
+        self.discrete = {'addGravityLoadForExtraMass':True, 'shear':True, 'geom':False, 'nM':2, 'Mmethod':1, 'lump':0}
+
+        self.d = np.linspace(6.0, 4.0, n) * np.array([[1.0], [1.2], [0.9]])
+        self.t = np.array([[0.03], [0.025], [0.04]]) * np.ones(n-1)
+        self.E = np.array([[200e9], [210e9], [190e9]])
+
+    def testSweep(self):
+        out = vc.cylinder_frame3dd_sweep(self.params, self.discrete, self.d, self.t, E=self.E)
+        comp = vc.CylinderFrame3DD(npts=11, nK=1, nMass=1, nPL=1)
+
+        for k in range(3):
+            params = dict(self.params)
+            tube = Tube(0.5*(self.d[k,:-1] + self.d[k,1:]), self.t[k])
+            params.update(d=self.d[k], t=self.t[k], E=self.E[k,0], Az=tube.Area, Asx=tube.Asx, Asy=tube.Asy,
+                          Jz=tube.J0, Ixx=tube.Jxx, Iyy=tube.Jyy)
+            unknowns = {}
+            comp.compute(params, unknowns, self.discrete, {})
+            for key in unknowns:
+                npt.assert_allclose(out[key][k], unknowns[key], rtol=1e-10)
+
+        # stiffer and lighter candidates have higher frequencies
+        self.assertGreater(out['f1'][1], out['f1'][0])
+        
+    def testWarmStart(self):
+        params = dict(self.params)
+        tube = Tube(0.5*(self.d[0,:-1] + self.d[0,1:]), self.t[0])
+        params.update(d=self.d[0], t=self.t[0], Az=tube.Area, Asx=tube.Asx, Asy=tube.Asy,
+                      Jz=tube.J0, Ixx=tube.Jxx, Iyy=tube.Jyy)
+
+        warm = vc.CylinderFrame3DD(npts=11, nK=1, nMass=1, nPL=1)
+        cold = vc.CylinderFrame3DD(npts=11, nK=1, nMass=1, nPL=1, modal_warm_start=False)
+        for scale in [1.0, 1.01, 1.02]:
+            params['Ixx'] = params['Iyy'] = scale*tube.Jxx
+            uwarm, ucold = {}, {}
+            warm.compute(params, uwarm, self.discrete, {})
+            cold.compute(params, ucold, self.discrete, {})
+            npt.assert_allclose(uwarm['f1'], ucold['f1'], rtol=1e-10)
+            npt.assert_allclose(uwarm['f2'], ucold['f2'], rtol=1e-10)
+
+        self.assertEqual(warm.modal_stats['solves'], 3)
+        self.assertEqual(warm.modal_stats['warm_starts'], 2)
+        self.assertEqual(cold.modal_stats['warm_starts'], 0)
+        self.assertLess(warm.modal_stats['iterations'], cold.modal_stats['iterations'])
+
+
 def suite():
     suite = unittest.TestSuite()
     suite.addTest(unittest.makeSuite(TestDiscretization))
     suite.addTest(unittest.makeSuite(TestMass))
+    suite.addTest(unittest.makeSuite(TestFrameSweep))
     return suite
 
 if __name__ == '__main__':
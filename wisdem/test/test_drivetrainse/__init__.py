@@ -1 +1 @@
-#from . import test_all
+from . import test_all
@@ -0,0 +1,12 @@
+import unittest
+
+from wisdem.test.test_drivetrainse import test_generator_sweep
+
+def suite():
+    suite = unittest.TestSuite( (test_generator_sweep.suite(),
+    ) )
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
@@ -0,0 +1,101 @@
+import unittest
+import numpy as np
+import numpy.testing as npt
+import openmdao.api as om
+import wisdem.drivetrainse.generator as generator
+import wisdem.drivetrainse.generator_sweep as gs
+
+# SCIG is not tested, since scigSE depends on the missing ddse_utils module
+genTypes = ['pmsg_arms', 'pmsg_disc', 'eesg', 'dfig']
+
+# Fixed (non-design) inputs, as in generator.optimization_example
+fixed = {'pmsg_arms': {'machine_rating': 10e6, 'Torque': 12.64e6, 'n_nom': 7.54, 'R_o': 0.43},
+         'pmsg_disc': {'machine_rating': 10e6, 'Torque': 12.64e6, 'n_nom': 7.54, 'R_o': 0.43},
+         'eesg':      {'machine_rating': 10e6, 'Torque': 12.64e6, 'n_nom': 7.54, 'R_o': 0.43},
+         'dfig':      {'machine_rating': 5e6, 'n_nom': 1200.0, 'Gearbox_efficiency': 0.955}}
+for genType in fixed:
+    fixed[genType].update({'rho_Fe': 7700.0, 'rho_Fes': 7850.0, 'rho_Copper': 8900.0, 'rho_PM': 7450.0,
+                           'shaft_cm': np.array([0.1, 0.0, 0.2]), 'shaft_length': 2.0})
+
+costs = {'C_Cu': 4.786, 'C_Fe': 0.556, 'C_Fes': 0.50139, 'C_PM': 95.0}
+
+
+def sample_inputs(genType, n, seed=0):
+    inputs = dict(fixed[genType])
+    inputs.update(gs.sample_designs(genType, n, seed=seed))
+    return inputs
+
+
+class TestGeneratorSweep(unittest.TestCase):
+
+    def testTablesFromOptimizationExample(self):
+        self.assertIs(gs.DESIGN_BOUNDS, generator.DESIGN_BOUNDS)
+        self.assertIs(gs.CONSTRAINTS, generator.CONSTRAINTS)
+
+    def testBatchVsScalar(self):
+        # Each design of a batch matches the same design sized on its own
+        n = 20
+        for genType in genTypes:
+            inputs = sample_inputs(genType, n)
+            batch  = gs.evaluate_designs(genType, **inputs, **costs)
+            model  = gs.get_model(genType)
+            for i in range(n):
+                args = [inputs[k] if k == 'shaft_cm' or np.ndim(inputs[k]) == 0 else float(inputs[k][i])
+                        for k in gs.INPUTS[genType]]
+                with np.errstate(all='ignore'):
+                    single = dict(zip(gs.OUTPUTS[genType], model.compute(*args)))
+                for k, v in single.items():
+                    npt.assert_allclose(batch[k][i], v, rtol=1e-12, atol=0.0, err_msg='%s %s' % (genType, k))
+
+                # evaluate_designs on one design gives the same margins and costs
+                scalar = gs.evaluate_designs(genType, **{k: v if np.ndim(v) == 0 or k == 'shaft_cm' else v[i]
+                                                         for k, v in inputs.items()}, **costs)
+                for k in scalar:
+                    npt.assert_allclose(batch[k][i], scalar[k], rtol=1e-12, atol=0.0, err_msg='%s %s' % (genType, k))
+                self.assertEqual(gs.violations(genType, batch)[i], gs.violations(genType, scalar))
+
+    def testBatchVsOpenMDAO(self):
+        # Costs and constraint margins match the Generator group used by optimization_example
+        n = 3
+        for genType in ['pmsg_arms', 'pmsg_disc', 'eesg']:
+            inputs = sample_inputs(genType, n, seed=1)
+            batch  = gs.evaluate_designs(genType, **inputs, **costs)
+
+            prob = om.Problem()
+            prob.model = generator.Generator(design=genType, topLevelFlag=True)
+            prob.setup()
+            for i in range(n):
+                for k, v in list(inputs.items()) + list(costs.items()):
+                    prob[k] = v if np.ndim(v) == 0 or k == 'shaft_cm' else v[i]
+                prob.run_model()
+                for name in ['Costs', 'Mass', generator.efficiency_name(genType)] + [c[0] for c in gs.CONSTRAINTS[genType]]:
+                    npt.assert_allclose(batch[name][i], prob[name], rtol=1e-10, err_msg='%s %s' % (genType, name))
+
+    def testNanDesignsInfeasible(self):
+        # Designs where the disc rotor deflection overflows are infeasible, the others are unaffected
+        inputs = sample_inputs('pmsg_disc', 3)
+        inputs['h_yr'] = np.array([inputs['h_yr'][0], 1e-12, inputs['h_yr'][2]])
+        out = gs.evaluate_designs('pmsg_disc', **inputs, **costs)
+        self.assertTrue(np.isnan(out['u_Ar'][1]))
+        self.assertFalse(np.any(np.isnan(out['u_Ar'][[0, 2]])))
+        self.assertFalse(gs.feasible('pmsg_disc', out)[1])
+
+        ref = gs.evaluate_designs('pmsg_disc', **{k: v if np.ndim(v) == 0 or k == 'shaft_cm' else v[[0, 2]]
+                                                  for k, v in inputs.items()}, **costs)
+        npt.assert_equal(out['u_Ar'][[0, 2]], ref['u_Ar'])
+
+    def testScreenDesigns(self):
+        designs, out = gs.screen_designs('pmsg_arms', 2000, n_best=5, seed=0, **fixed['pmsg_arms'])
+        self.assertEqual(len(out['Costs']), 5)
+        self.assertTrue(np.all(np.diff(out['violations']) >= 0))
+        for k, (lower, upper) in generator.DESIGN_BOUNDS['pmsg_arms'].items():
+            self.assertTrue(np.all((designs[k] >= lower) & (designs[k] <= upper)))
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestGeneratorSweep))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
@@ -5,6 +5,7 @@ import wisdem.floatingse.map_mooring as mapMooring
 from wisdem.floatingse.column import ColumnGeometry
 from wisdem.pymap import pyMAP
 from wisdem.commonse import gravity as g
+from wisdem.commonse.utilities import unassembleI
 
 def myisnumber(instr):
     try:
@@ -50,6 +51,41 @@ truth=['---------------------- LINE DICTIONARY ---------------------------------
 ' ref_position 0.0 0.0 0.0']
 
 
+def reference_profiles(mymap, inputs, tlpFlag, wet_mass_per_length):
+    # Line profiles and mooring MOI at the neutral position, line by line and point by point as computed before plot_xyz
+    fairleadDepth = inputs['fairlead']
+    waterDepth    = inputs['water_depth']
+    ntotal        = int(inputs['number_of_mooring_connections']) * int(inputs['mooring_lines_per_connection'])
+
+    plotMat = np.zeros((mapMooring.NLINES_MAX, mapMooring.NPTS_PLOT, 3))
+    nptsMOI = 100
+    xyzpts  = np.zeros((ntotal, nptsMOI, 3))
+    for k in range(ntotal):
+        plotMat[k,:,0] = mymap.plot_x(k, mapMooring.NPTS_PLOT)
+        plotMat[k,:,1] = mymap.plot_y(k, mapMooring.NPTS_PLOT)
+        plotMat[k,:,2] = mymap.plot_z(k, mapMooring.NPTS_PLOT)
+        xyzpts[k,:,0]  = mymap.plot_x(k, nptsMOI)
+        xyzpts[k,:,1]  = mymap.plot_y(k, nptsMOI)
+        xyzpts[k,:,2]  = mymap.plot_z(k, nptsMOI)
+        if tlpFlag:
+            plotMat[k,:,2] = np.linspace(-fairleadDepth, -waterDepth, mapMooring.NPTS_PLOT)
+            xyzpts[k,:,2]  = np.linspace(-fairleadDepth, -waterDepth, nptsMOI)
+
+    xyzpts_dx = np.gradient(xyzpts[:,:,0], axis=1)
+    xyzpts_dy = np.gradient(xyzpts[:,:,1], axis=1)
+    xyzpts_dz = np.gradient(xyzpts[:,:,2], axis=1)
+    xyzpts_ds = np.sqrt(xyzpts_dx**2 + xyzpts_dy**2 + xyzpts_dz**2)
+
+    r0 = np.array([0.0, 0.0, -fairleadDepth])
+    R  = np.zeros((ntotal, nptsMOI, 6))
+    for ii in range(nptsMOI):
+        for k in range(ntotal):
+            r = xyzpts[k,ii,:] - r0
+            R[k,ii,:] = unassembleI(np.dot(r,r)*np.eye(3) - np.outer(r,r))
+    Imat = wet_mass_per_length * np.trapz(R, x=xyzpts_ds[:,:,np.newaxis], axis=1)
+    return plotMat, np.abs( Imat.sum(axis=0) )
+
+
 class TestMapMooring(unittest.TestCase):
     
     def setUp(self):
@@ -161,6 +197,66 @@ class TestMapMooring(unittest.TestCase):
         self.assertEqual(np.count_nonzero(self.outputs['operational_heel_restoring_force']), 9)
         self.assertGreater(np.count_nonzero(self.outputs['mooring_plot_matrix']), 9*20-3)
 
+    def testSymmetricSweep(self):
+        angles = np.rad2deg( mapMooring.offset_sweep_headings(3, 2.0) )
+        npt.assert_almost_equal(angles, np.arange(0.0, 61.0, 2.0))
+        self.assertEqual(mapMooring.offset_sweep_headings(3, 2.0, symmetric=False).size, 180)
+
+        self.mymap.runMAP(self.inputs, self.discrete_inputs, self.outputs)
+        full = mapMooring.MapMooring(symmetric_sweep=False)
+        full.set_properties(self.inputs, self.discrete_inputs)
+        full_outputs = {}
+        full.set_geometry(self.inputs, full_outputs)
+        full.runMAP(self.inputs, self.discrete_inputs, full_outputs)
+        npt.assert_allclose(self.outputs['axial_unity'], full_outputs['axial_unity'], rtol=1e-4)
+        npt.assert_allclose(self.outputs['max_offset_restoring_force'], full_outputs['max_offset_restoring_force'], rtol=1e-4)
+
+    def testSymmetricSweepNonInteger(self):
+        # 360/7 is not a whole number of degrees: the repeated lines are written at their exact angles
+        self.inputs['number_of_mooring_connections'] = 7
+        self.mymap.set_properties(self.inputs, self.discrete_inputs)
+        self.mymap.write_input_file(self.inputs, self.discrete_inputs)
+        repeat = [line for line in self.mymap.finput if line.startswith('repeat')][0].split()[1:]
+        npt.assert_allclose([float(a) for a in repeat], 360.0*np.arange(1, 7)/7, atol=1e-6)
+
+        self.mymap.runMAP(self.inputs, self.discrete_inputs, self.outputs)
+        full = mapMooring.MapMooring(symmetric_sweep=False, sweep_processes=2)
+        full.set_properties(self.inputs, self.discrete_inputs)
+        full_outputs = {}
+        full.set_geometry(self.inputs, full_outputs)
+        full.runMAP(self.inputs, self.discrete_inputs, full_outputs)
+        self.assertEqual(np.count_nonzero(full_outputs['mooring_neutral_load'][:,0]), 7)
+        npt.assert_allclose(self.outputs['axial_unity'], full_outputs['axial_unity'], rtol=1e-4)
+        npt.assert_allclose(self.outputs['max_offset_restoring_force'], full_outputs['max_offset_restoring_force'], rtol=1e-4)
+
+    def testProfilesVsLineLoop(self):
+        # Sampled line profiles and MOI match the previous per line loop, for a catenary and a taut mooring
+        for length in [self.inputs['mooring_line_length'], 0.9*(self.inputs['water_depth'] - self.inputs['fairlead'])]:
+            self.inputs['mooring_line_length'] = length
+            self.mymap.set_properties(self.inputs, self.discrete_inputs)
+            self.mymap.set_geometry(self.inputs, self.outputs)
+            self.mymap.runMAP(self.inputs, self.discrete_inputs, self.outputs)
+
+            mymap = pyMAP( )
+            mymap.map_set_sea_depth(self.inputs['water_depth'])
+            mymap.map_set_gravity(g)
+            mymap.map_set_sea_density(self.inputs['water_density'])
+            mymap.read_list_input(self.mymap.finput)
+            mymap.init( )
+            mymap.displace_vessel(0, 0, 0, 0, 0, 0)
+            mymap.update_states(0.0, 0)
+            mymap.linear(1e-4)
+            mymap.displace_vessel(0, 0, 0, 0, 0, 0)
+            mymap.update_states(0.0, 0)
+            for k in range(3):
+                npt.assert_equal(mymap.plot_xyz(k, 20), np.c_[mymap.plot_x(k, 20), mymap.plot_y(k, 20), mymap.plot_z(k, 20)])
+            plotMat, moi = reference_profiles(mymap, self.inputs, self.mymap.tlpFlag, self.mymap.wet_mass_per_length)
+            mymap.end()
+
+            npt.assert_allclose(self.outputs['mooring_plot_matrix'], plotMat, rtol=1e-12, atol=1e-12)
+            npt.assert_allclose(self.outputs['mooring_moments_of_inertia'], moi, rtol=1e-12)
+        self.assertTrue(self.mymap.tlpFlag)
+
     def testCost(self):
         self.mymap.compute_cost(self.inputs, self.discrete_inputs, self.outputs)
     
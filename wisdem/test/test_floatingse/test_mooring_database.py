@@ -0,0 +1,112 @@
+import numpy as np
+import numpy.testing as npt
+import unittest
+import tempfile
+import shutil
+import os
+import wisdem.floatingse.map_mooring as mapMooring
+import wisdem.floatingse.mooring_database as mdb
+
+
+class TestMooringDatabase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.inputs = {}
+        cls.discrete_inputs = {}
+
+        cls.inputs['water_density'] = 1025.0
+        cls.inputs['water_depth'] = 218.0
+        cls.inputs['fairlead'] = 10.0
+        cls.inputs['fairlead_radius'] = 11.0
+        cls.inputs['anchor_radius'] = 175.0
+        cls.inputs['number_of_mooring_connections'] = 3
+        cls.inputs['mooring_lines_per_connection'] = 1
+        cls.inputs['mooring_line_length'] = 0.6*(218.0 + 175.0)
+        cls.inputs['mooring_diameter'] = 0.05
+        cls.inputs['max_offset'] = 10.0
+        cls.inputs['max_survival_heel'] = 10.0
+        cls.inputs['operational_heel'] = 10.0
+        cls.inputs['gamma_f'] = 1.35
+        cls.inputs['mooring_cost_factor'] = 1.1
+        cls.discrete_inputs['mooring_type'] = 'chain'
+        cls.discrete_inputs['anchor_type'] = 'suctionpile'
+
+        x0 = mdb.design_coordinates(cls.inputs)
+        cls.axes = {k: np.array([0.98*x, 1.02*x]) for k, x in zip(mdb.AXES, x0)}
+        cls.tmpdir = tempfile.mkdtemp()
+        cls.fname = os.path.join(cls.tmpdir, 'moor.npz')
+        cls.db = mdb.build_database(cls.fname, cls.axes, cls.inputs, cls.discrete_inputs, processes=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmpdir)
+
+    def run_map(self, inputs, **kwargs):
+        outputs = {}
+        mymoor = mapMooring.MapMooring(**kwargs)
+        mymoor.set_properties(inputs, self.discrete_inputs)
+        mymoor.set_geometry(inputs, outputs)
+        if not mymoor.runSurrogate(inputs, self.discrete_inputs, outputs):
+            mymoor.runMAP(inputs, self.discrete_inputs, outputs)
+        return mymoor, outputs
+
+    def testCoordinates(self):
+        x = mdb.design_coordinates(self.inputs)
+        inputs = mdb.design_inputs(x, self.inputs)
+        for k in ['water_depth', 'fairlead', 'mooring_line_length', 'anchor_radius', 'max_offset']:
+            self.assertAlmostEqual(inputs[k], self.inputs[k])
+
+    def testSaveLoad(self):
+        db = mdb.MooringDatabase.load(self.fname)
+        self.assertEqual(db.mooring_type, 'CHAIN')
+        for k in mdb.RESPONSES:
+            npt.assert_equal(db.data[k], self.db.data[k])
+
+    def testCovers(self):
+        self.assertTrue(self.db.covers(self.inputs, self.discrete_inputs))
+        inputs = dict(self.inputs)
+        inputs['water_depth'] = 300.0
+        self.assertFalse(self.db.covers(inputs, self.discrete_inputs))
+        inputs = dict(self.inputs)
+        inputs['operational_heel'] = 5.0
+        self.assertFalse(self.db.covers(inputs, self.discrete_inputs))
+        self.assertFalse(self.db.covers(self.inputs, {'mooring_type':'nylon'}))
+
+    def testGridPoint(self):
+        # At a grid point, and for a different diameter, the database matches MAP++
+        inputs = mdb.design_inputs([a[0] for a in self.axes.values()], self.inputs)
+        inputs['mooring_diameter'] = 0.08
+        _, truth = self.run_map(inputs)
+        mymoor, outputs = self.run_map(inputs, mooring_database=self.fname)
+        self.assertIsNotNone(mymoor.surrogate_errors)
+        for k in ['max_offset_restoring_force', 'axial_unity', 'mooring_stiffness', 'mooring_neutral_load']:
+            npt.assert_allclose(outputs[k], truth[k], rtol=1e-6, atol=1e-6*np.abs(truth[k]).max())
+
+    def testInterpolation(self):
+        mymoor, outputs = self.run_map(self.inputs, mooring_database=self.db)
+        errors = mymoor.surrogate_errors
+        _, truth = self.run_map(self.inputs)
+        self.assertLessEqual(np.abs(mymoor.max_tension*1.35/mymoor.min_break_load - truth['axial_unity']),
+                             errors['max_tension']*1.35/mymoor.min_break_load + 1e-12)
+        self.assertLessEqual(np.abs(outputs['max_offset_restoring_force'] - truth['max_offset_restoring_force']),
+                             errors['max_offset_restoring_force'])
+
+    def testFallback(self):
+        # Outside of the database or above the error tolerance, MAP++ is ran
+        inputs = dict(self.inputs)
+        inputs['water_depth'] = 300.0
+        mymoor, outputs = self.run_map(inputs, mooring_database=self.db)
+        self.assertIsNone(mymoor.surrogate_errors)
+
+        mymoor, outputs = self.run_map(self.inputs, mooring_database=self.db, surrogate_rtol=0.0)
+        self.assertIsNone(mymoor.surrogate_errors)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestMooringDatabase))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
@@ -0,0 +1,66 @@
+"""Tests for the `Environment` class."""
+
+__author__ = "Jake Nunemaker"
+__copyright__ = "Copyright 2020, National Renewable Energy Laboratory"
+__maintainer__ = "Jake Nunemaker"
+__email__ = "jake.nunemaker@nrel.gov"
+
+
+import numpy as np
+import marmot
+import pytest
+from marmot import le
+from marmot._exceptions import StateExhausted, WindowNotFound
+
+from wisdem.orbit.core import Environment
+from wisdem.test.test_orbit.data import test_weather
+
+constraints = {"windspeed": le(10), "waveheight": le(1.5)}
+
+
+@pytest.mark.parametrize("now", (0, 7, 150.5, 3000))
+@pytest.mark.parametrize("n", (0, 1, 6, 24, 2.5, 17.3))
+def test_matches_marmot(now, n):
+
+    env = Environment(state=test_weather)
+    ref = marmot.Environment(state=test_weather)
+    if now:
+        env.run(until=now)
+        ref.run(until=now)
+
+    assert env.find_operational_window(
+        ceil_int(n), constraints
+    ) == ref.find_operational_window(ceil_int(n), constraints)
+
+    assert env.calculate_operational_delays(
+        n, constraints
+    ) == ref.calculate_operational_delays(n, constraints)
+
+
+def test_exhausted_state():
+
+    state = np.array(
+        [(12.0, 1.0)] * 5 + [(5.0, 1.0)] * 3 + [(12.0, 1.0)] * 2,
+        dtype=[("windspeed", float), ("waveheight", float)],
+    )
+    env = Environment(state=state)
+
+    assert env.find_operational_window(3, constraints) == 5
+    assert env.calculate_operational_delays(3, constraints) == [5, 3]
+
+    with pytest.raises(WindowNotFound):
+        env.find_operational_window(4, constraints)
+
+    with pytest.raises(StateExhausted):
+        env.calculate_operational_delays(4, constraints)
+
+
+def test_no_weather():
+
+    env = Environment()
+    assert env.find_operational_window(5, constraints) == 0
+    assert env.calculate_operational_delays(5, constraints) == [5]
+
+
+def ceil_int(n):
+    return int(np.ceil(n))
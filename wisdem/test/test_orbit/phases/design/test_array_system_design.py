@@ -14,6 +14,7 @@ import pytest
 
 from wisdem.orbit.library import initialize_library, extract_library_specs
 from wisdem.orbit.phases.design import ArraySystemDesign, CustomArraySystemDesign
+from wisdem.orbit.phases.design.array_system_design import geodesic_distance
 from wisdem.orbit.core.exceptions import LibraryItemNotFoundError
 
 initialize_library(pytest.library)
@@ -209,3 +210,70 @@ def test_correct_turbines():
 
     with pytest.raises(ValueError):
         array.run()
+
+
+def test_geodesic_distance():
+    from geopy import distance
+
+    rng = np.random.RandomState(42)
+    lat1 = rng.uniform(-80, 80, 50)
+    lon1 = rng.uniform(-180, 180, 50)
+    lat2 = lat1 + rng.uniform(-1, 1, 50)
+    lon2 = lon1 + rng.uniform(-1, 1, 50)
+
+    # Include coincident, missing and nearly antipodal points
+    lat2[0], lon2[0] = lat1[0], lon1[0]
+    lat2[1] = np.nan
+    lat1[2], lon1[2], lat2[2], lon2[2] = 0.0, 0.0, 0.5, 179.7
+
+    d = geodesic_distance(lat1, lon1, lat2, lon2)
+    assert d[0] == 0.0
+    assert np.isnan(d[1])
+
+    for i in range(2, 50):
+        expected = distance.geodesic(
+            (lat1[i], lon1[i]), (lat2[i], lon2[i]), ellipsoid="WGS-84"
+        ).km
+        assert d[i] == pytest.approx(expected, abs=1e-8)
+
+
+def test_custom_layout_distances():
+    config = deepcopy(config_custom_base)
+    config["array_system_design"]["location_data"] = "test_custom"
+
+    array = CustomArraySystemDesign(config)
+    with pytest.warns(UserWarning):
+        array.run()
+
+    assert array.sections_distance.shape == (2, 4)
+    np.testing.assert_array_equal(array.sections_bury_speeds[0], 50)
+    np.testing.assert_array_equal(array.sections_bury_speeds[1], 80)
+
+    expected = geodesic_distance(
+        array.windfarm_y[:, :-1],
+        array.windfarm_x[:, :-1],
+        array.windfarm_y[:, 1:],
+        array.windfarm_x[:, 1:],
+    )
+    np.testing.assert_allclose(array.sections_distance, expected)
+
+
+def test_custom_layout_partial_string():
+    config = deepcopy(config_custom_base)
+    config["plant"]["num_turbines"] = 7
+    config["array_system_design"]["location_data"] = "test_custom_partial"
+
+    array = CustomArraySystemDesign(config)
+    array.run()
+
+    # The section of each turbine is in the column of its order, the
+    # sections past the end of the partial string are left empty
+    np.testing.assert_array_equal(
+        array.sections_cable_lengths,
+        [[110, 120, 130, 140], [210, 220, 230, 0]],
+    )
+    np.testing.assert_array_equal(
+        array.sections_bury_speeds, [[50, 51, 52, 53], [80, 81, 82, 0]]
+    )
+    assert np.isnan(array.windfarm_x[1, 4])
+    assert np.isnan(array.sections_distance[1, 3])
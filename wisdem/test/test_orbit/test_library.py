@@ -72,3 +72,47 @@ def test_phase_specific_file_extraction():
 
     with pytest.raises(LibraryItemNotFoundError):
         bad_project = ProjectManager(bad_config)
+
+
+def test_extract_library_specs_cache():
+    library.initialize_library(pytest.library)
+    library.clear_library_cache()
+
+    first = library.extract_library_specs("wtiv", "test_wtiv")
+    assert len(library._LIBRARY_CACHE) == 1
+
+    # Cached data is returned as an independent copy
+    first["vessel_specs"] = None
+    second = library.extract_library_specs("wtiv", "test_wtiv")
+    assert second["vessel_specs"] is not None
+    assert len(library._LIBRARY_CACHE) == 1
+
+
+def test_extract_file_cache_invalidation(tmp_path):
+    filepath = tmp_path / "item.yaml"
+    filepath.write_text("value: 1.0e3\n")
+    assert library._extract_file(str(filepath)) == {"value": 1000.0}
+
+    filepath.write_text("value: 2.5e3\nname: new\n")
+    assert library._extract_file(str(filepath)) == {
+        "value": 2500.0,
+        "name": "new",
+    }
+
+
+def test_csv_disk_cache(tmp_path):
+    filepath = tmp_path / "table.csv"
+    filepath.write_text("Wind Speed,Wave Height\n1.0,2.0\n3.0,4.0\n")
+
+    library.initialize_cache(str(tmp_path / "cache"))
+    try:
+        df = library._extract_file(str(filepath))
+        assert list(df.columns) == ["wind_speed", "wave_height"]
+        assert len(os.listdir(tmp_path / "cache")) == 1
+
+        library.clear_library_cache()
+        cached = library._extract_file(str(filepath))
+        assert cached.equals(df)
+
+    finally:
+        _ = os.environ.pop("DATA_LIBRARY_CACHE")
@@ -4,6 +4,7 @@ __maintainer__ = "Jake Nunemaker"
 __email__ = "jake.nunemaker@nrel.gov"
 
 
+import math
 from copy import deepcopy
 from datetime import datetime
 
@@ -357,3 +358,38 @@ def test_resolve_project_capacity():
 
     with pytest.raises(KeyError):
         num_turbines = out6["plant"]["num_turbines"]
+
+
+@pytest.mark.parametrize("weather", (None, weather_df))
+def test_columnar_logs(weather):
+
+    project = ProjectManager(config, weather=weather)
+    project.run_project()
+
+    columnar = ProjectManager(config, weather=weather, columnar_logs=True)
+    columnar.run_project()
+
+    logs = columnar.project_logs
+    assert isinstance(logs, pd.DataFrame)
+    assert len(logs) == len(project.project_logs)
+
+    expected = pd.DataFrame(project.project_actions)
+    actions = columnar.project_actions
+    for col in ["time", "duration", "cost", "agent", "action", "phase"]:
+        assert (actions[col] == expected[col]).all()
+
+
+def test_serial_phase_offsets():
+
+    project = ProjectManager(config, weather=weather_df, columnar_logs=True)
+    project.run_project()
+
+    actions = project.project_actions
+    _m = actions.loc[actions["phase"] == "MonopileInstallation"]
+    _t = actions.loc[actions["phase"] == "TurbineInstallation"]
+
+    _offset = math.ceil(project.phase_times["MonopileInstallation"])
+    assert _m["time"].max() == project.phase_times["MonopileInstallation"]
+    assert _t["time"].max() == pytest.approx(
+        _offset + project.phase_times["TurbineInstallation"]
+    )
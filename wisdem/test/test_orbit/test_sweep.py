@@ -0,0 +1,81 @@
+__author__ = "Jake Nunemaker"
+__copyright__ = "Copyright 2020, National Renewable Energy Laboratory"
+__maintainer__ = "Jake Nunemaker"
+__email__ = "jake.nunemaker@nrel.gov"
+
+
+from copy import deepcopy
+
+import pandas as pd
+import pytest
+
+from wisdem.orbit import ProjectManager, run_start_date_sweep
+from wisdem.test.test_orbit.data import test_weather
+from wisdem.orbit.library import initialize_library, extract_library_specs
+from wisdem.orbit.core.exceptions import WeatherProfileError
+
+weather_df = pd.DataFrame(test_weather).set_index("datetime")
+
+initialize_library(pytest.library)
+config = extract_library_specs("config", "project_manager")
+
+start_dates = ["03/01/2010", "06/01/2011", "09/01/2012"]
+
+
+def test_serial_sweep_matches_project_manager():
+
+    df = run_start_date_sweep(config, weather_df, start_dates, processes=1)
+
+    assert len(df) == len(start_dates) * len(config["install_phases"])
+    assert set(df["phase"]) == set(config["install_phases"])
+
+    for start in start_dates:
+        project = ProjectManager(config, weather=weather_df.loc[start:])
+        project.run_project()
+
+        res = df.loc[df["start_date"] == pd.Timestamp(start)]
+        for _, row in res.iterrows():
+            assert row["phase_time"] == project.phase_times[row["phase"]]
+            assert row["phase_cost"] == project.phase_costs[row["phase"]]
+
+        assert (res["total_capex"] == project.total_capex).all()
+
+
+def test_overlapping_sweep_matches_project_manager():
+
+    config_with_start_dates = deepcopy(config)
+    config_with_start_dates["install_phases"] = {
+        "MonopileInstallation": "01/01/2010",
+        "TurbineInstallation": "03/01/2010",
+    }
+
+    df = run_start_date_sweep(
+        config_with_start_dates, weather_df, ["05/01/2011"], processes=1
+    )
+
+    shifted = deepcopy(config_with_start_dates)
+    shifted["install_phases"] = {
+        "MonopileInstallation": "05/01/2011",
+        "TurbineInstallation": "06/29/2011",
+    }
+    project = ProjectManager(shifted, weather=weather_df)
+    project.run_project()
+
+    for _, row in df.iterrows():
+        assert row["phase_time"] == project.phase_times[row["phase"]]
+
+
+def test_parallel_sweep():
+
+    serial = run_start_date_sweep(config, weather_df, start_dates, processes=1)
+    parallel = run_start_date_sweep(
+        config, weather_df, start_dates, processes=2
+    )
+
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+def test_sweep_outside_weather():
+
+    with pytest.raises(WeatherProfileError):
+        run_start_date_sweep(config, weather_df, ["01/01/2020"], processes=1)
@@ -46,6 +46,60 @@ class TestPlantFinance(unittest.TestCase):
         for k in self.inputs.keys(): prob[k] = self.inputs[k]        
         for k in self.discrete_inputs.keys(): prob[k] = self.discrete_inputs[k]        
         #prob.check_partials()
+
+    def testBatch(self):
+        # Sites along the first axis, scenarios along the second
+        bos   = np.array([[7.7e3], [5e2], [1.2e3]])
+        taep  = np.array([[1.6e7], [1.2e7], [0.9e7]])
+        paep  = np.array([[1.6e7*50], [0.0], [0.0]])
+        nturb = np.array([[50], [87], [20]])
+        wlf   = np.array([0.15, 0.1, 0.2, 0.15])
+        fcr   = np.array([0.12, 0.12, 0.08, 0.079])
+        out = pf.plant_finance(1e3, 1.2e3, bos, 7e2, nturb, turbine_aep=taep, park_aep=paep,
+                               wake_loss_factor=wlf, fixed_charge_rate=fcr)
+        self.assertEqual(out['lcoe'].shape, (3, 4))
+
+        for i in range(3):
+            for j in range(4):
+                self.inputs['bos_per_kW'] = bos[i,0]
+                self.inputs['turbine_aep'] = taep[i,0]
+                self.inputs['park_aep'] = paep[i,0]
+                self.inputs['wake_loss_factor'] = wlf[j]
+                self.inputs['fixed_charge_rate'] = fcr[j]
+                self.discrete_inputs['turbine_number'] = nturb[i,0]
+                self.mypfin.compute(self.inputs, self.outputs, self.discrete_inputs, {})
+                npt.assert_allclose(out['lcoe'][i,j], self.outputs['lcoe'], rtol=1e-14)
+
+        # Net present value of a plant that breaks even over its life
+        out = pf.plant_finance(1e3, 1e3, 0.0, 0.0, 10, turbine_aep=1e6, wake_loss_factor=0.0,
+                               electricity_price=0.1, discount_rate=0.0, plant_life=10.0)
+        npt.assert_allclose(out['npv'], 0.0, atol=1e-6)
+        npt.assert_equal(out['capex'], 1e7)
+
+    def testBatchDerivatives(self):
+        prob = Problem()
+        prob.model.add_subsystem('pf', pf.PlantFinanceBatch(n_sites=3, n_scenarios=4), promotes=['*'])
+        prob.setup()
+        prob['machine_rating'] = 5e3
+        prob['tcc_per_kW'] = 1.2e3
+        prob['turbine_number'] = np.array([50, 87, 20])
+        prob['bos_per_kW'] = np.array([7.7e2, 5e2, 1.2e3])
+        prob['opex_per_kW'] = np.array([70.0, 43.56, 110.0])
+        prob['turbine_aep'] = np.array([1.6e7, 1.2e7, 0.9e7])
+        prob['park_aep'] = np.array([1.6e7*45, 0.0, 0.0])
+        prob['wake_loss_factor'] = np.array([0.15, 0.1, 0.2, 0.15])
+        prob['fixed_charge_rate'] = np.array([0.12, 0.12, 0.08, 0.079])
+        prob['availability'] = np.array([0.97, 0.95, 0.99, 0.9])
+        prob['electricity_price'] = np.array([0.05, 0.04, 0.06, 0.07])
+        prob['discount_rate'] = np.array([0.07, 0.05, 0.1, 0.03])
+        prob.run_model()
+
+        npt.assert_allclose(prob['capex'], 5e3*np.array([50, 87, 20])*(1.2e3 + np.array([7.7e2, 5e2, 1.2e3])))
+        data = prob.check_partials(out_stream=None, method='fd', form='central', step=1e-6, step_calc='rel')
+        for key, val in data['pf'].items():
+            # park_aep of 0 switches to the turbine AEP, so only the first site has a smooth derivative
+            J_fwd, J_fd = (val['J_fwd'][:,:1], val['J_fd'][:,:1]) if key[1] == 'park_aep' else (val['J_fwd'], val['J_fd'])
+            npt.assert_allclose(J_fwd, J_fd, rtol=1e-5, atol=1e-6*np.abs(J_fd).max(), err_msg=str(key))
         
 def suite():
     suite = unittest.TestSuite()
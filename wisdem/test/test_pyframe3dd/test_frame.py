@@ -577,6 +577,7 @@ class FrameTestEXB(unittest.TestCase):
 
 
 
+        self.frame = frame
         self.displacements, self.forces, self.reactions, self.internalForces, self.mass, self.modal = frame.run()
 
 
@@ -828,6 +829,64 @@ class FrameTestEXB(unittest.TestCase):
 
 
 
+    def test_sweep(self):
+
+        frame = self.frame
+        scale = np.array([[1.0], [2.0], [0.5]])
+        buffers = [frame.eAx, frame.eAsy, frame.eAsz, frame.eJx, frame.eIy, frame.eIz, frame.edensity]
+        props = [scale*p for p in buffers]
+        displacements, forces, reactions, mass, modal = frame.sweep(*props[:-1], density=props[-1])
+
+        self.assertEqual(displacements.dx.shape, (3,) + self.displacements.dx.shape)
+        self.assertEqual(modal.freq.shape, (3,) + self.modal.freq.shape)
+
+        # first candidate is the original frame, which the sweep leaves unchanged
+        np.testing.assert_allclose(displacements.dx[0], self.displacements.dx)
+        np.testing.assert_allclose(forces.Nx[0], self.forces.Nx)
+        np.testing.assert_allclose(reactions.Fz[0], self.reactions.Fz)
+        np.testing.assert_allclose(mass.struct_mass[0], self.mass.struct_mass)
+        np.testing.assert_allclose(modal.freq[0], self.modal.freq)
+        np.testing.assert_allclose(frame.run()[5].freq, self.modal.freq)
+
+        # other candidates match a run with the same properties
+        for k in range(1, 3):
+            for buf, p in zip(buffers, props):
+                buf[:] = p[k]
+            d, f, r, i, m, mo = frame.run()
+            for buf, p in zip(buffers, props):
+                buf[:] = p[0]
+            np.testing.assert_allclose(displacements.dx[k], d.dx)
+            np.testing.assert_allclose(forces.Myy[k], f.Myy)
+            np.testing.assert_allclose(reactions.Mxx[k], r.Mxx)
+            np.testing.assert_allclose(mass.total_mass[k], m.total_mass)
+            np.testing.assert_allclose(modal.freq[k], mo.freq)
+            np.testing.assert_allclose(modal.xdsp[k, 0], mo.xdsp[0])
+
+
+
+    def test_warm_start(self):
+
+        frame = self.frame
+        frame.enableWarmStart()
+
+        # first run has no previous modes, second starts from those of the first
+        frame.run()
+        self.assertFalse(frame.modalWarmStarted)
+        cold = frame.modalIterations
+        modal = frame.run()[5]
+        self.assertTrue(frame.modalWarmStarted)
+        self.assertFalse(frame.modalColdRestart)
+        self.assertLessEqual(frame.modalIterations, cold)
+        np.testing.assert_allclose(modal.freq, self.modal.freq, rtol=1e-8)
+
+        # a null start is not used
+        frame.enableWarmStart(np.zeros(frame.modalSubspace.shape))
+        modal = frame.run()[5]
+        self.assertFalse(frame.modalWarmStarted)
+        np.testing.assert_allclose(modal.freq, self.modal.freq, rtol=1e-8)
+
+
+
 class GravityAdd(unittest.TestCase):
 
     def test_addgrav_working(self):
@@ -0,0 +1,134 @@
+import os
+import copy
+import numpy as np
+from unittest import mock
+import numpy.testing as npt
+import unittest
+from openmdao.utils.options_dictionary import OptionsDictionary
+import wisdem.rotorse as rotorse
+from wisdem.rotorse.rotor_geometry_yaml import ReferenceBlade
+import wisdem.rotorse.rotor_cost as rotor_cost
+from wisdem.rotorse.rotor_cost import blade_cost_model, blade_cost_model_batch, pmt
+
+
+def nrel5mw_blade():
+    path = os.path.join(os.path.dirname(rotorse.__file__), 'turbine_inputs')
+    refBlade = ReferenceBlade()
+    refBlade.verbose      = False
+    refBlade.NINPUT       = 8
+    refBlade.NPTS         = 50
+    refBlade.spar_var     = ['Spar_Cap_SS', 'Spar_Cap_PS']
+    refBlade.te_var       = 'TE_reinforcement'
+    refBlade.validate     = False
+    refBlade.fname_schema = os.path.join(path, 'IEAontology_schema.yaml')
+    return refBlade.initialize(os.path.join(path, 'nrel5mw_mod_update.yaml'))
+
+
+def cost_options(discrete):
+    # As declared by RotorCost and RotorGeometry
+    options = OptionsDictionary()
+    for var in ['verbosity', 'tex_table', 'generate_plots', 'show_plots', 'show_warnings']:
+        options.declare(var, default=False)
+    options.declare('discrete', default=discrete)
+    return options
+
+
+def single_blade(blade, discrete, thickness=None):
+    # Single blade cost model with the (layer, station) thicknesses of blade_bom_batch
+    bcm = blade_cost_model(options=cost_options(discrete))
+    bcm.init_from_Ontology(blade)
+    bcm.upperCS = copy.deepcopy(bcm.upperCS)
+    bcm.lowerCS = copy.deepcopy(bcm.lowerCS)
+    bcm.websCS  = copy.deepcopy(bcm.websCS)
+    if thickness is not None:
+        for i_section in range(len(bcm.r)):
+            i_layer = 0
+            for cs in [bcm.upperCS[i_section], bcm.lowerCS[i_section], bcm.websCS[i_section]]:
+                for i_part in range(len(cs.t)):
+                    for i_mat in range(len(cs.t[i_part])):
+                        cs.t[i_part][i_mat] = thickness[i_layer, i_section]
+                        i_layer += 1
+    return bcm.execute_blade_cost_model()
+
+
+def labor_ct(blade, discrete, iterative=False):
+    # Operations, labor and cycle times of the blade, with the team sizes of the gating skin and
+    # assembly processes found by root search (the former iterative solution) if iterative
+    results = []
+    execute = rotor_cost.blade_labor_ct.execute_blade_labor_ct
+    def record(self):
+        results.append(execute(self))
+        return results[-1]
+    with mock.patch.object(rotor_cost.blade_labor_ct, 'execute_blade_labor_ct', record):
+        if iterative:
+            with mock.patch.object(rotor_cost, 'compile_team_size_model', lambda labor_ct, shape=(): None):
+                single_blade(blade, discrete)
+        else:
+            single_blade(blade, discrete)
+    return results[0]
+
+
+class TestBladeCost(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.blade = nrel5mw_blade()
+
+    def testPmt(self):
+        # 30 year mortgage of 100k at 5%
+        npt.assert_almost_equal(pmt(0.05/12, 360, 100000.), -536.8216230121398)
+        npt.assert_almost_equal(pmt(0., 10, 100.), -10.)
+
+    def testTeamSizeVsIterative(self):
+        # Closed form team sizes against brentq, which solves them to xtol=1e-4
+        for discrete in [False, True]:
+            operation, labor, gating_ct, non_gating_ct = labor_ct(self.blade, discrete)
+            ref = labor_ct(self.blade, discrete, iterative=True)
+            self.assertEqual(operation, ref[0])
+            rtol = 1e-10 if discrete else 1e-4
+            npt.assert_allclose(labor, ref[1], rtol=rtol)
+            npt.assert_allclose(gating_ct, ref[2], rtol=rtol)
+            npt.assert_allclose(non_gating_ct, ref[3], rtol=rtol)
+
+    def testSolveTeamSize(self):
+        # Quadratic and cubic (c1 != 0) cycle time models, scalar and per design
+        n      = np.linspace(0.5, 60., 7)
+        coeff  = np.zeros((4, 2, 7))
+        coeff[:,1] = [np.full(7, 2.), np.where(n > 30., 1e-3, 0.), 40. + n, 25. * np.ones(7)]
+        target = 6. + 0.1 * n
+        team   = rotor_cost.solve_team_size(coeff, target)
+        for k in range(7):
+            ct = lambda x: np.dot(rotor_cost.team_size_basis(x), coeff[:,1,k]) - target[k]
+            npt.assert_allclose(team[k], rotor_cost.brentq(ct, 0.01, 100., xtol=1e-12), rtol=1e-9)
+            npt.assert_allclose(rotor_cost.solve_team_size(coeff[...,k], target[k]), team[k], rtol=1e-12)
+
+    def testBatchVsSingle(self):
+        for discrete in [False, True]:
+            batch = blade_cost_model_batch(options=cost_options(discrete))
+            batch.init_from_Ontology(self.blade)
+            layup = batch.init_layup()
+
+            rng       = np.random.RandomState(0)
+            thickness = np.array([layup['t'], 1.1*layup['t'], layup['t'] * rng.uniform(0.8, 1.2, layup['t'].shape)])
+            results   = batch.execute_blade_cost_model(thickness)
+
+            for k in range(thickness.shape[0]):
+                cost, mass = single_blade(self.blade, discrete, thickness[k])
+                npt.assert_allclose(results['total_blade_cost'][k], cost, rtol=1e-10)
+                npt.assert_allclose(results['blade_mass'][k], mass, rtol=1e-10)
+
+            # Reference layup is the unchanged blade
+            cost, mass = single_blade(self.blade, discrete)
+            npt.assert_allclose(results['total_blade_cost'][0], cost, rtol=1e-10)
+
+        # Rounding plies up costs more
+        self.assertGreater(single_blade(self.blade, True)[0], single_blade(self.blade, False)[0])
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestBladeCost))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
@@ -187,6 +187,34 @@ class TestTowerSE(unittest.TestCase):
         npt.assert_equal(self.outputs['Mzz'], np.array([4e6]))
 
 
+    def testPostFrameDerivatives(self):
+        nFull = 7
+        prob = om.Problem()
+        ivc  = prob.model.add_subsystem('ivc', om.IndepVarComp(), promotes=['*'])
+        ivc.add_output('z', np.linspace(0.0, 60.0, nFull), units='m')
+        ivc.add_output('d', np.linspace(6.0, 4.0, nFull), units='m')
+        ivc.add_output('t', np.linspace(0.03, 0.02, nFull-1), units='m')
+        ivc.add_output('L_reinforced', 30.0, units='m')
+        ivc.add_output('E', 210e9, units='N/m**2')
+        ivc.add_output('sigma_y', 345e6, units='N/m**2')
+        ivc.add_output('Fz', -np.linspace(4e6, 3e6, nFull-1), units='N')
+        ivc.add_output('Mxx', np.linspace(2e7, 1e6, nFull-1), units='N*m')
+        ivc.add_output('Myy', np.linspace(6e7, 4e6, nFull-1), units='N*m')
+        ivc.add_output('axial_stress', -np.linspace(1.2e8, 4e7, nFull-1), units='N/m**2')
+        ivc.add_output('shear_stress', np.linspace(2e6, 1e6, nFull-1), units='N/m**2')
+        ivc.add_output('hoop_stress', -np.linspace(3e5, 5e5, nFull-1), units='N/m**2')
+        ivc.add_output('top_deflection_in', 0.5, units='m')
+        ivc.add_output('f1', 0.3, units='Hz')
+        ivc.add_output('f2', 0.31, units='Hz')
+        prob.model.add_subsystem('post', tow.TowerPostFrame(nFull=nFull), promotes=['*'])
+        prob.setup()
+        prob.run_model()
+
+        data = prob.check_partials(out_stream=None, method='fd', form='central', step=1e-6, step_calc='rel')
+        for (of, wrt), err in data['post'].items():
+            self.assertLess(err['rel error'].forward, 1e-5, msg=of+' wrt '+wrt)
+
+        
     def testProblemLand(self):
         prob = om.Problem()
         prob.model = tow.TowerSE(nLC=1, nPoints=3, nFull=7, wind='PowerWind', topLevelFlag=True, monopile=False)
@@ -445,7 +445,14 @@ class TowerPostFrame(ExplicitComponent):
         self.add_output('turbine_M', val=np.zeros(3), units='N*m', desc='Total x-moment on tower+rna measured at base')
         
         # Derivatives
-        # self.declare_partials('*', '*', method='fd', form='central', step=1e-6)
+        self.declare_partials('structural_frequencies', ['f1','f2'])
+        self.declare_partials('top_deflection', 'top_deflection_in')
+        self.declare_partials('stress', ['axial_stress','hoop_stress','shear_stress','gamma_f','gamma_m','gamma_n','sigma_y'])
+        self.declare_partials('shell_buckling', ['d','t','axial_stress','hoop_stress','shear_stress','L_reinforced','E','sigma_y',
+                                                 'gamma_f','gamma_b'])
+        self.declare_partials('global_buckling', ['d','t','z','Fz','Mxx','Myy','E','sigma_y','gamma_f','gamma_b'])
+
+        self.J = {}
 
         
     def compute(self, inputs, outputs):
@@ -456,8 +463,9 @@ class TowerPostFrame(ExplicitComponent):
         sigma_y      = inputs['sigma_y'] * np.ones(axial_stress.shape)
         E            = inputs['E'] * np.ones(axial_stress.shape)
         L_reinforced = inputs['L_reinforced'] * np.ones(axial_stress.shape)
-        d,_          = nodal2sectional(inputs['d'])
+        d,dd_dd      = nodal2sectional(inputs['d'])
         z_section,_  = nodal2sectional(inputs['z'])
+        gamma        = inputs['gamma_f']*inputs['gamma_m']*inputs['gamma_n']
 
         # Frequencies
         outputs['structural_frequencies'] = np.zeros(2)
@@ -468,18 +476,50 @@ class TowerPostFrame(ExplicitComponent):
         outputs['top_deflection'] = inputs['top_deflection_in']
         
         # von mises stress
-        outputs['stress'] = Util.vonMisesStressUtilization(axial_stress, hoop_stress, shear_stress,
-                      inputs['gamma_f']*inputs['gamma_m']*inputs['gamma_n'], sigma_y)
+        outputs['stress'], dVM = Util.vonMisesStressUtilization(axial_stress, hoop_stress, shear_stress,
+                                                                 gamma, sigma_y, derivatives=True)
 
-        # shell buckling
-        outputs['shell_buckling'] = Util.shellBucklingEurocode(d, inputs['t'], axial_stress, hoop_stress,
-                                                                shear_stress, L_reinforced, E, sigma_y, inputs['gamma_f'], inputs['gamma_b'])
+        # shell buckling.  TowerSE has one TowerPostFrame per load case, so the kernels are called
+        # with (nsection,) stresses here; their broadcasting over load cases is not used yet.
+        outputs['shell_buckling'], dEU = Util.shellBucklingEurocode(d, inputs['t'], axial_stress, hoop_stress,
+                                                                     shear_stress, L_reinforced, E, sigma_y, inputs['gamma_f'], inputs['gamma_b'],
+                                                                     derivatives=True)
 
         # global buckling
         tower_height = inputs['z'][-1] - inputs['z'][0]
         M = np.sqrt(inputs['Mxx']**2 + inputs['Myy']**2)
-        outputs['global_buckling'] = Util.bucklingGL(d, inputs['t'], inputs['Fz'], M, tower_height, E,
-                                                      sigma_y, inputs['gamma_f'], inputs['gamma_b'])
+        outputs['global_buckling'], dGL = Util.bucklingGL(d, inputs['t'], inputs['Fz'], M, tower_height, E,
+                                                           sigma_y, inputs['gamma_f'], inputs['gamma_b'], derivatives=True)
+
+        # Analytic derivatives.  The utilizations are element-wise in the sectional inputs.
+        self.J = {}
+        self.J['stress','axial_stress'] = np.diag(dVM['axial_stress'])
+        self.J['stress','hoop_stress']  = np.diag(dVM['hoop_stress'])
+        self.J['stress','shear_stress'] = np.diag(dVM['shear_stress'])
+        self.J['stress','gamma_f']      = dVM['gamma'] * inputs['gamma_m']*inputs['gamma_n']
+        self.J['stress','gamma_m']      = dVM['gamma'] * inputs['gamma_f']*inputs['gamma_n']
+        self.J['stress','gamma_n']      = dVM['gamma'] * inputs['gamma_f']*inputs['gamma_m']
+        self.J['stress','sigma_y']      = dVM['sigma_y']
+
+        self.J['shell_buckling','d']            = dEU['d'][:,np.newaxis] * dd_dd
+        self.J['shell_buckling','t']            = np.diag(dEU['t'])
+        self.J['shell_buckling','axial_stress'] = np.diag(dEU['sigma_z'])
+        self.J['shell_buckling','hoop_stress']  = np.diag(dEU['sigma_t'])
+        self.J['shell_buckling','shear_stress'] = np.diag(dEU['tau_zt'])
+        for var in ['L_reinforced','E','sigma_y','gamma_f','gamma_b']:
+            self.J['shell_buckling',var] = dEU[var]
+
+        Mpos = np.where(M > 0.0, M, 1.0)
+        self.J['global_buckling','d']   = dGL['d'][:,np.newaxis] * dd_dd
+        self.J['global_buckling','t']   = np.diag(dGL['t'])
+        self.J['global_buckling','z']   = np.zeros((d.size, inputs['z'].size))
+        self.J['global_buckling','z'][:,0]  = -dGL['tower_height']
+        self.J['global_buckling','z'][:,-1] =  dGL['tower_height']
+        self.J['global_buckling','Fz']  = np.diag(dGL['Fz'])
+        self.J['global_buckling','Mxx'] = np.diag(dGL['Myy'] * inputs['Mxx'] / Mpos)
+        self.J['global_buckling','Myy'] = np.diag(dGL['Myy'] * inputs['Myy'] / Mpos)
+        for var in ['E','sigma_y','gamma_f','gamma_b']:
+            self.J['global_buckling',var] = dGL[var]
 
         # fatigue
         N_DEL = 365.0*24.0*3600.0*inputs['life'] * np.ones(len(inputs['t']))
@@ -491,6 +531,15 @@ class TowerPostFrame(ExplicitComponent):
         #    outputs['damage'] = Util.fatigue(M_DEL, N_DEL, d, inputs['t'], inputs['m_SN'],
         #                                      inputs['DC'], inputs['gamma_fatigue'], stress_factor=1.0, weld_factor=True)
 
+
+    def compute_partials(self, inputs, J):
+        J['structural_frequencies','f1'] = np.array([1.0, 0.0])
+        J['structural_frequencies','f2'] = np.array([0.0, 1.0])
+        J['top_deflection','top_deflection_in'] = 1.0
+
+        for key in self.J:
+            J[key] = self.J[key]
+
 # -----------------
 #  Assembly
 # -----------------